@@ -0,0 +1,238 @@
+# 분석 1회 동안 발견된 확인 필요 데이터(진단 정보) 저장소
+import atexit
+import json
+import os
+import shutil
+import tempfile
+from datetime import date, datetime, time
+
+import numpy as np
+import pandas as pd
+
+# 분류별로 메모리에 보관하는 샘플 수
+DEFAULT_SAMPLE_LIMIT = 200
+
+# 진단 분류 키와 화면/내보내기에 표시할 이름
+DIAGNOSTIC_CATEGORIES = {
+    "unclear_security_days": "경비 데이터 불명확 업무일",
+    "missing_time_records": "출/퇴근 시간 누락",
+    "error_records": "초과근무 기록 처리 오류",
+    "no_security_records": "경비 기록 없는 초과근무",
+    "holiday_mismatch_records": "휴일 판단 불일치",
+}
+
+# 아직 삭제되지 않은 임시 폴더 -> 삭제를 맡은 프로세스 ID (창을 닫거나 프로그램이 끝날 때 남은 폴더를 삭제)
+#
+# 구역별 작업 프로세스가 만든 임시 폴더도 저장소를 만든 부모 프로세스가 결과를 합친 뒤 삭제하므로,
+# 작업 프로세스가 끝날 때(spawn 방식에서는 atexit 실행) 부모가 아직 읽을 폴더를 지우지 않도록 합니다.
+_spill_dirs = {}
+
+
+@atexit.register
+def _remove_spill_dirs():
+    for spill_dir, owner_pid in list(_spill_dirs.items()):
+        if owner_pid == os.getpid():
+            shutil.rmtree(spill_dir, ignore_errors=True)
+            del _spill_dirs[spill_dir]
+
+
+def _encode_value(value):
+    # 날짜/시각은 종류를 표시해 저장해 두었다가 읽을 때 같은 타입으로 복원
+    if isinstance(value, pd.Timestamp):
+        return {"__type__": "timestamp", "value": value.isoformat()}
+    if isinstance(value, datetime):
+        return {"__type__": "datetime", "value": value.isoformat()}
+    if isinstance(value, date):
+        return {"__type__": "date", "value": value.isoformat()}
+    if isinstance(value, time):
+        return {"__type__": "time", "value": value.isoformat()}
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
+
+_DECODERS = {
+    "timestamp": pd.Timestamp,
+    "datetime": datetime.fromisoformat,
+    "date": date.fromisoformat,
+    "time": time.fromisoformat,
+}
+
+
+def _decode_object(obj):
+    if obj.keys() == {"__type__", "value"} and obj["__type__"] in _DECODERS:
+        return _DECODERS[obj["__type__"]](obj["value"])
+    return obj
+
+
+def encode_line(value):
+    """기록을 한 줄짜리 JSON 으로 변환합니다. (날짜/시각 타입 유지)"""
+    return json.dumps(value, ensure_ascii=False, default=_encode_value) + "\n"
+
+
+def decode_line(line):
+    """encode_line 으로 만든 한 줄을 원래 값으로 되돌립니다."""
+    return json.loads(line, object_hook=_decode_object)
+
+
+class AnalysisDiagnostics:
+    """분류별 건수와 일부 샘플만 메모리에 보관하는 진단 정보 저장소
+
+    sample_limit 을 넘는 기록은 건수만 세고, spill=True 이면 전체 기록을 임시 폴더의
+    JSON Lines 파일에 기록해 두었다가 iter_records 로 다시 읽을 수 있습니다. (날짜/시각 타입 유지)
+    분석을 다시 실행할 때는 clear() 로 비워서 메모리/디스크 사용량이 누적되지 않게 합니다.
+    clear() 하지 못한 임시 폴더는 프로그램이 끝날 때 삭제합니다.
+    """
+
+    def __init__(self, sample_limit=DEFAULT_SAMPLE_LIMIT, spill=False):
+        self.sample_limit = sample_limit
+        self.spill = spill
+        self.counts = {category: 0 for category in DIAGNOSTIC_CATEGORIES}
+        self._samples = {category: [] for category in DIAGNOSTIC_CATEGORIES}
+        self._spill_dir = None
+        self._spill_files = {}
+        # 임시 폴더 삭제를 맡는 프로세스 (다른 프로세스로 전달되어도 만든 프로세스가 삭제)
+        self._owner_pid = os.getpid()
+
+    def __getstate__(self):
+        # 프로세스 풀로 전달할 때는 임시 파일을 닫아 내용을 모두 기록하고 파일 핸들은 제외
+        # (받는 쪽이 같은 컴퓨터에서 임시 파일을 읽고, 저장소를 만든 프로세스가 clear() 로 삭제)
+        for spill_file in self._spill_files.values():
+            spill_file.close()
+        self._spill_files = {}
+        return self.__dict__.copy()
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        # 작업 프로세스가 만든 임시 폴더를 돌려받은 경우 종료 시 삭제 대상으로 등록
+        if self._spill_dir is not None and self._owner_pid == os.getpid():
+            _spill_dirs[self._spill_dir] = self._owner_pid
+
+    def empty_copy(self):
+        """샘플 한도와 임시 파일 사용 여부가 같은 빈 저장소 (구역별 작업용)"""
+        return AnalysisDiagnostics(self.sample_limit, self.spill)
+
+    def add(self, category, record):
+        """진단 기록 하나를 추가합니다."""
+        self.counts[category] += 1
+        samples = self._samples[category]
+        if self.sample_limit is None or len(samples) < self.sample_limit:
+            samples.append(record)
+        if self.spill:
+            self._spill_file(category).write(encode_line(record))
+
+    def extend(self, category, records):
+        for record in records:
+            self.add(category, record)
+
+    def merge(self, other, transform=None):
+        """다른 저장소(예: 구역별 작업 결과)의 기록을 모두 가져옵니다.
+
+        상대 저장소에 샘플만 남은 분류도 전체 건수는 그대로 더합니다.
+        """
+        for category in DIAGNOSTIC_CATEGORIES:
+            added = 0
+            for record in other.iter_records(category):
+                self.add(category, transform(category, record) if transform else record)
+                added += 1
+            self.counts[category] += other.counts[category] - added
+
+    def count(self, category):
+        return self.counts[category]
+
+    def total_count(self):
+        return sum(self.counts.values())
+
+    def samples(self, category):
+        """메모리에 보관된 샘플 기록 목록을 반환합니다."""
+        return list(self._samples[category])
+
+    def is_truncated(self, category):
+        """샘플이 전체 기록 중 일부만 담고 있는지 여부"""
+        return self.counts[category] > len(self._samples[category])
+
+    def iter_records(self, category):
+        """전체 기록을 반환합니다. 임시 파일에 저장된 경우 파일에서 읽고, 아니면 샘플을 반환합니다."""
+        if self.spill and self.is_truncated(category) and self._spill_dir is not None:
+            spill_file = self._spill_files.get(category)
+            if spill_file is not None:
+                spill_file.flush()
+            with open(self._spill_path(category), encoding="utf-8") as f:
+                for line in f:
+                    yield decode_line(line)
+        else:
+            yield from self._samples[category]
+
+    def summary(self):
+        """[(분류 키, 표시 이름, 건수)] 목록을 반환합니다."""
+        return [
+            (category, label, self.counts[category])
+            for category, label in DIAGNOSTIC_CATEGORIES.items()
+        ]
+
+    def to_dict(self):
+        """건수와 메모리에 보관된 샘플을 dict 로 반환합니다. (프로세스 간 전달용)
+
+        임시 파일에 저장된 전체 기록까지 옮기려면 dump()/load() 를 사용합니다.
+        """
+        return {
+            "counts": dict(self.counts),
+            "records": {category: self.samples(category) for category in DIAGNOSTIC_CATEGORIES},
+        }
+
+    def load_dict(self, state):
+        """to_dict() 로 만든 내용으로 기록을 교체합니다."""
+        self.clear()
+        for category, records in state["records"].items():
+            self.extend(category, records)
+        # 저장 당시 샘플만 남아 있던 분류도 전체 건수는 그대로 유지
+        self.counts.update(state["counts"])
+
+    def dump(self, f):
+        """건수와 보관된 전체 기록을 바이너리 파일에 한 줄씩 씁니다. (결과 캐시/세션 저장용)
+
+        임시 파일의 기록을 한 번에 모두 메모리에 올리지 않고 하나씩 옮겨 씁니다.
+        """
+        f.write(encode_line({"counts": self.counts}).encode("utf-8"))
+        for category in DIAGNOSTIC_CATEGORIES:
+            for record in self.iter_records(category):
+                f.write(encode_line([category, record]).encode("utf-8"))
+
+    def load(self, f):
+        """dump() 로 쓴 내용을 한 줄씩 읽어 기록을 교체합니다."""
+        self.clear()
+        lines = iter(f)
+        header = next(lines, None)
+        if header is None:
+            return
+        for line in lines:
+            category, record = decode_line(line)
+            self.add(category, record)
+        # 저장 당시 샘플만 남아 있던 분류도 전체 건수는 그대로 유지
+        self.counts.update(decode_line(header)["counts"])
+
+    def clear(self):
+        """기록과 임시 파일을 모두 삭제합니다."""
+        for spill_file in self._spill_files.values():
+            spill_file.close()
+        self._spill_files = {}
+        if self._spill_dir is not None:
+            shutil.rmtree(self._spill_dir, ignore_errors=True)
+            _spill_dirs.pop(self._spill_dir, None)
+            self._spill_dir = None
+        for category in DIAGNOSTIC_CATEGORIES:
+            self.counts[category] = 0
+            self._samples[category] = []
+
+    def _spill_path(self, category):
+        return os.path.join(self._spill_dir, f"{category}.jsonl")
+
+    def _spill_file(self, category):
+        spill_file = self._spill_files.get(category)
+        if spill_file is None:
+            if self._spill_dir is None:
+                self._spill_dir = tempfile.mkdtemp(prefix="overtime_diagnostics_")
+                _spill_dirs[self._spill_dir] = self._owner_pid
+            spill_file = open(self._spill_path(category), "a", encoding="utf-8")
+            self._spill_files[category] = spill_file
+        return spill_file
@@ -0,0 +1,379 @@
+# 여러 사용자가 함께 쓰는 로컬 HTTP 분석 서비스 (표준 라이브러리만 사용)
+#
+# 한 서버 프로세스가 불러온 입력 파일(정규화된 데이터프레임)과 분석 결과를 메모리에 보관하므로,
+# 같은 공유 파일을 여러 사용자가 분석해도 파일은 한 번만 읽고, 같은 조건의 재요청은 바로 응답합니다.
+# 분석 자체는 프로세스 풀에서 실행합니다.
+#
+# 사용 예: python cli.py serve --port 8765
+#   POST /upload?name=경비.xlsx   본문: 파일 내용          -> {"path": 서버에 저장된 경로, "sha1": ...}
+#   POST /analyze                 본문: JSON (아래 참고)    -> 분석 결과 JSON 또는 엑셀 파일
+#        {"security": 경로, "overtime": 경로, "start": "2025-01-01", "end": "2025-12-31",
+#         "zones": 경로(선택), "holiday_source": "both", "format": "json" | "xlsx",
+#         "dedupe_seconds": 60(선택, 기본값은 서버 설정, 음수나 null 이면 병합 안 함)}
+#   GET  /health
+#
+# /analyze 의 파일 경로는 /upload 응답의 path(또는 그 파일 이름)만 받습니다. 서버 컴퓨터의 다른
+# 파일은 열지 않으며, 파일을 읽거나 분석하다 생긴 오류의 상세 내용은 서버 로그에만 남깁니다.
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from analysis_diagnostics import AnalysisDiagnostics
+from analyzer_engine import OvertimeAnalysisEngine
+from batch_analysis import analyze_in_worker
+from frame_dtypes import normalize_overtime_frame, normalize_security_frame
+from input_readers import SUPPORTED_EXTENSIONS, read_input_file
+from report_export import analysis_summary, export_analysis_workbook
+from result_cache import analysis_cache_key, default_cache_dir, file_fingerprint
+from security_log import DEFAULT_DEDUPE_SECONDS, DEFAULT_MEMORY_BUDGET_MB, should_stream
+from zone_mapping import load_zone_mapping
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# 메모리에 보관할 입력 파일/분석 결과 수 (넘으면 가장 오래 사용하지 않은 항목부터 삭제)
+INPUT_CACHE_ENTRIES = 8
+RESULT_CACHE_ENTRIES = 32
+
+# 업로드 파일 최대 크기 (MB)
+MAX_UPLOAD_MB = 512
+
+XLSX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+RESPONSE_FORMATS = ("json", "xlsx")
+
+
+def default_upload_dir():
+    """업로드 파일 저장 폴더 (분석 결과 캐시 폴더 옆)"""
+    return os.path.join(os.path.dirname(default_cache_dir()), "uploads")
+
+
+def _noop():
+    return None
+
+
+class MemoryLRU:
+    """최근 사용 순서를 기억하는 크기 제한 dict (잠금은 호출하는 쪽에서 처리)"""
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self._items = OrderedDict()
+
+    def __len__(self):
+        return len(self._items)
+
+    def get(self, key):
+        if key not in self._items:
+            return None
+        self._items.move_to_end(key)
+        return self._items[key]
+
+    def put(self, key, value):
+        self._items[key] = value
+        self._items.move_to_end(key)
+        while len(self._items) > self.max_entries:
+            self._items.popitem(last=False)
+
+    def clear(self):
+        self._items.clear()
+
+
+class AnalysisService:
+    """입력 파일과 분석 결과를 메모리에 보관하며 분석 요청을 프로세스 풀에서 처리합니다.
+
+    result_cache(ResultCache)를 주면 메모리에 없는 결과는 디스크 캐시에서도 찾습니다. 같은 조건의
+    분석이 동시에 요청되면 먼저 시작한 분석 결과를 함께 사용합니다. dedupe_seconds 는 요청에
+    중복 경비 기록 병합 간격이 없을 때 사용합니다.
+    """
+
+    def __init__(
+        self,
+        max_workers=None,
+        memory_budget_mb=DEFAULT_MEMORY_BUDGET_MB,
+        result_cache=None,
+        upload_dir=None,
+        dedupe_seconds=DEFAULT_DEDUPE_SECONDS,
+    ):
+        max_workers = max_workers or os.cpu_count() or 1
+        self.executor = ProcessPoolExecutor(max_workers=max_workers)
+        self.memory_budget_mb = memory_budget_mb
+        self.result_cache = result_cache
+        self.upload_dir = upload_dir or default_upload_dir()
+        self.dedupe_seconds = dedupe_seconds
+        self.inputs = MemoryLRU(INPUT_CACHE_ENTRIES)
+        self.results = MemoryLRU(RESULT_CACHE_ENTRIES)
+        self._in_flight = {}  # 캐시 키 -> 진행 중인 분석의 Future
+        self._lock = threading.Lock()
+
+        # 첫 요청이 프로세스 생성을 기다리지 않도록 작업자 프로세스를 미리 시작
+        for _ in range(max_workers):
+            self.executor.submit(_noop)
+
+    def close(self):
+        self.executor.shutdown(cancel_futures=True)
+
+    def status(self):
+        with self._lock:
+            return {"status": "ok", "inputs": len(self.inputs), "results": len(self.results)}
+
+    # 업로드된 파일을 내용 해시 이름으로 저장 (같은 파일을 다시 올리면 같은 경로)
+    def store_upload(self, name, data):
+        ext = os.path.splitext(name or "")[1].lower()
+        if ext not in SUPPORTED_EXTENSIONS:
+            raise ValueError(f"지원하지 않는 파일 형식입니다: {ext or name}")
+        os.makedirs(self.upload_dir, exist_ok=True)
+        digest = hashlib.sha1(data).hexdigest()
+        path = os.path.join(self.upload_dir, digest + ext)
+        if not os.path.exists(path):
+            fd, tmp_path = tempfile.mkstemp(dir=self.upload_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        print(f"[INFO] 업로드 저장: {name} -> {path}")
+        return {"path": path, "sha1": digest}
+
+    # 입력 파일을 읽어 정규화한 결과를 파일 내용 해시 기준으로 보관
+    def load_input(self, kind, path):
+        key = (kind, file_fingerprint(path))
+        with self._lock:
+            value = self.inputs.get(key)
+        if value is not None:
+            return value
+
+        if kind == "security":
+            value = normalize_security_frame(read_input_file(path))
+        elif kind == "overtime":
+            value = normalize_overtime_frame(read_input_file(path, header=0))
+        else:
+            value = load_zone_mapping(path)
+        with self._lock:
+            self.inputs.put(key, value)
+        return value
+
+    def upload_path(self, name, value):
+        """요청의 파일 값(/upload 응답의 path 또는 파일 이름)을 업로드 폴더 안의 경로로 바꿉니다."""
+        upload_dir = os.path.realpath(self.upload_dir)
+        path = os.path.realpath(os.path.join(upload_dir, str(value)))
+        ext = os.path.splitext(path)[1].lower()
+        if (
+            os.path.dirname(path) != upload_dir
+            or ext not in SUPPORTED_EXTENSIONS
+            or not os.path.isfile(path)
+        ):
+            raise ValueError(f"'{name}' 값은 /upload 로 올린 파일이어야 합니다.")
+        return path
+
+    def dedupe_seconds_for(self, params):
+        """요청의 중복 경비 기록 병합 간격(초). 없으면 서버 설정, 음수나 null 이면 None(병합 안 함)"""
+        if "dedupe_seconds" not in params:
+            return self.dedupe_seconds
+        value = params["dedupe_seconds"]
+        if value is None:
+            return None
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError("'dedupe_seconds' 값은 숫자여야 합니다.")
+        return None if value < 0 else value
+
+    def analyze(self, params):
+        """분석 요청을 처리하고 (엔진, 의심 기록, 캐시 사용 여부) 를 반환합니다."""
+        for name in ("security", "overtime", "start", "end"):
+            if not params.get(name):
+                raise ValueError(f"'{name}' 값이 필요합니다.")
+        security_path = self.upload_path("security", params["security"])
+        overtime_path = self.upload_path("overtime", params["overtime"])
+        zone_path = self.upload_path("zones", params["zones"]) if params.get("zones") else None
+
+        engine = OvertimeAnalysisEngine(
+            params["start"],
+            params["end"],
+            holiday_source=params.get("holiday_source", "both"),
+            dedupe_seconds=self.dedupe_seconds_for(params),
+        )
+        key = analysis_cache_key(engine, security_path, overtime_path, zone_path)
+
+        with self._lock:
+            entry = self.results.get(key)
+            future = self._in_flight.get(key) if entry is None else None
+            owner = entry is None and future is None
+            if owner:
+                future = self._in_flight[key] = Future()
+
+        if entry is None and not owner:
+            # 같은 조건의 분석이 진행 중이면 그 결과를 기다림
+            entry = future.result()
+        elif owner:
+            try:
+                entry = self._compute(engine, key, security_path, overtime_path, zone_path)
+                future.set_result(entry)
+            except Exception as e:
+                # 파일 내용이나 서버 내부 정보가 담길 수 있는 상세 오류는 서버 로그에만 기록
+                print(f"[경고] 분석 요청 처리 중 오류: {e}")
+                error = ValueError("입력 파일을 분석할 수 없습니다. 파일 형식과 내용을 확인하세요.")
+                future.set_exception(error)
+                raise error from e
+            except BaseException as e:
+                future.set_exception(e)
+                raise
+            finally:
+                with self._lock:
+                    self._in_flight.pop(key, None)
+        cached = not owner
+
+        suspicious_records, diagnostics_state = entry
+        engine.diagnostics.load_dict(diagnostics_state)
+        return engine, suspicious_records, cached
+
+    def _compute(self, engine, key, security_path, overtime_path, zone_path):
+        entry = None
+        if self.result_cache:
+            diagnostics = AnalysisDiagnostics()
+            suspicious_records = self.result_cache.get(key, diagnostics)
+            if suspicious_records is not None:
+                entry = (suspicious_records, diagnostics.to_dict())
+        if entry is None:
+            zone_mapping = self.load_input("zones", zone_path) if zone_path else None
+            overtime_df = self.load_input("overtime", overtime_path)
+            if should_stream(security_path, self.memory_budget_mb):
+                security = security_path
+            else:
+                security = self.load_input("security", security_path)
+
+            entry = self.executor.submit(
+                analyze_in_worker,
+                engine.start_date,
+                engine.end_date,
+                engine.holiday_source,
+                engine.dedupe_seconds,
+                engine.rule_tables,
+                security,
+                overtime_df,
+                zone_mapping,
+                self.memory_budget_mb,
+            ).result()
+
+            if self.result_cache:
+                diagnostics = AnalysisDiagnostics()
+                diagnostics.load_dict(entry[1])
+                try:
+                    self.result_cache.put(key, entry[0], diagnostics)
+                except OSError as e:
+                    print(f"[경고] 분석 결과 캐시 저장 실패: {e}")
+
+        with self._lock:
+            self.results.put(key, entry)
+        return entry
+
+
+def _json_default(value):
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+class AnalysisRequestHandler(BaseHTTPRequestHandler):
+    """분석 서비스 HTTP 요청 처리 (서버의 service 속성에 AnalysisService 가 있어야 함)"""
+
+    server_version = "OvertimeAnalyzer/1.0"
+
+    def do_GET(self):
+        if urlparse(self.path).path == "/health":
+            self._send_json(200, self.server.service.status())
+        else:
+            self._send_json(404, {"error": "찾을 수 없는 경로입니다."})
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        try:
+            if url.path == "/upload":
+                name = parse_qs(url.query).get("name", [""])[0]
+                self._send_json(200, self.server.service.store_upload(name, self._read_body()))
+            elif url.path == "/analyze":
+                self._handle_analyze(json.loads(self._read_body() or b"{}"))
+            else:
+                self._send_json(404, {"error": "찾을 수 없는 경로입니다."})
+        except ValueError as e:
+            # 잘못된 요청 값, 업로드되지 않은 파일, 분석할 수 없는 입력 파일
+            self._send_json(400, {"error": str(e)})
+        except Exception as e:
+            print(f"[경고] 요청 처리 중 오류: {e}")
+            self._send_json(500, {"error": "서버에서 요청을 처리하지 못했습니다."})
+
+    def _read_body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_UPLOAD_MB * 1024 * 1024:
+            raise ValueError(f"요청 본문이 너무 큽니다. (최대 {MAX_UPLOAD_MB}MB)")
+        return self.rfile.read(length)
+
+    def _handle_analyze(self, params):
+        response_format = params.get("format", "json")
+        if response_format not in RESPONSE_FORMATS:
+            raise ValueError(f"지원하지 않는 응답 형식입니다: {response_format}")
+
+        engine, suspicious_records, cached = self.server.service.analyze(params)
+        summary = analysis_summary(engine, suspicious_records)
+
+        if response_format == "xlsx":
+            fd, tmp_path = tempfile.mkstemp(suffix=".xlsx")
+            os.close(fd)
+            try:
+                export_analysis_workbook(tmp_path, suspicious_records, engine.diagnostics, summary)
+                with open(tmp_path, "rb") as f:
+                    body = f.read()
+            finally:
+                os.remove(tmp_path)
+            self._send(200, body, XLSX_CONTENT_TYPE, {"X-Cache": "hit" if cached else "miss"})
+            return
+
+        self._send_json(
+            200,
+            {
+                "cached": cached,
+                "summary": dict(summary),
+                "diagnostics": {
+                    category: count for category, _, count in engine.diagnostics.summary()
+                },
+                "records": suspicious_records,
+            },
+        )
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload, ensure_ascii=False, default=_json_default).encode("utf-8")
+        self._send(status, body, "application/json; charset=utf-8")
+
+    def _send(self, status, body, content_type, headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        print(f"[INFO] {self.address_string()} {format % args}")
+
+
+def make_server(service, host=DEFAULT_HOST, port=DEFAULT_PORT):
+    """분석 서비스를 제공하는 HTTP 서버를 만듭니다. (요청마다 스레드 하나)"""
+    server = ThreadingHTTPServer((host, port), AnalysisRequestHandler)
+    server.daemon_threads = True
+    server.service = service
+    return server
+
+
+def serve(service, host=DEFAULT_HOST, port=DEFAULT_PORT):
+    """종료할 때까지(Ctrl+C) 분석 요청을 처리합니다."""
+    server = make_server(service, host, port)
+    print(f"[INFO] 분석 서비스 시작: http://{host}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("[INFO] 분석 서비스 종료")
+    finally:
+        server.server_close()
+        service.close()
@@ -0,0 +1,34 @@
+# 분석을 별도 스레드에서 실행하는 작업자 (분석 중에도 화면이 멈추지 않도록)
+import traceback
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+
+class AnalysisWorker(QThread):
+    """의심 기록 묶음을 반환하는 제너레이터를 실행하고, 묶음이 나올 때마다 batch_ready 로 알립니다.
+
+    제너레이터(예: engine.iter_analyze(...))는 실행 전까지 아무 작업도 하지 않으므로, 전처리부터
+    비교까지 모두 이 스레드에서 실행됩니다. 분석이 끝나면 completed, 오류가 나면 failed 를 보냅니다.
+    """
+
+    batch_ready = pyqtSignal(object)
+    completed = pyqtSignal()
+    failed = pyqtSignal(str)
+
+    def __init__(self, batches, parent=None):
+        super().__init__(parent)
+        self.batches = batches
+
+    def run(self):
+        try:
+            for batch in self.batches:
+                self.batch_ready.emit(batch)
+                if self.isInterruptionRequested():
+                    print("[INFO] 분석 중단")
+                    self.batches.close()
+                    return
+        except Exception as e:
+            print(traceback.format_exc())  # 상세 오류 정보 출력
+            self.failed.emit(str(e))
+            return
+        self.completed.emit()
@@ -0,0 +1,1090 @@
+# 경비 기록과 초과근무 기록을 비교 분석하는 엔진 (GUI 와 무관하게 동작)
+import os
+import time as time_module
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, time, timedelta
+
+import pandas as pd
+
+from analysis_diagnostics import AnalysisDiagnostics
+from classification_rules import get_rule_tables
+from employee_index import EmployeeTimelineIndex, overtime_interval
+from frame_dtypes import employee_keys, normalize_overtime_frame, normalize_security_frame
+from holiday_calendar import get_holiday_calendar
+from security_log import (
+    ALL_ZONES,
+    ArmedTimeline,
+    DEFAULT_DEDUPE_SECONDS,
+    DEFAULT_MEMORY_BUDGET_MB,
+    STATE_LABELS,
+    SecurityStateBuilder,
+    chunk_rows_for_budget,
+    iter_security_chunks,
+    repeated_state_mask,
+)
+
+# 분석 로직 버전 - 같은 입력/조건에서 의심 기록이나 확인 필요 데이터가 달라지는 변경(판단 규칙,
+# 업무일 계산, 경비 기록 병합 등)을 하면 올려서 이전 로직으로 저장된 분석 결과 캐시를 무시
+ANALYSIS_LOGIC_VERSION = 1
+
+# 휴일 판단 기준 - calendar: 공휴일 달력, column: F열(휴일여부), both: 둘 중 하나라도 휴일이면 휴일
+HOLIDAY_SOURCES = ("both", "calendar", "column")
+
+# 전체 데이터가 이 행 수보다 적으면 프로세스 생성 비용이 더 크므로 구역별 작업을 순차 실행
+PARALLEL_MIN_ROWS = 50000
+
+# 의심 기록을 찾는 대로 넘겨줄 때 한 번에 묶는 최대 건수와 최대 대기 시간(초)
+RESULT_BATCH_SIZE = 200
+RESULT_BATCH_SECONDS = 0.3
+
+
+def _process_zone_security_log(
+    start_date, end_date, rule_tables, dedupe_seconds, diagnostics, zone_df
+):
+    """구역 하나의 경비 기록을 처리합니다. (프로세스 풀에서 실행)
+
+    diagnostics 는 호출한 엔진과 샘플 한도/임시 파일 사용 여부가 같은 빈 저장소입니다.
+    """
+    engine = OvertimeAnalysisEngine(
+        start_date,
+        end_date,
+        rule_tables=rule_tables,
+        diagnostics=diagnostics,
+        dedupe_seconds=dedupe_seconds,
+    )
+    security_status_by_day = engine.process_security_log(zone_df)
+    return security_status_by_day, engine.diagnostics
+
+
+def _compare_zone(
+    start_date, end_date, rule_tables, diagnostics, security_status_by_day, overtime_records
+):
+    """구역 하나의 경비 상태와 초과근무 기록을 비교합니다. (프로세스 풀에서 실행)"""
+    engine = OvertimeAnalysisEngine(
+        start_date, end_date, rule_tables=rule_tables, diagnostics=diagnostics
+    )
+    suspicious_records = engine.compare_security_and_overtime(
+        security_status_by_day, overtime_records
+    )
+    return suspicious_records, engine.diagnostics
+
+
+def parallel_workers(job_count, total_rows, max_workers=None):
+    """구역별 작업에 사용할 프로세스 수를 반환합니다. 순차 실행해야 하면 0 을 반환합니다.
+
+    작업이 하나뿐이거나 데이터가 작으면 순차 실행합니다.
+    """
+    if max_workers is None:
+        max_workers = min(job_count, os.cpu_count() or 1)
+    if job_count <= 1 or max_workers <= 1 or total_rows < PARALLEL_MIN_ROWS:
+        return 0
+    return max_workers
+
+
+def run_per_zone(func, zone_args, total_rows, max_workers=None):
+    """구역별 작업을 프로세스 풀에서 병렬로 실행하고 {구역: 결과} 를 반환합니다.
+
+    작업이 하나뿐이거나 데이터가 작으면 현재 프로세스에서 순차 실행합니다.
+    """
+    max_workers = parallel_workers(len(zone_args), total_rows, max_workers)
+    if not max_workers:
+        return {zone: func(*args) for zone, args in zone_args.items()}
+
+    print(f"[INFO] {len(zone_args)}개 구역을 {max_workers}개 프로세스로 병렬 처리")
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {zone: executor.submit(func, *args) for zone, args in zone_args.items()}
+        return {zone: future.result() for zone, future in futures.items()}
+
+
+def iter_batches(records, batch_size=RESULT_BATCH_SIZE, max_seconds=RESULT_BATCH_SECONDS):
+    """기록을 batch_size 건씩 묶은 목록으로 반환합니다.
+
+    기록이 드문드문 나오더라도 마지막으로 넘겨준 뒤 max_seconds 가 지나면 모인 만큼 넘겨줍니다.
+    """
+    batch = []
+    flushed_at = time_module.monotonic()
+    for record in records:
+        batch.append(record)
+        now = time_module.monotonic()
+        if len(batch) >= batch_size or now - flushed_at >= max_seconds:
+            yield batch
+            batch = []
+            flushed_at = now
+    if batch:
+        yield batch
+
+
+class OvertimeAnalysisEngine:
+    """경비 기록과 초과근무 기록을 비교하여 의심스러운 초과근무 기록을 찾습니다.
+
+    start_date, end_date 는 "yyyy-MM-dd" 형식 문자열이며, 분석 중 발견된 확인 필요 데이터는
+    분류별 건수와 샘플로 diagnostics(AnalysisDiagnostics)에 저장됩니다. 엔진은 분석 1회마다
+    새로 만들어 사용합니다.
+    모드/휴일여부 키워드 분류는 rule_tables(기본값: 분류 규칙 설정 파일)를, 휴일 판단은
+    holiday_source(HOLIDAY_SOURCES 중 하나)와 공휴일 달력을 따릅니다.
+    """
+
+    def __init__(
+        self,
+        start_date=None,
+        end_date=None,
+        max_workers=None,
+        rule_tables=None,
+        holiday_source="both",
+        holiday_calendar=None,
+        diagnostics=None,
+        dedupe_seconds=DEFAULT_DEDUPE_SECONDS,
+    ):
+        if holiday_source not in HOLIDAY_SOURCES:
+            raise ValueError(f"지원하지 않는 휴일 판단 기준입니다: {holiday_source}")
+        self.start_date = start_date
+        self.end_date = end_date
+        self.max_workers = max_workers
+        self.rule_tables = rule_tables or get_rule_tables()
+        self.holiday_source = holiday_source
+        self.holiday_calendar = holiday_calendar or get_holiday_calendar()
+        # 같은 업무일에 반복된 같은 경비 상태 전환을 합칠 간격(초), None 이면 합치지 않음
+        self.dedupe_seconds = dedupe_seconds
+        # 경비 데이터 불명확 업무일, 시간 누락/오류/경비 기록 없음/휴일 불일치 초과근무 기록
+        self.diagnostics = diagnostics if diagnostics is not None else AnalysisDiagnostics()
+        # 마지막 분석의 구역별 업무일 경비 상태 (분석 세션 저장용)
+        self.security_by_zone = {}
+        # 마지막 분석의 직원별 초과근무/경비 설정 타임라인 색인 (직원별 상세 보기용)
+        self.employee_index = None
+
+    # 경비/초과근무 기록 전체 분석 (메인 메서드)
+    def analyze(self, security_df, overtime_df, zone_mapping=None):
+        """두 기록을 분석하여 의심스러운 초과근무 기록 목록을 반환합니다.
+
+        경비 기록에 구역 컬럼이 있으면 구역별로 경비 상태를 따로 계산하고, zone_mapping 으로
+        직원/부서에 배정된 구역의 경비 상태와 비교합니다.
+        """
+        return [
+            record
+            for batch in self.iter_analyze(security_df, overtime_df, zone_mapping)
+            for record in batch
+        ]
+
+    def iter_analyze(
+        self, security_df, overtime_df, zone_mapping=None, batch_size=RESULT_BATCH_SIZE
+    ):
+        """analyze 와 같은 결과를, 의심 기록을 찾는 대로 batch_size 건 이하의 목록으로 나누어 반환합니다."""
+        overtime_records = self.process_overtime_log(overtime_df)
+        records_by_zone = self.assign_zones(overtime_records, zone_mapping)
+        security_by_zone = self.process_security_log_by_zone(security_df, set(records_by_zone))
+        yield from iter_batches(
+            self.iter_compare_by_zone(security_by_zone, records_by_zone, len(security_df)),
+            batch_size,
+        )
+
+    # 대용량 경비 기록 파일을 청크 단위로 읽어 분석
+    def analyze_streaming(
+        self,
+        security_file_path,
+        overtime_df,
+        zone_mapping=None,
+        memory_budget_mb=DEFAULT_MEMORY_BUDGET_MB,
+    ):
+        """경비 기록 파일 전체를 로드하지 않고 업무일별 경비 상태만 누적하여 분석합니다."""
+        return [
+            record
+            for batch in self.iter_analyze_streaming(
+                security_file_path, overtime_df, zone_mapping, memory_budget_mb
+            )
+            for record in batch
+        ]
+
+    def iter_analyze_streaming(
+        self,
+        security_file_path,
+        overtime_df,
+        zone_mapping=None,
+        memory_budget_mb=DEFAULT_MEMORY_BUDGET_MB,
+        batch_size=RESULT_BATCH_SIZE,
+    ):
+        """analyze_streaming 과 같은 결과를, 의심 기록을 찾는 대로 목록으로 나누어 반환합니다."""
+        overtime_records = self.process_overtime_log(overtime_df)
+        records_by_zone = self.assign_zones(overtime_records, zone_mapping)
+        security_by_zone, row_count = self.stream_security_log_by_zone(
+            security_file_path, set(records_by_zone), memory_budget_mb
+        )
+        yield from iter_batches(
+            self.iter_compare_by_zone(security_by_zone, records_by_zone, row_count),
+            batch_size,
+        )
+
+    def stream_security_log_by_zone(
+        self, security_file_path, zones, memory_budget_mb=DEFAULT_MEMORY_BUDGET_MB
+    ):
+        """경비 기록 파일을 청크 단위로 읽어 ({구역: 업무일별 경비 상태}, 읽은 행 수) 를 반환합니다."""
+        chunk_rows = chunk_rows_for_budget(memory_budget_mb)
+        print(
+            f"[INFO] 경비 기록 스트리밍 처리 시작 (청크: {chunk_rows}행, 기준: {memory_budget_mb}MB)"
+        )
+        builder = SecurityStateBuilder(
+            self.start_date, self.end_date, self.rule_tables, self.dedupe_seconds
+        )
+        for chunk in iter_security_chunks(security_file_path, chunk_rows):
+            builder.add_chunk(chunk)
+
+        security_by_zone = {}
+        for zone in zones:
+            security_status_by_day, unclear_security_days = builder.finalize(zone)
+            security_by_zone[zone] = security_status_by_day
+            self.diagnostics.extend(
+                "unclear_security_days",
+                self._tag_zone(unclear_security_days, zone, builder.has_zones),
+            )
+        print(f"[INFO] 경비 기록 스트리밍 처리 완료: {builder.row_count}행")
+        return security_by_zone, builder.row_count
+
+    # 비교 없이 직원별 타임라인 색인만 생성 (캐시된 결과나 세션을 열었을 때 직원별 상세 보기용)
+    def build_employee_index(
+        self,
+        overtime_df,
+        security_df=None,
+        zone_mapping=None,
+        security_by_zone=None,
+        security_stream_path=None,
+        memory_budget_mb=DEFAULT_MEMORY_BUDGET_MB,
+    ):
+        """security_by_zone(구역별 업무일 경비 상태)이 없으면 security_df 로 계산하여 색인을 만듭니다.
+
+        security_df 대신 security_stream_path 를 주면 경비 기록 파일을 스트리밍 모드로 읽어 계산합니다.
+        """
+        overtime_records = self.process_overtime_log(overtime_df)
+        records_by_zone = self.assign_zones(overtime_records, zone_mapping)
+        if security_by_zone is None and security_stream_path is not None:
+            security_by_zone, _ = self.stream_security_log_by_zone(
+                security_stream_path, set(records_by_zone), memory_budget_mb
+            )
+        elif security_by_zone is None:
+            security_by_zone = self.process_security_log_by_zone(security_df, set(records_by_zone))
+        self.employee_index = EmployeeTimelineIndex.build(security_by_zone, records_by_zone)
+        return self.employee_index
+
+    # 초과근무 기록을 직원/부서에 배정된 구역별로 분류
+    def assign_zones(self, overtime_records, zone_mapping=None):
+        """{구역: 초과근무 기록 목록} 을 반환합니다. 구역이 배정되지 않은 기록은 ALL_ZONES 입니다."""
+        records_by_zone = {}
+        for record in overtime_records:
+            zone = ALL_ZONES
+            if zone_mapping is not None:
+                zone = zone_mapping.zone_for(record["직원명"], record.get("부서명", ""))
+            records_by_zone.setdefault(zone, []).append(record)
+
+        if zone_mapping is not None and ALL_ZONES in records_by_zone:
+            print(
+                f"[경고] 구역이 배정되지 않은 초과근무 기록 {len(records_by_zone[ALL_ZONES])}건은 "
+                "전체 구역의 경비 기록과 비교합니다."
+            )
+        return records_by_zone
+
+    # 경비 기록을 구역별로 나누어 날짜별 경비 상태 분석
+    def process_security_log_by_zone(self, df, zones=None):
+        """{구역: 업무일별 경비 상태} 를 반환합니다.
+
+        구역 컬럼이 없으면 전체 기록을 ALL_ZONES 하나로 처리합니다. zones 가 주어지면 해당 구역만
+        계산합니다 (ALL_ZONES 는 구역 구분 없이 합친 기록).
+        """
+        df = normalize_security_frame(df)
+        if "구역" not in df.columns:
+            return {ALL_ZONES: self.process_security_log(df)}
+
+        # 구역별 행 위치 (정규화된 기록의 구역 컬럼은 공백을 제거한 범주형)
+        zone_positions = df.groupby("구역", observed=True).indices
+        if zones is None:
+            zones = set(zone_positions) | {ALL_ZONES}
+
+        zone_args = {}
+        for zone in zones:
+            if zone == ALL_ZONES:
+                zone_df = df
+            else:
+                zone_df = df.take(zone_positions.get(zone, []))
+                if zone_df.empty:
+                    print(f"[경고] 경비 기록에 '{zone}' 구역 데이터가 없습니다.")
+            zone_args[zone] = (
+                self.start_date,
+                self.end_date,
+                self.rule_tables,
+                self.dedupe_seconds,
+                self.diagnostics.empty_copy(),
+                zone_df,
+            )
+
+        results = run_per_zone(_process_zone_security_log, zone_args, len(df), self.max_workers)
+
+        security_by_zone = {}
+        for zone, (security_status_by_day, zone_diagnostics) in results.items():
+            security_by_zone[zone] = security_status_by_day
+            # 작업별 저장소의 기록(샘플 한도를 넘은 건수 포함)을 구역 정보와 함께 가져온 뒤 삭제
+            self.diagnostics.merge(zone_diagnostics, lambda _, record: dict(record, 구역=zone))
+            zone_diagnostics.clear()
+        return security_by_zone
+
+    # 구역별 경비 상태와 초과근무 기록 비교
+    def compare_by_zone(self, security_by_zone, records_by_zone, total_rows=0):
+        """구역마다 compare_security_and_overtime 을 실행하고 결과를 합쳐 반환합니다."""
+        return list(self.iter_compare_by_zone(security_by_zone, records_by_zone, total_rows))
+
+    def iter_compare_by_zone(self, security_by_zone, records_by_zone, total_rows=0):
+        """compare_by_zone 과 같은 순서로 의심 기록을 하나씩 반환하는 제너레이터
+
+        순차 실행하면 기록을 찾는 즉시, 프로세스 풀로 병렬 실행하면 구역 하나가 끝날 때마다 반환합니다.
+        """
+        self.security_by_zone = security_by_zone
+        self.employee_index = EmployeeTimelineIndex.build(security_by_zone, records_by_zone)
+        max_workers = parallel_workers(len(records_by_zone), total_rows, self.max_workers)
+        if not max_workers:
+            for zone, records in records_by_zone.items():
+                zone_label = "" if zone == ALL_ZONES else zone
+                for record in self.iter_suspicious_records(security_by_zone.get(zone, {}), records):
+                    record["구역"] = zone_label
+                    yield record
+            return
+
+        print(f"[INFO] {len(records_by_zone)}개 구역을 {max_workers}개 프로세스로 병렬 처리")
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                zone: executor.submit(
+                    _compare_zone,
+                    self.start_date,
+                    self.end_date,
+                    self.rule_tables,
+                    self.diagnostics.empty_copy(),
+                    security_by_zone.get(zone, {}),
+                    records,
+                )
+                for zone, records in records_by_zone.items()
+            }
+            for zone, future in futures.items():
+                zone_suspicious, zone_diagnostics = future.result()
+                self.diagnostics.merge(zone_diagnostics)
+                zone_diagnostics.clear()
+                zone_label = "" if zone == ALL_ZONES else zone
+                for record in zone_suspicious:
+                    record["구역"] = zone_label
+                    yield record
+
+    @staticmethod
+    def _employee_day_key(record):
+        # 직원키(개인식별번호 기반 정수)가 없는 기록은 직원명으로 구분
+        return record.get("직원키", record["직원명"]), record["업무일"]
+
+    @staticmethod
+    def _tag_zone(records, zone, has_zones):
+        # 구역 구분이 있는 경우에만 확인 필요 데이터에 구역 정보 추가
+        if not has_zones:
+            return records
+        return [dict(record, 구역=zone) for record in records]
+
+    # 경비 로그를 처리하여 날짜별 경비 상태 (설정/해제) 분석
+    def process_security_log(self, df):
+        """경비 기록을 처리하여 각 날짜별 경비 상태를 분석합니다."""
+        try:
+            # 불러올 때 정규화하지 않은 경비 기록이면 여기서 정규화 (발생일시 순 정렬, 업무일 계산)
+            # 정규화된 데이터프레임은 여러 번 분석해도 같은 결과가 나오도록 수정하지 않음
+            df = normalize_security_frame(df)
+
+            # 날짜 필터링 적용
+            start_date = self.start_date
+            end_date = self.end_date
+
+            filtered_df = df
+            if start_date and end_date:
+                filtered_df = df[(df["발생일자"] >= start_date) & (df["발생일자"] <= end_date)]
+
+            # 각 기록 유형 판단
+            record_types = self.rule_tables.security_mode.classify_series(filtered_df["모드"])
+            # 출입 기록을 재분류할 때 쓰는 라벨이 범주에 없으면 추가
+            record_types = record_types.cat.add_categories(
+                [
+                    label
+                    for label in ("경비해제", "기타")
+                    if label not in record_types.cat.categories
+                ]
+            )
+            # 기록유형 열만 새로 만들고 나머지 열은 정규화된 데이터프레임과 공유
+            filtered_df_slim = filtered_df.assign(기록유형=record_types)
+
+            # 출입(불명확) 기록 처리
+            # 컨텍스트를 바탕으로 출입 기록을 경비해제 또는 경비시작으로 재분류
+            # 업무일별 행 위치 (정규화된 기록은 이미 발생일시 순이므로 업무일 내에서도 시간순)
+            day_positions = {
+                business_day.date(): positions
+                for business_day, positions in filtered_df_slim.groupby(
+                    "업무일", sort=False
+                ).indices.items()
+            }
+            business_days = list(day_positions)
+
+            # 경비 데이터가 불명확한 업무일 기록
+            unclear_security_days = []
+
+            for business_day in business_days:
+                day_records = filtered_df_slim.iloc[day_positions[business_day]]
+                unclear_records = day_records[day_records["기록유형"] == "출입(불명확)"]
+                day_records_sorted = day_records
+
+                # 경비 해제/시작 기록 확인
+                has_release = any(
+                    record["기록유형"] == "경비해제" for _, record in day_records_sorted.iterrows()
+                )
+                has_start = any(
+                    record["기록유형"] == "경비시작" for _, record in day_records_sorted.iterrows()
+                )
+
+                if len(unclear_records) > 0:
+                    # 새로운 요구사항에 맞게 처리:
+                    # 1. 첫 기록이 '출입(불명확)'이면 '경비해제'로 간주
+                    # 2. 그 외 모든 '출입(불명확)' 기록은 무시
+
+                    # 첫 기록이 '출입(불명확)'이면 '경비해제'로 간주
+                    if day_records_sorted.iloc[0]["기록유형"] == "출입(불명확)":
+                        first_record_index = day_records_sorted.index[0]
+                        filtered_df_slim.loc[first_record_index, "기록유형"] = "경비해제"
+                        print(
+                            f"[경비판단] {business_day} - 첫 기록이 '출입'이므로 '경비해제'로 판단"
+                        )
+
+                    # 첫 번째가 아닌 모든 '출입(불명확)' 기록은 무시 (기타로 변경)
+                    for i, record in enumerate(day_records_sorted.iterrows()):
+                        if i == 0:  # 첫 번째 기록은 건너뛰기 (이미 처리됨)
+                            continue
+
+                        idx, row = record
+                        # 첫 번째가 아닌 모든 불명확 출입 기록은 '기타'로 처리 (무시)
+                        if row["기록유형"] == "출입(불명확)":
+                            filtered_df_slim.loc[idx, "기록유형"] = "기타"
+                            print(
+                                f"[출입무시] {business_day} - 첫 번째가 아닌 출입기록은 무시함 (시간: {row['시간_시']:02d}:{row['시간_분']:02d})"
+                            )
+
+                    # '출입(불명확)' 기록은 첫번째를 제외한 모든 기록이 '기타'로 처리되므로 검사 불필요
+
+                    # 마지막 기록이 확실한 경비시작이 아니면 확인 필요
+                    # (단, '기타'로 처리된 출입 기록은 무시)
+                    if (
+                        day_records_sorted.iloc[-1]["기록유형"] != "경비시작"
+                        and day_records_sorted.iloc[-1]["기록유형"] != "기타"
+                    ):
+                        last_record = day_records_sorted.iloc[-1]
+                        last_record_time = (
+                            f"{last_record['시간_시']:02d}:{last_record['시간_분']:02d}"
+                        )
+                        unclear_security_days.append(
+                            {
+                                "업무일": business_day,
+                                "마지막기록시간": last_record_time,
+                                "기록유형": last_record["기록유형"],
+                                "문제": "마지막 기록이 '경비시작'이 아님",
+                            }
+                        )
+                        print(
+                            f"[의심데이터] {business_day} - 마지막 기록이 '경비시작'이 아닙니다 (유형: {last_record['기록유형']}, 시간: {last_record_time})"
+                        )
+
+                # 명확한 경비 기록이 아예 없는 경우도 의심 데이터로 분류
+                if not has_release and not has_start and len(day_records) > 0:
+                    unclear_security_days.append(
+                        {
+                            "업무일": business_day,
+                            "기록수": len(day_records),
+                            "문제": "명확한 경비해제/시작 기록 없음",
+                        }
+                    )
+                    print(f"[의심데이터] {business_day} - 명확한 경비 기록 없음 (사용자 확인 필요)")
+
+            # 의심 기록 저장
+            self.diagnostics.extend("unclear_security_days", unclear_security_days)
+
+            # 각 업무일별 경비 상태 시간 분석 (경비해제/경비시작 기록만 시간순으로 모음)
+            state_df = filtered_df_slim[filtered_df_slim["기록유형"].isin(list(STATE_LABELS))]
+            states = state_df["기록유형"].astype(str).map(STATE_LABELS)
+            if self.dedupe_seconds is not None:
+                # 같은 업무일에 바로 앞 전환과 같은 상태로 반복된 전환은 하나로 합침
+                repeated = repeated_state_mask(
+                    state_df["업무일"], states, state_df["발생일시"], self.dedupe_seconds
+                )
+                if repeated.any():
+                    print(f"[INFO] 반복된 경비 상태 기록 {int(repeated.sum())}건을 합쳤습니다.")
+                    state_df, states = state_df[~repeated], states[~repeated]
+            times = (
+                state_df["발생일자"].dt.strftime("%Y-%m-%d")
+                + " "
+                + state_df["시간_시"].astype(str).str.zfill(2)
+                + ":"
+                + state_df["시간_분"].astype(str).str.zfill(2)
+            )
+
+            # 업무일별 경비 상태 저장 (전환 기록이 없는 업무일은 빈 목록)
+            security_status_by_day = {business_day: [] for business_day in business_days}
+            for business_day, time_str, status in zip(state_df["업무일"], times, states):
+                security_status_by_day[business_day.date()].append(
+                    {"시간": time_str, "상태": status}
+                )
+
+            return security_status_by_day
+
+        except Exception as e:
+            # 예외 발생 시 상세 정보 출력하고 다시 발생
+            import traceback
+
+            print(f"경비 기록 처리 중 오류: {str(e)}")
+            print(traceback.format_exc())
+            raise
+
+    def process_overtime_log(self, df):
+        """초과근무 기록을 처리합니다."""
+        try:
+            # 파일이 이미 header=0로 로드되었으므로 별도의 헤더 감지 로직은 필요 없음
+            print("[INFO] 헤더가 설정된 상태로 초과근무 기록 처리 시작")
+
+            # 불러올 때 정규화하지 않은 기록이면 여기서 열 위치 기준으로 컬럼 이름을 표준화하고
+            # 초과근무일자를 변환 (정규화된 데이터프레임은 수정하지 않음)
+            df = normalize_overtime_frame(df)
+
+            # 표준화된 컬럼 매핑 (데이터 처리에 필요한 핵심 필드 접근용)
+            col_mapping = {
+                "날짜": "초과근무일자",
+                "시작시간": "출근시간",
+                "종료시간": "퇴근시간",
+                "이름": "성명",
+            }
+
+            # 날짜 필터링 적용
+            start_date = self.start_date
+            end_date = self.end_date
+
+            def parse_time(time_value, default_time):
+                """시간 값을 파싱하여 time 객체로 반환합니다."""
+                if pd.isna(time_value):
+                    return default_time
+
+                try:
+                    if isinstance(time_value, str):
+                        time_str = time_value.strip()
+                        parts = time_str.split(":")
+                        if len(parts) >= 2:
+                            hour = int(parts[0])
+                            minute = int(parts[1])
+                            return time(hour, minute)
+                        else:
+                            print(f"시간 형식 오류 (HH:mm 형식이 아님): {time_str}")
+                            return default_time
+                    elif isinstance(time_value, datetime):
+                        return time_value.time()
+                    elif isinstance(time_value, time):
+                        return time_value
+                    else:
+                        print(f"지원하지 않는 시간 형식: {type(time_value)}")
+                        return default_time
+                except Exception as e:
+                    print(f"시간 파싱 오류: {str(e)}")
+                    return default_time
+
+            # 시간 데이터 유효성 검사
+            # 시간 형식 검사 함수 (HH:mm 형식 고정)
+            def is_valid_time_format(time_str):
+                if not isinstance(time_str, str):
+                    return False
+                try:
+                    # HH:mm 형식 검사
+                    parts = time_str.strip().split(":")
+                    if len(parts) != 2:
+                        return False
+                    hour, minute = int(parts[0]), int(parts[1])
+                    return 0 <= hour < 24 and 0 <= minute < 60
+                except:
+                    return False
+
+            # 데이터가 유효하고 (이름/날짜/출퇴근시간 존재) 분석 기간에 속하는 행만 한 번에 선택
+            valid = (
+                pd.notna(df[col_mapping["이름"]])
+                & pd.notna(df[col_mapping["날짜"]])
+                & pd.notna(df[col_mapping["시작시간"]])
+                & pd.notna(df[col_mapping["종료시간"]])
+                & pd.notna(df["날짜_datetime"])
+            )
+            if start_date and end_date:
+                valid &= (df["날짜_datetime"] >= start_date) & (df["날짜_datetime"] <= end_date)
+            filtered_df = df[valid]
+
+            # 직원별 정수 키 (개인식별번호, 없으면 직원명 기준) - 직원별 색인/그룹화에 사용
+            if "개인식별번호" in filtered_df.columns:
+                key_codes, _ = employee_keys(
+                    filtered_df["개인식별번호"], filtered_df[col_mapping["이름"]]
+                )
+            else:
+                key_codes, _ = employee_keys(
+                    pd.Series(pd.NA, index=filtered_df.index), filtered_df[col_mapping["이름"]]
+                )
+            employee_key_by_row = pd.Series(key_codes, index=filtered_df.index)
+
+            # 휴일여부(F열) 분류 - 고유값만 규칙 테이블로 분류한 뒤 전체 행에 적용
+            holiday_labels = None
+            if "휴일여부" in df.columns:
+                holiday_labels = self.rule_tables.holiday.classify_series(filtered_df["휴일여부"])
+
+            # 공휴일 달력 조회 (초과근무일자 -> 휴일 여부 배열 조회)
+            calendar_flags = self.holiday_calendar.is_holiday(filtered_df["날짜_datetime"])
+            uncovered_years = self.holiday_calendar.uncovered_years(filtered_df["날짜_datetime"])
+            if uncovered_years:
+                print(
+                    f"[경고] 공휴일 달력에 {uncovered_years}년 데이터가 없어 주말만 휴일로 판단합니다."
+                )
+
+            # 초과근무 데이터 정리
+            overtime_records = []
+
+            # 정규 근무시간 설정 (9:00-18:00)
+            regular_start = time(9, 0)
+            regular_end = time(18, 0)
+
+            for row_index, row in filtered_df.iterrows():
+                try:
+                    # 날짜 처리
+                    work_date = row["날짜_datetime"].date()
+
+                    # 출/퇴근 시간 누락 여부 플래그
+                    has_missing_time = False
+                    missing_time_fields = []
+
+                    # 출근시간 처리 (HH:mm 고정 형식)
+                    if pd.isna(row[col_mapping["시작시간"]]):
+                        has_missing_time = True
+                        missing_time_fields.append("출근시간")
+
+                    start_time = parse_time(row[col_mapping["시작시간"]], regular_start)
+
+                    if start_time is None:
+                        # 시작 시간이 없거나 파싱 실패
+                        has_missing_time = True
+                        missing_time_fields.append("출근시간")
+                        start_time = regular_start  # 일단 기본값 설정 (나중에 의심 데이터로 표시)
+
+                    # 퇴근시간 처리 (HH:mm 고정 형식)
+                    if pd.isna(row[col_mapping["종료시간"]]):
+                        has_missing_time = True
+                        missing_time_fields.append("퇴근시간")
+
+                    end_time = parse_time(row[col_mapping["종료시간"]], regular_end)
+
+                    if end_time is None:
+                        # 종료 시간이 없거나 파싱 실패
+                        has_missing_time = True
+                        missing_time_fields.append("퇴근시간")
+                        end_time = regular_end  # 일단 기본값 설정 (나중에 의심 데이터로 표시)
+
+                    # 업무일 결정 (새벽 4시 기준)
+                    business_date = work_date
+
+                    # 자정 이후 새벽 4시 이전 근무는 전날 업무일로 계산
+                    # (출근일 저녁에 시작해 자정을 넘긴 근무는 출근일 업무일 그대로)
+                    if end_time < time(4, 0) and start_time <= end_time:
+                        business_date = work_date - timedelta(days=1)
+
+                    # 휴일 여부 확인 (공휴일 달력 + F열 휴일여부)
+                    calendar_holiday = bool(calendar_flags[row_index])
+                    column_holiday = None
+                    if holiday_labels is not None and pd.notna(row["휴일여부"]):
+                        # 휴일 규칙 키워드("Y", "휴일", "공휴일", "토요일", "일요일" 등)가 포함되어 있으면 휴일로 판단
+                        column_holiday = self.rule_tables.is_holiday_label(
+                            holiday_labels[row_index]
+                        )
+
+                    if self.holiday_source == "column":
+                        # F열 데이터가 없거나 누락된 경우 기본값은 평일(False)로 설정
+                        is_holiday = bool(column_holiday)
+                    elif self.holiday_source == "calendar":
+                        is_holiday = calendar_holiday
+                    else:
+                        is_holiday = calendar_holiday or bool(column_holiday)
+
+                    # 달력과 F열의 휴일 판단이 다르면 확인 필요 데이터로 기록
+                    if column_holiday is not None and column_holiday != calendar_holiday:
+                        calendar_name = self.holiday_calendar.holiday_name(work_date) or "평일"
+                        self.diagnostics.add(
+                            "holiday_mismatch_records",
+                            {
+                                "날짜": work_date,
+                                "직원명": str(row[col_mapping["이름"]]),
+                                "F열데이터": str(row["휴일여부"]),
+                                "달력": calendar_name,
+                                "문제": (
+                                    "달력은 휴일이지만 F열은 평일"
+                                    if calendar_holiday
+                                    else "F열은 휴일이지만 달력은 평일"
+                                ),
+                            },
+                        )
+                        print(
+                            f"[휴일불일치] 날짜: {work_date}, 달력: {calendar_name}, F열 데이터: '{row['휴일여부']}'"
+                        )
+
+                    # 디버그 정보 출력
+                    if is_holiday:
+                        print(
+                            f"[휴일처리] {business_date} - {row.get('성명', '이름없음')} - 휴일로 처리됨"
+                        )
+
+                    # 초과근무 여부 확인
+                    # 휴일인 경우: 모든 시간이 초과근무 시간
+                    # 평일인 경우: 시작 시간이 18시 이후이거나 종료 시간이 9시 이전인 경우만 초과근무
+                    is_overtime = is_holiday or (
+                        start_time >= regular_end or end_time <= regular_start
+                    )
+
+                    # 직원 이름 정보
+                    employee_name = (
+                        str(row[col_mapping["이름"]])
+                        if pd.notna(row[col_mapping["이름"]])
+                        else "Unknown"
+                    )
+                    employee_key = int(employee_key_by_row[row_index])
+                    # 부서명 정보 추가 (있는 경우)
+                    department = (
+                        str(row["부서명"]) if "부서명" in row and pd.notna(row["부서명"]) else ""
+                    )  # 초과근무시간 정보 (있는 경우 사용)
+                    overtime_hours = None
+                    if "초과근무시간" in df.columns and pd.notna(row["초과근무시간"]):
+                        try:
+                            # 문자열이면 숫자로 변환 시도
+                            if isinstance(row["초과근무시간"], str):
+                                # 콤마, 공백 등 제거하고 숫자 변환
+                                clean_str = row["초과근무시간"].replace(",", "").strip()
+                                overtime_hours = float(clean_str)
+                            else:
+                                overtime_hours = float(row["초과근무시간"])
+                        except:
+                            print(f"초과근무시간 변환 실패: {row['초과근무시간']}")
+                            pass
+
+                    # 추가 정보 (근무내용)
+                    work_description = ""
+                    if "근무내용" in df.columns and pd.notna(row["근무내용"]):
+                        work_description = str(row["근무내용"]).strip()
+
+                    # 휴일인 경우 모든 시간을 초과근무로 처리
+                    if is_holiday:
+                        # 휴일 근무는 전체가 초과근무
+                        overtime_start = start_time
+                        overtime_end = end_time
+
+                        overtime_records.append(
+                            {
+                                "업무일": business_date,
+                                "날짜": work_date,
+                                "시작시간": overtime_start,
+                                "종료시간": overtime_end,
+                                "초과근무유형": "휴일근무",
+                                "직원명": employee_name,
+                                "직원키": employee_key,
+                                "부서명": department,
+                                "기록된_초과근무시간": overtime_hours,
+                                "근무내용": work_description,
+                                "휴일여부": True,
+                            }
+                        )
+                    # 평일인 경우 정규 근무시간(9-18)을 제외한 시간만 초과근무로 처리
+                    else:
+                        # 업무 시간이 정규 근무시간(9-18)에 걸쳐있는 경우, 그 부분은 초과근무가 아님
+                        if not is_overtime and (
+                            start_time < regular_end and end_time > regular_start
+                        ):
+                            # 시작 시간이 9시 이전이면 초과근무 시작 부분 기록
+                            if start_time < regular_start:
+                                overtime_start = start_time
+                                overtime_end = regular_start
+
+                                overtime_records.append(
+                                    {
+                                        "업무일": business_date,
+                                        "날짜": work_date,
+                                        "시작시간": overtime_start,
+                                        "종료시간": overtime_end,
+                                        "초과근무유형": "조기출근",
+                                        "직원명": employee_name,
+                                        "직원키": employee_key,
+                                        "부서명": department,
+                                        "기록된_초과근무시간": overtime_hours,
+                                        "근무내용": work_description,
+                                        "휴일여부": False,
+                                    }
+                                )
+
+                            # 종료 시간이 18시 이후면 초과근무 종료 부분 기록
+                            if end_time > regular_end:
+                                overtime_start = regular_end
+                                overtime_end = end_time
+
+                                overtime_records.append(
+                                    {
+                                        "업무일": business_date,
+                                        "날짜": work_date,
+                                        "시작시간": overtime_start,
+                                        "종료시간": overtime_end,
+                                        "초과근무유형": "야근",
+                                        "직원명": employee_name,
+                                        "직원키": employee_key,
+                                        "부서명": department,
+                                        "기록된_초과근무시간": overtime_hours,
+                                        "근무내용": work_description,
+                                        "휴일여부": False,
+                                    }
+                                )
+                        elif is_overtime:
+                            # 전체가 초과근무인 경우
+                            overtime_start = start_time
+                            overtime_end = end_time
+
+                            # 시간대에 따른 초과근무 유형 결정
+                            if overtime_start < regular_start:
+                                overtime_type = "조기출근"
+                            else:
+                                overtime_type = "야근"
+
+                            overtime_records.append(
+                                {
+                                    "업무일": business_date,
+                                    "날짜": work_date,
+                                    "시작시간": overtime_start,
+                                    "종료시간": overtime_end,
+                                    "초과근무유형": overtime_type,
+                                    "직원명": employee_name,
+                                    "직원키": employee_key,
+                                    "부서명": department,
+                                    "기록된_초과근무시간": overtime_hours,
+                                    "근무내용": work_description,
+                                    "휴일여부": False,
+                                }
+                            )
+
+                except Exception as e:
+                    print(f"초과근무 기록 처리 중 오류: {str(e)}")
+                    error_desc = str(e)
+                    # 오류 발생 데이터 저장
+                    error_record = {
+                        "업무일": (
+                            business_date
+                            if "business_date" in locals()
+                            else work_date if "work_date" in locals() else "알 수 없음"
+                        ),
+                        "직원명": (
+                            employee_name
+                            if "employee_name" in locals()
+                            else row.get(col_mapping["이름"], "알 수 없음")
+                        ),
+                        "오류내용": error_desc,
+                        "원본데이터": {
+                            k: str(v)
+                            for k, v in row.items()
+                            if k
+                            in [
+                                col_mapping["날짜"],
+                                col_mapping["시작시간"],
+                                col_mapping["종료시간"],
+                                col_mapping["이름"],
+                                "부서명",
+                                "근무내용",
+                            ]
+                        },
+                    }
+
+                    # 오류 데이터 목록에 추가
+                    self.diagnostics.add("error_records", error_record)
+                    continue
+
+            # 누락된 시간 정보가 있는 데이터 검사 및 의심 데이터로 추가
+            missing_time_records = []
+            for record in filtered_df.iterrows():
+                row = record[1]
+                if pd.isna(row[col_mapping["시작시간"]]) or pd.isna(row[col_mapping["종료시간"]]):
+                    work_date = (
+                        row["날짜_datetime"].date() if pd.notna(row["날짜_datetime"]) else None
+                    )
+                    employee_name = (
+                        str(row[col_mapping["이름"]])
+                        if pd.notna(row[col_mapping["이름"]])
+                        else "Unknown"
+                    )
+                    department = (
+                        str(row["부서명"]) if "부서명" in row and pd.notna(row["부서명"]) else ""
+                    )
+
+                    missing_fields = []
+                    if pd.isna(row[col_mapping["시작시간"]]):
+                        missing_fields.append("출근시간")
+                    if pd.isna(row[col_mapping["종료시간"]]):
+                        missing_fields.append("퇴근시간")
+
+                    missing_time_records.append(
+                        {
+                            "업무일": work_date,
+                            "직원명": employee_name,
+                            "부서명": department,
+                            "누락필드": ", ".join(missing_fields),
+                            "원본데이터": {
+                                k: str(v)
+                                for k, v in row.items()
+                                if k
+                                in [
+                                    col_mapping["날짜"],
+                                    col_mapping["시작시간"],
+                                    col_mapping["종료시간"],
+                                    col_mapping["이름"],
+                                    "부서명",
+                                    "근무내용",
+                                ]
+                            },
+                        }
+                    )
+
+            # 시간 누락 기록 저장
+            self.diagnostics.extend("missing_time_records", missing_time_records)
+            if missing_time_records:
+                print(
+                    f"[주의] {len(missing_time_records)}개의 출/퇴근 시간 누락 기록이 발견되었습니다."
+                )
+
+            return overtime_records
+
+        except Exception as e:
+            # 예외 발생 시 상세 정보 출력하고 다시 발생
+            import traceback
+
+            print(f"초과근무 기록 처리 중 오류: {str(e)}")
+            print(traceback.format_exc())
+            raise
+
+    def compare_security_and_overtime(self, security_status_by_day, overtime_records):
+        """경비 상태와 초과근무 기록을 비교 분석하여 의심스러운 기록을 찾습니다."""
+        return list(self.iter_suspicious_records(security_status_by_day, overtime_records))
+
+    def iter_suspicious_records(self, security_status_by_day, overtime_records):
+        """compare_security_and_overtime 과 같은 의심 기록을 찾는 대로 하나씩 반환하는 제너레이터"""
+        # 분석 기간 전체의 경비 설정/해제 전환을 하나의 타임라인으로 한 번만 구성
+        timeline = ArmedTimeline.from_status_by_day(security_status_by_day)
+
+        # 직원(정수 키)/업무일별 첫 초과근무 기록 색인 (부서명/근무내용/휴일여부 조회용)
+        first_record_by_employee_day = {}
+        for record in overtime_records:
+            first_record_by_employee_day.setdefault(self._employee_day_key(record), record)
+
+        # 각 초과근무 기록에 대해 경비 상태 확인
+        for overtime in overtime_records:
+            business_date = overtime["업무일"]
+            employee_name = overtime["직원명"]
+            overtime_start = overtime["시작시간"]
+            overtime_end = overtime["종료시간"]
+
+            # 업무일에 해당하는 경비 기록 찾기
+            security_status = security_status_by_day.get(business_date, [])
+
+            if not security_status:
+                # 해당 업무일의 경비 기록이 없는 경우 의심 데이터로 저장
+                self.diagnostics.add(
+                    "no_security_records",
+                    {
+                        "업무일": business_date,
+                        "직원명": employee_name,
+                        "초과근무시간": f"{overtime_start.strftime('%H:%M')}-{overtime_end.strftime('%H:%M')}",
+                        "문제": "경비 기록 없음",
+                    },
+                )
+                print(
+                    f"[의심데이터] {business_date} - {employee_name} - 경비 기록 없음 (사용자 확인 필요)"
+                )
+                # 경비 기록이 없어도 의심 데이터로 추가
+                suspicious_reason = "해당 업무일에 경비 기록 없음"
+
+                # 초과근무 기록에서 추가 정보 수집 (같은 직원/업무일의 첫 기록)
+                first_record = first_record_by_employee_day[self._employee_day_key(overtime)]
+                department = first_record.get("부서명") or ""
+                work_content = first_record.get("근무내용") or ""
+                is_holiday = first_record.get("휴일여부", False)
+
+                yield {
+                    "날짜": business_date,
+                    "직원명": employee_name,
+                    "부서명": department,
+                    "초과근무시간": f"{overtime_start.strftime('%H:%M')}-{overtime_end.strftime('%H:%M')}",
+                    "경비상태": "기록 없음",
+                    "의심사유": suspicious_reason,
+                    "의심시간": 0.0,  # 경비 설정 구간과 겹친 시간이 아니므로 0
+                    "근무내용": work_content,
+                    "휴일여부": "휴일" if is_holiday else "평일",
+                }
+                continue
+
+            # 초과근무 시간을 datetime으로 변환 (자정을 넘어가는 경우 종료는 다음날)
+            overtime_start_dt, overtime_end_dt = overtime_interval(overtime)
+
+            # 초과근무 시간과 경비 설정 구간이 겹치는 의심 구간 계산 (업무일/자정 경계와 무관)
+            suspicious_intervals = timeline.armed_intervals(overtime_start_dt, overtime_end_dt)
+            for overlap_start, overlap_end in suspicious_intervals:
+                print(
+                    f"[의심기록] {business_date} - {employee_name} - 경비 작동 중 초과근무 발생({overlap_start.strftime('%H:%M:%S')}-{overlap_end.strftime('%H:%M:%S')})"
+                )
+
+            # 모든 의심 구간에 대해 총 중첩 시간 계산
+            total_suspicious_hours = 0
+            suspicious_periods = []
+
+            for start_time, end_time in suspicious_intervals:
+                if start_time < end_time:  # 유효한 구간만 처리
+                    duration_hours = (end_time - start_time).seconds / 3600
+                    if duration_hours > 0:  # 1분이라도 중첩되면 의심 구간으로 간주
+                        total_suspicious_hours += duration_hours
+                        start_str = start_time.strftime("%H:%M")
+                        end_str = end_time.strftime("%H:%M")
+                        suspicious_periods.append(f"{start_str}-{end_str}")
+
+            # 의심 시간이 있으면 기록
+            if total_suspicious_hours > 0:  # 1분이라도 의심 시간이 있으면 기록
+                period_str = ", ".join(suspicious_periods)
+                suspicious_reason = f"경비 작동 중 총 {total_suspicious_hours:.1f}시간 초과근무 기록 존재 ({period_str})"
+
+                # 디버그 정보: 의심 세부 정보
+                print(f"[의심결과] {business_date} - {employee_name}")
+                print(
+                    f"  ├─ 초과근무: {overtime_start_dt.strftime('%H:%M')}-{overtime_end_dt.strftime('%H:%M')}"
+                )
+                print(f"  ├─ 의심구간: {period_str}")
+                print(f"  └─ 총 의심시간: {total_suspicious_hours:.2f}시간")
+
+                # 해당 직원의 같은 업무일 첫 초과근무 기록에서 부가 정보/휴일 여부 찾기
+                first_record = first_record_by_employee_day[self._employee_day_key(overtime)]
+                department = first_record.get("부서명") or ""
+                work_content = first_record.get("근무내용") or ""
+                is_holiday = first_record.get("휴일여부", False)
+
+                # 휴일 여부에 따라 의심 사유 보완
+                if is_holiday:
+                    suspicious_reason += " (휴일 근무)"
+
+                # 결과에 추가할 의심 정보 준비
+                security_info = "경비 작동 중"
+
+                # 경비 설정 시간 정보가 있으면 포함
+                security_set_times = [
+                    set_time.strftime("%H:%M:%S")
+                    for set_time in timeline.set_times_between(overtime_start_dt, overtime_end_dt)
+                ]
+
+                if security_set_times:
+                    security_info += f" (경비설정시각: {', '.join(security_set_times)})"
+
+                yield {
+                    "날짜": business_date,
+                    "직원명": employee_name,
+                    "부서명": department,
+                    "초과근무시간": f"{overtime_start.strftime('%H:%M')}-{overtime_end.strftime('%H:%M')}",
+                    "경비상태": security_info,
+                    "의심사유": suspicious_reason,
+                    "의심시간": total_suspicious_hours,  # 집계/필터용 숫자 값 (시간)
+                    "근무내용": work_content,
+                    "휴일여부": "휴일" if is_holiday else "평일",
+                }
@@ -1,3 +1,4 @@
+import multiprocessing
 import sys
 import pandas as pd
 import traceback
@@ -10,6 +11,7 @@ from PyQt5.QtWidgets import (
     QPushButton,
     QLabel,
     QFileDialog,
+    QTableView,
     QTableWidget,
     QTableWidgetItem,
     QHeaderView,
@@ -18,10 +20,42 @@ from PyQt5.QtWidgets import (
     QGroupBox,
     QDateEdit,
     QInputDialog,
+    QSpinBox,
+    QComboBox,
+    QTabWidget,
+    QLineEdit,
+    QCheckBox,
+    QDoubleSpinBox,
+    QCompleter,
+    QDialog,
 )
 from PyQt5.QtCore import Qt, QDate
 import os
 
+from analysis_diagnostics import DIAGNOSTIC_CATEGORIES, AnalysisDiagnostics
+from analysis_worker import AnalysisWorker
+from analyzer_engine import OvertimeAnalysisEngine
+from employee_panel import EmployeeTimelinePanel
+from frame_dtypes import normalize_overtime_frame, normalize_security_frame
+from input_preview import DEFAULT_PREVIEW_ROWS, PREVIEW_FUNCTIONS
+from input_readers import FILE_DIALOG_FILTER, read_input_file
+from preview_dialog import InputPreviewDialog
+from report_export import analysis_summary, export_analysis_workbook
+from result_cache import ResultCache, analysis_cache_key
+from result_model import FrameTableModel, SuspiciousRecordModel
+from result_summary import SUMMARY_GROUPS, summary_tables
+from security_log import DEFAULT_DEDUPE_SECONDS, DEFAULT_MEMORY_BUDGET_MB, should_stream
+from session_store import (
+    SESSION_DIALOG_FILTER,
+    SESSION_EXTENSION,
+    AnalysisSession,
+    load_session,
+    save_session,
+)
+from timeline_data import TimelineData
+from timeline_view import TimelineView
+from zone_mapping import load_zone_mapping
+
 
 class OvertimeAnalyzer(QMainWindow):
 
@@ -32,7 +66,23 @@ class OvertimeAnalyzer(QMainWindow):
         self.setGeometry(100, 100, 1200, 700)
         self.security_df = None  # 경비 기록 데이터프레임
         self.overtime_df = None  # 초과근무 기록 데이터프레임
+        self.security_stream_path = None  # 스트리밍 모드로 처리할 대용량 경비 기록 파일 경로
+        self.zone_mapping = None  # 직원/부서별 경비 구역 매핑 (선택)
+        # 분석 결과 캐시 키 계산에 사용하는 입력 파일 경로
+        self.security_path = None
+        self.overtime_path = None
+        self.zone_path = None
+        self.result_cache = ResultCache()
         self.suspicious_records = []
+        # 확인이 필요한 데이터 (분석할 때마다 비우고 다시 채움)
+        self.diagnostics = AnalysisDiagnostics(spill=True)
+        self.analysis_summary = None  # 전체 분석 자료 내보내기의 요약 시트 내용
+        self.security_by_zone = {}  # 마지막 분석의 구역별 업무일 경비 상태 (세션 저장용)
+        self.analysis_worker = None  # 실행 중인 분석 작업자 (분석 스레드)
+        # 직원별 상세 보기 색인을 처음 볼 때 만드는 함수 (캐시된 결과/세션을 연 경우)
+        self.employee_index_builder = None
+        self.timeline_index = None  # 타임라인에 표시 중인 직원별 색인
+        self.summary_tables = None  # 부서별/직원별 월간 요약 (요약 탭을 처음 볼 때 계산)
         self.init_ui()
 
     # GUI의 레이아웃과 위젯 구성
@@ -43,7 +93,7 @@ class OvertimeAnalyzer(QMainWindow):
         main_layout = QVBoxLayout(central_widget)
 
         # 경비 기록 파일 선택 영역
-        security_file_group = QGroupBox("경비 기록 엑셀 파일 선택")
+        security_file_group = QGroupBox("경비 기록 파일 선택 (엑셀, CSV, Parquet)")
         security_file_layout = QHBoxLayout()
 
         self.security_file_label = QLabel("선택된 파일 없음")
@@ -75,6 +125,24 @@ class OvertimeAnalyzer(QMainWindow):
         overtime_file_layout.addWidget(overtime_info)
         overtime_file_group.setLayout(overtime_file_layout)
 
+        # 구역 매핑 파일 선택 영역 (선택)
+        zone_file_group = QGroupBox("직원/부서별 경비 구역 매핑 파일 선택 (선택)")
+        zone_file_layout = QHBoxLayout()
+
+        self.zone_file_label = QLabel("선택된 파일 없음 (모든 직원을 전체 경비 기록과 비교)")
+        self.zone_browse_button = QPushButton("파일 선택")
+        self.zone_browse_button.clicked.connect(lambda: self.browse_file("zone"))
+
+        zone_info = QLabel(
+            "※ 경비 기록에 구역(건물) 컬럼이 있으면 구역 컬럼과 직원명 또는 부서명 컬럼이 있는 매핑 파일로 직원별 구역을 지정할 수 있습니다."
+        )
+        zone_info.setWordWrap(True)
+
+        zone_file_layout.addWidget(self.zone_file_label)
+        zone_file_layout.addWidget(self.zone_browse_button)
+        zone_file_layout.addWidget(zone_info)
+        zone_file_group.setLayout(zone_file_layout)
+
         # 날짜 필터 영역
         date_group = QGroupBox("날짜 범위 설정 (선택)")
         date_layout = QHBoxLayout()
@@ -91,8 +159,63 @@ class OvertimeAnalyzer(QMainWindow):
         date_layout.addWidget(self.start_date)
         date_layout.addWidget(QLabel("종료 날짜:"))
         date_layout.addWidget(self.end_date)
+
+        # 휴일 판단 기준 (공휴일 달력 / F열 휴일여부)
+        self.holiday_source = QComboBox()
+        self.holiday_source.addItem("달력 + F열 (둘 중 하나라도 휴일이면 휴일)", "both")
+        self.holiday_source.addItem("공휴일 달력만 사용", "calendar")
+        self.holiday_source.addItem("F열(휴일여부)만 사용", "column")
+
+        # 여러 패널/리더기가 같은 경비 설정/해제를 반복 기록한 경우 합칠 간격 (-1 이면 합치지 않음)
+        self.dedupe_seconds = QSpinBox()
+        self.dedupe_seconds.setRange(-1, 3600)
+        self.dedupe_seconds.setSuffix(" 초")
+        self.dedupe_seconds.setSpecialValueText("사용 안 함")
+        self.dedupe_seconds.setValue(DEFAULT_DEDUPE_SECONDS)
+        self.dedupe_seconds.setToolTip(
+            "같은 업무일에 바로 앞 기록과 같은 경비 상태가 이 간격 안에 다시 기록되면 하나로 합칩니다."
+        )
+
+        date_layout.addWidget(QLabel("휴일 판단:"))
+        date_layout.addWidget(self.holiday_source)
+        date_layout.addWidget(QLabel("중복 경비 기록 병합:"))
+        date_layout.addWidget(self.dedupe_seconds)
         date_group.setLayout(date_layout)
 
+        # 대용량 파일 처리 설정 영역
+        memory_group = QGroupBox("대용량 파일 처리 설정")
+        memory_layout = QHBoxLayout()
+
+        self.memory_budget = QSpinBox()
+        self.memory_budget.setRange(64, 16384)
+        self.memory_budget.setSingleStep(64)
+        self.memory_budget.setSuffix(" MB")
+        self.memory_budget.setValue(DEFAULT_MEMORY_BUDGET_MB)
+
+        memory_hint = QLabel(
+            "경비 기록 파일을 통째로 불러왔을 때 예상 크기가 이 기준을 넘으면 파일 전체를 로드하지 않고 "
+            "나누어 읽는 스트리밍 모드로 분석합니다. 읽기 청크 크기만 정하며, 업무일별 경비 상태는 "
+            "계속 메모리에 남으므로 전체 메모리 사용량의 한도는 아닙니다."
+        )
+        memory_hint.setWordWrap(True)
+
+        # 파일을 모두 읽기 전에 앞부분만 읽어 컬럼 매핑/분류 결과 확인
+        self.preview_before_load = QCheckBox("불러오기 전에 미리 보기")
+        self.preview_before_load.setChecked(True)
+        self.preview_rows = QSpinBox()
+        self.preview_rows.setRange(10, 10000)
+        self.preview_rows.setSingleStep(100)
+        self.preview_rows.setSuffix(" 행")
+        self.preview_rows.setValue(DEFAULT_PREVIEW_ROWS)
+        self.preview_before_load.toggled.connect(self.preview_rows.setEnabled)
+
+        memory_layout.addWidget(QLabel("스트리밍 전환 기준:"))
+        memory_layout.addWidget(self.memory_budget)
+        memory_layout.addWidget(memory_hint)
+        memory_layout.addWidget(self.preview_before_load)
+        memory_layout.addWidget(self.preview_rows)
+        memory_group.setLayout(memory_layout)
+
         # 분석 버튼
         analyze_btn_group = QGroupBox("분석 실행")
         analyze_btn_layout = QHBoxLayout()
@@ -103,8 +226,18 @@ class OvertimeAnalyzer(QMainWindow):
 
         analyze_hint = QLabel("두 파일이 모두 로드되면 분석 버튼이 활성화됩니다.")
 
+        # 분석 세션 저장/열기 버튼
+        self.save_session_button = QPushButton("세션 저장")
+        self.save_session_button.clicked.connect(self.save_session_file)
+        self.save_session_button.setEnabled(False)
+        self.open_session_button = QPushButton("세션 열기")
+        self.open_session_button.clicked.connect(self.open_session_file)
+
         analyze_btn_layout.addWidget(self.analyze_button)
         analyze_btn_layout.addWidget(analyze_hint)
+        analyze_btn_layout.addStretch()
+        analyze_btn_layout.addWidget(self.save_session_button)
+        analyze_btn_layout.addWidget(self.open_session_button)
         analyze_btn_group.setLayout(analyze_btn_layout)
 
         # 내보내기 버튼
@@ -112,71 +245,193 @@ class OvertimeAnalyzer(QMainWindow):
         self.export_button.clicked.connect(self.export_results)
         self.export_button.setEnabled(False)
 
-        # 결과 테이블
-        self.table = QTableWidget()
-        self.table.setColumnCount(
-            8
-        )  # 날짜, 직원명, 부서명, 초과근무시간, 경비상태, 의심사유, 근무내용, 휴일여부
-        self.table.setHorizontalHeaderLabels(
-            [
-                "날짜",
-                "직원명",
-                "부서명",
-                "초과근무 시간",
-                "경비상태",
-                "의심 사유",
-                "근무내용",
-                "휴일여부",
-            ]
-        )
+        # 전체 분석 자료(요약 + 의심 기록 + 확인 필요 데이터) 내보내기 버튼
+        self.export_all_button = QPushButton("전체 분석 자료 내보내기")
+        self.export_all_button.clicked.connect(self.export_all_results)
+        self.export_all_button.setEnabled(False)
+        export_layout = QHBoxLayout()
+        export_layout.addWidget(self.export_button)
+        export_layout.addWidget(self.export_all_button)
+
+        # 결과 테이블 (날짜, 직원명, 부서명, 초과근무시간, 경비상태, 의심사유, 근무내용, 휴일여부, 구역)
+        # 분석 중에도 찾은 기록부터 표시되도록 모델에 기록을 추가하는 방식으로 표시
+        self.result_model = SuspiciousRecordModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.result_model)
+        self.table.setSelectionBehavior(QTableView.SelectRows)
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.table.doubleClicked.connect(self.open_employee_view)
+        self.result_count_label = QLabel("의심 기록: 0건")
+
+        # 결과 필터 (직원명, 부서명, 날짜 범위, 휴일/평일, 최소 의심시간)
+        # 결과 목록의 컬럼별 색인으로 조건에 맞는 행을 구하므로 조건을 바꿀 때마다 바로 적용
+        self.filter_employee = QLineEdit()
+        self.filter_employee.setPlaceholderText("직원명")
+        self.filter_department = QLineEdit()
+        self.filter_department.setPlaceholderText("부서명")
+        self.filter_date_enabled = QCheckBox("날짜:")
+        self.filter_start_date = QDateEdit()
+        self.filter_start_date.setCalendarPopup(True)
+        self.filter_end_date = QDateEdit()
+        self.filter_end_date.setCalendarPopup(True)
+        self.filter_holiday = QComboBox()
+        self.filter_holiday.addItem("휴일/평일 전체", None)
+        self.filter_holiday.addItem("휴일만", True)
+        self.filter_holiday.addItem("평일만", False)
+        self.filter_min_hours = QDoubleSpinBox()
+        self.filter_min_hours.setRange(0, 24)
+        self.filter_min_hours.setSingleStep(0.5)
+        self.filter_min_hours.setDecimals(1)
+        self.filter_min_hours.setPrefix("의심시간 ")
+        self.filter_min_hours.setSuffix("시간 이상")
+        self.filter_reset_button = QPushButton("필터 초기화")
+        self.filter_reset_button.clicked.connect(self.reset_result_filter)
+
+        self.filter_employee.textChanged.connect(self.apply_result_filter)
+        self.filter_department.textChanged.connect(self.apply_result_filter)
+        self.filter_date_enabled.toggled.connect(self.apply_result_filter)
+        self.filter_start_date.dateChanged.connect(self.apply_result_filter)
+        self.filter_end_date.dateChanged.connect(self.apply_result_filter)
+        self.filter_holiday.currentIndexChanged.connect(self.apply_result_filter)
+        self.filter_min_hours.valueChanged.connect(self.apply_result_filter)
+
+        filter_layout = QHBoxLayout()
+        filter_layout.addWidget(QLabel("필터:"))
+        filter_layout.addWidget(self.filter_employee)
+        filter_layout.addWidget(self.filter_department)
+        filter_layout.addWidget(self.filter_date_enabled)
+        filter_layout.addWidget(self.filter_start_date)
+        filter_layout.addWidget(QLabel("~"))
+        filter_layout.addWidget(self.filter_end_date)
+        filter_layout.addWidget(self.filter_holiday)
+        filter_layout.addWidget(self.filter_min_hours)
+        filter_layout.addWidget(self.filter_reset_button)
+        self.filter_widgets = [
+            self.filter_employee,
+            self.filter_department,
+            self.filter_date_enabled,
+            self.filter_start_date,
+            self.filter_end_date,
+            self.filter_holiday,
+            self.filter_min_hours,
+            self.filter_reset_button,
+        ]
+
+        results_widget = QWidget()
+        results_layout = QVBoxLayout(results_widget)
+        results_layout.addLayout(filter_layout)
+        results_layout.addWidget(self.result_count_label)
+        results_layout.addWidget(self.table)
 
         # 레이아웃에 위젯 추가
         main_layout.addWidget(security_file_group)
         main_layout.addWidget(overtime_file_group)
+        main_layout.addWidget(zone_file_group)
         main_layout.addWidget(date_group)
+        main_layout.addWidget(memory_group)
         main_layout.addWidget(analyze_btn_group)
-        main_layout.addWidget(self.table)
-        main_layout.addWidget(self.export_button)
+        # 확인 필요 데이터 패널 (분류별 건수 + 선택한 분류의 샘플)
+        diagnostics_widget = QWidget()
+        diagnostics_layout = QVBoxLayout(diagnostics_widget)
+        self.diagnostics_summary_table = QTableWidget()
+        self.diagnostics_summary_table.setColumnCount(2)
+        self.diagnostics_summary_table.setHorizontalHeaderLabels(["분류", "건수"])
+        self.diagnostics_summary_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.diagnostics_summary_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.diagnostics_summary_table.itemSelectionChanged.connect(self.show_diagnostic_samples)
+        self.diagnostics_sample_label = QLabel("분류를 선택하면 상세 기록이 표시됩니다.")
+        self.diagnostics_sample_table = QTableWidget()
+        diagnostics_layout.addWidget(self.diagnostics_summary_table)
+        diagnostics_layout.addWidget(self.diagnostics_sample_label)
+        diagnostics_layout.addWidget(self.diagnostics_sample_table)
+
+        self.result_tabs = QTabWidget()
+        self.result_tabs.addTab(results_widget, "의심 기록")
+        self.result_tabs.addTab(diagnostics_widget, "확인 필요 데이터")
+        # 부서별/직원별 월간 요약 (의심 기록 수, 총 의심시간, 휴일 비율)
+        self.summary_kind = QComboBox()
+        for kind, (label, _) in SUMMARY_GROUPS.items():
+            self.summary_kind.addItem(label, kind)
+        self.summary_kind.currentIndexChanged.connect(self.update_summary)
+        self.summary_label = QLabel()
+        self.summary_model = FrameTableModel(self)
+        summary_table = QTableView()
+        summary_table.setModel(self.summary_model)
+        summary_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.summary_widget = QWidget()
+        summary_layout = QVBoxLayout(self.summary_widget)
+        summary_selector_layout = QHBoxLayout()
+        summary_selector_layout.addWidget(self.summary_kind)
+        summary_selector_layout.addWidget(self.summary_label, 1)
+        summary_layout.addLayout(summary_selector_layout)
+        summary_layout.addWidget(summary_table)
+        self.result_tabs.addTab(self.summary_widget, "요약")
+        # 직원별 상세 보기 (결과 테이블에서 기록을 더블클릭하면 해당 직원/월 표시)
+        self.employee_panel = EmployeeTimelinePanel()
+        self.result_tabs.addTab(self.employee_panel, "직원별 보기")
+        # 전체 직원의 초과근무와 경비 설정 구간 타임라인 (더블클릭하면 직원별 보기로 이동)
+        self.timeline_view = TimelineView()
+        self.timeline_view.employee_activated.connect(self.open_employee_key)
+        self.result_tabs.addTab(self.timeline_view, "타임라인")
+        self.result_tabs.currentChanged.connect(self.result_tab_changed)
+
+        main_layout.addWidget(self.result_tabs)
+        main_layout.addLayout(export_layout)
 
     # 사용자 엑셀 파일 선택 및 로드
     def browse_file(self, file_type):
         options = QFileDialog.Options()
         file_path, _ = QFileDialog.getOpenFileName(
-            self, "엑셀 파일 선택", "", "Excel Files (*.xlsx *.xls)", options=options
+            self, "데이터 파일 선택", "", FILE_DIALOG_FILTER, options=options
         )
 
+        # 미리 보기에서 취소하면 이전에 불러온 파일을 그대로 유지
+        if file_path and file_type in PREVIEW_FUNCTIONS and self.preview_before_load.isChecked():
+            if not self.confirm_preview(file_type, file_path):
+                return
+
         if file_path:  # file_path 가 존재하는 경우
             if file_type == "security":
                 self.security_file_label.setText(file_path)
+                self.security_stream_path = None
+                self.security_path = file_path
                 try:
-                    file_ext = os.path.splitext(file_path)[1].lower()
-                    if file_ext == ".xls":
-                        self.security_df = pd.read_excel(file_path, engine="xlrd")
+                    if should_stream(file_path, self.memory_budget.value()):
+                        # 대용량 파일은 분석 시점에 청크 단위로 읽음
+                        self.security_df = None
+                        self.security_stream_path = file_path
+                        QMessageBox.information(
+                            self,
+                            "성공",
+                            "경비 기록 파일이 스트리밍 전환 기준보다 커서 스트리밍 모드로 분석합니다.\n"
+                            f"(스트리밍 전환 기준: {self.memory_budget.value()} MB)",
+                        )
                     else:
-                        self.security_df = pd.read_excel(file_path, engine="openpyxl")
-                    QMessageBox.information(
-                        self,
-                        "성공",
-                        f"경비 기록 파일을 로드했습니다.\n총 {len(self.security_df)} 행의 데이터가 있습니다.",
-                    )
+                        # 불러올 때 한 번만 정규화해 두고 분석할 때마다 재사용
+                        raw_df = read_input_file(file_path)
+                        self.security_df = normalize_security_frame(raw_df)
+                        skipped = len(raw_df) - len(self.security_df)
+                        message = f"경비 기록 파일을 로드했습니다.\n총 {len(raw_df)} 행의 데이터가 있습니다."
+                        if skipped:
+                            message += f"\n(발생일자/발생시각을 읽을 수 없는 {skipped}행 제외)"
+                        QMessageBox.information(self, "성공", message)
                 except Exception as e:
                     QMessageBox.critical(
                         self, "오류", f"파일을 로드하는 중 오류가 발생했습니다: {str(e)}"
                     )
                     self.security_file_label.setText("선택된 파일 없음")
                     self.security_df = None
+                    self.security_stream_path = None
+                    self.security_path = None
 
             elif file_type == "overtime":
                 self.overtime_file_label.setText(file_path)
                 try:
-                    file_ext = os.path.splitext(file_path)[1].lower()
-
-                    # 엑셀 파일 로드 (첫 행을 헤더로 처리)
-                    if file_ext == ".xls":
-                        self.overtime_df = pd.read_excel(file_path, engine="xlrd", header=0)
-                    else:
-                        self.overtime_df = pd.read_excel(file_path, engine="openpyxl", header=0)
+                    # 파일 로드 (첫 행을 헤더로 처리, 열 위치 기반 매핑은 엑셀/CSV/Parquet 공통)
+                    self.overtime_df = normalize_overtime_frame(
+                        read_input_file(file_path, header=0)
+                    )
+                    self.overtime_path = file_path
 
                     # 데이터 유효성 확인 (헤더 제외 최소 1건의 실제 데이터 필요)
                     if len(self.overtime_df) < 1:
@@ -196,1083 +451,515 @@ class OvertimeAnalyzer(QMainWindow):
                     )
                     self.overtime_file_label.setText("선택된 파일 없음")
                     self.overtime_df = None
+                    self.overtime_path = None
+
+            elif file_type == "zone":
+                try:
+                    self.zone_mapping = load_zone_mapping(file_path)
+                    self.zone_path = file_path
+                    self.zone_file_label.setText(file_path)
+                    QMessageBox.information(
+                        self,
+                        "성공",
+                        f"구역 매핑 파일을 로드했습니다.\n"
+                        f"직원 {len(self.zone_mapping.employee_zones)}명, "
+                        f"부서 {len(self.zone_mapping.department_zones)}개의 구역이 지정되었습니다.",
+                    )
+                except Exception as e:
+                    QMessageBox.critical(
+                        self, "오류", f"파일을 로드하는 중 오류가 발생했습니다: {str(e)}"
+                    )
+                    self.zone_file_label.setText(
+                        "선택된 파일 없음 (모든 직원을 전체 경비 기록과 비교)"
+                    )
+                    self.zone_mapping = None
+                    self.zone_path = None
 
             # 두 파일이 모두 로드되었을 때만 분석 버튼 활성화
-            if self.security_df is not None and self.overtime_df is not None:
-                self.analyze_button.setEnabled(True)
+            self.analyze_button.setEnabled(
+                self.has_security_input() and self.overtime_df is not None
+            )
+
+    def confirm_preview(self, file_type, file_path):
+        """파일 앞부분만 읽어 컬럼 매핑과 분류 결과를 보여 주고, 전체를 불러올지 확인합니다."""
+        try:
+            preview = PREVIEW_FUNCTIONS[file_type](file_path, self.preview_rows.value())
+        except Exception as e:
+            QMessageBox.critical(self, "오류", f"파일을 미리 보는 중 오류가 발생했습니다: {str(e)}")
+            print(traceback.format_exc())
+            return False
+        print(f"[INFO] 파일 미리 보기: {file_path} ({preview.seconds:.2f}초)")
+        return InputPreviewDialog(preview, self).exec_() == QDialog.Accepted
+
+    def selected_dedupe_seconds(self):
+        """중복 경비 기록 병합 간격(초). '사용 안 함'이면 None"""
+        value = self.dedupe_seconds.value()
+        return None if value < 0 else value
+
+    # 경비 기록이 로드되었거나 스트리밍 모드로 지정되었는지 확인
+    def has_security_input(self):
+        return self.security_df is not None or self.security_stream_path is not None
 
     # 경비 및 초과 근무 데이터를 분석하여 의심스러운 기록 탐지 (메인 메서드)
     def analyze_data(self):
-        if self.security_df is None or self.overtime_df is None:
+        if not self.has_security_input() or self.overtime_df is None:
             QMessageBox.warning(self, "경고", "두 파일이 모두 로드되어야 합니다.")
             return
 
+        # 이전 분석의 확인 필요 데이터는 비우고 새로 기록 (반복 분석 시 메모리 누적 방지)
+        self.diagnostics.clear()
+        self.analysis_summary = None
+        self.security_by_zone = {}
+        self.export_all_button.setEnabled(False)
+        self.reset_employee_index()
+
         try:
-            # 경비 기록 파일 분석
-            print("[DEBUG] 경비 기록 파일 처리 시작...")
-            security_df_processed = self.process_security_log(self.security_df)
-            print("[DEBUG] 경비 기록 파일 처리 완료")
-
-            # 초과근무 기록 파일 분석
-            print("[DEBUG] 초과근무 기록 파일 처리 시작...")
-            overtime_df_processed = self.process_overtime_log(self.overtime_df)
-            print("[DEBUG] 초과근무 기록 파일 처리 완료")
-
-            # 두 데이터 비교 분석
-            print("[DEBUG] 데이터 비교 분석 시작...")
-            suspicious_records = self.compare_security_and_overtime(
-                security_df_processed, overtime_df_processed
+            engine = OvertimeAnalysisEngine(
+                self.start_date.date().toString("yyyy-MM-dd"),
+                self.end_date.date().toString("yyyy-MM-dd"),
+                holiday_source=self.holiday_source.currentData(),
+                diagnostics=self.diagnostics,
+                dedupe_seconds=self.selected_dedupe_seconds(),
             )
-            print("[DEBUG] 데이터 비교 분석 완료")
-
-            # 결과 테이블에 표시
-            self.display_results(suspicious_records)
-
-            # 분석 결과 메시지 표시
-            if len(suspicious_records) == 0:
-                QMessageBox.information(self, "분석 완료", "의심스러운 초과근무 기록이 없습니다.")
-            else:
-                QMessageBox.information(
-                    self,
-                    "분석 완료",
-                    f"{len(suspicious_records)}개의 의심스러운 초과근무 기록을 발견했습니다.",
-                )
-
-            # 내보내기 버튼 활성화
-            self.export_button.setEnabled(len(suspicious_records) > 0)
 
+            # 같은 입력 파일/기간/규칙으로 분석한 적이 있으면 저장된 결과 사용
+            cache_key = self.result_cache_key(engine)
+            cached = self.result_cache.get(cache_key, self.diagnostics) if cache_key else None
         except Exception as e:
             QMessageBox.critical(self, "오류", f"데이터 분석 중 오류가 발생했습니다: {str(e)}")
-            import traceback
-
             print(traceback.format_exc())  # 상세 오류 정보 출력
+            return
 
-    # 경비 로그를 처리하여 날짜별 경비 상태 (설정/해제) 분석
-    def process_security_log(self, df):
-        """경비 기록을 처리하여 각 날짜별 경비 상태를 분석합니다."""
-        try:
-            # 필수 컬럼 정의
-            required_cols = ["발생일자", "발생시각", "모드"]
-
-            # 열 이름으로 컬럼 찾기
-            col_mapping = {}
-
-            # 컬럼 이름 매핑 (정확한 이름 또는 포함된 문자열로 찾기)
-            for col in df.columns:
-                col_str = str(col).lower()  # 컬럼명을 소문자로 변환하여 비교
-                if "발생일자" in col_str or "날짜" in col_str:
-                    col_mapping["발생일자"] = col
-                elif "발생시각" in col_str or "시간" in col_str:
-                    col_mapping["발생시각"] = col
-                elif "모드" in col_str or "상태" in col_str or "내용" in col_str:
-                    col_mapping["모드"] = col
-
-            # 찾지 못한 컬럼은 기본 위치로 설정
-            if "발생일자" not in col_mapping:
-                col_mapping["발생일자"] = df.columns[0]  # A열
-            if "발생시각" not in col_mapping:
-                col_mapping["발생시각"] = df.columns[1]  # B열
-            if "모드" not in col_mapping:
-                if len(df.columns) > 8:
-                    col_mapping["모드"] = df.columns[8]  # I열
-                else:
-                    col_mapping["모드"] = None
-
-            # 필요한 컬럼이 없으면 오류 반환
-            missing_cols = []
-            if col_mapping["모드"] is None:
-                missing_cols.append("모드")
-            if missing_cols:
-                raise ValueError(f"다음 컬럼을 찾을 수 없습니다: {', '.join(missing_cols)}")
-
-            # 날짜 필터링 적용
-            start_date = self.start_date.date().toString("yyyy-MM-dd")
-            end_date = self.end_date.date().toString("yyyy-MM-dd")
-
-            # 데이터프레임에서 날짜 열이 문자열이면 datetime으로 변환
-            if not pd.api.types.is_datetime64_any_dtype(df[col_mapping["발생일자"]]):
-                df[col_mapping["발생일자"]] = pd.to_datetime(
-                    df[col_mapping["발생일자"]], errors="coerce"
+        if cached is not None:
+            suspicious_records = cached
+            # 직원별 상세 보기는 처음 열 때 비교 없이 경비 상태만 다시 계산
+            # (스트리밍 모드면 경비 기록 파일을 다시 나누어 읽음)
+            security_df, security_stream_path, overtime_df, zone_mapping, memory_budget_mb = (
+                self.security_df,
+                self.security_stream_path,
+                self.overtime_df,
+                self.zone_mapping,
+                self.memory_budget.value(),
+            )
+            self.reset_employee_index(
+                lambda: self.index_engine(engine).build_employee_index(
+                    overtime_df,
+                    security_df,
+                    zone_mapping,
+                    security_stream_path=security_stream_path,
+                    memory_budget_mb=memory_budget_mb,
                 )
-
-            # 시각 열이 문자열이면 datetime.time으로 변환
-            if not pd.api.types.is_datetime64_any_dtype(df[col_mapping["발생시각"]]):
-                try:
-                    df["시간_datetime"] = pd.to_datetime(
-                        df[col_mapping["발생시각"]], errors="coerce"
-                    )
-                    df["시간_시"] = df["시간_datetime"].dt.hour
-                    df["시간_분"] = df["시간_datetime"].dt.minute
-                except:
-                    # 시간이 이미 시:분:초 형식인 경우
-                    df["시간_시"] = df[col_mapping["발생시각"]].str.split(":").str[0].astype(int)
-                    df["시간_분"] = df[col_mapping["발생시각"]].str.split(":").str[1].astype(int)
-            else:
-                df["시간_시"] = df[col_mapping["발생시각"]].dt.hour
-                df["시간_분"] = df[col_mapping["발생시각"]].dt.minute
-
-            # 필터링 적용
-            filtered_df = df
-            if start_date and end_date:
-                filtered_df = df[
-                    (df[col_mapping["발생일자"]] >= start_date)
-                    & (df[col_mapping["발생일자"]] <= end_date)
-                ]
-
-            # 필요한 열만 선택하여 메모리 사용 최적화
-            filtered_df_slim = filtered_df[
-                [
-                    col_mapping["발생일자"],
-                    col_mapping["발생시각"],
-                    col_mapping["모드"],
-                    "시간_시",
-                    "시간_분",
-                ]
-            ].copy()
-
-            # 이전날짜와 다음날짜 관계 분석을 위해 날짜별로 정렬
-            filtered_df_slim = filtered_df_slim.sort_values(
-                by=[col_mapping["발생일자"], col_mapping["발생시각"]]
             )
+            self.display_results(suspicious_records)
+            self.finish_analysis(engine)
+            return
 
-            # 각 기록에 시간대 태그 생성 (새벽 4시 기준)
-            filtered_df_slim["시간대"] = "주간"
-            filtered_df_slim.loc[
-                (filtered_df_slim["시간_시"] >= 0) & (filtered_df_slim["시간_시"] < 4), "시간대"
-            ] = "새벽"
-
-            # 업무일 계산 (새벽 4시 기준)
-            filtered_df_slim["업무일"] = filtered_df_slim[col_mapping["발생일자"]].dt.date
-            # 새벽 시간대(0-4시)는 전날의 업무일로 계산
-            filtered_df_slim.loc[filtered_df_slim["시간대"] == "새벽", "업무일"] = (
-                filtered_df_slim.loc[
-                    filtered_df_slim["시간대"] == "새벽", col_mapping["발생일자"]
-                ].dt.date
-                - pd.Timedelta(days=1)
+        # 경비/초과근무 기록 분석 및 비교 (구역이 있으면 구역별로 병렬 처리)
+        # 분석은 별도 스레드에서 실행하고, 의심 기록은 찾는 대로 결과 테이블에 추가
+        print("[DEBUG] 데이터 분석 시작...")
+        if self.security_stream_path is not None:
+            batches = engine.iter_analyze_streaming(
+                self.security_stream_path,
+                self.overtime_df,
+                self.zone_mapping,
+                self.memory_budget.value(),
+            )
+        else:
+            batches = engine.iter_analyze(self.security_df, self.overtime_df, self.zone_mapping)
+
+        self.display_results([])
+        self.result_count_label.setText("의심 기록: 0건 (분석 중...)")
+        self.set_analysis_running(True)
+        self.analysis_worker = AnalysisWorker(batches, self)
+        self.analysis_worker.batch_ready.connect(self.append_result_batch)
+        self.analysis_worker.completed.connect(lambda: self.analysis_completed(engine, cache_key))
+        self.analysis_worker.failed.connect(self.analysis_failed)
+        self.analysis_worker.start()
+
+    def set_analysis_running(self, running):
+        """분석 중에는 입력/분석/세션 버튼을 비활성화합니다."""
+        for button in (self.analyze_button, self.open_session_button):
+            button.setEnabled(not running)
+        for button in (self.export_button, self.export_all_button, self.save_session_button):
+            button.setEnabled(False)
+        # 분석 중에는 결과가 계속 추가되므로 필터는 분석이 끝난 뒤 사용
+        for widget in self.filter_widgets:
+            widget.setEnabled(not running)
+
+    # 분석 스레드에서 찾은 의심 기록 묶음을 결과 테이블에 추가
+    def append_result_batch(self, batch):
+        self.result_model.append_records(batch)
+        self.result_count_label.setText(f"의심 기록: {self.result_model.rowCount()}건 (분석 중...)")
+
+    def analysis_completed(self, engine, cache_key):
+        print("[DEBUG] 데이터 분석 완료")
+        self.analysis_worker = None
+        self.set_analysis_running(False)
+        self.security_by_zone = engine.security_by_zone
+        self.set_employee_index(engine.employee_index)
+        if cache_key:
+            self.store_cached_result(cache_key, self.suspicious_records)
+        self.finish_analysis(engine)
+
+    def analysis_failed(self, message):
+        self.analysis_worker = None
+        self.set_analysis_running(False)
+        self.result_count_label.setText(f"의심 기록: {self.result_model.rowCount()}건 (분석 실패)")
+        QMessageBox.critical(self, "오류", f"데이터 분석 중 오류가 발생했습니다: {message}")
+        self.display_diagnostics()
+
+    def finish_analysis(self, engine):
+        """분석 결과 요약/확인 필요 데이터를 표시하고 완료 메시지를 보여 줍니다."""
+        suspicious_records = self.suspicious_records
+        # 분석 중 추가된 기록으로 필터 색인/자동 완성, 요약을 다시 준비
+        self.reset_result_filter()
+        self.reset_summary()
+        self.display_diagnostics()
+        self.analysis_summary = analysis_summary(engine, suspicious_records)
+
+        # 분석 결과 메시지 표시
+        if len(suspicious_records) == 0:
+            QMessageBox.information(self, "분석 완료", "의심스러운 초과근무 기록이 없습니다.")
+        else:
+            QMessageBox.information(
+                self,
+                "분석 완료",
+                f"{len(suspicious_records)}개의 의심스러운 초과근무 기록을 발견했습니다.",
             )
 
-            # 기록을 경비해제/경비시작으로 판단하는 함수
-            def determine_record_type(row):
-                mode = str(row[col_mapping["모드"]]).lower()
-
-                # 명시적인 경비 해제/설정 상태 확인
-                if "출근" in mode or "해제" in mode:
-                    return "경비해제"
-                elif "퇴근" in mode or "세팅" in mode or "세트" in mode:
-                    return "경비시작"
-                # 출입 기록은 컨텍스트로 판단해야 하므로 일단 불명확으로 분류
-                elif "출입" in mode:
-                    return "출입(불명확)"
-
-                return "기타"
-
-            # 각 기록 유형 판단
-            filtered_df_slim["기록유형"] = filtered_df_slim.apply(determine_record_type, axis=1)
-
-            # 출입(불명확) 기록 처리
-            # 컨텍스트를 바탕으로 출입 기록을 경비해제 또는 경비시작으로 재분류
-            business_days = filtered_df_slim["업무일"].unique()
-
-            # 경비 데이터가 불명확한 업무일 기록
-            unclear_security_days = []
-
-            for business_day in business_days:
-                day_records = filtered_df_slim[filtered_df_slim["업무일"] == business_day]
-                unclear_records = day_records[day_records["기록유형"] == "출입(불명확)"]
-
-                # 업무일 내 기록 시간순 정렬
-                day_records_sorted = day_records.sort_values(
-                    by=[col_mapping["발생일자"], col_mapping["발생시각"]]
-                )
-
-                # 경비 해제/시작 기록 확인
-                has_release = any(
-                    record["기록유형"] == "경비해제" for _, record in day_records_sorted.iterrows()
-                )
-                has_start = any(
-                    record["기록유형"] == "경비시작" for _, record in day_records_sorted.iterrows()
-                )
-
-                if len(unclear_records) > 0:
-                    # 새로운 요구사항에 맞게 처리:
-                    # 1. 첫 기록이 '출입(불명확)'이면 '경비해제'로 간주
-                    # 2. 그 외 모든 '출입(불명확)' 기록은 무시
-
-                    # 첫 기록이 '출입(불명확)'이면 '경비해제'로 간주
-                    if day_records_sorted.iloc[0]["기록유형"] == "출입(불명확)":
-                        first_record_index = day_records_sorted.index[0]
-                        filtered_df_slim.loc[first_record_index, "기록유형"] = "경비해제"
-                        print(
-                            f"[경비판단] {business_day} - 첫 기록이 '출입'이므로 '경비해제'로 판단"
-                        )
-
-                    # 첫 번째가 아닌 모든 '출입(불명확)' 기록은 무시 (기타로 변경)
-                    for i, record in enumerate(day_records_sorted.iterrows()):
-                        if i == 0:  # 첫 번째 기록은 건너뛰기 (이미 처리됨)
-                            continue
-
-                        idx, row = record
-                        # 첫 번째가 아닌 모든 불명확 출입 기록은 '기타'로 처리 (무시)
-                        if row["기록유형"] == "출입(불명확)":
-                            filtered_df_slim.loc[idx, "기록유형"] = "기타"
-                            print(
-                                f"[출입무시] {business_day} - 첫 번째가 아닌 출입기록은 무시함 (시간: {row['시간_시']:02d}:{row['시간_분']:02d})"
-                            )
-
-                    # '출입(불명확)' 기록은 첫번째를 제외한 모든 기록이 '기타'로 처리되므로 검사 불필요
-
-                    # 마지막 기록이 확실한 경비시작이 아니면 확인 필요
-                    # (단, '기타'로 처리된 출입 기록은 무시)
-                    if (
-                        day_records_sorted.iloc[-1]["기록유형"] != "경비시작"
-                        and day_records_sorted.iloc[-1]["기록유형"] != "기타"
-                    ):
-                        last_record = day_records_sorted.iloc[-1]
-                        last_record_time = (
-                            f"{last_record['시간_시']:02d}:{last_record['시간_분']:02d}"
-                        )
-                        unclear_security_days.append(
-                            {
-                                "업무일": business_day,
-                                "마지막기록시간": last_record_time,
-                                "기록유형": last_record["기록유형"],
-                                "문제": "마지막 기록이 '경비시작'이 아님",
-                            }
-                        )
-                        print(
-                            f"[의심데이터] {business_day} - 마지막 기록이 '경비시작'이 아닙니다 (유형: {last_record['기록유형']}, 시간: {last_record_time})"
-                        )
-
-                # 명확한 경비 기록이 아예 없는 경우도 의심 데이터로 분류
-                if not has_release and not has_start and len(day_records) > 0:
-                    unclear_security_days.append(
-                        {
-                            "업무일": business_day,
-                            "기록수": len(day_records),
-                            "문제": "명확한 경비해제/시작 기록 없음",
-                        }
-                    )
-                    print(f"[의심데이터] {business_day} - 명확한 경비 기록 없음 (사용자 확인 필요)")
-
-            # 의심 기록 저장
-            self.unclear_security_days = unclear_security_days
-
-            # 각 업무일별 경비 상태 시간 분석
-            security_status_by_day = {}
-
-            for business_day in business_days:
-                day_records = filtered_df_slim[filtered_df_slim["업무일"] == business_day]
-                day_records_sorted = day_records.sort_values(
-                    by=[col_mapping["발생일자"], col_mapping["발생시각"]]
-                )
-
-                # 해당 업무일의 경비 상태 시간 기록 초기화
-                security_status = []
-
-                for _, record in day_records_sorted.iterrows():
-                    record_date = record[col_mapping["발생일자"]]
-                    record_time = f"{record['시간_시']:02d}:{record['시간_분']:02d}"
-                    record_type = record["기록유형"]
-
-                    # 경비해제/경비시작 시간 기록
-                    if record_type == "경비해제":
-                        security_status.append(
-                            {
-                                "시간": f"{record_date.strftime('%Y-%m-%d')} {record_time}",
-                                "상태": "해제",
-                            }
-                        )
-                    elif record_type == "경비시작":
-                        security_status.append(
-                            {
-                                "시간": f"{record_date.strftime('%Y-%m-%d')} {record_time}",
-                                "상태": "시작",
-                            }
-                        )
-
-                # 업무일별 경비 상태 저장
-                security_status_by_day[business_day] = security_status
-
-            return security_status_by_day
-
+        # 내보내기 버튼 활성화
+        self.export_button.setEnabled(len(suspicious_records) > 0)
+        self.export_all_button.setEnabled(True)
+        self.save_session_button.setEnabled(True)
+
+    # 창을 닫을 때 실행 중인 분석 중단
+    def closeEvent(self, event):
+        if self.analysis_worker is not None:
+            self.analysis_worker.requestInterruption()
+            self.analysis_worker.wait()
+        # 확인 필요 데이터 임시 파일 삭제
+        self.diagnostics.clear()
+        super().closeEvent(event)
+
+    # 불러온 데이터와 분석 결과를 세션 파일로 저장
+    def save_session_file(self):
+        options = QFileDialog.Options()
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "분석 세션 저장", "", SESSION_DIALOG_FILTER, options=options
+        )
+        if not file_path:
+            return
+        if not file_path.endswith(SESSION_EXTENSION):
+            file_path += SESSION_EXTENSION
+
+        session = AnalysisSession(
+            self.start_date.date().toString("yyyy-MM-dd"),
+            self.end_date.date().toString("yyyy-MM-dd"),
+            self.holiday_source.currentData(),
+            self.selected_dedupe_seconds(),
+            security_df=self.security_df,
+            overtime_df=self.overtime_df,
+            security_stream_path=self.security_stream_path,
+            zone_mapping=self.zone_mapping,
+            suspicious_records=self.suspicious_records,
+            security_by_zone=self.security_by_zone,
+            diagnostics=self.diagnostics,
+            source_paths={
+                "security": self.security_path,
+                "overtime": self.overtime_path,
+                "zone": self.zone_path,
+            },
+        )
+        try:
+            save_session(file_path, session)
+            QMessageBox.information(self, "완료", f"분석 세션을 저장했습니다:\n{file_path}")
         except Exception as e:
-            # 예외 발생 시 상세 정보 출력하고 다시 발생
-            import traceback
+            QMessageBox.critical(self, "오류", f"세션 저장 중 오류가 발생했습니다: {str(e)}")
 
-            print(f"경비 기록 처리 중 오류: {str(e)}")
-            print(traceback.format_exc())
-            raise
+    # 저장된 세션을 열어 데이터와 분석 결과 복원
+    def open_session_file(self):
+        options = QFileDialog.Options()
+        file_path, _ = QFileDialog.getOpenFileName(
+            self, "분석 세션 열기", "", SESSION_DIALOG_FILTER, options=options
+        )
+        if not file_path:
+            return
 
-    def process_overtime_log(self, df):
-        """초과근무 기록을 처리합니다."""
         try:
-            # 파일이 이미 header=0로 로드되었으므로 별도의 헤더 감지 로직은 필요 없음
-            print("[INFO] 헤더가 설정된 상태로 초과근무 기록 처리 시작")
-
-            # 표준화된 열 이름으로 변환
-            # 인덱스 기반으로 컬럼 이름 표준화 - 특정 위치의 컬럼을 우리가 정의한 이름으로 매핑
-            renamed_columns = {}
+            session = load_session(file_path, self.diagnostics)
+        except Exception as e:
+            QMessageBox.critical(self, "오류", f"세션을 여는 중 오류가 발생했습니다: {str(e)}")
+            return
 
-            # 기본 열 개수 확인
-            min_expected_columns = 14  # 최소 14개의 열이 필요
+        paths = session.source_paths
+        self.security_df = session.security_df
+        self.security_stream_path = session.security_stream_path
+        self.overtime_df = session.overtime_df
+        self.zone_mapping = session.zone_mapping
+        self.security_path = paths.get("security")
+        self.overtime_path = paths.get("overtime")
+        self.zone_path = paths.get("zone")
+        self.security_file_label.setText(self.security_path or "선택된 파일 없음")
+        self.overtime_file_label.setText(self.overtime_path or "선택된 파일 없음")
+        self.zone_file_label.setText(
+            self.zone_path or "선택된 파일 없음 (모든 직원을 전체 경비 기록과 비교)"
+        )
+        self.start_date.setDate(QDate.fromString(session.start_date, "yyyy-MM-dd"))
+        self.end_date.setDate(QDate.fromString(session.end_date, "yyyy-MM-dd"))
+        holiday_index = self.holiday_source.findData(session.holiday_source)
+        if holiday_index >= 0:
+            self.holiday_source.setCurrentIndex(holiday_index)
+        # 병합 안 함(None)은 '사용 안 함' 표시값(-1)
+        self.dedupe_seconds.setValue(
+            -1 if session.dedupe_seconds is None else int(session.dedupe_seconds)
+        )
 
-            if len(df.columns) < min_expected_columns:
-                print(
-                    f"[경고] 예상 열 수보다 적은 열이 있습니다. 예상: {min_expected_columns}, 실제: {len(df.columns)}"
+        # 저장된 분석 결과 복원 (확인 필요 데이터는 load_session 에서 채움)
+        self.security_by_zone = session.security_by_zone
+        engine = OvertimeAnalysisEngine(
+            session.start_date,
+            session.end_date,
+            holiday_source=session.holiday_source,
+            diagnostics=self.diagnostics,
+            dedupe_seconds=session.dedupe_seconds,
+        )
+        self.reset_employee_index()
+        # 저장된 경비 상태가 없으면(캐시된 결과로 저장한 세션) 경비 기록으로 다시 계산
+        if session.overtime_df is not None and (
+            session.security_by_zone or session.security_df is not None
+        ):
+            self.reset_employee_index(
+                lambda: self.index_engine(engine).build_employee_index(
+                    session.overtime_df,
+                    session.security_df,
+                    session.zone_mapping,
+                    session.security_by_zone or None,
                 )
-
-            # 고정 위치 기반 매핑 수행
-            for i, col in enumerate(df.columns):
-                if i == 0:
-                    renamed_columns[col] = "부서명"
-                elif i == 1:
-                    renamed_columns[col] = "직급"
-                elif i == 2:
-                    renamed_columns[col] = "개인식별번호"
-                elif i == 3:
-                    renamed_columns[col] = "성명"
-                elif i == 4:
-                    renamed_columns[col] = "현업여부"
-                elif i == 5:
-                    renamed_columns[col] = "휴일여부"
-                elif i == 6:
-                    renamed_columns[col] = "초과근무일자"
-                elif i == 7:
-                    renamed_columns[col] = "출근시간"
-                elif i == 8:
-                    renamed_columns[col] = "퇴근시간"
-                elif i == 9:
-                    renamed_columns[col] = "출근IP"
-                elif i == 10:
-                    renamed_columns[col] = "퇴근IP"
-                elif i == 11:
-                    renamed_columns[col] = "초과근무시간"
-                elif i == 12:
-                    renamed_columns[col] = "수당시간"
-                elif i == 13:
-                    renamed_columns[col] = "근무내용"
-                else:
-                    renamed_columns[col] = f"컬럼{i}"
-
-            # 데이터프레임 컬럼 이름 변경
-            df = df.rename(columns=renamed_columns)
-
-            # 표준화된 컬럼 매핑 (데이터 처리에 필요한 핵심 필드 접근용)
-            col_mapping = {
-                "날짜": "초과근무일자",
-                "시작시간": "출근시간",
-                "종료시간": "퇴근시간",
-                "이름": "성명",
-            }
-
-            print(
-                f"[INFO] 초과근무 데이터 표준화 완료: {list(df.columns)[:min(len(df.columns), 14)]}"
-            )
-
-            # 날짜 필터링 적용
-            start_date = self.start_date.date().toString("yyyy-MM-dd")
-            end_date = self.end_date.date().toString("yyyy-MM-dd")
-
-            # 날짜 데이터 정리 (YYYY-MM-DD 형식 고정)
-            # 데이터프레임에서 초과근무일자 열이 문자열이면 datetime으로 변환
-            df["날짜_datetime"] = pd.to_datetime(
-                df[col_mapping["날짜"]], format="%Y-%m-%d", errors="coerce"
-            )
-
-            def parse_time(time_value, default_time):
-                """시간 값을 파싱하여 time 객체로 반환합니다."""
-                if pd.isna(time_value):
-                    return default_time
-
-                try:
-                    if isinstance(time_value, str):
-                        time_str = time_value.strip()
-                        parts = time_str.split(":")
-                        if len(parts) >= 2:
-                            hour = int(parts[0])
-                            minute = int(parts[1])
-                            return time(hour, minute)
-                        else:
-                            print(f"시간 형식 오류 (HH:mm 형식이 아님): {time_str}")
-                            return default_time
-                    elif isinstance(time_value, datetime):
-                        return time_value.time()
-                    elif isinstance(time_value, time):
-                        return time_value
-                    else:
-                        print(f"지원하지 않는 시간 형식: {type(time_value)}")
-                        return default_time
-                except Exception as e:
-                    print(f"시간 파싱 오류: {str(e)}")
-                    return default_time
-
-            # 시간 데이터 유효성 검사
-            # 시간 형식 검사 함수 (HH:mm 형식 고정)
-            def is_valid_time_format(time_str):
-                if not isinstance(time_str, str):
-                    return False
-                try:
-                    # HH:mm 형식 검사
-                    parts = time_str.strip().split(":")
-                    if len(parts) != 2:
-                        return False
-                    hour, minute = int(parts[0]), int(parts[1])
-                    return 0 <= hour < 24 and 0 <= minute < 60
-                except:
-                    return False
-
-            # 필터링 적용
-            filtered_df = df
-            if start_date and end_date:
-                filtered_df = df[
-                    (df["날짜_datetime"] >= start_date) & (df["날짜_datetime"] <= end_date)
-                ]
-
-            # 각 행의 데이터 유효성 확인을 위한 작업
-            filtered_df["데이터_유효"] = (
-                pd.notna(filtered_df[col_mapping["이름"]])
-                & pd.notna(filtered_df[col_mapping["날짜"]])
-                & pd.notna(filtered_df[col_mapping["시작시간"]])
-                & pd.notna(filtered_df[col_mapping["종료시간"]])
-                & pd.notna(filtered_df["날짜_datetime"])
             )
+        self.analysis_summary = analysis_summary(engine, session.suspicious_records)
+        self.display_results(session.suspicious_records)
+        self.display_diagnostics()
+
+        self.analyze_button.setEnabled(self.has_security_input() and self.overtime_df is not None)
+        self.export_button.setEnabled(len(session.suspicious_records) > 0)
+        self.export_all_button.setEnabled(True)
+        self.save_session_button.setEnabled(True)
+
+    @staticmethod
+    def index_engine(engine):
+        """직원별 색인을 만들 때 쓰는 엔진 (확인 필요 데이터는 화면에 표시된 것을 그대로 유지)"""
+        return OvertimeAnalysisEngine(
+            engine.start_date,
+            engine.end_date,
+            rule_tables=engine.rule_tables,
+            holiday_source=engine.holiday_source,
+            holiday_calendar=engine.holiday_calendar,
+            diagnostics=AnalysisDiagnostics(),
+            dedupe_seconds=engine.dedupe_seconds,
+        )
 
-            # 유효한 데이터만 선택
-            filtered_df = filtered_df[filtered_df["데이터_유효"]]
-
-            # 초과근무 데이터 정리
-            overtime_records = []
-
-            # 정규 근무시간 설정 (9:00-18:00)
-            regular_start = time(9, 0)
-            regular_end = time(18, 0)
-
-            for _, row in filtered_df.iterrows():
-                try:
-                    # 날짜 처리
-                    work_date = row["날짜_datetime"].date()
-
-                    # 출/퇴근 시간 누락 여부 플래그
-                    has_missing_time = False
-                    missing_time_fields = []
-
-                    # 출근시간 처리 (HH:mm 고정 형식)
-                    if pd.isna(row[col_mapping["시작시간"]]):
-                        has_missing_time = True
-                        missing_time_fields.append("출근시간")
-
-                    start_time = parse_time(row[col_mapping["시작시간"]], regular_start)
-
-                    if start_time is None:
-                        # 시작 시간이 없거나 파싱 실패
-                        has_missing_time = True
-                        missing_time_fields.append("출근시간")
-                        start_time = regular_start  # 일단 기본값 설정 (나중에 의심 데이터로 표시)
-
-                    # 퇴근시간 처리 (HH:mm 고정 형식)
-                    if pd.isna(row[col_mapping["종료시간"]]):
-                        has_missing_time = True
-                        missing_time_fields.append("퇴근시간")
-
-                    end_time = parse_time(row[col_mapping["종료시간"]], regular_end)
-
-                    if end_time is None:
-                        # 종료 시간이 없거나 파싱 실패
-                        has_missing_time = True
-                        missing_time_fields.append("퇴근시간")
-                        end_time = regular_end  # 일단 기본값 설정 (나중에 의심 데이터로 표시)
-
-                    # 업무일 결정 (새벽 4시 기준)
-                    business_date = work_date
-
-                    # 자정 이후 새벽 4시 이전 근무는 전날 업무일로 계산
-                    if end_time < time(4, 0):
-                        business_date = work_date - timedelta(days=1)
-
-                    # 휴일 여부 확인 (F열 데이터만 사용)
-                    is_holiday = False
-
-                    # F열(휴일여부) 데이터 확인
-                    if "휴일여부" in df.columns and pd.notna(row["휴일여부"]):
-                        holiday_value = str(row["휴일여부"]).strip().lower()
-                        # "Y", "휴일", "공휴일", "토요일", "일요일" 등의 문자가 포함되어 있으면 휴일로 판단
-                        holiday_keywords = ["y", "휴", "공휴", "토요일", "일요일"]
-                        is_holiday = any(x in holiday_value for x in holiday_keywords)
-                        matched_keywords = [x for x in holiday_keywords if x in holiday_value]
-                        if matched_keywords:
-                            print(
-                                f"[휴일판단] 날짜: {business_date}, 휴일여부: {is_holiday}, F열 데이터: '{row.get('휴일여부', '데이터 없음')}', 일치 키워드: {matched_keywords}"
-                            )
-                        else:
-                            print(
-                                f"[평일판단] 날짜: {business_date}, 평일근무, F열 데이터: '{row.get('휴일여부', '데이터 없음')}'"
-                            )
-                    else:
-                        # F열 데이터가 없거나 누락된 경우 기본값은 평일(False)로 설정
-                        print(
-                            f"[데이터없음] 날짜: {business_date}, 평일로 처리(기본값), F열 데이터: '{row.get('휴일여부', '데이터 없음')}'"
-                        )
-
-                    # 디버그 정보 출력
-                    if is_holiday:
-                        print(
-                            f"[휴일처리] {business_date} - {row.get('성명', '이름없음')} - 휴일로 처리됨"
-                        )
-
-                    # 초과근무 여부 확인
-                    # 휴일인 경우: 모든 시간이 초과근무 시간
-                    # 평일인 경우: 시작 시간이 18시 이후이거나 종료 시간이 9시 이전인 경우만 초과근무
-                    is_overtime = is_holiday or (
-                        start_time >= regular_end or end_time <= regular_start
-                    )
-
-                    # 직원 이름 정보
-                    employee_name = (
-                        str(row[col_mapping["이름"]])
-                        if pd.notna(row[col_mapping["이름"]])
-                        else "Unknown"
-                    )
-                    # 부서명 정보 추가 (있는 경우)
-                    department = (
-                        str(row["부서명"]) if "부서명" in row and pd.notna(row["부서명"]) else ""
-                    )  # 초과근무시간 정보 (있는 경우 사용)
-                    overtime_hours = None
-                    if "초과근무시간" in df.columns and pd.notna(row["초과근무시간"]):
-                        try:
-                            # 문자열이면 숫자로 변환 시도
-                            if isinstance(row["초과근무시간"], str):
-                                # 콤마, 공백 등 제거하고 숫자 변환
-                                clean_str = row["초과근무시간"].replace(",", "").strip()
-                                overtime_hours = float(clean_str)
-                            else:
-                                overtime_hours = float(row["초과근무시간"])
-                        except:
-                            print(f"초과근무시간 변환 실패: {row['초과근무시간']}")
-                            pass
-
-                    # 추가 정보 (근무내용)
-                    work_description = ""
-                    if "근무내용" in df.columns and pd.notna(row["근무내용"]):
-                        work_description = str(row["근무내용"]).strip()
-
-                    # 휴일인 경우 모든 시간을 초과근무로 처리
-                    if is_holiday:
-                        # 휴일 근무는 전체가 초과근무
-                        overtime_start = start_time
-                        overtime_end = end_time
-
-                        overtime_records.append(
-                            {
-                                "업무일": business_date,
-                                "날짜": work_date,
-                                "시작시간": overtime_start,
-                                "종료시간": overtime_end,
-                                "초과근무유형": "휴일근무",
-                                "직원명": employee_name,
-                                "부서명": department,
-                                "기록된_초과근무시간": overtime_hours,
-                                "근무내용": work_description,
-                                "휴일여부": True,
-                            }
-                        )
-                    # 평일인 경우 정규 근무시간(9-18)을 제외한 시간만 초과근무로 처리
-                    else:
-                        # 업무 시간이 정규 근무시간(9-18)에 걸쳐있는 경우, 그 부분은 초과근무가 아님
-                        if not is_overtime and (
-                            start_time < regular_end and end_time > regular_start
-                        ):
-                            # 시작 시간이 9시 이전이면 초과근무 시작 부분 기록
-                            if start_time < regular_start:
-                                overtime_start = start_time
-                                overtime_end = regular_start
-
-                                overtime_records.append(
-                                    {
-                                        "업무일": business_date,
-                                        "날짜": work_date,
-                                        "시작시간": overtime_start,
-                                        "종료시간": overtime_end,
-                                        "초과근무유형": "조기출근",
-                                        "직원명": employee_name,
-                                        "부서명": department,
-                                        "기록된_초과근무시간": overtime_hours,
-                                        "근무내용": work_description,
-                                        "휴일여부": False,
-                                    }
-                                )
-
-                            # 종료 시간이 18시 이후면 초과근무 종료 부분 기록
-                            if end_time > regular_end:
-                                overtime_start = regular_end
-                                overtime_end = end_time
-
-                                overtime_records.append(
-                                    {
-                                        "업무일": business_date,
-                                        "날짜": work_date,
-                                        "시작시간": overtime_start,
-                                        "종료시간": overtime_end,
-                                        "초과근무유형": "야근",
-                                        "직원명": employee_name,
-                                        "부서명": department,
-                                        "기록된_초과근무시간": overtime_hours,
-                                        "근무내용": work_description,
-                                        "휴일여부": False,
-                                    }
-                                )
-                        elif is_overtime:
-                            # 전체가 초과근무인 경우
-                            overtime_start = start_time
-                            overtime_end = end_time
-
-                            # 시간대에 따른 초과근무 유형 결정
-                            if overtime_start < regular_start:
-                                overtime_type = "조기출근"
-                            else:
-                                overtime_type = "야근"
-
-                            overtime_records.append(
-                                {
-                                    "업무일": business_date,
-                                    "날짜": work_date,
-                                    "시작시간": overtime_start,
-                                    "종료시간": overtime_end,
-                                    "초과근무유형": overtime_type,
-                                    "직원명": employee_name,
-                                    "부서명": department,
-                                    "기록된_초과근무시간": overtime_hours,
-                                    "근무내용": work_description,
-                                    "휴일여부": False,
-                                }
-                            )
-
-                except Exception as e:
-                    print(f"초과근무 기록 처리 중 오류: {str(e)}")
-                    error_desc = str(e)
-                    # 오류 발생 데이터 저장
-                    error_record = {
-                        "업무일": (
-                            business_date
-                            if "business_date" in locals()
-                            else work_date if "work_date" in locals() else "알 수 없음"
-                        ),
-                        "직원명": (
-                            employee_name
-                            if "employee_name" in locals()
-                            else row.get(col_mapping["이름"], "알 수 없음")
-                        ),
-                        "오류내용": error_desc,
-                        "원본데이터": {
-                            k: str(v)
-                            for k, v in row.items()
-                            if k
-                            in [
-                                col_mapping["날짜"],
-                                col_mapping["시작시간"],
-                                col_mapping["종료시간"],
-                                col_mapping["이름"],
-                                "부서명",
-                                "근무내용",
-                            ]
-                        },
-                    }
-
-                    # 오류 데이터 목록에 추가
-                    if not hasattr(self, "error_records"):
-                        self.error_records = []
-                    self.error_records.append(error_record)
-                    continue
-
-            # 누락된 시간 정보가 있는 데이터 검사 및 의심 데이터로 추가
-            missing_time_records = []
-            for record in filtered_df.iterrows():
-                row = record[1]
-                if pd.isna(row[col_mapping["시작시간"]]) or pd.isna(row[col_mapping["종료시간"]]):
-                    work_date = (
-                        row["날짜_datetime"].date() if pd.notna(row["날짜_datetime"]) else None
-                    )
-                    employee_name = (
-                        str(row[col_mapping["이름"]])
-                        if pd.notna(row[col_mapping["이름"]])
-                        else "Unknown"
-                    )
-                    department = (
-                        str(row["부서명"]) if "부서명" in row and pd.notna(row["부서명"]) else ""
-                    )
-
-                    missing_fields = []
-                    if pd.isna(row[col_mapping["시작시간"]]):
-                        missing_fields.append("출근시간")
-                    if pd.isna(row[col_mapping["종료시간"]]):
-                        missing_fields.append("퇴근시간")
-
-                    missing_time_records.append(
-                        {
-                            "업무일": work_date,
-                            "직원명": employee_name,
-                            "부서명": department,
-                            "누락필드": ", ".join(missing_fields),
-                            "원본데이터": {
-                                k: str(v)
-                                for k, v in row.items()
-                                if k
-                                in [
-                                    col_mapping["날짜"],
-                                    col_mapping["시작시간"],
-                                    col_mapping["종료시간"],
-                                    col_mapping["이름"],
-                                    "부서명",
-                                    "근무내용",
-                                ]
-                            },
-                        }
-                    )
-
-            # 시간 누락 기록 저장
-            self.missing_time_records = missing_time_records
-            if missing_time_records:
-                print(
-                    f"[주의] {len(missing_time_records)}개의 출/퇴근 시간 누락 기록이 발견되었습니다."
-                )
-
-            return overtime_records
-
+    def reset_employee_index(self, builder=None):
+        """직원별 상세 보기를 비웁니다. builder 가 있으면 처음 볼 때 색인을 만듭니다."""
+        self.employee_index_builder = builder
+        self.set_employee_index(None)
+
+    def set_employee_index(self, index, message=None):
+        """직원별 보기/타임라인에 쓸 색인을 바꿉니다. (타임라인은 보고 있을 때만 다시 그림)"""
+        if message is None:
+            self.employee_panel.set_index(index)
+        else:
+            self.employee_panel.set_index(index, message)
+        if self.result_tabs.currentWidget() is self.timeline_view:
+            self.update_timeline()
+
+    def ensure_employee_index(self):
+        """직원별 색인이 아직 없으면 만듭니다."""
+        builder = self.employee_index_builder
+        if builder is None or self.employee_panel.index is not None:
+            return
+        self.employee_index_builder = None
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            self.set_employee_index(builder())
         except Exception as e:
-            # 예외 발생 시 상세 정보 출력하고 다시 발생
-            import traceback
-
-            print(f"초과근무 기록 처리 중 오류: {str(e)}")
-            print(traceback.format_exc())
-            raise
-
-    def compare_security_and_overtime(self, security_status_by_day, overtime_records):
-        """경비 상태와 초과근무 기록을 비교 분석하여 의심스러운 기록을 찾습니다."""
-        suspicious_records = []
-
-        # 각 초과근무 기록에 대해 경비 상태 확인
-        for overtime in overtime_records:
-            business_date = overtime["업무일"]
-            employee_name = overtime["직원명"]
-            overtime_start = overtime["시작시간"]
-            overtime_end = overtime["종료시간"]
-
-            # 업무일에 해당하는 경비 기록 찾기
-            security_status = security_status_by_day.get(business_date, [])
-
-            if not security_status:
-                # 해당 업무일의 경비 기록이 없는 경우 의심 데이터로 저장
-                if not hasattr(self, "no_security_records"):
-                    self.no_security_records = []
-
-                self.no_security_records.append(
-                    {
-                        "업무일": business_date,
-                        "직원명": employee_name,
-                        "초과근무시간": f"{overtime_start.strftime('%H:%M')}-{overtime_end.strftime('%H:%M')}",
-                        "문제": "경비 기록 없음",
-                    }
-                )
-                print(
-                    f"[의심데이터] {business_date} - {employee_name} - 경비 기록 없음 (사용자 확인 필요)"
-                )
-                # 경비 기록이 없어도 의심 데이터로 추가
-                suspicious_reason = "해당 업무일에 경비 기록 없음"
-
-                # 초과근무 기록에서 추가 정보 수집
-                work_content = ""
-                department = ""
-                is_holiday = False
-
-                for ovt_record in overtime_records:
-                    if (
-                        ovt_record["직원명"] == employee_name
-                        and ovt_record["업무일"] == business_date
-                    ):
-                        if "부서명" in ovt_record and ovt_record["부서명"]:
-                            department = ovt_record["부서명"]
-                        if "근무내용" in ovt_record and ovt_record["근무내용"]:
-                            work_content = ovt_record["근무내용"]
-                        if "휴일여부" in ovt_record:
-                            is_holiday = ovt_record["휴일여부"]
-                        break
-
-                suspicious_records.append(
-                    {
-                        "날짜": business_date,
-                        "직원명": employee_name,
-                        "부서명": department,
-                        "초과근무시간": f"{overtime_start.strftime('%H:%M')}-{overtime_end.strftime('%H:%M')}",
-                        "경비상태": "기록 없음",
-                        "의심사유": suspicious_reason,
-                        "근무내용": work_content,
-                        "휴일여부": "휴일" if is_holiday else "평일",
-                    }
-                )
-                continue
-
-            # 초과근무 시간과 경비 상태 비교
-            security_active = False  # 경비가 활성화된 상태인지
-            suspicious_reason = None
-
-            # 초과근무 시간을 datetime으로 변환
-            overtime_start_dt = datetime.combine(overtime["날짜"], overtime_start)
-            overtime_end_dt = datetime.combine(overtime["날짜"], overtime_end)
-
-            # 자정을 넘어가는 경우 다음날로 설정
-            if overtime_end < overtime_start:
-                overtime_end_dt = datetime.combine(
-                    overtime["날짜"] + timedelta(days=1), overtime_end
-                )
-
-            # 경비 기록을 시간순으로 정렬
-            security_status.sort(key=lambda x: x["시간"])
-
-            # 경비 상태 변화 기록
-            security_changes = []
-
-            # 경비 상태 기록을 시간 순으로 정렬하고 상태 변화 추적
-            for record in security_status:
-                record_time = datetime.strptime(record["시간"], "%Y-%m-%d %H:%M")
-                security_changes.append({"시간": record_time, "상태": record["상태"]})
-
-            # 경비 변화가 없으면 다음 기록으로 넘어감
-            if not security_changes:
-                continue
-
-            # 초기 상태 설정
-            security_changes.sort(key=lambda x: x["시간"])
-
-            # 의심 시간 구간 계산
-            suspicious_intervals = []
-
-            # 초과근무 시간과 경비 상태를 구간별로 비교하여 의심 시간대 계산
-            # 경비 상태의 시간대별 구간 생성 (경비시작-경비해제 구간)
-            security_periods = []
-
-            # 경비 변화 상태에 따른 시간대 구간 생성
-            if len(security_changes) > 0:
-                # 먼저 첫 상태가 "해제"인 경우, 자정부터 첫 해제까지는 경비 활성화 상태로 간주
-                if security_changes[0]["상태"] == "해제":
-                    midnight = datetime.combine(overtime["날짜"], time(0, 0))
-                    security_periods.append(
-                        {
-                            "시작": midnight,
-                            "종료": security_changes[0]["시간"],
-                            "상태": "시작",  # 경비 활성화 상태
-                        }
-                    )
-
-                # 이후의 상태 변화를 추적하며 구간 생성
-                for i in range(len(security_changes)):
-                    current = security_changes[i]
-
-                    # 마지막 항목이거나 다음 항목의 상태가 현재와 다른 경우
-                    if i == len(security_changes) - 1:
-                        # 마지막 상태가 "시작"인 경우, 해당 시작부터 자정까지 경비 활성화 상태로 간주
-                        if current["상태"] == "시작":
-                            next_day = datetime.combine(
-                                overtime["날짜"] + timedelta(days=1), time(0, 0)
-                            )
-                            security_periods.append(
-                                {"시작": current["시간"], "종료": next_day, "상태": "시작"}
-                            )
-                    else:
-                        next_change = security_changes[i + 1]
-                        # 현재 상태부터 다음 상태 변경 전까지의 구간 생성
-                        security_periods.append(
-                            {
-                                "시작": current["시간"],
-                                "종료": next_change["시간"],
-                                "상태": current["상태"],
-                            }
-                        )
-
-            # 경비기록이 하나도 없는 경우 (상태 변화가 없는 경우)
-            if len(security_periods) == 0:
-                # 기본적으로 보수적인 접근: 경비 활성화 상태로 간주
-                today_start = datetime.combine(overtime["날짜"], time(0, 0))
-                tomorrow_start = datetime.combine(overtime["날짜"] + timedelta(days=1), time(0, 0))
-                security_periods.append(
-                    {
-                        "시작": today_start,
-                        "종료": tomorrow_start,
-                        "상태": "시작",  # 경비 활성화 상태
-                    }
-                )
-
-            # 초과근무 시간과 경비 활성화 시간대를 비교하여 의심 구간 계산
-            suspicious_intervals = []
-
-            # 각 경비 활성화 구간과 초과근무 시간 비교
-            for period in security_periods:
-                # 경비 활성화 상태인 경우만 검사
-                if period["상태"] == "시작":
-                    # 초과근무 시간이 경비 활성화 구간과 겹치는지 확인
-                    if max(period["시작"], overtime_start_dt) < min(
-                        period["종료"], overtime_end_dt
-                    ):
-                        # 겹치는 구간 계산
-                        overlap_start = max(period["시작"], overtime_start_dt)
-                        overlap_end = min(period["종료"], overtime_end_dt)
-                        suspicious_intervals.append((overlap_start, overlap_end))
-
-                        # 디버그 출력
-                        print(
-                            f"[의심기록] {business_date} - {employee_name} - 경비활성화({period['시작'].strftime('%H:%M:%S')}-{period['종료'].strftime('%H:%M:%S')}) 중 초과근무 발생({overlap_start.strftime('%H:%M:%S')}-{overlap_end.strftime('%H:%M:%S')})"
-                        )
-
-            # 모든 의심 구간에 대해 총 중첩 시간 계산
-            total_suspicious_hours = 0
-            suspicious_periods = []
-
-            for start_time, end_time in suspicious_intervals:
-                if start_time < end_time:  # 유효한 구간만 처리
-                    duration_hours = (end_time - start_time).seconds / 3600
-                    if duration_hours > 0:  # 1분이라도 중첩되면 의심 구간으로 간주
-                        total_suspicious_hours += duration_hours
-                        start_str = start_time.strftime("%H:%M")
-                        end_str = end_time.strftime("%H:%M")
-                        suspicious_periods.append(f"{start_str}-{end_str}")
-
-            # 의심 시간이 있으면 기록
-            if total_suspicious_hours > 0:  # 1분이라도 의심 시간이 있으면 기록
-                period_str = ", ".join(suspicious_periods)
-                suspicious_reason = f"경비 작동 중 총 {total_suspicious_hours:.1f}시간 초과근무 기록 존재 ({period_str})"
-
-                # 디버그 정보: 의심 세부 정보
-                print(f"[의심결과] {business_date} - {employee_name}")
-                print(
-                    f"  ├─ 초과근무: {overtime_start_dt.strftime('%H:%M')}-{overtime_end_dt.strftime('%H:%M')}"
-                )
-                print(f"  ├─ 의심구간: {period_str}")
-                print(f"  └─ 총 의심시간: {total_suspicious_hours:.2f}시간")
-
-                # 초과근무 기록에서 추가 정보 찾기
-                department = ""
-                work_content = ""
-
-                # 해당 직원의 초과근무 기록 중에서 부가 정보 찾기
-                for ovt_record in overtime_records:
-                    if (
-                        ovt_record["직원명"] == employee_name
-                        and ovt_record["업무일"] == business_date
-                    ):
-                        if "부서명" in ovt_record and ovt_record["부서명"]:
-                            department = ovt_record["부서명"]
-                        if "근무내용" in ovt_record and ovt_record["근무내용"]:
-                            work_content = ovt_record["근무내용"]
-                        break
-
-                # 휴일 여부 파악
-                is_holiday = False
-                for ovt_record in overtime_records:
-                    if (
-                        ovt_record["직원명"] == employee_name
-                        and ovt_record["업무일"] == business_date
-                    ):
-                        if "휴일여부" in ovt_record:
-                            is_holiday = ovt_record["휴일여부"]
-                        break
-
-                # 휴일 여부에 따라 의심 사유 보완
-                if is_holiday:
-                    suspicious_reason += " (휴일 근무)"
-
-                # 결과에 추가할 의심 정보 준비
-                security_info = "경비 작동 중"
-
-                # 경비 설정 시간 정보가 있으면 포함
-                security_set_times = []
-                for change in security_changes:
-                    if (
-                        change["상태"] == "시작"
-                        and overtime_start_dt <= change["시간"] <= overtime_end_dt
-                    ):
-                        security_set_times.append(change["시간"].strftime("%H:%M:%S"))
-
-                if security_set_times:
-                    security_info += f" (경비설정시각: {', '.join(security_set_times)})"
-
-                suspicious_records.append(
-                    {
-                        "날짜": business_date,
-                        "직원명": employee_name,
-                        "부서명": department,
-                        "초과근무시간": f"{overtime_start.strftime('%H:%M')}-{overtime_end.strftime('%H:%M')}",
-                        "경비상태": security_info,
-                        "의심사유": suspicious_reason,
-                        "근무내용": work_content,
-                        "휴일여부": "휴일" if is_holiday else "평일",
-                    }
-                )
-
-        return suspicious_records
+            print(traceback.format_exc())  # 상세 오류 정보 출력
+            self.set_employee_index(None, f"직원별 기록을 만들지 못했습니다: {e}")
+        finally:
+            QApplication.restoreOverrideCursor()
+
+    def update_timeline(self):
+        """직원별 색인이 바뀌었으면 타임라인 데이터를 다시 만듭니다."""
+        index = self.employee_panel.index
+        if index is self.timeline_index:
+            return
+        self.timeline_index = index
+        self.timeline_view.set_data(TimelineData.from_index(index) if index is not None else None)
+
+    def result_tab_changed(self, tab_index):
+        widget = self.result_tabs.widget(tab_index)
+        if widget is self.employee_panel or widget is self.timeline_view:
+            self.ensure_employee_index()
+        if widget is self.timeline_view:
+            self.update_timeline()
+        if widget is self.summary_widget:
+            self.update_summary()
+
+    # 결과 테이블에서 더블클릭한 기록의 직원/월을 직원별 보기에 표시
+    def open_employee_view(self, model_index):
+        record = self.result_model.record_at(model_index.row())
+        self.ensure_employee_index()
+        if self.employee_panel.show_employee(
+            record["직원명"], record.get("부서명", ""), record.get("날짜")
+        ):
+            self.result_tabs.setCurrentWidget(self.employee_panel)
+
+    # 타임라인에서 더블클릭한 직원/시각을 직원별 보기에 표시
+    def open_employee_key(self, employee_key, moment):
+        if self.employee_panel.show_employee_key(employee_key, moment):
+            self.result_tabs.setCurrentWidget(self.employee_panel)
+
+    def result_cache_key(self, engine):
+        """분석 결과 캐시 키를 반환합니다. 원본 파일을 찾을 수 없으면(예: 세션으로 연 경우) None"""
+        paths = [self.security_path, self.overtime_path, self.zone_path]
+        if not all(paths[:2]) or not all(os.path.exists(path) for path in paths if path):
+            return None
+        return analysis_cache_key(engine, *paths)
+
+    def store_cached_result(self, cache_key, suspicious_records):
+        """분석 결과를 캐시에 저장합니다. (저장에 실패해도 분석 결과는 그대로 사용)"""
+        try:
+            self.result_cache.put(cache_key, suspicious_records, self.diagnostics)
+        except Exception as e:
+            print(f"[경고] 분석 결과 캐시 저장 실패: {e}")
 
     def display_results(self, suspicious_records):
         """의심스러운 기록을 테이블에 표시합니다."""
-        # 테이블 초기화
-        self.table.setRowCount(0)
-        self.suspicious_records = suspicious_records
-
-        if not suspicious_records:
+        self.result_model.set_records(suspicious_records)
+        # 결과 모델의 목록을 그대로 사용 (분석 중 추가되는 기록도 함께 반영)
+        self.suspicious_records = self.result_model.records
+        self.reset_result_filter()
+        self.reset_summary()
+
+    def reset_summary(self):
+        """요약을 다시 계산하도록 비웁니다. (요약 탭을 보고 있으면 바로 계산)"""
+        self.summary_tables = None
+        if self.result_tabs.currentWidget() is self.summary_widget:
+            self.update_summary()
+
+    def update_summary(self):
+        """선택한 종류의 월간 요약 표를 표시합니다."""
+        if self.analysis_worker is not None:
+            self.summary_model.set_frame(None)
+            self.summary_label.setText("분석이 끝나면 요약이 표시됩니다.")
             return
-
-        # 테이블 컬럼 수 조정 (추가 정보를 위해)
-        self.table.setColumnCount(
-            8
-        )  # 날짜, 직원명, 부서명, 초과근무시간, 경비상태, 의심사유, 근무내용, 휴일여부
-        self.table.setHorizontalHeaderLabels(
-            [
-                "날짜",
-                "직원명",
-                "부서명",
-                "초과근무시간",
-                "경비상태",
-                "의심사유",
-                "근무내용",
-                "휴일여부",
-            ]
-        )
-
-        # 테이블에 행 추가
-        for i, record in enumerate(suspicious_records):
-            self.table.insertRow(i)
-
-            # 날짜
-            date_item = QTableWidgetItem(
-                record["날짜"].strftime("%Y-%m-%d")
-                if hasattr(record["날짜"], "strftime")
-                else str(record["날짜"])
+        if self.summary_tables is None:
+            self.summary_tables = summary_tables(self.suspicious_records)
+        table = self.summary_tables[self.summary_kind.currentData()]
+        self.summary_model.set_frame(table)
+        self.summary_label.setText(f"의심 기록 {len(self.suspicious_records)}건 ({len(table)}행)")
+
+    def reset_result_filter(self):
+        """필터 조건을 비우고 전체 결과를 표시합니다. 날짜 범위는 결과의 첫날~마지막날로 맞춥니다."""
+        for widget in self.filter_widgets:
+            widget.blockSignals(True)
+        self.filter_employee.clear()
+        self.filter_department.clear()
+        self.filter_date_enabled.setChecked(False)
+        self.filter_holiday.setCurrentIndex(0)
+        self.filter_min_hours.setValue(0)
+        if self.suspicious_records:
+            index = self.result_model.search_index()
+            date_range = index.date_range()
+            if date_range is not None:
+                self.filter_start_date.setDate(QDate(date_range[0]))
+                self.filter_end_date.setDate(QDate(date_range[1]))
+            # 직원명/부서명 자동 완성
+            for line_edit, field in (
+                (self.filter_employee, "직원명"),
+                (self.filter_department, "부서명"),
+            ):
+                completer = QCompleter(index.values(field), line_edit)
+                completer.setCaseSensitivity(Qt.CaseInsensitive)
+                completer.setFilterMode(Qt.MatchContains)
+                line_edit.setCompleter(completer)
+        for widget in self.filter_widgets:
+            widget.blockSignals(False)
+        self.apply_result_filter()
+
+    def apply_result_filter(self):
+        """필터 바의 조건에 맞는 의심 기록만 결과 테이블에 표시합니다."""
+        criteria = {}
+        if self.filter_employee.text().strip():
+            criteria["employee"] = self.filter_employee.text()
+        if self.filter_department.text().strip():
+            criteria["department"] = self.filter_department.text()
+        if self.filter_date_enabled.isChecked():
+            criteria["start"] = self.filter_start_date.date().toPyDate()
+            criteria["end"] = self.filter_end_date.date().toPyDate()
+        if self.filter_holiday.currentData() is not None:
+            criteria["holiday"] = self.filter_holiday.currentData()
+        if self.filter_min_hours.value() > 0:
+            criteria["min_hours"] = self.filter_min_hours.value()
+        self.result_model.set_filter(**criteria)
+
+        total = len(self.suspicious_records)
+        if criteria:
+            self.result_count_label.setText(
+                f"의심 기록: {total}건 (필터 결과 {self.result_model.rowCount()}건)"
             )
-            self.table.setItem(i, 0, date_item)
-
-            # 직원명
-            name_item = QTableWidgetItem(str(record["직원명"]))
-            self.table.setItem(i, 1, name_item)
-
-            # 부서명
-            dept_item = QTableWidgetItem(str(record.get("부서명", "")))
-            self.table.setItem(i, 2, dept_item)
-
-            # 초과근무 시간
-            time_item = QTableWidgetItem(str(record["초과근무시간"]))
-            self.table.setItem(i, 3, time_item)
-
-            # 경비 상태
-            security_item = QTableWidgetItem(str(record["경비상태"]))
-            self.table.setItem(i, 4, security_item)
-
-            # 의심 사유
-            reason_item = QTableWidgetItem(str(record["의심사유"]))
-            self.table.setItem(i, 5, reason_item)
-
-            # 근무내용
-            content_item = QTableWidgetItem(str(record.get("근무내용", "")))
-            self.table.setItem(i, 6, content_item)
-
-            # 휴일여부
-            holiday_item = QTableWidgetItem(str(record.get("휴일여부", "평일")))
-            self.table.setItem(i, 7, holiday_item)
+        else:
+            self.result_count_label.setText(f"의심 기록: {total}건")
+
+    def display_diagnostics(self):
+        """확인 필요 데이터의 분류별 건수를 표시합니다."""
+        summary = self.diagnostics.summary()
+        self.diagnostics_summary_table.setRowCount(len(summary))
+        for i, (category, label, count) in enumerate(summary):
+            label_item = QTableWidgetItem(label)
+            label_item.setData(Qt.UserRole, category)
+            label_item.setFlags(label_item.flags() & ~Qt.ItemIsEditable)
+            count_item = QTableWidgetItem(str(count))
+            count_item.setFlags(count_item.flags() & ~Qt.ItemIsEditable)
+            self.diagnostics_summary_table.setItem(i, 0, label_item)
+            self.diagnostics_summary_table.setItem(i, 1, count_item)
+
+        self.diagnostics_sample_table.clear()
+        self.diagnostics_sample_table.setRowCount(0)
+        self.diagnostics_sample_table.setColumnCount(0)
+        self.diagnostics_sample_label.setText("분류를 선택하면 상세 기록이 표시됩니다.")
+        self.result_tabs.setTabText(1, f"확인 필요 데이터 ({self.diagnostics.total_count()})")
+
+    def show_diagnostic_samples(self):
+        """선택한 분류의 샘플 기록을 표시합니다."""
+        selected = self.diagnostics_summary_table.selectedItems()
+        if not selected:
+            return
+        category = self.diagnostics_summary_table.item(selected[0].row(), 0).data(Qt.UserRole)
+        samples = self.diagnostics.samples(category)
+
+        columns = []
+        for record in samples:
+            for key in record:
+                if key not in columns:
+                    columns.append(key)
+
+        self.diagnostics_sample_table.clear()
+        self.diagnostics_sample_table.setColumnCount(len(columns))
+        self.diagnostics_sample_table.setHorizontalHeaderLabels(columns)
+        self.diagnostics_sample_table.setRowCount(len(samples))
+        for i, record in enumerate(samples):
+            for j, key in enumerate(columns):
+                item = QTableWidgetItem(str(record.get(key, "")))
+                item.setFlags(item.flags() & ~Qt.ItemIsEditable)
+                self.diagnostics_sample_table.setItem(i, j, item)
+
+        count = self.diagnostics.count(category)
+        if self.diagnostics.is_truncated(category):
+            self.diagnostics_sample_label.setText(
+                f"{DIAGNOSTIC_CATEGORIES[category]}: 전체 {count}건 중 {len(samples)}건 표시"
+            )
+        else:
+            self.diagnostics_sample_label.setText(f"{DIAGNOSTIC_CATEGORIES[category]}: {count}건")
 
     def export_results(self):
         # 의심 기록이 없는 경우 처리
@@ -1296,32 +983,33 @@ class OvertimeAnalyzer(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "오류", f"결과 내보내기 중 오류가 발생했습니다: {str(e)}")
 
+    def export_all_results(self):
+        """요약, 의심 기록, 확인 필요 데이터를 시트별로 나눠 하나의 엑셀 파일로 내보냅니다."""
+        if self.analysis_summary is None:
+            QMessageBox.information(self, "내보내기", "먼저 분석을 실행해 주세요.")
+            return
+
+        options = QFileDialog.Options()
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "전체 분석 자료 저장", "", "Excel Files (*.xlsx)", options=options
+        )
+
+        if not file_path:
+            return
+
+        try:
+            export_analysis_workbook(
+                file_path, self.suspicious_records, self.diagnostics, self.analysis_summary
+            )
+            QMessageBox.information(self, "완료", f"결과가 성공적으로 저장되었습니다:\n{file_path}")
+
+        except Exception as e:
+            QMessageBox.critical(self, "오류", f"결과 내보내기 중 오류가 발생했습니다: {str(e)}")
+
     def export_suspicious_records(self, file_path):
         """의심 기록만 엑셀로 내보냅니다."""
-        # 결과를 데이터프레임으로 변환
-        data = []
-        for row in range(self.table.rowCount()):
-            date = self.table.item(row, 0).text()
-            employee = self.table.item(row, 1).text()
-            department = self.table.item(row, 2).text() if self.table.item(row, 2) else ""
-            overtime = self.table.item(row, 3).text()
-            security = self.table.item(row, 4).text()
-            reason = self.table.item(row, 5).text()
-            work_content = self.table.item(row, 6).text() if self.table.item(row, 6) else ""
-            holiday_status = self.table.item(row, 7).text() if self.table.item(row, 7) else "평일"
-
-            data.append(
-                {
-                    "날짜": date,
-                    "직원명": employee,
-                    "부서명": department,
-                    "초과근무 시간": overtime,
-                    "경비상태": security,
-                    "의심 사유": reason,
-                    "근무내용": work_content,
-                    "휴일여부": holiday_status,
-                }
-            )
+        # 결과를 화면에 표시된 값 그대로 데이터프레임으로 변환
+        data = self.result_model.to_frame_rows()
 
         # 엑셀로 저장
         df = pd.DataFrame(data)
@@ -1329,6 +1017,8 @@ class OvertimeAnalyzer(QMainWindow):
 
 
 if __name__ == "__main__":
+    # PyInstaller 실행 파일에서 구역별 병렬 처리(프로세스 풀)를 사용하기 위해 필요
+    multiprocessing.freeze_support()
     app = QApplication(sys.argv)
     window = OvertimeAnalyzer()
     window.show()
@@ -0,0 +1,123 @@
+# 파일 단위 분석 공용 로직 (명령줄 분석, 폴더 감시 모드에서 함께 사용)
+import os
+
+from analyzer_engine import OvertimeAnalysisEngine
+from frame_dtypes import normalize_overtime_frame, normalize_security_frame
+from input_readers import read_input_file
+from report_export import analysis_summary, export_analysis_workbook
+from result_cache import analysis_cache_key
+from security_log import DEFAULT_MEMORY_BUDGET_MB, should_stream
+from zone_mapping import load_zone_mapping
+
+
+def read_inputs(security_path, overtime_path, memory_budget_mb=DEFAULT_MEMORY_BUDGET_MB):
+    """(경비 기록, 정규화된 초과근무 데이터프레임) 을 반환합니다.
+
+    경비 기록 파일이 스트리밍 전환 기준보다 크면 데이터프레임 대신 파일 경로를 반환합니다. (스트리밍 모드로 분석)
+    """
+    overtime_df = normalize_overtime_frame(read_input_file(overtime_path, header=0))
+    if should_stream(security_path, memory_budget_mb):
+        return security_path, overtime_df
+    return normalize_security_frame(read_input_file(security_path)), overtime_df
+
+
+def analyze_inputs(
+    engine, security, overtime_df, zone_mapping=None, memory_budget_mb=DEFAULT_MEMORY_BUDGET_MB
+):
+    """read_inputs 결과를 분석하여 의심 기록 목록을 반환합니다. (경비 기록이 경로이면 스트리밍 모드)"""
+    if isinstance(security, str):
+        return engine.analyze_streaming(security, overtime_df, zone_mapping, memory_budget_mb)
+    return engine.analyze(security, overtime_df, zone_mapping)
+
+
+def analyze_in_worker(
+    start_date,
+    end_date,
+    holiday_source,
+    dedupe_seconds,
+    rule_tables,
+    security,
+    overtime_df,
+    zone_mapping,
+    budget,
+):
+    """프로세스 풀에서 분석을 실행하고 (의심 기록, 확인 필요 데이터 dict) 를 반환합니다.
+
+    풀 안에서 다시 프로세스를 만들지 않도록 구역별 작업은 순차 실행합니다.
+    """
+    engine = OvertimeAnalysisEngine(
+        start_date,
+        end_date,
+        max_workers=1,
+        rule_tables=rule_tables,
+        holiday_source=holiday_source,
+        dedupe_seconds=dedupe_seconds,
+    )
+    records = analyze_inputs(engine, security, overtime_df, zone_mapping, budget)
+    return records, engine.diagnostics.to_dict()
+
+
+def analyze_files(
+    engine,
+    security_path,
+    overtime_path,
+    zone_path=None,
+    memory_budget_mb=DEFAULT_MEMORY_BUDGET_MB,
+):
+    """입력 파일을 읽어 분석하고 의심 기록 목록을 반환합니다.
+
+    경비 기록 파일이 스트리밍 전환 기준보다 크면 스트리밍 모드로 분석합니다.
+    """
+    zone_mapping = load_zone_mapping(zone_path) if zone_path else None
+    security, overtime_df = read_inputs(security_path, overtime_path, memory_budget_mb)
+    return analyze_inputs(engine, security, overtime_df, zone_mapping, memory_budget_mb)
+
+
+def analyze_with_cache(
+    engine,
+    security_path,
+    overtime_path,
+    zone_path=None,
+    memory_budget_mb=DEFAULT_MEMORY_BUDGET_MB,
+    cache=None,
+):
+    """캐시(ResultCache)에 같은 조건의 결과가 있으면 사용하고, 없으면 분석한 뒤 저장합니다.
+
+    확인 필요 데이터는 engine.diagnostics 에 채워집니다.
+    """
+    cache_key = (
+        analysis_cache_key(engine, security_path, overtime_path, zone_path) if cache else None
+    )
+    cached = cache.get(cache_key, engine.diagnostics) if cache else None
+    if cached is not None:
+        return cached
+
+    suspicious_records = analyze_files(
+        engine, security_path, overtime_path, zone_path, memory_budget_mb
+    )
+    if cache:
+        try:
+            cache.put(cache_key, suspicious_records, engine.diagnostics)
+        except OSError as e:
+            print(f"[경고] 분석 결과 캐시 저장 실패: {e}")
+    return suspicious_records
+
+
+def write_workbook(file_path, engine, suspicious_records):
+    """요약/의심 기록/확인 필요 데이터 시트를 담은 엑셀 파일을 저장합니다.
+
+    다른 프로그램이 쓰는 도중의 파일을 읽지 않도록 임시 파일에 쓴 뒤 이름을 바꿉니다.
+    """
+    directory, name = os.path.split(os.path.abspath(file_path))
+    tmp_path = os.path.join(directory, f"~{name}")
+    try:
+        export_analysis_workbook(
+            tmp_path,
+            suspicious_records,
+            engine.diagnostics,
+            analysis_summary(engine, suspicious_records),
+        )
+        os.replace(tmp_path, file_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
@@ -0,0 +1,232 @@
+# 여러 파일 쌍을 읽기/분석/저장 단계로 나누어 겹쳐 실행하는 일괄 분석 파이프라인
+#
+# 읽기 스레드가 다음 파일 쌍을 미리 읽는 동안 분석 프로세스는 앞 쌍을 분석하고, 저장 스레드는 그 앞 쌍의
+# 결과 엑셀 파일을 씁니다. 단계 사이는 크기가 제한된 큐로 연결되어 있어, 느린 단계가 있으면 앞 단계가
+# 큐에 자리가 날 때까지 기다립니다. (읽어 둔 데이터가 메모리에 계속 쌓이지 않음)
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from analysis_diagnostics import AnalysisDiagnostics
+from analyzer_engine import OvertimeAnalysisEngine
+from batch_analysis import analyze_in_worker, read_inputs, write_workbook
+from result_cache import analysis_cache_key
+from security_log import DEFAULT_DEDUPE_SECONDS, DEFAULT_MEMORY_BUDGET_MB
+from zone_mapping import load_zone_mapping
+
+DEFAULT_READERS = 2
+DEFAULT_WRITERS = 1
+# 단계 사이 큐에 담아 둘 수 있는 파일 쌍 수
+DEFAULT_QUEUE_SIZE = 2
+
+PIPELINE_STAGES = ("읽기", "분석", "저장")
+
+_STOP = object()
+
+
+class BatchPipeline:
+    """파일 쌍 목록을 읽기 → 분석 → 저장 파이프라인으로 처리합니다.
+
+    파일 쌍은 (이름, 경비 기록 경로, 초과근무 기록 경로, 결과 파일 경로) 이며, 분석은 compute_workers
+    개의 프로세스에서 실행합니다. 캐시(ResultCache)에 결과가 있는 쌍은 읽기/분석 단계를 건너뜁니다.
+    """
+
+    def __init__(
+        self,
+        start_date=None,
+        end_date=None,
+        zone_path=None,
+        holiday_source="both",
+        dedupe_seconds=DEFAULT_DEDUPE_SECONDS,
+        readers=DEFAULT_READERS,
+        compute_workers=None,
+        writers=DEFAULT_WRITERS,
+        queue_size=DEFAULT_QUEUE_SIZE,
+        memory_budget_mb=DEFAULT_MEMORY_BUDGET_MB,
+        cache=None,
+    ):
+        if min(readers, writers, queue_size) < 1 or (compute_workers or 1) < 1:
+            raise ValueError("단계별 작업자 수와 큐 크기는 1 이상이어야 합니다.")
+        # 규칙/공휴일 달력은 한 번만 읽어 모든 파일 쌍에서 사용
+        self.engine = OvertimeAnalysisEngine(
+            start_date, end_date, holiday_source=holiday_source, dedupe_seconds=dedupe_seconds
+        )
+        self.zone_path = zone_path
+        self.readers = readers
+        self.compute_workers = compute_workers
+        self.writers = writers
+        self.queue_size = queue_size
+        self.memory_budget_mb = memory_budget_mb
+        self.cache = cache
+        self.zone_mapping = None
+        self.stage_seconds = dict.fromkeys(PIPELINE_STAGES, 0.0)
+        self._stage_lock = threading.Lock()
+
+    def _job_engine(self):
+        """저장 단계에서 요약 시트를 만들 때 쓰는 파일 쌍별 엔진"""
+        return OvertimeAnalysisEngine(
+            self.engine.start_date,
+            self.engine.end_date,
+            rule_tables=self.engine.rule_tables,
+            holiday_source=self.engine.holiday_source,
+            holiday_calendar=self.engine.holiday_calendar,
+            diagnostics=AnalysisDiagnostics(),
+            dedupe_seconds=self.engine.dedupe_seconds,
+        )
+
+    def _timed(self, stage, func, *args):
+        started = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            with self._stage_lock:
+                self.stage_seconds[stage] += time.perf_counter() - started
+
+    def _cache_key(self, job):
+        _, security_path, overtime_path, _ = job
+        return analysis_cache_key(self.engine, security_path, overtime_path, self.zone_path)
+
+    def _read(self, job):
+        """(캐시 키, 캐시된 결과 또는 None, 입력 데이터 또는 None)"""
+        cache_key = self._cache_key(job) if self.cache else None
+        if self.cache:
+            diagnostics = AnalysisDiagnostics()
+            cached = self.cache.get(cache_key, diagnostics)
+            if cached is not None:
+                return cache_key, (cached, diagnostics.to_dict()), None
+        _, security_path, overtime_path, _ = job
+        return cache_key, None, read_inputs(security_path, overtime_path, self.memory_budget_mb)
+
+    def _analyze(self, executor, cache_key, inputs):
+        security, overtime_df = inputs
+        entry = executor.submit(
+            analyze_in_worker,
+            self.engine.start_date,
+            self.engine.end_date,
+            self.engine.holiday_source,
+            self.engine.dedupe_seconds,
+            self.engine.rule_tables,
+            security,
+            overtime_df,
+            self.zone_mapping,
+            self.memory_budget_mb,
+        ).result()
+        if self.cache:
+            diagnostics = AnalysisDiagnostics()
+            diagnostics.load_dict(entry[1])
+            try:
+                self.cache.put(cache_key, entry[0], diagnostics)
+            except OSError as e:
+                print(f"[경고] 분석 결과 캐시 저장 실패: {e}")
+        return entry
+
+    def _write(self, job, entry):
+        suspicious_records, diagnostics_state = entry
+        engine = self._job_engine()
+        engine.diagnostics.load_dict(diagnostics_state)
+        write_workbook(job[3], engine, suspicious_records)
+        return len(suspicious_records)
+
+    def _reader(self, jobs, read_queue):
+        while True:
+            job = jobs.get()
+            if job is _STOP:
+                return
+            try:
+                item = (job, None) + self._timed("읽기", self._read, job)
+            except Exception as e:
+                item = (job, e, None, None, None)
+            read_queue.put(item)  # 큐가 가득 차면 분석 단계가 꺼내 갈 때까지 대기
+
+    def _computer(self, executor, read_queue, write_queue):
+        while True:
+            item = read_queue.get()
+            if item is _STOP:
+                return
+            job, error, cache_key, entry, inputs = item
+            if error is None and entry is None:
+                try:
+                    entry = self._timed("분석", self._analyze, executor, cache_key, inputs)
+                except Exception as e:
+                    error = e
+            write_queue.put((job, error, entry))
+
+    def _writer(self, write_queue, results):
+        while True:
+            item = write_queue.get()
+            if item is _STOP:
+                return
+            job, error, entry = item
+            if error is None:
+                try:
+                    results[job[3]] = self._timed("저장", self._write, job, entry)
+                    print(f"[INFO] 분석 완료: {job[3]} (의심 기록 {results[job[3]]}건)")
+                    continue
+                except Exception as e:
+                    error = e
+            results[job[3]] = error
+            print(f"[경고] '{job[0]}' 파일 쌍 분석 실패: {error}")
+
+    def run(self, jobs):
+        """파일 쌍을 모두 처리하고 {결과 파일 경로: 의심 기록 건수 또는 오류} 를 반환합니다."""
+        jobs = list(jobs)
+        if not jobs:
+            return {}
+        self.zone_mapping = load_zone_mapping(self.zone_path) if self.zone_path else None
+        self.stage_seconds = dict.fromkeys(PIPELINE_STAGES, 0.0)
+        compute_workers = self.compute_workers or min(len(jobs), os.cpu_count() or 1)
+
+        job_queue = queue.Queue()
+        for job in jobs:
+            job_queue.put(job)
+        read_queue = queue.Queue(maxsize=self.queue_size)
+        write_queue = queue.Queue(maxsize=self.queue_size)
+        results = {}
+
+        started = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=compute_workers) as executor:
+            stages = [
+                (
+                    [
+                        threading.Thread(target=self._reader, args=(job_queue, read_queue))
+                        for _ in range(self.readers)
+                    ],
+                    job_queue,
+                ),
+                (
+                    [
+                        threading.Thread(
+                            target=self._computer, args=(executor, read_queue, write_queue)
+                        )
+                        for _ in range(compute_workers)
+                    ],
+                    read_queue,
+                ),
+                (
+                    [
+                        threading.Thread(target=self._writer, args=(write_queue, results))
+                        for _ in range(self.writers)
+                    ],
+                    write_queue,
+                ),
+            ]
+            for threads, _ in stages:
+                for thread in threads:
+                    thread.start()
+            # 앞 단계가 모두 끝난 뒤에 다음 단계에 종료 신호를 보냄
+            for threads, input_queue in stages:
+                for _ in threads:
+                    input_queue.put(_STOP)
+                for thread in threads:
+                    thread.join()
+
+        busy = ", ".join(
+            f"{stage} {seconds:.1f}초" for stage, seconds in self.stage_seconds.items()
+        )
+        print(
+            f"[INFO] 일괄 분석 완료: {len(jobs)}쌍, {time.perf_counter() - started:.1f}초 "
+            f"(단계별 누적 시간: {busy})"
+        )
+        return results
@@ -31,6 +31,9 @@ PyInstaller.__main__.run(
         "--add-data={}".format(
             os.path.join(script_path, "requirements.txt") + os.path.pathsep + "."
         ),
+        "--add-data={}".format(
+            os.path.join(script_path, "classification_rules.json") + os.path.pathsep + "."
+        ),
         "--noupx",
     ]
 )
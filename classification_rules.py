@@ -0,0 +1,134 @@
+# 경비 모드 / 휴일여부 키워드 분류 규칙 테이블
+#
+# 규칙은 JSON 설정 파일에서 읽어 규칙 테이블마다 하나의 정규식으로 한 번만 컴파일하며,
+# 컬럼의 고유값에만 적용한 뒤 결과를 전체 행에 펼쳐서 분류 비용이 고유 문자열 수에 비례합니다.
+import hashlib
+import json
+import os
+import re
+import sys
+
+import numpy as np
+import pandas as pd
+
+# 기본 규칙 파일 이름 (실행 파일 옆에 같은 이름의 파일이 있으면 그 파일을 우선 사용)
+RULES_FILE_NAME = "classification_rules.json"
+
+# 규칙 파일 경로를 직접 지정하는 환경 변수
+RULES_FILE_ENV = "OVERTIME_ANALYZER_RULES"
+
+
+class KeywordClassifier:
+    """키워드 목록을 가진 규칙들을 순서대로 적용하여 값을 분류합니다.
+
+    값에 여러 규칙의 키워드가 포함되어 있으면 먼저 정의된 규칙이 우선합니다.
+    """
+
+    def __init__(self, rules, default):
+        self.labels = [rule["label"] for rule in rules]
+        self.default = default
+
+        # 모든 위치에서 키워드 시작 여부를 검사하도록 전방탐색(lookahead)으로 묶고,
+        # 같은 위치에서 여러 규칙이 맞으면 앞선 규칙 그룹이 선택되도록 규칙 순서대로 나열
+        groups = []
+        for i, rule in enumerate(rules):
+            keywords = sorted({str(k).lower() for k in rule["keywords"] if str(k)}, key=len)
+            if keywords:
+                alternation = "|".join(re.escape(k) for k in reversed(keywords))
+                groups.append(f"(?P<r{i}>{alternation})")
+        self.pattern = re.compile(f"(?=(?:{'|'.join(groups)}))") if groups else None
+
+    def match_rule(self, value):
+        """값에 포함된 키워드 중 가장 우선순위가 높은 규칙 번호를 반환합니다. (없으면 None)"""
+        if self.pattern is None:
+            return None
+        best = None
+        for match in self.pattern.finditer(str(value).strip().lower()):
+            rule_index = int(match.lastgroup[1:])
+            if best is None or rule_index < best:
+                best = rule_index
+                if best == 0:
+                    break
+        return best
+
+    def classify(self, value):
+        """값 하나를 분류하여 규칙 라벨(또는 기본값)을 반환합니다."""
+        rule_index = self.match_rule(value)
+        return self.default if rule_index is None else self.labels[rule_index]
+
+    def classify_series(self, series):
+        """시리즈의 고유값만 분류한 뒤 전체 행에 펼쳐 범주형 라벨 시리즈로 반환합니다. (결측값은 기본값)"""
+        codes, uniques = pd.factorize(series)
+        # 범주는 데이터에 나온 라벨과 관계없이 규칙 라벨 전체 + 기본값
+        label_names = list(dict.fromkeys(self.labels + [self.default]))
+        label_position = {label: i for i, label in enumerate(label_names)}
+        unique_codes = [label_position[self.classify(value)] for value in uniques]
+        # factorize 는 결측값을 -1 로 표시하므로 마지막 칸(기본값)을 가리키게 됨
+        label_codes = np.array(unique_codes + [label_position[self.default]], dtype=np.int32)
+        labels = pd.Categorical.from_codes(label_codes[codes], label_names)
+        return pd.Series(labels, index=series.index)
+
+
+class RuleTables:
+    """경비 모드와 휴일여부 분류 규칙 테이블 묶음"""
+
+    def __init__(self, config, source=None):
+        self.source = source
+        self.security_mode = KeywordClassifier(
+            config["security_mode"]["rules"], config["security_mode"].get("default", "기타")
+        )
+        self.holiday = KeywordClassifier(
+            config["holiday"]["rules"], config["holiday"].get("default", "평일")
+        )
+        # 규칙 내용이 바뀌면 버전도 바뀌도록 설정 내용의 해시를 포함
+        canonical = json.dumps(config, ensure_ascii=False, sort_keys=True)
+        digest = hashlib.sha1(canonical.encode("utf-8")).hexdigest()[:12]
+        self.version = f"{config.get('version', 1)}-{digest}"
+
+    def is_holiday_label(self, label):
+        return label != self.holiday.default
+
+
+def _bundled_rules_path():
+    # PyInstaller 실행 파일에서는 번들 데이터가 임시 폴더(_MEIPASS)에 풀림
+    base_dir = getattr(sys, "_MEIPASS", os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base_dir, RULES_FILE_NAME)
+
+
+def find_rules_file():
+    """환경 변수 > 실행 파일 옆 > 번들 기본값 순서로 규칙 파일 경로를 찾습니다."""
+    candidates = [os.environ.get(RULES_FILE_ENV)]
+    if getattr(sys, "frozen", False):
+        candidates.append(os.path.join(os.path.dirname(sys.executable), RULES_FILE_NAME))
+    candidates.append(_bundled_rules_path())
+
+    for path in candidates:
+        if path and os.path.exists(path):
+            return path
+    raise FileNotFoundError(f"분류 규칙 파일을 찾을 수 없습니다: {RULES_FILE_NAME}")
+
+
+def load_rule_tables(file_path=None):
+    """규칙 파일을 읽어 컴파일된 RuleTables 를 반환합니다."""
+    file_path = file_path or find_rules_file()
+    with open(file_path, encoding="utf-8") as f:
+        config = json.load(f)
+
+    try:
+        rule_tables = RuleTables(config, source=file_path)
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"분류 규칙 파일 형식이 올바르지 않습니다: {file_path} ({e})")
+
+    print(f"[INFO] 분류 규칙 로드: {file_path} (버전 {rule_tables.version})")
+    return rule_tables
+
+
+_default_rule_tables = None
+
+
+def get_rule_tables():
+    """기본 규칙 테이블을 반환합니다. (처음 호출할 때 한 번만 읽고 컴파일)"""
+    global _default_rule_tables
+    if _default_rule_tables is None:
+        _default_rule_tables = load_rule_tables()
+    return _default_rule_tables
@@ -0,0 +1,317 @@
+# 초과근무 분석기 명령줄 실행 (GUI 없이 일괄 분석)
+#
+# 사용 예:
+#   python cli.py analyze --security 경비.xlsx --overtime 초과근무.xlsx \
+#       --start 2025-01-01 --end 2025-12-31 --output 분석결과.xlsx \
+#       --artifacts-dir 분석자료 --artifacts-format parquet
+#   python cli.py serve --port 8765
+#   python cli.py watch --input-dir 받은파일 --output-dir 분석결과
+#   python cli.py batch --input-dir 받은파일 --output-dir 분석결과 --readers 2 --workers 4
+#   python cli.py perf-check --datasets small large
+#   python cli.py preview --security 경비.xlsx --overtime 초과근무.xlsx --rows 200
+import argparse
+import multiprocessing
+import os
+import sys
+
+from analysis_diagnostics import AnalysisDiagnostics
+from analysis_server import DEFAULT_HOST, DEFAULT_PORT, AnalysisService, serve
+from analyzer_engine import HOLIDAY_SOURCES, OvertimeAnalysisEngine
+from batch_analysis import analyze_with_cache, write_workbook
+from batch_pipeline import DEFAULT_QUEUE_SIZE, DEFAULT_READERS, DEFAULT_WRITERS, BatchPipeline
+from folder_watcher import DEFAULT_POLL_SECONDS, DEFAULT_SETTLE_SECONDS, FolderWatcher, find_pairs
+from input_preview import DEFAULT_PREVIEW_ROWS, PREVIEW_FUNCTIONS
+from perf_check import DEFAULT_BASELINE_PATH, PERF_DATASETS, perf_check
+from report_export import ARTIFACT_FORMATS, export_analysis_artifacts
+from result_cache import ResultCache
+from security_log import DEFAULT_DEDUPE_SECONDS, DEFAULT_MEMORY_BUDGET_MB
+
+# 파일 전체 메모리 사용량이 아니라 스트리밍 전환/읽기 청크 크기만 정하는 값
+MEMORY_BUDGET_HELP = "스트리밍 전환 기준 크기 (MB, 읽기 청크 크기도 이 값으로 정함)"
+
+
+def add_dedupe_argument(parser):
+    parser.add_argument(
+        "--dedupe-seconds",
+        type=float,
+        default=DEFAULT_DEDUPE_SECONDS,
+        help="같은 업무일에 반복된 같은 경비 상태 기록을 합칠 간격(초), 음수면 합치지 않음",
+    )
+
+
+def selected_dedupe_seconds(args):
+    """--dedupe-seconds 값 (음수면 None: 병합 안 함)"""
+    return None if args.dedupe_seconds < 0 else args.dedupe_seconds
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="overtime_analyzer", description="초과근무 분석기")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    analyze = subparsers.add_parser("analyze", help="경비/초과근무 기록을 분석하고 결과를 저장")
+    analyze.add_argument("--security", required=True, help="경비 기록 파일")
+    analyze.add_argument("--overtime", required=True, help="초과근무 기록 파일")
+    analyze.add_argument("--start", required=True, help="분석 시작일 (yyyy-MM-dd)")
+    analyze.add_argument("--end", required=True, help="분석 종료일 (yyyy-MM-dd)")
+    analyze.add_argument("--zones", help="직원/부서별 구역 매핑 파일 (선택)")
+    analyze.add_argument("--holiday-source", choices=HOLIDAY_SOURCES, default="both")
+    analyze.add_argument(
+        "--memory-budget", type=int, default=DEFAULT_MEMORY_BUDGET_MB, help=MEMORY_BUDGET_HELP
+    )
+    add_dedupe_argument(analyze)
+    analyze.add_argument("--output", help="요약/의심 기록/확인 필요 데이터 시트를 담을 엑셀 파일")
+    analyze.add_argument("--artifacts-dir", help="분석 자료를 분류별 파일로 저장할 폴더")
+    analyze.add_argument("--artifacts-format", choices=ARTIFACT_FORMATS, default="csv")
+    analyze.add_argument("--workers", type=int, help="병렬 처리에 사용할 최대 프로세스/스레드 수")
+    analyze.add_argument("--cache-dir", help="분석 결과 캐시 폴더 (기본값: 사용자 캐시 폴더)")
+    analyze.add_argument("--no-cache", action="store_true", help="분석 결과 캐시를 사용하지 않음")
+
+    serve = subparsers.add_parser(
+        "serve", help="여러 사용자가 함께 쓰는 로컬 HTTP 분석 서비스 실행"
+    )
+    serve.add_argument("--host", default=DEFAULT_HOST, help=f"접속 주소 (기본값: {DEFAULT_HOST})")
+    serve.add_argument("--port", type=int, default=DEFAULT_PORT, help="포트 번호")
+    serve.add_argument("--workers", type=int, help="분석에 사용할 최대 프로세스 수")
+    serve.add_argument(
+        "--memory-budget", type=int, default=DEFAULT_MEMORY_BUDGET_MB, help=MEMORY_BUDGET_HELP
+    )
+    add_dedupe_argument(serve)
+    serve.add_argument("--upload-dir", help="업로드 파일 저장 폴더")
+    serve.add_argument("--cache-dir", help="분석 결과 캐시 폴더 (기본값: 사용자 캐시 폴더)")
+    serve.add_argument(
+        "--no-cache", action="store_true", help="분석 결과 디스크 캐시를 사용하지 않음"
+    )
+
+    watch = subparsers.add_parser(
+        "watch", help="입력 폴더에 들어오는 경비/초과근무 파일 쌍을 자동으로 분석"
+    )
+    watch.add_argument("--input-dir", required=True, help="감시할 입력 폴더")
+    watch.add_argument("--output-dir", required=True, help="분석 결과 엑셀 파일을 저장할 폴더")
+    watch.add_argument("--start", help="분석 시작일 (yyyy-MM-dd, 기본값: 전체 기간)")
+    watch.add_argument("--end", help="분석 종료일 (yyyy-MM-dd, 기본값: 전체 기간)")
+    watch.add_argument("--zones", help="직원/부서별 구역 매핑 파일 (선택)")
+    watch.add_argument("--holiday-source", choices=HOLIDAY_SOURCES, default="both")
+    add_dedupe_argument(watch)
+    watch.add_argument("--workers", type=int, help="동시에 분석할 최대 파일 쌍 수")
+    watch.add_argument(
+        "--poll-seconds", type=float, default=DEFAULT_POLL_SECONDS, help="폴더 확인 간격 (초)"
+    )
+    watch.add_argument(
+        "--settle-seconds",
+        type=float,
+        default=DEFAULT_SETTLE_SECONDS,
+        help="파일 크기/수정 시각이 이 시간 동안 바뀌지 않아야 분석 (초)",
+    )
+    watch.add_argument(
+        "--memory-budget", type=int, default=DEFAULT_MEMORY_BUDGET_MB, help=MEMORY_BUDGET_HELP
+    )
+    watch.add_argument("--cache-dir", help="분석 결과 캐시 폴더 (기본값: 사용자 캐시 폴더)")
+    watch.add_argument("--no-cache", action="store_true", help="분석 결과 캐시를 사용하지 않음")
+    watch.add_argument("--once", action="store_true", help="현재 폴더의 파일 쌍만 분석하고 종료")
+
+    batch = subparsers.add_parser(
+        "batch", help="폴더의 경비/초과근무 파일 쌍을 읽기/분석/저장 단계를 겹쳐 일괄 분석"
+    )
+    batch.add_argument("--input-dir", required=True, help="경비/초과근무 파일 쌍이 있는 폴더")
+    batch.add_argument("--output-dir", required=True, help="분석 결과 엑셀 파일을 저장할 폴더")
+    batch.add_argument("--start", help="분석 시작일 (yyyy-MM-dd, 기본값: 전체 기간)")
+    batch.add_argument("--end", help="분석 종료일 (yyyy-MM-dd, 기본값: 전체 기간)")
+    batch.add_argument("--zones", help="직원/부서별 구역 매핑 파일 (선택)")
+    batch.add_argument("--holiday-source", choices=HOLIDAY_SOURCES, default="both")
+    add_dedupe_argument(batch)
+    batch.add_argument(
+        "--readers", type=int, default=DEFAULT_READERS, help="입력 파일을 미리 읽는 스레드 수"
+    )
+    batch.add_argument("--workers", type=int, help="분석 프로세스 수 (기본값: CPU 수)")
+    batch.add_argument(
+        "--writers", type=int, default=DEFAULT_WRITERS, help="결과 파일을 저장하는 스레드 수"
+    )
+    batch.add_argument(
+        "--queue-size",
+        type=int,
+        default=DEFAULT_QUEUE_SIZE,
+        help="단계 사이에 대기시킬 수 있는 파일 쌍 수",
+    )
+    batch.add_argument(
+        "--memory-budget", type=int, default=DEFAULT_MEMORY_BUDGET_MB, help=MEMORY_BUDGET_HELP
+    )
+    batch.add_argument("--cache-dir", help="분석 결과 캐시 폴더 (기본값: 사용자 캐시 폴더)")
+    batch.add_argument("--no-cache", action="store_true", help="분석 결과 캐시를 사용하지 않음")
+
+    preview = subparsers.add_parser(
+        "preview", help="파일 앞부분만 읽어 컬럼 매핑과 분류 결과를 미리 보기"
+    )
+    preview.add_argument("--security", help="경비 기록 파일")
+    preview.add_argument("--overtime", help="초과근무 기록 파일")
+    preview.add_argument("--rows", type=int, default=DEFAULT_PREVIEW_ROWS, help="읽을 앞부분 행 수")
+    preview.add_argument("--show", type=int, default=10, help="화면에 출력할 분류된 기록 수")
+
+    perf = subparsers.add_parser(
+        "perf-check", help="합성 데이터의 처리 시간/메모리를 측정하여 기준값보다 느려졌는지 검사"
+    )
+    perf.add_argument(
+        "--datasets",
+        nargs="+",
+        choices=list(PERF_DATASETS),
+        default=list(PERF_DATASETS),
+        help="측정할 데이터 세트",
+    )
+    perf.add_argument("--baseline", default=DEFAULT_BASELINE_PATH, help="성능 기준값 JSON 파일")
+    perf.add_argument(
+        "--update-baseline", action="store_true", help="비교하지 않고 측정값을 기준값으로 저장"
+    )
+    perf.add_argument("--time-tolerance", type=float, help="처리 시간 허용 증가 비율 (예: 0.3)")
+    perf.add_argument("--memory-tolerance", type=float, help="최대 메모리 허용 증가 비율 (예: 0.2)")
+    return parser
+
+
+def run_analyze(args):
+    """분석을 실행하고 지정된 형식으로 결과를 저장합니다."""
+    diagnostics = AnalysisDiagnostics(spill=True)
+    engine = OvertimeAnalysisEngine(
+        args.start,
+        args.end,
+        max_workers=args.workers,
+        holiday_source=args.holiday_source,
+        diagnostics=diagnostics,
+        dedupe_seconds=selected_dedupe_seconds(args),
+    )
+    cache = None if args.no_cache else ResultCache(args.cache_dir)
+
+    try:
+        suspicious_records = analyze_with_cache(
+            engine,
+            args.security,
+            args.overtime,
+            args.zones,
+            args.memory_budget,
+            cache,
+        )
+        print(f"[INFO] 의심 기록 {len(suspicious_records)}건")
+
+        if args.output:
+            write_workbook(args.output, engine, suspicious_records)
+        if args.artifacts_dir:
+            export_analysis_artifacts(
+                args.artifacts_dir,
+                suspicious_records,
+                diagnostics,
+                args.artifacts_format,
+                args.workers,
+            )
+    finally:
+        diagnostics.clear()
+    return 0
+
+
+def run_serve(args):
+    """분석 서비스를 실행합니다. (Ctrl+C 로 종료)"""
+    service = AnalysisService(
+        max_workers=args.workers,
+        memory_budget_mb=args.memory_budget,
+        result_cache=None if args.no_cache else ResultCache(args.cache_dir),
+        upload_dir=args.upload_dir,
+        dedupe_seconds=selected_dedupe_seconds(args),
+    )
+    serve(service, args.host, args.port)
+    return 0
+
+
+def run_watch(args):
+    """폴더 감시를 실행합니다. (Ctrl+C 로 종료)"""
+    watcher = FolderWatcher(
+        args.input_dir,
+        args.output_dir,
+        start_date=args.start,
+        end_date=args.end,
+        zone_path=args.zones,
+        holiday_source=args.holiday_source,
+        dedupe_seconds=selected_dedupe_seconds(args),
+        max_workers=args.workers,
+        memory_budget_mb=args.memory_budget,
+        cache_dir=args.cache_dir,
+        use_cache=not args.no_cache,
+        poll_seconds=args.poll_seconds,
+        settle_seconds=args.settle_seconds,
+    )
+    try:
+        results = watcher.run(once=args.once)
+    except KeyboardInterrupt:
+        print("[INFO] 폴더 감시 종료")
+        return 0
+    return 1 if any(isinstance(result, Exception) for result in results.values()) else 0
+
+
+def run_batch(args):
+    """폴더의 파일 쌍을 파이프라인으로 일괄 분석합니다."""
+    os.makedirs(args.output_dir, exist_ok=True)
+    jobs = find_pairs(args.input_dir, args.output_dir)
+    print(f"[INFO] 분석할 파일 쌍 {len(jobs)}개")
+    pipeline = BatchPipeline(
+        args.start,
+        args.end,
+        zone_path=args.zones,
+        holiday_source=args.holiday_source,
+        dedupe_seconds=selected_dedupe_seconds(args),
+        readers=args.readers,
+        compute_workers=args.workers,
+        writers=args.writers,
+        queue_size=args.queue_size,
+        memory_budget_mb=args.memory_budget,
+        cache=None if args.no_cache else ResultCache(args.cache_dir),
+    )
+    results = pipeline.run(jobs)
+    return 1 if any(isinstance(result, Exception) for result in results.values()) else 0
+
+
+def run_preview(args):
+    """파일 앞부분의 컬럼 매핑과 분류된 기록을 출력합니다."""
+    files = {"security": args.security, "overtime": args.overtime}
+    if not any(files.values()):
+        raise ValueError("--security 또는 --overtime 파일을 지정해야 합니다.")
+    for kind, file_path in files.items():
+        if not file_path:
+            continue
+        preview = PREVIEW_FUNCTIONS[kind](file_path, args.rows)
+        print(f"\n=== {file_path} ===")
+        print(preview.summary_text())
+        print()
+        print(preview.sample.head(args.show).to_string())
+    return 0
+
+
+def run_perf_check(args):
+    """성능을 측정하여 기준값과 비교합니다. 느려졌으면 1 을 반환합니다."""
+    return perf_check(
+        args.datasets,
+        args.baseline,
+        update_baseline=args.update_baseline,
+        time_tolerance=args.time_tolerance,
+        memory_tolerance=args.memory_tolerance,
+    )
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        if args.command == "analyze":
+            return run_analyze(args)
+        if args.command == "serve":
+            return run_serve(args)
+        if args.command == "watch":
+            return run_watch(args)
+        if args.command == "batch":
+            return run_batch(args)
+        if args.command == "preview":
+            return run_preview(args)
+        if args.command == "perf-check":
+            return run_perf_check(args)
+    except (ValueError, OSError) as e:
+        print(f"[오류] {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -0,0 +1,158 @@
+# 날짜/시각 컬럼 형식 판별 및 고정 형식 변환
+#
+# 경비 기록의 발생일자/발생시각 컬럼은 내보낸 시스템에 따라 문자열 형식이 다르고, 엑셀에서 읽으면
+# datetime / datetime.time 객체나 엑셀 일련번호(숫자)로 들어오기도 합니다. 형식 없이
+# pd.to_datetime 을 호출하면 값마다 형식을 추론하므로 느리기 때문에, 일부 값으로 형식을 판별한 뒤
+# 전체 컬럼을 고정 형식으로 한 번에 변환합니다.
+from datetime import datetime, time
+
+import pandas as pd
+
+# 형식 판별에 사용할 샘플 값 수
+SNIFF_SAMPLE_SIZE = 200
+
+# 발생일자 문자열 형식 후보 (앞에서부터 순서대로 시도)
+DATE_FORMATS = (
+    "%Y-%m-%d",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %H:%M",
+    "%Y.%m.%d",
+    "%Y. %m. %d",
+    "%Y.%m.%d.",
+    "%Y/%m/%d",
+    "%Y%m%d",
+    "%Y-%m-%dT%H:%M:%S",
+)
+
+# 발생시각 문자열 형식 후보 (날짜가 포함된 형식은 시각 부분만 사용)
+TIME_FORMATS = (
+    "%H:%M:%S",
+    "%H:%M",
+    "%H%M%S",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %H:%M",
+    "%Y-%m-%dT%H:%M:%S",
+)
+
+# 엑셀 일련번호의 기준일 (1900 날짜 체계)
+EXCEL_EPOCH = "1899-12-30"
+
+# 값 종류 (판별 결과)
+KIND_TEXT = "text"
+KIND_DATETIME = "datetime"
+KIND_TIME = "time"
+KIND_NUMBER = "number"
+KIND_MIXED = "mixed"
+
+
+def _sample(series, sample_size=SNIFF_SAMPLE_SIZE):
+    """컬럼 전체에서 고르게 뽑은 비어 있지 않은 샘플 값"""
+    values = series.dropna()
+    if len(values) > sample_size:
+        values = values.iloc[:: len(values) // sample_size][:sample_size]
+    return values
+
+
+def value_kind(series):
+    """컬럼 값의 종류(KIND_*)를 반환합니다."""
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return KIND_DATETIME
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        return KIND_NUMBER
+    if pd.api.types.is_timedelta64_dtype(series):
+        return KIND_TIME
+
+    kinds = set()
+    for value in _sample(series):
+        if isinstance(value, str):
+            kinds.add(KIND_TEXT)
+        elif isinstance(value, (datetime, pd.Timestamp)):
+            kinds.add(KIND_DATETIME)
+        elif isinstance(value, time):
+            kinds.add(KIND_TIME)
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            kinds.add(KIND_NUMBER)
+        else:
+            kinds.add(KIND_MIXED)
+    if len(kinds) == 1:
+        return kinds.pop()
+    return KIND_MIXED if kinds else KIND_TEXT
+
+
+def sniff_format(series, formats):
+    """샘플 값을 가장 많이 변환할 수 있는 형식을 반환합니다. 맞는 형식이 없으면 None"""
+    sample = _sample(series).astype(str).str.strip()
+    if sample.empty:
+        return None
+
+    best_format, best_count = None, 0
+    for fmt in formats:
+        count = pd.to_datetime(sample, format=fmt, errors="coerce").notna().sum()
+        if count == len(sample):
+            return fmt
+        if count > best_count:
+            best_format, best_count = fmt, count
+    return best_format
+
+
+def _as_text(series):
+    return series.where(series.isna(), series.astype(str).str.strip())
+
+
+def _parse_text(series, fmt):
+    """고정 형식으로 변환하고, 형식이 맞지 않는 일부 값만 값별 추론으로 다시 변환합니다."""
+    if fmt is None:
+        return pd.to_datetime(_as_text(series), errors="coerce", format="mixed")
+
+    parsed = pd.to_datetime(series, format=fmt, errors="coerce")
+    failed = parsed.isna() & series.notna()
+    if failed.any():
+        parsed[failed] = pd.to_datetime(_as_text(series[failed]), errors="coerce", format="mixed")
+    return parsed
+
+
+def parse_dates(series, date_format=None):
+    """발생일자 컬럼을 datetime64 시리즈로 변환합니다. (변환할 수 없는 값은 NaT)
+
+    date_format 을 주면 문자열 값은 판별 없이 해당 형식으로 변환합니다.
+    """
+    kind = value_kind(series)
+    if kind == KIND_DATETIME:
+        return pd.to_datetime(series, errors="coerce")
+    if kind == KIND_NUMBER:
+        # 엑셀 일련번호 (1 = 1900-01-01)
+        return pd.to_datetime(
+            pd.to_numeric(series, errors="coerce"), unit="D", origin=EXCEL_EPOCH, errors="coerce"
+        )
+    if kind == KIND_TEXT:
+        return _parse_text(series, date_format or sniff_format(series, DATE_FORMATS))
+    return _parse_text(series, None)
+
+
+def parse_times(series, time_format=None):
+    """발생시각 컬럼을 자정 기준 경과 시간(timedelta64) 시리즈로 변환합니다. (변환할 수 없는 값은 NaT)
+
+    문자열, datetime.time, datetime(날짜 부분은 무시), 엑셀 시각(하루에 대한 비율) 값을 처리합니다.
+    """
+    kind = value_kind(series)
+    if kind == KIND_TIME:
+        if pd.api.types.is_timedelta64_dtype(series):
+            return series
+        # datetime.time 은 "HH:MM:SS[.ffffff]" 문자열로 바꾸면 한 번에 변환 가능
+        return pd.to_timedelta(series.where(series.isna(), series.astype(str)), errors="coerce")
+    if kind == KIND_NUMBER:
+        fraction = pd.to_numeric(series, errors="coerce") % 1
+        return pd.to_timedelta((fraction * 86400).round(), unit="s")
+
+    if kind == KIND_DATETIME:
+        parsed = pd.to_datetime(series, errors="coerce")
+    elif kind == KIND_TEXT:
+        parsed = _parse_text(series, time_format or sniff_format(series, TIME_FORMATS))
+    else:
+        parsed = _parse_text(series, None)
+    return parsed - parsed.dt.normalize()
+
+
+def combine_date_time(dates, times):
+    """변환된 발생일자와 발생시각을 하나의 발생일시(datetime64) 시리즈로 합칩니다."""
+    return dates.dt.normalize() + times
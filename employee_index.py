@@ -0,0 +1,152 @@
+# 직원별 초과근무 타임라인 색인 (특정 직원의 한 달 기록을 다시 비교하지 않고 바로 조회)
+from bisect import bisect_left
+from datetime import date, datetime, time, timedelta
+
+from security_log import ArmedTimeline
+
+# 업무일 시작 시각 (04시 이전 기록은 전날 업무일)
+BUSINESS_DAY_START = time(4, 0)
+
+
+def overtime_interval(record):
+    """초과근무 기록의 (시작 datetime, 종료 datetime) 을 반환합니다. 자정을 넘기면 종료는 다음날"""
+    start = datetime.combine(record["날짜"], record["시작시간"])
+    end = datetime.combine(record["날짜"], record["종료시간"])
+    if record["종료시간"] < record["시작시간"]:
+        end = datetime.combine(record["날짜"] + timedelta(days=1), record["종료시간"])
+    return start, end
+
+
+def business_day_window(business_day):
+    """업무일의 [시작, 종료) 구간 (04시 ~ 다음날 04시)"""
+    start = datetime.combine(business_day, BUSINESS_DAY_START)
+    return start, start + timedelta(days=1)
+
+
+def overlap_intervals(segments, intervals):
+    """두 구간 목록(각각 시작 시각 순)이 겹치는 구간 목록을 반환합니다."""
+    overlaps = []
+    for seg_start, seg_end in segments:
+        for start, end in intervals:
+            if start >= seg_end:
+                break
+            if end > seg_start:
+                overlaps.append((max(start, seg_start), min(end, seg_end)))
+    return overlaps
+
+
+def _month_range(year, month):
+    first = date(year, month, 1)
+    return first, date(year + month // 12, month % 12 + 1, 1)
+
+
+class EmployeeTimelineIndex:
+    """직원키 → 업무일 순으로 정렬된 초과근무 구간, 구역별 업무일 경비 설정 구간을 담은 색인
+
+    분석할 때 한 번 만들어 두면 직원 한 명의 한 달 기록은 이진 탐색과 목록 조회만으로 구성됩니다.
+    """
+
+    def __init__(self):
+        self.employees = {}  # 직원키 -> {"직원명", "부서명", "구역"}
+        # 직원키 -> [(업무일, 시작, 종료, 초과근무유형, 근무내용)] (업무일/시작 시각 순)
+        self.segments = {}
+        # 구역 -> {업무일: [(시작, 종료)]} 경비 설정 구간 (경비 기록이 없는 업무일은 None)
+        self.armed_by_zone_day = {}
+        self._business_days = {}  # 직원키 -> 업무일 목록 (이진 탐색용)
+
+    def __len__(self):
+        return len(self.employees)
+
+    @classmethod
+    def build(cls, security_by_zone, records_by_zone):
+        """{구역: 업무일별 경비 상태} 와 {구역: 초과근무 기록 목록} 으로 색인을 만듭니다."""
+        index = cls()
+        for zone, records in records_by_zone.items():
+            status_by_day = security_by_zone.get(zone, {})
+            timeline = ArmedTimeline.from_status_by_day(status_by_day)
+            windows = {}  # 업무일 -> 경비 설정 구간을 구할 [시작, 종료)
+            for record in records:
+                key = record.get("직원키", record["직원명"])
+                start, end = overtime_interval(record)
+                business_day = record["업무일"]
+                index.employees.setdefault(
+                    key,
+                    {
+                        "직원명": record["직원명"],
+                        "부서명": record.get("부서명") or "",
+                        "구역": zone,
+                    },
+                )
+                index.segments.setdefault(key, []).append(
+                    (
+                        business_day,
+                        start,
+                        end,
+                        record.get("초과근무유형", ""),
+                        record.get("근무내용") or "",
+                    )
+                )
+                window_start, window_end = windows.get(business_day) or business_day_window(
+                    business_day
+                )
+                windows[business_day] = (min(window_start, start), max(window_end, end))
+
+            zone_armed = index.armed_by_zone_day.setdefault(zone, {})
+            for business_day, (window_start, window_end) in windows.items():
+                # 경비 기록이 없는 업무일은 비교할 때처럼 '경비 기록 없음' (None)
+                if business_day in status_by_day:
+                    zone_armed[business_day] = timeline.armed_intervals(window_start, window_end)
+                else:
+                    zone_armed[business_day] = None
+
+        for key, segments in index.segments.items():
+            segments.sort(key=lambda segment: (segment[0], segment[1]))
+            index._business_days[key] = [segment[0] for segment in segments]
+        return index
+
+    def find_employee(self, employee_name, department=""):
+        """이름(과 부서명)으로 직원키를 찾습니다. 동명이인이면 부서명이 같은 직원을 우선합니다."""
+        candidates = [
+            key for key, info in self.employees.items() if info["직원명"] == employee_name
+        ]
+        for key in candidates:
+            if self.employees[key]["부서명"] == department:
+                return key
+        return candidates[0] if candidates else None
+
+    def months(self, employee_key):
+        """직원의 초과근무가 있는 (연, 월) 목록"""
+        return sorted({(day.year, day.month) for day in self._business_days.get(employee_key, [])})
+
+    def month_days(self, employee_key, year, month):
+        """직원의 한 달 업무일별 기록 목록을 반환합니다.
+
+        각 항목: {"업무일", "초과근무": [(시작, 종료, 유형, 근무내용)], "경비설정": [(시작, 종료)]
+        또는 None(경비 기록 없음), "겹침": [(시작, 종료)], "겹침시간": 시간}
+        """
+        segments = self.segments.get(employee_key)
+        if not segments:
+            return []
+        first, next_month = _month_range(year, month)
+        business_days = self._business_days[employee_key]
+        lo = bisect_left(business_days, first)
+        hi = bisect_left(business_days, next_month)
+
+        zone_armed = self.armed_by_zone_day.get(self.employees[employee_key]["구역"], {})
+        days = []
+        for business_day, start, end, overtime_type, work_content in segments[lo:hi]:
+            if not days or days[-1]["업무일"] != business_day:
+                days.append(
+                    {
+                        "업무일": business_day,
+                        "초과근무": [],
+                        "경비설정": zone_armed.get(business_day),
+                    }
+                )
+            days[-1]["초과근무"].append((start, end, overtime_type, work_content))
+
+        for day in days:
+            intervals = [(start, end) for start, end, _, _ in day["초과근무"]]
+            day["겹침"] = overlap_intervals(intervals, day["경비설정"] or [])
+            day["겹침시간"] = sum((end - start).seconds for start, end in day["겹침"]) / 3600
+        return days
@@ -0,0 +1,152 @@
+# 직원별 상세 보기 패널 (선택한 직원의 한 달 초과근무와 경비 설정 구간 비교)
+from PyQt5.QtGui import QBrush, QColor
+from PyQt5.QtWidgets import (
+    QComboBox,
+    QHBoxLayout,
+    QHeaderView,
+    QLabel,
+    QTableWidget,
+    QTableWidgetItem,
+    QVBoxLayout,
+    QWidget,
+)
+
+DAY_COLUMNS = ["업무일", "초과근무", "경비 설정", "겹친 구간", "겹친 시간"]
+
+# 경비 설정 중 초과근무가 있는 업무일 강조 색
+OVERLAP_BRUSH = QBrush(QColor(255, 224, 224))
+
+NO_INDEX_MESSAGE = "분석을 실행하거나 세션을 열면 직원별 기록이 표시됩니다."
+
+
+def format_intervals(intervals):
+    """[(시작, 종료)] 를 "HH:MM-HH:MM, ..." 형식으로 표시합니다. (다음날이면 시각 앞에 +1)"""
+    parts = []
+    for start, end in intervals:
+        day_offset = (end.date() - start.date()).days
+        end_str = end.strftime("%H:%M") if day_offset == 0 else f"+{day_offset} {end:%H:%M}"
+        parts.append(f"{start:%H:%M}-{end_str}")
+    return ", ".join(parts)
+
+
+class EmployeeTimelinePanel(QWidget):
+    """EmployeeTimelineIndex 로 직원 한 명의 한 달 기록을 업무일별로 표시합니다."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.index = None
+
+        self.employee_combo = QComboBox()
+        self.employee_combo.setEditable(True)  # 이름 입력으로 찾기
+        self.employee_combo.setInsertPolicy(QComboBox.NoInsert)
+        self.employee_combo.setMinimumWidth(240)
+        self.employee_combo.currentIndexChanged.connect(self.employee_changed)
+        self.month_combo = QComboBox()
+        self.month_combo.currentIndexChanged.connect(self.refresh)
+        self.summary_label = QLabel(NO_INDEX_MESSAGE)
+
+        selector_layout = QHBoxLayout()
+        selector_layout.addWidget(QLabel("직원:"))
+        selector_layout.addWidget(self.employee_combo)
+        selector_layout.addWidget(QLabel("월:"))
+        selector_layout.addWidget(self.month_combo)
+        selector_layout.addWidget(self.summary_label, 1)
+
+        self.day_table = QTableWidget()
+        self.day_table.setColumnCount(len(DAY_COLUMNS))
+        self.day_table.setHorizontalHeaderLabels(DAY_COLUMNS)
+        self.day_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.day_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+
+        layout = QVBoxLayout(self)
+        layout.addLayout(selector_layout)
+        layout.addWidget(self.day_table)
+
+    def set_index(self, index, message=NO_INDEX_MESSAGE):
+        """새 색인으로 직원 목록을 다시 채웁니다. index 가 None 이면 message 를 표시합니다."""
+        self.index = index
+        self.employee_combo.blockSignals(True)
+        self.employee_combo.clear()
+        if index is not None:
+            employees = sorted(
+                index.employees.items(), key=lambda item: (item[1]["직원명"], item[1]["부서명"])
+            )
+            for key, info in employees:
+                label = f"{info['직원명']} ({info['부서명']})" if info["부서명"] else info["직원명"]
+                self.employee_combo.addItem(label, key)
+        self.employee_combo.blockSignals(False)
+        self.day_table.setRowCount(0)
+        self.summary_label.setText(message if index is None else f"직원 {len(index)}명")
+        if index is not None and len(index):
+            self.employee_changed()
+
+    def employee_changed(self):
+        """선택한 직원의 초과근무가 있는 월 목록을 채우고 첫 달을 표시합니다."""
+        key = self.employee_combo.currentData()
+        self.month_combo.blockSignals(True)
+        self.month_combo.clear()
+        if self.index is not None and key is not None:
+            for year, month in self.index.months(key):
+                self.month_combo.addItem(f"{year}-{month:02d}", (year, month))
+        self.month_combo.blockSignals(False)
+        self.refresh()
+
+    def show_employee(self, employee_name, department="", business_day=None):
+        """이름(과 부서명)으로 직원을 찾아 business_day 가 속한 달을 표시합니다. 찾으면 True"""
+        if self.index is None:
+            return False
+        key = self.index.find_employee(employee_name, department)
+        return key is not None and self.show_employee_key(key, business_day)
+
+    def show_employee_key(self, employee_key, business_day=None):
+        """직원키로 직원을 선택하고 business_day 가 속한 달을 표시합니다. 찾으면 True"""
+        combo_index = self.employee_combo.findData(employee_key)
+        if self.index is None or combo_index < 0:
+            return False
+        self.employee_combo.setCurrentIndex(combo_index)
+        self.employee_changed()
+        if business_day is not None:
+            month_index = self.month_combo.findData((business_day.year, business_day.month))
+            if month_index >= 0:
+                self.month_combo.setCurrentIndex(month_index)
+        return True
+
+    def refresh(self):
+        """선택한 직원/월의 업무일별 기록을 표시합니다."""
+        key = self.employee_combo.currentData()
+        month = self.month_combo.currentData()
+        if self.index is None or key is None or month is None:
+            self.day_table.setRowCount(0)
+            return
+
+        days = self.index.month_days(key, *month)
+        self.day_table.setRowCount(len(days))
+        for row, day in enumerate(days):
+            overtime = [(start, end) for start, end, _, _ in day["초과근무"]]
+            values = [
+                day["업무일"].strftime("%Y-%m-%d"),
+                format_intervals(overtime),
+                (
+                    "경비 기록 없음"
+                    if day["경비설정"] is None
+                    else format_intervals(day["경비설정"]) or "없음"
+                ),
+                format_intervals(day["겹침"]),
+                f"{day['겹침시간']:.1f}시간" if day["겹침"] else "",
+            ]
+            tooltip = "\n".join(
+                f"{overtime_type}: {content}" if content else overtime_type
+                for _, _, overtime_type, content in day["초과근무"]
+            )
+            for col, value in enumerate(values):
+                item = QTableWidgetItem(value)
+                item.setToolTip(tooltip)
+                if day["겹침"]:
+                    item.setBackground(OVERLAP_BRUSH)
+                self.day_table.setItem(row, col, item)
+
+        flagged = sum(1 for day in days if day["겹침"])
+        hours = sum(day["겹침시간"] for day in days)
+        self.summary_label.setText(
+            f"초과근무 {len(days)}일, 경비 설정 중 초과근무 {flagged}일 (총 {hours:.1f}시간)"
+        )
@@ -0,0 +1,234 @@
+# 입력 폴더를 감시하다가 새로 들어온 경비/초과근무 기록 파일 쌍을 자동으로 분석 (폴더 감시 모드)
+#
+# 파일 이름에 '경비'/'security' 가 들어간 파일과 '초과근무'/'overtime' 이 들어간 파일 중, 키워드를 뺀
+# 나머지 이름이 같은 파일끼리 한 쌍으로 분석합니다. (예: 경비_2025-03.xlsx + 초과근무_2025-03.xlsx)
+# 복사 중인 파일을 읽지 않도록 크기/수정 시각이 settle_seconds 동안 바뀌지 않은 파일만 사용하며,
+# 시작할 때 쌓여 있던 파일 쌍은 프로세스 풀에서 병렬로 분석합니다.
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from analysis_diagnostics import AnalysisDiagnostics
+from analyzer_engine import OvertimeAnalysisEngine
+from batch_analysis import analyze_with_cache, write_workbook
+from input_readers import SUPPORTED_EXTENSIONS
+from result_cache import ResultCache
+from security_log import DEFAULT_DEDUPE_SECONDS, DEFAULT_MEMORY_BUDGET_MB
+
+# 파일 종류를 구분하는 파일 이름 키워드 (긴 키워드부터 확인)
+SECURITY_NAME_KEYWORDS = ("경비기록", "경비", "security")
+OVERTIME_NAME_KEYWORDS = ("초과근무기록", "초과근무", "overtime")
+
+DEFAULT_POLL_SECONDS = 5
+DEFAULT_SETTLE_SECONDS = 10
+
+OUTPUT_FILE_SUFFIX = "분석결과.xlsx"
+
+# 무시할 파일 (엑셀 잠금 파일 ~$..., 숨김 파일, 복사/다운로드 중 임시 파일)
+IGNORED_PREFIXES = ("~", ".")
+IGNORED_SUFFIXES = (".tmp", ".part", ".crdownload")
+
+# 짝 맞추기 키 앞뒤에서 제거할 구분 문자
+KEY_SEPARATORS = " _-."
+
+
+def pair_key(file_name, keywords):
+    """파일 이름(확장자 제외)에서 키워드를 뺀 나머지를 짝 맞추기 키로 반환합니다. 키워드가 없으면 None"""
+    stem = os.path.splitext(file_name)[0]
+    lowered = stem.lower()
+    for keyword in keywords:
+        index = lowered.find(keyword.lower())
+        if index >= 0:
+            rest = stem[:index] + stem[index + len(keyword) :]
+            return rest.strip(KEY_SEPARATORS)
+    return None
+
+
+def classify_file(file_name):
+    """("security" | "overtime", 짝 맞추기 키) 를 반환합니다. 분석 대상이 아니면 None"""
+    ext = os.path.splitext(file_name)[1].lower()
+    if ext not in SUPPORTED_EXTENSIONS or file_name.startswith(IGNORED_PREFIXES):
+        return None
+    if file_name.lower().endswith(IGNORED_SUFFIXES):
+        return None
+    security_key = pair_key(file_name, SECURITY_NAME_KEYWORDS)
+    overtime_key = pair_key(file_name, OVERTIME_NAME_KEYWORDS)
+    if (security_key is None) == (overtime_key is None):
+        # 키워드가 없거나 두 종류 키워드가 모두 있으면 어느 쪽인지 알 수 없음
+        return None
+    if security_key is not None:
+        return "security", security_key
+    return "overtime", overtime_key
+
+
+def output_file_name(key):
+    return f"{key}_{OUTPUT_FILE_SUFFIX}" if key else OUTPUT_FILE_SUFFIX
+
+
+def analyze_pair(security_path, overtime_path, output_path, options):
+    """파일 쌍 하나를 분석하여 결과 엑셀 파일을 저장하고 의심 기록 건수를 반환합니다. (프로세스 풀에서 실행)"""
+    diagnostics = AnalysisDiagnostics(spill=True)
+    engine = OvertimeAnalysisEngine(
+        options["start_date"],
+        options["end_date"],
+        max_workers=1,
+        holiday_source=options["holiday_source"],
+        diagnostics=diagnostics,
+        dedupe_seconds=options["dedupe_seconds"],
+    )
+    cache = ResultCache(options["cache_dir"]) if options["use_cache"] else None
+    try:
+        suspicious_records = analyze_with_cache(
+            engine,
+            security_path,
+            overtime_path,
+            options["zone_path"],
+            options["memory_budget_mb"],
+            cache,
+        )
+        write_workbook(output_path, engine, suspicious_records)
+    finally:
+        diagnostics.clear()
+    return len(suspicious_records)
+
+
+class FolderWatcher:
+    """입력 폴더의 파일 쌍을 찾아 분석 결과를 출력 폴더에 저장합니다.
+
+    같은 이름의 결과 파일이 입력 파일보다 새로우면 이미 분석한 쌍으로 보고 건너뜁니다. 분석에 실패한
+    쌍은 입력 파일이 바뀔 때까지 다시 시도하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        input_dir,
+        output_dir,
+        start_date=None,
+        end_date=None,
+        zone_path=None,
+        holiday_source="both",
+        dedupe_seconds=DEFAULT_DEDUPE_SECONDS,
+        max_workers=None,
+        memory_budget_mb=DEFAULT_MEMORY_BUDGET_MB,
+        cache_dir=None,
+        use_cache=True,
+        poll_seconds=DEFAULT_POLL_SECONDS,
+        settle_seconds=DEFAULT_SETTLE_SECONDS,
+    ):
+        if not os.path.isdir(input_dir):
+            raise ValueError(f"입력 폴더를 찾을 수 없습니다: {input_dir}")
+        self.input_dir = input_dir
+        self.output_dir = output_dir
+        self.max_workers = max_workers
+        self.poll_seconds = poll_seconds
+        self.settle_seconds = settle_seconds
+        self.options = {
+            "start_date": start_date,
+            "end_date": end_date,
+            "zone_path": zone_path,
+            "holiday_source": holiday_source,
+            "dedupe_seconds": dedupe_seconds,
+            "memory_budget_mb": memory_budget_mb,
+            "cache_dir": cache_dir,
+            "use_cache": use_cache,
+        }
+        self._observed = {}  # 경로 -> ((크기, 수정 시각), 이 상태를 처음 본 시각)
+        self._handled = {}  # 쌍 키 -> 분석을 시작한 입력 파일 상태 (같으면 다시 분석하지 않음)
+
+    def _is_settled(self, path, now):
+        stat = os.stat(path)
+        state = (stat.st_size, stat.st_mtime_ns)
+        observed = self._observed.get(path)
+        if observed is None or observed[0] != state:
+            self._observed[path] = observed = (state, now)
+        return now - observed[1] >= self.settle_seconds
+
+    def scan(self, now=None):
+        """(분석할 파일 쌍 목록, 아직 쓰는 중인 파일 수) 를 반환합니다.
+
+        파일 쌍은 (키, 경비 기록 경로, 초과근무 기록 경로, 결과 파일 경로) 입니다.
+        """
+        now = time.monotonic() if now is None else now
+        newest = {}  # (종류, 소문자 키) -> (수정 시각, 경로, 키)
+        unsettled = 0
+        for entry in os.scandir(self.input_dir):
+            classified = classify_file(entry.name) if entry.is_file() else None
+            if classified is None:
+                continue
+            try:
+                if not self._is_settled(entry.path, now):
+                    unsettled += 1
+                    continue
+                mtime = entry.stat().st_mtime_ns
+            except FileNotFoundError:
+                continue  # 확인하는 사이 삭제/이름 변경된 파일
+            kind, key = classified
+            slot = (kind, key.lower())
+            if slot not in newest or mtime > newest[slot][0]:
+                newest[slot] = (mtime, entry.path, key)
+
+        pairs = []
+        for (kind, slot_key), (security_mtime, security_path, key) in sorted(newest.items()):
+            if kind != "security" or ("overtime", slot_key) not in newest:
+                continue
+            overtime_mtime, overtime_path, _ = newest[("overtime", slot_key)]
+            output_path = os.path.join(self.output_dir, output_file_name(key))
+            state = (security_path, security_mtime, overtime_path, overtime_mtime)
+            if self._handled.get(slot_key) == state:
+                continue
+            self._handled[slot_key] = state
+            if os.path.exists(output_path) and os.stat(output_path).st_mtime_ns >= max(
+                security_mtime, overtime_mtime
+            ):
+                continue
+            pairs.append((key, security_path, overtime_path, output_path))
+        return pairs, unsettled
+
+    def run(self, once=False):
+        """폴더 감시를 시작합니다. once 이면 현재 폴더의 파일 쌍을 모두 분석한 뒤 끝냅니다.
+
+        {결과 파일 경로: 의심 기록 건수 또는 오류} 를 반환합니다.
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+        print(f"[INFO] 폴더 감시 시작: {self.input_dir} -> {self.output_dir}")
+        results = {}
+        pending = {}  # Future -> (키, 결과 파일 경로)
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            while True:
+                pairs, unsettled = self.scan()
+                for key, security_path, overtime_path, output_path in pairs:
+                    print(
+                        f"[INFO] 분석 시작: {os.path.basename(security_path)} + "
+                        f"{os.path.basename(overtime_path)}"
+                    )
+                    future = executor.submit(
+                        analyze_pair, security_path, overtime_path, output_path, self.options
+                    )
+                    pending[future] = (key, output_path)
+
+                if once and not pending and not unsettled:
+                    break
+                if pending:
+                    done, _ = wait(pending, timeout=self.poll_seconds, return_when=FIRST_COMPLETED)
+                else:
+                    done = ()
+                    time.sleep(self.poll_seconds)
+                for future in done:
+                    key, output_path = pending.pop(future)
+                    try:
+                        results[output_path] = future.result()
+                        print(
+                            f"[INFO] 분석 완료: {output_path} (의심 기록 {results[output_path]}건)"
+                        )
+                    except Exception as e:
+                        results[output_path] = e
+                        print(f"[경고] '{key}' 파일 쌍 분석 실패: {e}")
+        return results
+
+
+def find_pairs(input_dir, output_dir):
+    """입력 폴더에서 분석할 파일 쌍 목록을 바로 반환합니다. (파일이 다 쓰였는지 기다리지 않음)
+
+    결과 파일이 입력 파일보다 새로운 쌍은 제외합니다. 각 쌍의 형식은 FolderWatcher.scan 과 같습니다.
+    """
+    return FolderWatcher(input_dir, output_dir, settle_seconds=0).scan()[0]
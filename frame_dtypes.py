@@ -0,0 +1,157 @@
+# 불러온 경비/초과근무 기록 데이터프레임의 정규화와 메모리 최적화 (범주형 컬럼, 정수 직원 키)
+#
+# 직원명, 부서명, 모드처럼 같은 값이 반복되는 문자열 컬럼은 범주형(category)으로 바꾸면 값마다
+# 파이썬 문자열을 따로 보관하지 않고 정수 코드만 저장하므로, 대용량 파일의 메모리 사용량이 크게
+# 줄고 비교/그룹화도 정수 연산으로 처리됩니다.
+#
+# 파일을 불러올 때 normalize_*_frame 으로 한 번만 정규화해 두면, 분석을 다시 실행할 때마다 날짜/시각
+# 변환이나 컬럼 이름 변경을 반복하지 않습니다. 정규화된 데이터프레임은 분석 중에 수정하지 않습니다.
+import numpy as np
+import pandas as pd
+
+from datetime_formats import combine_date_time, parse_dates, parse_times
+from security_log import map_security_columns, zone_labels
+
+# 고유값 비율이 이 값 이하인 컬럼만 범주형으로 변환 (고유값이 많으면 오히려 손해)
+CATEGORY_MAX_UNIQUE_RATIO = 0.5
+
+# 초과근무 기록에서 범주형으로 바꿀 컬럼 위치 (부서명, 직급, 성명, 현업여부, 휴일여부)
+OVERTIME_CATEGORY_POSITIONS = (0, 1, 3, 4, 5)
+
+# 정규화된 경비 기록 컬럼 (발생일시 순으로 정렬, 업무일은 새벽 4시 기준)
+NORMALIZED_SECURITY_COLUMNS = ("발생일자", "모드", "발생일시", "시간_시", "시간_분", "업무일")
+
+# 초과근무 기록의 열 위치별 표준 컬럼 이름 (이후 열은 "컬럼<번호>")
+OVERTIME_COLUMNS = (
+    "부서명",
+    "직급",
+    "개인식별번호",
+    "성명",
+    "현업여부",
+    "휴일여부",
+    "초과근무일자",
+    "출근시간",
+    "퇴근시간",
+    "출근IP",
+    "퇴근IP",
+    "초과근무시간",
+    "수당시간",
+    "근무내용",
+)
+
+# 개인식별번호가 없는 기록의 직원 키에 붙이는 접두어 (번호와 이름이 겹치지 않도록)
+NAME_KEY_PREFIX = "이름:"
+
+
+def to_category(series, max_unique_ratio=CATEGORY_MAX_UNIQUE_RATIO):
+    """반복되는 문자열 컬럼이면 범주형으로 변환하고, 아니면 그대로 반환합니다."""
+    if isinstance(series.dtype, pd.CategoricalDtype) or len(series) == 0:
+        return series
+    if pd.api.types.is_numeric_dtype(series) or pd.api.types.is_datetime64_any_dtype(series):
+        return series
+    if series.nunique(dropna=True) > len(series) * max_unique_ratio:
+        return series
+    return series.astype("category")
+
+
+def is_normalized_security_frame(df):
+    """normalize_security_frame 으로 정규화된 경비 기록인지 확인합니다."""
+    return all(col in df.columns for col in NORMALIZED_SECURITY_COLUMNS)
+
+
+def normalize_security_frame(df):
+    """경비 기록을 분석에 필요한 컬럼만 담은 정규화된 데이터프레임으로 변환합니다.
+
+    발생일자/발생시각을 변환해 발생일시와 업무일을 계산하고, 변환할 수 없는 행은 제외한 뒤
+    발생일시 순(같은 시각은 원본 순서)으로 정렬합니다. 모드/구역은 범주형으로 저장하고, 이미
+    정규화된 데이터프레임은 그대로 반환합니다.
+    """
+    if is_normalized_security_frame(df):
+        return df
+
+    col_mapping = map_security_columns(df.columns)
+    dates = parse_dates(df[col_mapping["발생일자"]])
+    times = parse_times(df[col_mapping["발생시각"]])
+    occurred_at = combine_date_time(dates, times)
+    seconds = times.dt.total_seconds().round()
+    hours = seconds // 3600
+    # 새벽 시간대(0-4시)는 전날의 업무일로 계산
+    calendar_days = dates.dt.normalize()
+    business_days = calendar_days.where(hours >= 4, calendar_days - pd.Timedelta(days=1))
+
+    columns = {
+        "발생일자": dates,
+        "모드": to_category(df[col_mapping["모드"]]),
+        "발생일시": occurred_at,
+        "시간_시": hours,
+        "시간_분": seconds % 3600 // 60,
+        "업무일": business_days,
+    }
+    if col_mapping["구역"] is not None:
+        columns["구역"] = zone_labels(df[col_mapping["구역"]]).astype("category")
+
+    normalized = pd.DataFrame(columns, index=df.index)
+    normalized = normalized[occurred_at.notna()]
+    normalized = normalized.astype({"시간_시": "int8", "시간_분": "int8"})
+    return normalized.sort_values(by="발생일시", kind="stable").reset_index(drop=True)
+
+
+def categorize_overtime_frame(df):
+    """초과근무 기록의 부서명/직급/성명/현업여부/휴일여부 컬럼을 범주형으로 바꾼 데이터프레임을 반환합니다.
+
+    초과근무 기록은 열 위치로 컬럼을 구분하므로 컬럼 순서와 이름은 그대로 유지합니다.
+    """
+    df = df.copy(deep=False)
+    for position in OVERTIME_CATEGORY_POSITIONS:
+        if position < len(df.columns):
+            df.isetitem(position, to_category(df.iloc[:, position]))
+    return df
+
+
+def is_normalized_overtime_frame(df):
+    """normalize_overtime_frame 으로 정규화된 초과근무 기록인지 확인합니다."""
+    columns = tuple(df.columns)
+    return "날짜_datetime" in columns and columns[: len(OVERTIME_COLUMNS)] == OVERTIME_COLUMNS
+
+
+def normalize_overtime_frame(df):
+    """초과근무 기록의 컬럼을 열 위치에 따라 표준 이름으로 바꾸고 초과근무일자를 변환합니다.
+
+    반복되는 컬럼은 범주형으로 저장하고, 이미 정규화된 데이터프레임은 그대로 반환합니다.
+    """
+    if is_normalized_overtime_frame(df):
+        return df
+
+    if len(df.columns) < len(OVERTIME_COLUMNS):
+        print(
+            f"[경고] 예상 열 수보다 적은 열이 있습니다. 예상: {len(OVERTIME_COLUMNS)}, 실제: {len(df.columns)}"
+        )
+
+    # 인덱스 기반으로 컬럼 이름 표준화 - 특정 위치의 컬럼을 우리가 정의한 이름으로 매핑
+    names = [
+        OVERTIME_COLUMNS[i] if i < len(OVERTIME_COLUMNS) else f"컬럼{i}"
+        for i in range(len(df.columns))
+    ]
+    df = categorize_overtime_frame(df.set_axis(names, axis=1))
+
+    print(f"[INFO] 초과근무 데이터 표준화 완료: {names[:len(OVERTIME_COLUMNS)]}")
+
+    # 날짜 데이터 정리 (YYYY-MM-DD 형식 고정)
+    return df.assign(
+        날짜_datetime=pd.to_datetime(df["초과근무일자"], format="%Y-%m-%d", errors="coerce")
+    )
+
+
+def employee_keys(ids, names):
+    """개인식별번호(없으면 직원명)로 직원마다 고유한 정수 키 배열을 만듭니다.
+
+    반환값은 (키 배열, 키 -> 식별 문자열 목록) 이며, 둘 다 없는 기록의 키는 -1 입니다.
+    """
+    id_text = ids.astype("string").str.strip()
+    id_text = id_text.mask(id_text == "")
+    # 엑셀에서 숫자로 읽힌 번호(1001.0)와 문자열 번호(1001)를 같은 키로 처리
+    id_text = id_text.str.replace(r"\.0$", "", regex=True)
+    name_text = NAME_KEY_PREFIX + names.astype("string").str.strip()
+    identity = id_text.fillna(name_text)
+    codes, uniques = pd.factorize(identity)
+    return codes.astype(np.int64), list(uniques)
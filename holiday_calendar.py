@@ -0,0 +1,270 @@
+# 대한민국 공휴일/대체공휴일 및 주말 달력
+#
+# 관공서의 공휴일에 관한 규정 기준의 공휴일, 대체공휴일, 임시공휴일(선거일 포함)을 연도별로
+# 미리 정리해 둔 표입니다. 새 연도의 공휴일이 확정되면 KOREAN_PUBLIC_HOLIDAYS 에 추가하고
+# CALENDAR_VERSION 을 올려야 합니다.
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+# 달력 데이터 버전 (공휴일 표가 바뀌면 변경)
+CALENDAR_VERSION = "2027.1"
+
+KOREAN_PUBLIC_HOLIDAYS = {
+    2020: [
+        ("01-01", "신정"),
+        ("01-24", "설날 연휴"),
+        ("01-25", "설날"),
+        ("01-26", "설날 연휴"),
+        ("01-27", "대체공휴일(설날)"),
+        ("03-01", "삼일절"),
+        ("04-15", "국회의원선거일"),
+        ("04-30", "부처님오신날"),
+        ("05-05", "어린이날"),
+        ("06-06", "현충일"),
+        ("08-15", "광복절"),
+        ("08-17", "임시공휴일"),
+        ("09-30", "추석 연휴"),
+        ("10-01", "추석"),
+        ("10-02", "추석 연휴"),
+        ("10-03", "개천절"),
+        ("10-09", "한글날"),
+        ("12-25", "기독탄신일"),
+    ],
+    2021: [
+        ("01-01", "신정"),
+        ("02-11", "설날 연휴"),
+        ("02-12", "설날"),
+        ("02-13", "설날 연휴"),
+        ("03-01", "삼일절"),
+        ("05-05", "어린이날"),
+        ("05-19", "부처님오신날"),
+        ("06-06", "현충일"),
+        ("08-15", "광복절"),
+        ("08-16", "대체공휴일(광복절)"),
+        ("09-20", "추석 연휴"),
+        ("09-21", "추석"),
+        ("09-22", "추석 연휴"),
+        ("10-03", "개천절"),
+        ("10-04", "대체공휴일(개천절)"),
+        ("10-09", "한글날"),
+        ("10-11", "대체공휴일(한글날)"),
+        ("12-25", "기독탄신일"),
+    ],
+    2022: [
+        ("01-01", "신정"),
+        ("01-31", "설날 연휴"),
+        ("02-01", "설날"),
+        ("02-02", "설날 연휴"),
+        ("03-01", "삼일절"),
+        ("03-09", "대통령선거일"),
+        ("05-05", "어린이날"),
+        ("05-08", "부처님오신날"),
+        ("06-01", "지방선거일"),
+        ("06-06", "현충일"),
+        ("08-15", "광복절"),
+        ("09-09", "추석 연휴"),
+        ("09-10", "추석"),
+        ("09-11", "추석 연휴"),
+        ("09-12", "대체공휴일(추석)"),
+        ("10-03", "개천절"),
+        ("10-09", "한글날"),
+        ("10-10", "대체공휴일(한글날)"),
+        ("12-25", "기독탄신일"),
+    ],
+    2023: [
+        ("01-01", "신정"),
+        ("01-21", "설날 연휴"),
+        ("01-22", "설날"),
+        ("01-23", "설날 연휴"),
+        ("01-24", "대체공휴일(설날)"),
+        ("03-01", "삼일절"),
+        ("05-05", "어린이날"),
+        ("05-27", "부처님오신날"),
+        ("05-29", "대체공휴일(부처님오신날)"),
+        ("06-06", "현충일"),
+        ("08-15", "광복절"),
+        ("09-28", "추석 연휴"),
+        ("09-29", "추석"),
+        ("09-30", "추석 연휴"),
+        ("10-02", "임시공휴일"),
+        ("10-03", "개천절"),
+        ("10-09", "한글날"),
+        ("12-25", "기독탄신일"),
+    ],
+    2024: [
+        ("01-01", "신정"),
+        ("02-09", "설날 연휴"),
+        ("02-10", "설날"),
+        ("02-11", "설날 연휴"),
+        ("02-12", "대체공휴일(설날)"),
+        ("03-01", "삼일절"),
+        ("04-10", "국회의원선거일"),
+        ("05-05", "어린이날"),
+        ("05-06", "대체공휴일(어린이날)"),
+        ("05-15", "부처님오신날"),
+        ("06-06", "현충일"),
+        ("08-15", "광복절"),
+        ("09-16", "추석 연휴"),
+        ("09-17", "추석"),
+        ("09-18", "추석 연휴"),
+        ("10-01", "임시공휴일(국군의 날)"),
+        ("10-03", "개천절"),
+        ("10-09", "한글날"),
+        ("12-25", "기독탄신일"),
+    ],
+    2025: [
+        ("01-01", "신정"),
+        ("01-27", "임시공휴일"),
+        ("01-28", "설날 연휴"),
+        ("01-29", "설날"),
+        ("01-30", "설날 연휴"),
+        ("03-01", "삼일절"),
+        ("03-03", "대체공휴일(삼일절)"),
+        ("05-05", "어린이날/부처님오신날"),
+        ("05-06", "대체공휴일(어린이날/부처님오신날)"),
+        ("06-03", "대통령선거일"),
+        ("06-06", "현충일"),
+        ("08-15", "광복절"),
+        ("10-03", "개천절"),
+        ("10-05", "추석 연휴"),
+        ("10-06", "추석"),
+        ("10-07", "추석 연휴"),
+        ("10-08", "대체공휴일(추석)"),
+        ("10-09", "한글날"),
+        ("12-25", "기독탄신일"),
+    ],
+    2026: [
+        ("01-01", "신정"),
+        ("02-16", "설날 연휴"),
+        ("02-17", "설날"),
+        ("02-18", "설날 연휴"),
+        ("03-01", "삼일절"),
+        ("03-02", "대체공휴일(삼일절)"),
+        ("05-05", "어린이날"),
+        ("05-24", "부처님오신날"),
+        ("05-25", "대체공휴일(부처님오신날)"),
+        ("06-03", "지방선거일"),
+        ("06-06", "현충일"),
+        ("08-15", "광복절"),
+        ("08-17", "대체공휴일(광복절)"),
+        ("09-24", "추석 연휴"),
+        ("09-25", "추석"),
+        ("09-26", "추석 연휴"),
+        ("10-03", "개천절"),
+        ("10-05", "대체공휴일(개천절)"),
+        ("10-09", "한글날"),
+        ("12-25", "기독탄신일"),
+    ],
+    2027: [
+        ("01-01", "신정"),
+        ("02-06", "설날 연휴"),
+        ("02-07", "설날"),
+        ("02-08", "설날 연휴"),
+        ("02-09", "대체공휴일(설날)"),
+        ("03-01", "삼일절"),
+        ("05-05", "어린이날"),
+        ("05-13", "부처님오신날"),
+        ("06-06", "현충일"),
+        ("08-15", "광복절"),
+        ("08-16", "대체공휴일(광복절)"),
+        ("09-14", "추석 연휴"),
+        ("09-15", "추석"),
+        ("09-16", "추석 연휴"),
+        ("10-03", "개천절"),
+        ("10-04", "대체공휴일(개천절)"),
+        ("10-09", "한글날"),
+        ("10-11", "대체공휴일(한글날)"),
+        ("12-25", "기독탄신일"),
+        ("12-27", "대체공휴일(기독탄신일)"),
+    ],
+}
+
+# 1970-01-01(목요일) 기준 일수를 요일(월=0)로 바꾸기 위한 보정값
+_EPOCH_WEEKDAY = 3
+
+
+class HolidayCalendar:
+    """날짜를 휴일(주말 + 공휴일) 여부로 변환하는 달력
+
+    표에 있는 연도 범위를 하나의 bool 배열(날짜 -> 휴일 여부)로 미리 계산해 두고,
+    날짜 시리즈는 배열 인덱싱 한 번으로 조회합니다.
+    """
+
+    def __init__(self, holidays=None, extra_dates=None):
+        holidays = KOREAN_PUBLIC_HOLIDAYS if holidays is None else holidays
+        self.version = CALENDAR_VERSION
+        self.names = {}
+        for year, entries in holidays.items():
+            for month_day, name in entries:
+                month, day = map(int, month_day.split("-"))
+                self.names[date(year, month, day)] = name
+        for extra_date in extra_dates or []:
+            self.names.setdefault(pd.Timestamp(extra_date).date(), "지정휴일")
+
+        self.first_year = min(holidays) if holidays else None
+        self.last_year = max(holidays) if holidays else None
+
+        # 표 범위 전체의 날짜 -> 공휴일 여부 배열 (1970-01-01 기준 일수로 인덱싱)
+        if self.names:
+            first_day = self._day_number(date(min(d.year for d in self.names), 1, 1))
+            last_day = self._day_number(date(max(d.year for d in self.names), 12, 31))
+            self._base_day = first_day
+            self._public = np.zeros(last_day - first_day + 1, dtype=bool)
+            for holiday_date in self.names:
+                self._public[self._day_number(holiday_date) - first_day] = True
+        else:
+            self._base_day = 0
+            self._public = np.zeros(0, dtype=bool)
+
+    @staticmethod
+    def _day_number(value):
+        return (value - date(1970, 1, 1)).days
+
+    def covers(self, year):
+        """해당 연도의 공휴일 데이터가 있는지 여부"""
+        return self.first_year is not None and self.first_year <= year <= self.last_year
+
+    def is_holiday(self, dates):
+        """날짜 시리즈를 휴일 여부(bool) 시리즈로 변환합니다. (주말 또는 공휴일, NaT 는 False)"""
+        dates = pd.to_datetime(pd.Series(dates), errors="coerce")
+        valid = dates.notna().to_numpy()
+        day_numbers = np.zeros(len(dates), dtype=np.int64)
+        day_numbers[valid] = dates[valid].to_numpy().astype("datetime64[D]").astype(np.int64)
+
+        weekend = (day_numbers + _EPOCH_WEEKDAY) % 7 >= 5
+
+        offsets = day_numbers - self._base_day
+        in_table = valid & (offsets >= 0) & (offsets < len(self._public))
+        public = np.zeros(len(dates), dtype=bool)
+        public[in_table] = self._public[offsets[in_table]]
+
+        return pd.Series(valid & (weekend | public), index=dates.index)
+
+    def holiday_name(self, value):
+        """공휴일 이름을 반환합니다. 주말이면 요일 이름, 평일이면 빈 문자열입니다."""
+        value = pd.Timestamp(value).date()
+        if value in self.names:
+            return self.names[value]
+        if value.weekday() == 5:
+            return "토요일"
+        if value.weekday() == 6:
+            return "일요일"
+        return ""
+
+    def uncovered_years(self, dates):
+        """공휴일 데이터가 없는 연도 목록을 반환합니다. (주말만 판단 가능)"""
+        years = pd.to_datetime(pd.Series(dates), errors="coerce").dropna().dt.year.unique()
+        return sorted(int(year) for year in years if not self.covers(int(year)))
+
+
+_default_calendar = None
+
+
+def get_holiday_calendar():
+    """기본 공휴일 달력을 반환합니다. (처음 호출할 때 한 번만 계산)"""
+    global _default_calendar
+    if _default_calendar is None:
+        _default_calendar = HolidayCalendar()
+    return _default_calendar
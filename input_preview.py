@@ -0,0 +1,229 @@
+# 입력 파일 미리 보기 (전체를 불러오기 전에 헤더와 앞부분 행만 읽어 컬럼 매핑과 분류 결과를 확인)
+#
+# 경비 기록은 컬럼 이름으로(찾지 못하면 기본 위치로), 초과근무 기록은 열 위치로 컬럼을 정하므로
+# 파일 형식이 조금만 달라도 엉뚱한 컬럼으로 분석될 수 있습니다. 수백 MB 파일을 모두 읽기 전에
+# 앞부분만으로 어느 컬럼이 선택되는지와 기록이 어떻게 분류되는지 먼저 보여 줍니다.
+import time as timer
+from datetime import datetime, time
+
+import pandas as pd
+
+from classification_rules import get_rule_tables
+from datetime_formats import parse_dates
+from frame_dtypes import OVERTIME_COLUMNS, normalize_overtime_frame
+from input_readers import read_input_head
+from security_log import map_security_columns, parse_time_parts, security_column_field
+
+# 미리 보기로 읽을 기본 행 수
+DEFAULT_PREVIEW_ROWS = 200
+
+SECURITY_FIELDS = ("발생일자", "발생시각", "모드", "구역")
+
+# 초과근무 기록 분석에 꼭 필요한 열 (A~I열: 성명, 휴일여부, 초과근무일자, 출근/퇴근시간 포함)
+OVERTIME_REQUIRED_COLUMNS = OVERTIME_COLUMNS.index("퇴근시간") + 1
+
+# 초과근무 기록의 열 위치가 맞는지 헤더 이름으로 확인할 때 사용하는 키워드
+OVERTIME_HEADER_HINTS = {
+    "성명": ("성명", "이름", "직원"),
+    "초과근무일자": ("일자", "날짜"),
+    "출근시간": ("출근", "시작"),
+    "퇴근시간": ("퇴근", "종료"),
+}
+
+# 분류된 기록 중 '기타' 비율이 이보다 높으면 모드 컬럼 확인 안내
+OTHER_RATIO_WARNING = 0.5
+
+
+def column_letter(position):
+    """0부터 시작하는 열 번호를 엑셀 열 이름(A, B, ..., AA)으로 변환합니다."""
+    letters = ""
+    position += 1
+    while position:
+        position, remainder = divmod(position - 1, 26)
+        letters = chr(ord("A") + remainder) + letters
+    return letters
+
+
+def _column_label(columns, column):
+    return f"{column_letter(columns.index(column))}열 '{column}'"
+
+
+class InputPreview:
+    """입력 파일 미리 보기 결과
+
+    mapping 은 (필드, 선택된 원본 컬럼, 선택 방법) 목록, sample 은 원본 값에 분류 결과를 붙인 앞부분 행,
+    counts 는 분류별 건수, warnings 는 컬럼이 잘못 선택되었을 수 있는 경우의 안내 문장입니다.
+    """
+
+    def __init__(self, kind, file_path, mapping, sample, counts, warnings, seconds):
+        self.kind = kind
+        self.file_path = file_path
+        self.mapping = mapping
+        self.sample = sample
+        self.counts = counts
+        self.warnings = warnings
+        self.seconds = seconds
+
+    def summary_text(self):
+        """컬럼 매핑, 분류별 건수, 확인 필요 사항을 여러 줄 문장으로 반환합니다."""
+        lines = [f"앞부분 {len(self.sample)}행 ({self.seconds:.2f}초)", "", "[컬럼 매핑]"]
+        lines += [f"  {field}: {column} ({method})" for field, column, method in self.mapping]
+        if self.counts:
+            counts = ", ".join(f"{label} {count}건" for label, count in self.counts.items())
+            lines += ["", f"[분류 결과] {counts}"]
+        if self.warnings:
+            lines += ["", "[확인 필요]"] + [f"  - {warning}" for warning in self.warnings]
+        return "\n".join(lines)
+
+
+def preview_security(file_path, nrows=DEFAULT_PREVIEW_ROWS, rule_tables=None):
+    """경비 기록 파일의 앞부분으로 컬럼 매핑과 기록 유형/업무일 분류 결과를 미리 봅니다."""
+    started = timer.perf_counter()
+    rule_tables = rule_tables or get_rule_tables()
+    df = read_input_head(file_path, nrows)
+    columns = list(df.columns)
+    col_mapping = map_security_columns(columns)
+
+    mapping = []
+    warnings = []
+    for field in SECURITY_FIELDS:
+        column = col_mapping[field]
+        if column is None:
+            mapping.append((field, "없음", "모든 기록을 하나의 구역으로 처리"))
+        elif security_column_field(column) == field:
+            mapping.append((field, _column_label(columns, column), "이름으로 찾음"))
+        else:
+            label = _column_label(columns, column)
+            mapping.append((field, label, "기본 위치"))
+            warnings.append(f"'{field}' 컬럼을 이름으로 찾지 못해 {label}을 사용합니다.")
+
+    dates = parse_dates(df[col_mapping["발생일자"]])
+    hours, minutes, _ = parse_time_parts(df[col_mapping["발생시각"]])
+    record_types = rule_tables.security_mode.classify_series(df[col_mapping["모드"]])
+    # 새벽 시간대(0-4시)는 전날의 업무일로 계산
+    early = (hours < 4).fillna(False).astype(bool)
+    business_days = dates.dt.normalize() - pd.to_timedelta(early.astype(int), unit="D")
+    business_days = business_days.where(dates.notna() & hours.notna())
+
+    sample = (
+        pd.DataFrame(
+            {field: df[column] for field, column in col_mapping.items() if column is not None}
+        )
+        .astype(object)
+        .fillna("")
+    )
+    sample["기록유형"] = record_types.astype(str)
+    sample["업무일"] = business_days.dt.strftime("%Y-%m-%d").fillna("")
+
+    invalid_dates = int(dates.isna().sum())
+    invalid_times = int(hours.isna().sum())
+    if invalid_dates:
+        warnings.append(f"발생일자를 읽을 수 없는 행 {invalid_dates}개 (분석에서 제외됨)")
+    if invalid_times:
+        warnings.append(f"발생시각을 읽을 수 없는 행 {invalid_times}개 (분석에서 제외됨)")
+
+    counts = {label: int(count) for label, count in record_types.value_counts().items() if count}
+    other = rule_tables.security_mode.default
+    if len(df) and not (counts.get("경비해제") or counts.get("경비시작")):
+        warnings.append(
+            "경비해제/경비시작으로 분류된 기록이 없습니다. 모드 컬럼이 올바른지 확인하세요."
+        )
+    elif counts.get(other, 0) > OTHER_RATIO_WARNING * len(df):
+        warnings.append(
+            f"'{other}'(으)로 분류된 기록이 절반이 넘습니다. 모드 컬럼 또는 분류 규칙을 확인하세요."
+        )
+    if df.empty:
+        warnings.append("데이터 행이 없습니다.")
+
+    return InputPreview(
+        "security",
+        file_path,
+        mapping,
+        sample,
+        counts,
+        warnings,
+        timer.perf_counter() - started,
+    )
+
+
+def _is_time_value(value):
+    """process_overtime_log 가 읽을 수 있는 HH:mm 문자열 또는 시각 값인지 확인합니다."""
+    if isinstance(value, (datetime, time)):
+        return True
+    if not isinstance(value, str):
+        return False
+    parts = value.strip().split(":")
+    return len(parts) >= 2 and all(part.isdigit() for part in parts[:2])
+
+
+def preview_overtime(file_path, nrows=DEFAULT_PREVIEW_ROWS, rule_tables=None):
+    """초과근무 기록 파일의 앞부분으로 열 위치 매핑과 날짜/시간/휴일 분류 결과를 미리 봅니다."""
+    started = timer.perf_counter()
+    rule_tables = rule_tables or get_rule_tables()
+    df = read_input_head(file_path, nrows, header=0)
+    columns = list(df.columns)
+    if len(columns) < OVERTIME_REQUIRED_COLUMNS:
+        raise ValueError(
+            f"초과근무 기록에 필요한 {OVERTIME_REQUIRED_COLUMNS}개 열(A~"
+            f"{column_letter(OVERTIME_REQUIRED_COLUMNS - 1)}열)이 없습니다. "
+            f"(현재 {len(columns)}개 열)"
+        )
+
+    mapping = []
+    warnings = []
+    for position, field in enumerate(OVERTIME_COLUMNS):
+        if position >= len(columns):
+            mapping.append((field, "없음", "열 위치"))
+            continue
+        header = str(columns[position])
+        mapping.append((field, _column_label(columns, columns[position]), "열 위치"))
+        hints = OVERTIME_HEADER_HINTS.get(field)
+        if hints and not any(hint in header for hint in hints):
+            warnings.append(
+                f"{column_letter(position)}열 '{header}'을 {field}(으)로 사용합니다. "
+                "열 순서가 맞는지 확인하세요."
+            )
+
+    normalized = normalize_overtime_frame(df)
+    holiday_labels = rule_tables.holiday.classify_series(normalized["휴일여부"])
+    valid_dates = normalized["날짜_datetime"].notna()
+    valid_times = normalized["출근시간"].map(_is_time_value) & normalized["퇴근시간"].map(
+        _is_time_value
+    )
+    problems = pd.Series("", index=normalized.index)
+    problems = problems.mask(~valid_times, "출퇴근시간 형식 오류")
+    problems = problems.mask(~valid_dates, "초과근무일자 형식 오류")
+
+    sample = (
+        normalized[["부서명", "성명", "초과근무일자", "출근시간", "퇴근시간", "휴일여부"]]
+        .astype(object)
+        .fillna("")
+    )
+    sample["휴일분류"] = holiday_labels.astype(str)
+    sample["확인"] = problems
+
+    invalid_dates = int((~valid_dates).sum())
+    invalid_times = int((~valid_times).sum())
+    if invalid_dates:
+        warnings.append(
+            f"초과근무일자를 YYYY-MM-DD 로 읽을 수 없는 행 {invalid_dates}개 (분석에서 제외됨)"
+        )
+    if invalid_times:
+        warnings.append(f"출근/퇴근시간이 HH:mm 형식이 아닌 행 {invalid_times}개")
+    if df.empty:
+        warnings.append("데이터 행이 없습니다.")
+
+    counts = {label: int(count) for label, count in holiday_labels.value_counts().items() if count}
+    return InputPreview(
+        "overtime",
+        file_path,
+        mapping,
+        sample,
+        counts,
+        warnings,
+        timer.perf_counter() - started,
+    )
+
+
+# 파일 종류 -> 미리 보기 함수
+PREVIEW_FUNCTIONS = {"security": preview_security, "overtime": preview_overtime}
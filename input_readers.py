@@ -0,0 +1,113 @@
+# 경비/초과근무 기록 파일(엑셀, CSV, Parquet) 로드
+import codecs
+import os
+
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401
+
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# 지원하는 입력 파일 확장자
+EXCEL_EXTENSIONS = (".xlsx", ".xlsm", ".xls")
+CSV_EXTENSIONS = (".csv",)
+PARQUET_EXTENSIONS = (".parquet", ".pq")
+SUPPORTED_EXTENSIONS = EXCEL_EXTENSIONS + CSV_EXTENSIONS + PARQUET_EXTENSIONS
+
+# 파일 선택 대화상자 필터
+FILE_DIALOG_FILTER = (
+    "데이터 파일 (*.xlsx *.xls *.csv *.parquet);;"
+    "Excel Files (*.xlsx *.xls);;"
+    "CSV Files (*.csv);;"
+    "Parquet Files (*.parquet)"
+)
+
+# 한국어 CSV 내보내기에서 주로 쓰이는 인코딩 (앞에서부터 순서대로 시도)
+CSV_ENCODING_CANDIDATES = ("utf-8-sig", "cp949")
+
+# 인코딩 판별에 사용할 파일 앞부분 크기
+ENCODING_SAMPLE_BYTES = 256 * 1024
+
+
+def detect_csv_encoding(file_path, sample_bytes=ENCODING_SAMPLE_BYTES):
+    """CSV 파일 앞부분을 읽어 utf-8(-sig) 또는 cp949 인코딩을 판별합니다."""
+    with open(file_path, "rb") as f:
+        sample = f.read(sample_bytes)
+
+    for encoding in CSV_ENCODING_CANDIDATES:
+        # 샘플 끝에서 잘린 멀티바이트 문자는 오류로 보지 않도록 증분 디코더 사용
+        decoder = codecs.getincrementaldecoder(encoding)()
+        try:
+            decoder.decode(sample, final=len(sample) < sample_bytes)
+            return encoding
+        except UnicodeDecodeError:
+            continue
+
+    # 어느 인코딩으로도 읽을 수 없으면 cp949 로 읽되 깨진 문자는 대체
+    return CSV_ENCODING_CANDIDATES[-1]
+
+
+def read_csv_file(file_path, header=0, nrows=None):
+    """CSV 파일을 인코딩 자동 판별 후 pyarrow(없으면 C) 엔진으로 읽습니다."""
+    encoding = detect_csv_encoding(file_path)
+    # pyarrow 엔진은 nrows 를 지원하지 않으므로 일부만 읽을 때는 C 엔진 사용
+    engine = "pyarrow" if HAS_PYARROW and nrows is None else "c"
+    print(f"[INFO] CSV 로드: 인코딩={encoding}, 엔진={engine}")
+    return pd.read_csv(
+        file_path,
+        header=header,
+        nrows=nrows,
+        encoding=encoding,
+        encoding_errors="replace",
+        engine=engine,
+    )
+
+
+def read_parquet_file(file_path):
+    """Parquet 파일을 pyarrow 엔진으로 읽습니다."""
+    if not HAS_PYARROW:
+        raise ValueError("Parquet 파일을 읽으려면 pyarrow 패키지가 필요합니다.")
+    return pd.read_parquet(file_path, engine="pyarrow")
+
+
+def read_input_file(file_path, header=0):
+    """파일 확장자에 맞는 엔진으로 경비/초과근무 기록 파일을 읽어 데이터프레임으로 반환합니다."""
+    file_ext = os.path.splitext(file_path)[1].lower()
+
+    if file_ext == ".xls":
+        return pd.read_excel(file_path, engine="xlrd", header=header)
+    if file_ext in EXCEL_EXTENSIONS:
+        return pd.read_excel(file_path, engine="openpyxl", header=header)
+    if file_ext in CSV_EXTENSIONS:
+        return read_csv_file(file_path, header=header)
+    if file_ext in PARQUET_EXTENSIONS:
+        return read_parquet_file(file_path)
+
+    raise ValueError(f"지원하지 않는 파일 형식입니다: {file_ext}")
+
+
+def read_input_head(file_path, nrows, header=0):
+    """파일의 헤더와 앞부분 nrows 행만 읽습니다. (미리 보기용, 파일 전체를 읽지 않음)"""
+    file_ext = os.path.splitext(file_path)[1].lower()
+
+    if file_ext == ".xls":
+        return pd.read_excel(file_path, engine="xlrd", header=header, nrows=nrows)
+    if file_ext in EXCEL_EXTENSIONS:
+        # openpyxl 엔진은 nrows 행까지만 읽고 멈춤
+        return pd.read_excel(file_path, engine="openpyxl", header=header, nrows=nrows)
+    if file_ext in CSV_EXTENSIONS:
+        return read_csv_file(file_path, header=header, nrows=nrows)
+    if file_ext in PARQUET_EXTENSIONS:
+        if not HAS_PYARROW:
+            raise ValueError("Parquet 파일을 읽으려면 pyarrow 패키지가 필요합니다.")
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(file_path)
+        for batch in parquet_file.iter_batches(batch_size=nrows):
+            return batch.to_pandas()
+        return parquet_file.schema_arrow.empty_table().to_pandas()
+
+    raise ValueError(f"지원하지 않는 파일 형식입니다: {file_ext}")
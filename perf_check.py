@@ -0,0 +1,377 @@
+# 성능 회귀 검사 (고정된 합성 데이터로 단계별 처리 시간과 최대 메모리를 측정하여 기준값과 비교)
+#
+# 사용 예:
+#   python cli.py perf-check                      # perf_baseline.json 과 비교, 느려지면 종료 코드 1
+#   python cli.py perf-check --datasets small     # 작은 데이터만 빠르게 확인
+#   python cli.py perf-check --update-baseline    # 현재 측정값으로 기준값 파일 갱신
+#
+# 데이터 세트마다 새 프로세스에서 측정하므로 이전 측정의 메모리가 섞이지 않습니다. 처리 시간은 같은
+# 컴퓨터라도 CPU 속도에 따라 달라지므로, 고정된 보정 작업의 실행 시간 비율로 기준값을 조정해 비교합니다.
+# 메모리도 운영체제마다 측정 기준(Linux RSS, Windows 작업 집합)과 할당 방식이 다르므로, 고정된 보정 작업의
+# 최대 메모리 증가량 비율로 기준값을 조정해 비교합니다.
+import ctypes
+import json
+import os
+import platform
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+import numpy as np
+import pandas as pd
+
+BASELINE_FORMAT_VERSION = 2
+DEFAULT_BASELINE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "perf_baseline.json"
+)
+
+# 허용 오차 (기준값 대비 증가 비율)
+DEFAULT_TIME_TOLERANCE = 0.3
+DEFAULT_MEMORY_TOLERANCE = 0.2
+# 아주 짧은 단계가 측정 잡음으로 실패하지 않도록 더해 주는 여유 시간(초)
+MIN_TIME_SLACK_SECONDS = 0.1
+
+PERF_START_DATE = "2025-01-01"
+PERF_END_DATE = "2025-12-31"
+PERF_DAYS = 365
+
+# 합성 데이터 세트 (큰 데이터는 앱이 대용량 파일에 쓰는 스트리밍 경로로 경비 기록 처리)
+PERF_DATASETS = {
+    "small": {"events": 10_000, "zones": 1, "overtime_rows": 2_000, "streaming": False},
+    "large": {"events": 1_000_000, "zones": 20, "overtime_rows": 50_000, "streaming": True},
+}
+PERF_STAGES = ("초과근무 기록", "경비 기록", "비교")
+
+PERF_EMPLOYEES = 400
+PERF_DEPARTMENTS = 20
+STREAM_CHUNK_ROWS = 200_000
+
+SECURITY_MODES = np.array(["출근 해제", "퇴근 세팅", "출입", "경비 세트", "해제", "점검"])
+SECURITY_MODE_WEIGHTS = [0.3, 0.3, 0.2, 0.1, 0.05, 0.05]
+OVERTIME_STARTS = np.array(["07:30", "08:00", "13:00", "18:00", "19:00"])
+OVERTIME_ENDS = np.array(["20:00", "21:30", "22:30", "23:50", "01:30"])
+
+
+def _two_digits(values):
+    return pd.Series(values).astype(str).str.zfill(2)
+
+
+def _day_strings(day_offsets):
+    days = pd.Timestamp(PERF_START_DATE) + pd.to_timedelta(day_offsets, unit="D")
+    return pd.Series(days.strftime("%Y-%m-%d"))
+
+
+def synthetic_security_frame(events, zones=1, seed=0):
+    """경비 기록 형식의 합성 데이터 (같은 인자면 항상 같은 데이터)"""
+    rng = np.random.default_rng(seed)
+    seconds = rng.integers(0, 86400, events)
+    columns = {
+        "발생일자": _day_strings(rng.integers(0, PERF_DAYS, events)),
+        "발생시각": (
+            _two_digits(seconds // 3600)
+            + ":"
+            + _two_digits(seconds % 3600 // 60)
+            + ":"
+            + _two_digits(seconds % 60)
+        ),
+        "모드": SECURITY_MODES[rng.choice(len(SECURITY_MODES), events, p=SECURITY_MODE_WEIGHTS)],
+    }
+    if zones > 1:
+        columns["구역"] = "구역" + _two_digits(rng.integers(0, zones, events))
+    return pd.DataFrame(columns)
+
+
+def synthetic_overtime_frame(rows, seed=1):
+    """초과근무 기록 형식(열 위치 기준 14개 열)의 합성 데이터"""
+    rng = np.random.default_rng(seed)
+    employees = rng.integers(0, PERF_EMPLOYEES, rows)
+    return pd.DataFrame(
+        {
+            "부서명": "부서" + _two_digits(employees % PERF_DEPARTMENTS),
+            "직급": "주무관",
+            "개인식별번호": 1000 + employees,
+            "성명": "직원" + pd.Series(employees).astype(str),
+            "현업여부": "N",
+            "휴일여부": rng.choice(["N", "Y", ""], rows),
+            "초과근무일자": _day_strings(rng.integers(0, PERF_DAYS, rows)),
+            "출근시간": rng.choice(OVERTIME_STARTS, rows),
+            "퇴근시간": rng.choice(OVERTIME_ENDS, rows),
+            "출근IP": "",
+            "퇴근IP": "",
+            "초과근무시간": 2.0,
+            "수당시간": 2.0,
+            "근무내용": "업무",
+        }
+    )
+
+
+def _zone_mapping(zones):
+    from zone_mapping import ZoneMapping
+
+    if zones <= 1:
+        return None
+    return ZoneMapping(
+        department_zones={f"부서{i:02d}": f"구역{i % zones:02d}" for i in range(PERF_DEPARTMENTS)}
+    )
+
+
+class _MemoryCounters(ctypes.Structure):
+    # Windows PROCESS_MEMORY_COUNTERS
+    _fields_ = [
+        ("cb", ctypes.c_ulong),
+        ("PageFaultCount", ctypes.c_ulong),
+        ("PeakWorkingSetSize", ctypes.c_size_t),
+        ("WorkingSetSize", ctypes.c_size_t),
+        ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+        ("QuotaPagedPoolUsage", ctypes.c_size_t),
+        ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+        ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+        ("PagefileUsage", ctypes.c_size_t),
+        ("PeakPagefileUsage", ctypes.c_size_t),
+    ]
+
+
+def memory_usage_mb():
+    """(현재 메모리, 최대 메모리) 사용량(MB). Windows 는 작업 집합, 그 외는 RSS 기준"""
+    if sys.platform == "win32":
+        counters = _MemoryCounters()
+        counters.cb = ctypes.sizeof(counters)
+        process = ctypes.windll.kernel32.GetCurrentProcess()
+        ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb)
+        return counters.WorkingSetSize / 2**20, counters.PeakWorkingSetSize / 2**20
+
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss 단위는 Linux KB, macOS 바이트
+    peak_mb = peak / 2**20 if sys.platform == "darwin" else peak / 1024
+    try:
+        with open("/proc/self/statm") as f:
+            current_mb = int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except OSError:
+        current_mb = peak_mb
+    return current_mb, peak_mb
+
+
+def measure_dataset(name):
+    """데이터 세트 하나의 단계별 처리 시간(초)과 최대 메모리 증가량(MB)을 측정합니다. (새 프로세스에서 실행)"""
+    import contextlib
+    import io
+
+    from analyzer_engine import OvertimeAnalysisEngine
+    from security_log import SecurityStateBuilder
+
+    spec = PERF_DATASETS[name]
+    start_mb, _ = memory_usage_mb()
+    security_df = synthetic_security_frame(spec["events"], spec["zones"])
+    overtime_df = synthetic_overtime_frame(spec["overtime_rows"])
+    engine = OvertimeAnalysisEngine(PERF_START_DATE, PERF_END_DATE, max_workers=1)
+
+    stages = {}
+    # 분석 중 기록별 로그는 측정에서 제외
+    with contextlib.redirect_stdout(io.StringIO()):
+        started = time.perf_counter()
+        overtime_records = engine.process_overtime_log(overtime_df)
+        records_by_zone = engine.assign_zones(overtime_records, _zone_mapping(spec["zones"]))
+        stages["초과근무 기록"] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        if spec["streaming"]:
+            builder = SecurityStateBuilder(
+                PERF_START_DATE, PERF_END_DATE, engine.rule_tables, engine.dedupe_seconds
+            )
+            for first in range(0, len(security_df), STREAM_CHUNK_ROWS):
+                builder.add_chunk(security_df.iloc[first : first + STREAM_CHUNK_ROWS])
+            security_by_zone = {zone: builder.finalize(zone)[0] for zone in records_by_zone}
+        else:
+            security_by_zone = engine.process_security_log_by_zone(
+                security_df, set(records_by_zone)
+            )
+        stages["경비 기록"] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        suspicious_records = engine.compare_by_zone(security_by_zone, records_by_zone)
+        stages["비교"] = time.perf_counter() - started
+
+    _, peak_mb = memory_usage_mb()
+    return {
+        "stages": {stage: round(seconds, 3) for stage, seconds in stages.items()},
+        "peak_memory_mb": round(peak_mb - start_mb, 1),
+        "suspicious_records": len(suspicious_records),
+    }
+
+
+def calibration_seconds(repeat=5):
+    """CPU 속도 보정용 고정 작업(파이썬 반복 + pandas 집계)의 가장 짧은 실행 시간(초)"""
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        values = [(i * 7919) % 100003 for i in range(300_000)]
+        groups = {}
+        for i, value in enumerate(values):
+            groups.setdefault(value % 1000, []).append(i)
+        series = pd.Series(values)
+        series.groupby(series % 1000).sum()
+        sorted(values)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def _memory_calibration_workload():
+    """메모리 보정용 고정 작업(데이터프레임 생성 + 정렬/집계)의 최대 메모리 증가량(MB) (새 프로세스에서 실행)"""
+    start_mb, _ = memory_usage_mb()
+    df = synthetic_security_frame(200_000)
+    df.sort_values(["발생일자", "발생시각"]).groupby("발생일자")["모드"].value_counts()
+    _, peak_mb = memory_usage_mb()
+    return round(peak_mb - start_mb, 1)
+
+
+def _run_in_new_process(function, *args):
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as executor:
+        return executor.submit(function, *args).result()
+
+
+def calibration_memory_mb():
+    """메모리 보정 작업을 새 프로세스에서 실행한 최대 메모리 증가량(MB)"""
+    return _run_in_new_process(_memory_calibration_workload)
+
+
+def run_measurements(datasets):
+    """{데이터 세트: 측정 결과} 를 반환합니다. 데이터 세트마다 새 프로세스에서 차례로 측정합니다."""
+    results = {}
+    for name in datasets:
+        spec = PERF_DATASETS[name]
+        print(
+            f"[INFO] 성능 측정: {name} (경비 기록 {spec['events']}건, "
+            f"초과근무 기록 {spec['overtime_rows']}건)"
+        )
+        results[name] = _run_in_new_process(measure_dataset, name)
+    return results
+
+
+def load_baseline(path):
+    with open(path, encoding="utf-8") as f:
+        baseline = json.load(f)
+    if baseline.get("format") != BASELINE_FORMAT_VERSION:
+        raise ValueError(f"지원하지 않는 성능 기준값 파일 형식입니다: {baseline.get('format')}")
+    return baseline
+
+
+def save_baseline(path, calibration, results, time_tolerance, memory_tolerance):
+    seconds, memory_mb = calibration
+    baseline = {
+        "format": BASELINE_FORMAT_VERSION,
+        "machine": f"{platform.system()} {platform.machine()} / Python {platform.python_version()}",
+        "calibration_seconds": round(seconds, 4),
+        "calibration_memory_mb": memory_mb,
+        "tolerances": {"time": time_tolerance, "memory": memory_tolerance},
+        "datasets": results,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(baseline, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+    print(f"[INFO] 성능 기준값 저장: {path}")
+
+
+def _calibration_scales(calibration, baseline):
+    """(처리 시간, 메모리) 기준값에 곱할 보정 비율"""
+    seconds, memory_mb = calibration
+    return (
+        seconds / baseline["calibration_seconds"],
+        memory_mb / baseline["calibration_memory_mb"],
+    )
+
+
+def compare_to_baseline(results, baseline, calibration, time_tolerance=None, memory_tolerance=None):
+    """측정 결과를 기준값과 비교하여 허용 범위를 넘은 항목의 설명 목록을 반환합니다.
+
+    calibration 은 (보정 작업 실행 시간(초), 보정 작업 최대 메모리 증가량(MB)) 입니다.
+    """
+    tolerances = baseline.get("tolerances", {})
+    if time_tolerance is None:
+        time_tolerance = tolerances.get("time", DEFAULT_TIME_TOLERANCE)
+    if memory_tolerance is None:
+        memory_tolerance = tolerances.get("memory", DEFAULT_MEMORY_TOLERANCE)
+    # 기준값을 측정한 컴퓨터보다 느린(빠른) 컴퓨터면 기준 시간도 그만큼 늘림(줄임)
+    scale, memory_scale = _calibration_scales(calibration, baseline)
+    print(f"[INFO] CPU 속도 보정 비율: {scale:.2f} (기준: {baseline.get('machine', '')})")
+    print(f"[INFO] 메모리 보정 비율: {memory_scale:.2f}")
+
+    regressions = []
+    for name, result in results.items():
+        expected = baseline["datasets"].get(name)
+        if expected is None:
+            print(f"[경고] '{name}' 데이터 세트의 기준값이 없어 비교하지 않습니다.")
+            continue
+        for stage, seconds in result["stages"].items():
+            base = expected["stages"][stage] * scale
+            limit = base * (1 + time_tolerance) + MIN_TIME_SLACK_SECONDS
+            print(f"  {name} {stage}: {seconds:.2f}초 (기준 {base:.2f}초, 한도 {limit:.2f}초)")
+            if seconds > limit:
+                regressions.append(f"{name} {stage}: {seconds:.2f}초 > 한도 {limit:.2f}초")
+
+        memory = result["peak_memory_mb"]
+        base = expected["peak_memory_mb"] * memory_scale
+        limit = base * (1 + memory_tolerance)
+        print(f"  {name} 최대 메모리 증가: {memory:.0f}MB (기준 {base:.0f}MB, 한도 {limit:.0f}MB)")
+        if memory > limit:
+            regressions.append(f"{name} 최대 메모리: {memory:.0f}MB > 한도 {limit:.0f}MB")
+        if result["suspicious_records"] != expected.get("suspicious_records"):
+            # 분석 결과 자체가 바뀐 경우 (성능과 무관하므로 경고만 표시)
+            print(
+                f"[경고] {name} 의심 기록 수가 기준값과 다릅니다: "
+                f"{result['suspicious_records']}건 (기준 {expected.get('suspicious_records')}건)"
+            )
+    return regressions
+
+
+def perf_check(
+    datasets=tuple(PERF_DATASETS),
+    baseline_path=DEFAULT_BASELINE_PATH,
+    update_baseline=False,
+    time_tolerance=None,
+    memory_tolerance=None,
+):
+    """성능을 측정하여 기준값과 비교합니다. 허용 범위를 넘으면 1, 아니면 0 을 반환합니다."""
+    for name in datasets:
+        if name not in PERF_DATASETS:
+            raise ValueError(f"알 수 없는 성능 측정 데이터 세트입니다: {name}")
+    calibration = (calibration_seconds(), calibration_memory_mb())
+    results = run_measurements(datasets)
+
+    if update_baseline:
+        if os.path.exists(baseline_path):
+            # 이번에 측정하지 않은 데이터 세트의 기준값은 유지
+            previous = load_baseline(baseline_path)
+            scale, memory_scale = _calibration_scales(calibration, previous)
+            for name, result in previous["datasets"].items():
+                if name not in results:
+                    result["stages"] = {
+                        stage: round(seconds * scale, 3)
+                        for stage, seconds in result["stages"].items()
+                    }
+                    result["peak_memory_mb"] = round(result["peak_memory_mb"] * memory_scale, 1)
+                    results[name] = result
+        save_baseline(
+            baseline_path,
+            calibration,
+            {name: results[name] for name in PERF_DATASETS if name in results},
+            DEFAULT_TIME_TOLERANCE if time_tolerance is None else time_tolerance,
+            DEFAULT_MEMORY_TOLERANCE if memory_tolerance is None else memory_tolerance,
+        )
+        return 0
+
+    if not os.path.exists(baseline_path):
+        raise ValueError(f"성능 기준값 파일을 찾을 수 없습니다: {baseline_path}")
+    regressions = compare_to_baseline(
+        results, load_baseline(baseline_path), calibration, time_tolerance, memory_tolerance
+    )
+    if regressions:
+        print("[오류] 성능 저하가 감지되었습니다:", file=sys.stderr)
+        for regression in regressions:
+            print(f"  - {regression}", file=sys.stderr)
+        return 1
+    print("[INFO] 성능 검사 통과")
+    return 0
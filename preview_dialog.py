@@ -0,0 +1,50 @@
+# 입력 파일 미리 보기 대화상자 (컬럼 매핑과 분류된 앞부분 기록을 보여 주고 전체 불러오기 여부 확인)
+from PyQt5.QtWidgets import (
+    QDialog,
+    QDialogButtonBox,
+    QHeaderView,
+    QLabel,
+    QTableView,
+    QVBoxLayout,
+)
+
+from result_model import FrameTableModel
+
+PREVIEW_TITLES = {
+    "security": "경비 기록 파일 미리 보기",
+    "overtime": "초과근무 기록 파일 미리 보기",
+}
+
+
+class InputPreviewDialog(QDialog):
+    """InputPreview 를 표시합니다. '전체 불러오기'를 누르면 accept 됩니다."""
+
+    def __init__(self, preview, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle(PREVIEW_TITLES.get(preview.kind, "파일 미리 보기"))
+        self.resize(900, 600)
+
+        path_label = QLabel(preview.file_path)
+        path_label.setWordWrap(True)
+        summary_label = QLabel(preview.summary_text())
+        summary_label.setWordWrap(True)
+        if preview.warnings:
+            summary_label.setStyleSheet("color: #b00000;")
+
+        self.sample_model = FrameTableModel(self)
+        self.sample_model.set_frame(preview.sample)
+        sample_table = QTableView()
+        sample_table.setModel(self.sample_model)
+        sample_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+
+        buttons = QDialogButtonBox()
+        buttons.addButton("전체 불러오기", QDialogButtonBox.AcceptRole)
+        buttons.addButton("취소", QDialogButtonBox.RejectRole)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(path_label)
+        layout.addWidget(summary_label)
+        layout.addWidget(sample_table, 1)
+        layout.addWidget(buttons)
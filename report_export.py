@@ -0,0 +1,162 @@
+# 분석 결과(의심 기록 + 확인 필요 데이터) 내보내기
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+from openpyxl import Workbook
+
+from analysis_diagnostics import DIAGNOSTIC_CATEGORIES
+from input_readers import HAS_PYARROW
+from result_summary import SUMMARY_GROUPS, summary_tables
+
+# 의심 기록 필드와 내보내기 컬럼명 (결과 테이블 내보내기와 동일한 이름 사용)
+SUSPICIOUS_COLUMNS = {
+    "날짜": "날짜",
+    "직원명": "직원명",
+    "부서명": "부서명",
+    "초과근무시간": "초과근무 시간",
+    "경비상태": "경비상태",
+    "의심사유": "의심 사유",
+    "근무내용": "근무내용",
+    "휴일여부": "휴일여부",
+    "구역": "구역",
+}
+
+SUMMARY_SHEET = "요약"
+SUSPICIOUS_SHEET = "의심 기록"
+SUSPICIOUS_ARTIFACT = "suspicious_records"
+
+# 분석 자료를 파일로 따로 저장할 때 지원하는 형식
+ARTIFACT_FORMATS = ("csv", "parquet")
+
+# 엑셀 시트 이름에 쓸 수 없는 문자
+_INVALID_SHEET_CHARS = "[]:*?/\\"
+
+
+def _cell_value(value):
+    """엑셀/CSV 셀에 쓸 값으로 변환합니다. (날짜/시각 등은 확인 필요 데이터 임시 파일과 같은 문자열 형식)"""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, np.generic):
+        return value.item()
+    if pd.isna(value):
+        return None
+    return str(value)
+
+
+def _sheet_title(label):
+    for char in _INVALID_SHEET_CHARS:
+        label = label.replace(char, "·")
+    return label[:31]
+
+
+def analysis_summary(engine, suspicious_records):
+    """요약 시트에 쓸 (항목, 값) 목록을 반환합니다."""
+    summary = [
+        ("분석 기간", f"{engine.start_date} ~ {engine.end_date}"),
+        ("내보낸 시각", datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
+        ("분류 규칙 버전", engine.rule_tables.version),
+        ("공휴일 달력 버전", engine.holiday_calendar.version),
+        ("휴일 판단 기준", engine.holiday_source),
+        ("의심 기록", len(suspicious_records)),
+    ]
+    for category, label, count in engine.diagnostics.summary():
+        summary.append((label, count))
+    return summary
+
+
+def _artifact_rows(category, suspicious_records, diagnostics):
+    """(컬럼 목록, 행 반복자 생성 함수)를 반환합니다. 확인 필요 데이터는 임시 파일에서 다시 읽습니다."""
+    if category == SUSPICIOUS_ARTIFACT:
+        columns = list(SUSPICIOUS_COLUMNS.values())
+
+        def rows():
+            for record in suspicious_records:
+                yield [_cell_value(record.get(key, "")) for key in SUSPICIOUS_COLUMNS]
+
+        return columns, rows
+
+    # 기록마다 필드가 조금씩 다를 수 있으므로 먼저 전체 컬럼을 모음 (행은 보관하지 않음)
+    columns = []
+    for record in diagnostics.iter_records(category):
+        for key in record:
+            if key not in columns:
+                columns.append(key)
+
+    def rows():
+        for record in diagnostics.iter_records(category):
+            yield [_cell_value(record.get(key)) for key in columns]
+
+    return columns, rows
+
+
+def export_analysis_workbook(file_path, suspicious_records, diagnostics, summary=None):
+    """요약, 의심 기록, 부서별/직원별 월간 요약, 확인 필요 데이터 분류별 시트를 하나의 엑셀 파일로 저장합니다.
+
+    openpyxl write-only 모드로 행을 하나씩 기록하므로 기록 수와 관계없이 메모리 사용량이 일정합니다.
+    """
+    workbook = Workbook(write_only=True)
+
+    summary_sheet = workbook.create_sheet(SUMMARY_SHEET)
+    summary_sheet.append(["항목", "값"])
+    for item, value in summary or []:
+        summary_sheet.append([item, _cell_value(value)])
+
+    sheets = [(SUSPICIOUS_ARTIFACT, SUSPICIOUS_SHEET)] + list(DIAGNOSTIC_CATEGORIES.items())
+    tables = summary_tables(suspicious_records)
+    for category, label in sheets:
+        columns, rows = _artifact_rows(category, suspicious_records, diagnostics)
+        sheet = workbook.create_sheet(_sheet_title(label))
+        sheet.append(columns)
+        for row in rows():
+            sheet.append(row)
+
+        if category == SUSPICIOUS_ARTIFACT:
+            # 의심 기록 시트 바로 뒤에 부서별/직원별 월간 요약 시트
+            for kind, (summary_label, _) in SUMMARY_GROUPS.items():
+                summary_sheet = workbook.create_sheet(_sheet_title(summary_label))
+                summary_sheet.append(list(tables[kind].columns))
+                for row in tables[kind].itertuples(index=False):
+                    summary_sheet.append([_cell_value(value) for value in row])
+
+    workbook.save(file_path)
+    sheet_count = len(sheets) + len(tables) + 1
+    print(f"[INFO] 분석 자료 엑셀 저장: {file_path} ({sheet_count}개 시트)")
+
+
+def _write_artifact(output_dir, category, suspicious_records, diagnostics, file_format):
+    columns, rows = _artifact_rows(category, suspicious_records, diagnostics)
+    df = pd.DataFrame(list(rows()), columns=columns)
+    path = os.path.join(output_dir, f"{category}.{file_format}")
+    if file_format == "csv":
+        # 엑셀에서 바로 열 수 있도록 BOM 포함 utf-8 로 저장
+        df.to_csv(path, index=False, encoding="utf-8-sig")
+    else:
+        df.to_parquet(path, index=False, engine="pyarrow")
+    return path
+
+
+def export_analysis_artifacts(
+    output_dir, suspicious_records, diagnostics, file_format="csv", max_workers=None
+):
+    """의심 기록과 확인 필요 데이터 분류별로 CSV/Parquet 파일을 동시에 저장하고 경로 목록을 반환합니다."""
+    if file_format not in ARTIFACT_FORMATS:
+        raise ValueError(f"지원하지 않는 내보내기 형식입니다: {file_format}")
+    if file_format == "parquet" and not HAS_PYARROW:
+        raise ValueError("Parquet 파일로 저장하려면 pyarrow 패키지가 필요합니다.")
+    os.makedirs(output_dir, exist_ok=True)
+
+    categories = [SUSPICIOUS_ARTIFACT] + list(DIAGNOSTIC_CATEGORIES)
+    with ThreadPoolExecutor(max_workers=max_workers or len(categories)) as executor:
+        futures = [
+            executor.submit(
+                _write_artifact, output_dir, category, suspicious_records, diagnostics, file_format
+            )
+            for category in categories
+        ]
+        paths = [future.result() for future in futures]
+
+    print(f"[INFO] 분석 자료 {len(paths)}개 파일 저장: {output_dir}")
+    return paths
@@ -0,0 +1,147 @@
+# 분석 결과 캐시 (같은 입력 파일/기간/규칙으로 다시 분석하면 저장된 결과를 바로 반환)
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+
+from analyzer_engine import ANALYSIS_LOGIC_VERSION
+
+# 캐시 폴더를 지정하는 환경 변수
+CACHE_DIR_ENV = "OVERTIME_ANALYZER_CACHE_DIR"
+
+# 캐시 폴더 최대 크기 (넘으면 가장 오래 사용하지 않은 결과부터 삭제)
+DEFAULT_CACHE_MAX_MB = 200
+
+# 저장 형식이 바뀌면 올려서 이전 캐시를 무시
+CACHE_FORMAT_VERSION = 3
+
+CACHE_FILE_SUFFIX = ".pkl"
+_HASH_BLOCK_BYTES = 1024 * 1024
+
+# 파일 경로/크기/수정 시각 -> 내용 해시 (같은 실행 중 같은 파일을 다시 읽지 않도록)
+_fingerprint_memo = {}
+
+
+def default_cache_dir():
+    """환경 변수 > 사용자 캐시 폴더 순서로 캐시 폴더 경로를 반환합니다."""
+    if os.environ.get(CACHE_DIR_ENV):
+        return os.environ[CACHE_DIR_ENV]
+    base = os.environ.get("LOCALAPPDATA") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "overtime_analyzer", "results")
+
+
+def file_fingerprint(file_path):
+    """파일 내용의 SHA-1 해시를 반환합니다."""
+    stat = os.stat(file_path)
+    memo_key = (os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns)
+    if memo_key not in _fingerprint_memo:
+        digest = hashlib.sha1()
+        with open(file_path, "rb") as f:
+            for block in iter(lambda: f.read(_HASH_BLOCK_BYTES), b""):
+                digest.update(block)
+        _fingerprint_memo[memo_key] = digest.hexdigest()
+    return _fingerprint_memo[memo_key]
+
+
+def analysis_cache_key(engine, security_path, overtime_path, zone_path=None):
+    """입력 파일 내용, 분석 기간, 분석 로직/분류 규칙/공휴일 달력 버전, 휴일 판단 기준, 중복 경비
+    기록 병합 간격으로 캐시 키를 만듭니다."""
+    key = {
+        "format": CACHE_FORMAT_VERSION,
+        "logic": ANALYSIS_LOGIC_VERSION,
+        "security": file_fingerprint(security_path),
+        "overtime": file_fingerprint(overtime_path),
+        "zones": file_fingerprint(zone_path) if zone_path else None,
+        "start_date": engine.start_date,
+        "end_date": engine.end_date,
+        "rules": engine.rule_tables.version,
+        "calendar": engine.holiday_calendar.version,
+        "holiday_source": engine.holiday_source,
+        "dedupe_seconds": engine.dedupe_seconds,
+    }
+    return hashlib.sha1(json.dumps(key, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """분석 결과(의심 기록 + 확인 필요 데이터)를 파일로 저장하는 LRU 캐시
+
+    결과마다 캐시 폴더에 파일 하나를 저장하고, 파일 수정 시각을 마지막 사용 시각으로 사용합니다.
+    폴더 크기가 max_mb 를 넘으면 가장 오래 사용하지 않은 결과부터 삭제합니다.
+    """
+
+    def __init__(self, cache_dir=None, max_mb=DEFAULT_CACHE_MAX_MB):
+        self.cache_dir = cache_dir or default_cache_dir()
+        self.max_bytes = max_mb * 1024 * 1024
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key + CACHE_FILE_SUFFIX)
+
+    def get(self, key, diagnostics):
+        """저장된 의심 기록 목록을 반환하고 확인 필요 데이터는 diagnostics 에 채웁니다.
+
+        저장된 결과가 없으면 None 을 반환합니다.
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                suspicious_records = pickle.load(f)
+                # 확인 필요 데이터는 한 줄씩 읽어 diagnostics 의 샘플/임시 파일로 옮김
+                diagnostics.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            # 손상된 캐시 파일은 삭제하고 다시 분석
+            print(f"[경고] 분석 결과 캐시를 읽을 수 없어 삭제합니다: {e}")
+            diagnostics.clear()
+            self._remove(path)
+            return None
+
+        os.utime(path)  # 마지막 사용 시각 갱신
+        print(f"[INFO] 분석 결과 캐시 사용: {key[:12]}")
+        return suspicious_records
+
+    def put(self, key, suspicious_records, diagnostics):
+        """분석 결과를 저장하고 크기 한도를 넘으면 오래된 결과를 삭제합니다."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        # 다른 프로세스가 동시에 읽더라도 완성된 파일만 보이도록 임시 파일에 쓴 뒤 교체
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(suspicious_records, f, protocol=pickle.HIGHEST_PROTOCOL)
+                diagnostics.dump(f)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            self._remove(tmp_path)
+            raise
+        self.evict()
+
+    def evict(self):
+        """크기 한도를 넘는 동안 가장 오래 사용하지 않은 결과부터 삭제합니다."""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(CACHE_FILE_SUFFIX):
+                stat = os.stat(os.path.join(self.cache_dir, name))
+                entries.append((stat.st_mtime_ns, stat.st_size, name))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self._remove(os.path.join(self.cache_dir, name))
+            total -= size
+
+    def clear(self):
+        """저장된 결과를 모두 삭제합니다."""
+        if os.path.isdir(self.cache_dir):
+            for name in os.listdir(self.cache_dir):
+                if name.endswith(CACHE_FILE_SUFFIX):
+                    self._remove(os.path.join(self.cache_dir, name))
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
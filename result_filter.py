@@ -0,0 +1,125 @@
+# 의심 기록 검색/필터 색인
+#
+# 결과가 수만 건이면 필터를 바꿀 때마다 모든 셀의 문자열을 다시 비교하지 않도록, 결과를 처음 필터링할 때
+# 컬럼별 색인(직원명/부서명 값 -> 행 번호 배열, 날짜/의심시간 정렬 배열, 휴일 여부 배열)을 한 번 만들고
+# 조건마다 해당 행 집합을 구해 조합합니다. 이름 검색은 행이 아니라 서로 다른 값(직원 수) 만큼만 비교합니다.
+import re
+
+import numpy as np
+import pandas as pd
+
+# 검색할 수 있는 문자열 컬럼
+TEXT_FIELDS = ("직원명", "부서명")
+
+# 의심시간 필드가 없는 이전 형식 기록(캐시/세션)의 의심 사유 문장에서 시간을 읽는 패턴
+_REASON_HOURS_PATTERN = re.compile(r"총 ([0-9.]+)시간")
+
+# 최소 의심시간 비교 허용 오차 (구간 길이 합의 부동소수점 오차)
+_HOURS_TOLERANCE = 1e-9
+
+
+def suspicious_hours(record):
+    """의심 기록의 의심시간(경비 설정 중 초과근무 시간)을 숫자로 반환합니다."""
+    hours = record.get("의심시간")
+    if hours is not None and not pd.isna(hours):
+        return float(hours)
+    match = _REASON_HOURS_PATTERN.search(str(record.get("의심사유", "")))
+    return float(match.group(1)) if match else 0.0
+
+
+class ResultIndex:
+    """의심 기록 목록의 필터용 색인 (기록 목록이 바뀌면 다시 만듦)"""
+
+    def __init__(self, records):
+        self.size = len(records)
+        # 컬럼 -> {값: 행 번호 배열}, 검색용 (소문자 값, 원래 값) 목록
+        self._rows_by_value = {}
+        self._lowered_values = {}
+        for field in TEXT_FIELDS:
+            rows_by_value = {}
+            for row, record in enumerate(records):
+                rows_by_value.setdefault(str(record.get(field) or ""), []).append(row)
+            self._rows_by_value[field] = {
+                value: np.asarray(rows, dtype=np.int64) for value, rows in rows_by_value.items()
+            }
+            self._lowered_values[field] = [(value.lower(), value) for value in rows_by_value]
+
+        # 날짜는 일 단위 datetime64 (날짜가 없으면 NaT 로 정렬 배열 끝에 위치)
+        dates = pd.to_datetime(
+            pd.Series([record.get("날짜") for record in records], dtype=object), errors="coerce"
+        )
+        dates = dates.to_numpy(dtype="datetime64[ns]").astype("datetime64[D]")
+        self._date_order = np.argsort(dates, kind="stable")
+        self._sorted_dates = dates[self._date_order]
+
+        hours = np.fromiter((suspicious_hours(record) for record in records), np.float64, self.size)
+        self._hours_order = np.argsort(hours, kind="stable")
+        self._sorted_hours = hours[self._hours_order]
+
+        self._holiday = np.fromiter(
+            (record.get("휴일여부") == "휴일" for record in records), bool, self.size
+        )
+
+    def __len__(self):
+        return self.size
+
+    def values(self, field):
+        """컬럼의 서로 다른 값 목록 (자동 완성용)"""
+        return sorted(value for value in self._rows_by_value[field] if value)
+
+    def date_range(self):
+        """(가장 이른 날짜, 가장 늦은 날짜). 날짜가 없으면 None"""
+        dates = self._sorted_dates[~np.isnat(self._sorted_dates)]
+        if len(dates) == 0:
+            return None
+        return dates[0].astype(object), dates[-1].astype(object)
+
+    def text_rows(self, field, text):
+        """컬럼 값에 text 가 들어 있는(대소문자 무시) 행 번호 배열"""
+        text = text.strip().lower()
+        rows_by_value = self._rows_by_value[field]
+        matched = [
+            rows_by_value[value]
+            for lowered, value in self._lowered_values[field]
+            if text in lowered
+        ]
+        return np.concatenate(matched) if matched else np.empty(0, dtype=np.int64)
+
+    def date_rows(self, start=None, end=None):
+        """날짜가 start 이상 end 이하인 행 번호 배열"""
+        lo = 0 if start is None else np.searchsorted(self._sorted_dates, np.datetime64(start, "D"))
+        hi = (
+            np.searchsorted(self._sorted_dates, np.datetime64("NaT"))
+            if end is None
+            else np.searchsorted(self._sorted_dates, np.datetime64(end, "D"), side="right")
+        )
+        return self._date_order[lo:hi]
+
+    def hours_rows(self, min_hours):
+        """의심시간이 min_hours 이상인 행 번호 배열"""
+        lo = np.searchsorted(self._sorted_hours, min_hours - _HOURS_TOLERANCE)
+        return self._hours_order[lo:]
+
+    def filter(self, employee="", department="", start=None, end=None, holiday=None, min_hours=0):
+        """모든 조건에 맞는 행 번호 배열을 원래 순서대로 반환합니다.
+
+        holiday 가 True/False 이면 휴일/평일 기록만, min_hours 가 0 보다 크면 의심시간이 그 이상인 기록만
+        """
+        mask = np.ones(self.size, dtype=bool)
+
+        def restrict(rows):
+            selected = np.zeros(self.size, dtype=bool)
+            selected[rows] = True
+            mask[:] &= selected
+
+        if employee.strip():
+            restrict(self.text_rows("직원명", employee))
+        if department.strip():
+            restrict(self.text_rows("부서명", department))
+        if start is not None or end is not None:
+            restrict(self.date_rows(start, end))
+        if holiday is not None:
+            mask &= self._holiday if holiday else ~self._holiday
+        if min_hours > 0:
+            restrict(self.hours_rows(min_hours))
+        return np.flatnonzero(mask)
@@ -0,0 +1,141 @@
+# 의심 기록 결과 테이블 모델
+#
+# 분석 중 의심 기록을 찾는 대로 append_records 로 추가하면 추가된 행만 화면에 반영되므로, 전체 분석이
+# 끝나기 전에도 먼저 찾은 기록을 확인할 수 있습니다. (QTableWidget 처럼 셀마다 항목 객체를 만들지 않음)
+# 필터를 적용하면 ResultIndex 로 구한 행 번호 배열의 기록만 표시합니다.
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+from report_export import SUSPICIOUS_COLUMNS
+from result_filter import ResultIndex
+
+# 값이 없을 때 표시할 기본값
+DEFAULT_VALUES = {"휴일여부": "평일"}
+
+
+def display_value(record, key):
+    """의심 기록의 필드를 화면/엑셀에 표시할 문자열로 변환합니다."""
+    value = record.get(key, DEFAULT_VALUES.get(key, ""))
+    if key == "날짜" and hasattr(value, "strftime"):
+        return value.strftime("%Y-%m-%d")
+    return str(value)
+
+
+class SuspiciousRecordModel(QAbstractTableModel):
+    """의심 기록 목록(dict)을 표시하는 테이블 모델"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.keys = list(SUSPICIOUS_COLUMNS)
+        self.headers = list(SUSPICIOUS_COLUMNS.values())
+        self.records = []
+        self.rows = None  # 필터를 적용했으면 표시할 기록의 행 번호 배열
+        self._index = None
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.records) if self.rows is None else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.keys)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.ToolTipRole):
+            return None
+        return display_value(self.record_at(index.row()), self.keys[index.column()])
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.headers[section]
+        # 필터를 적용해도 전체 결과에서의 행 번호를 표시
+        return section + 1 if self.rows is None else int(self.rows[section]) + 1
+
+    def record_at(self, row):
+        """화면의 row 번째 행에 표시된 기록"""
+        return self.records[row if self.rows is None else self.rows[row]]
+
+    def set_records(self, records):
+        """표시할 기록 전체를 바꿉니다."""
+        self.beginResetModel()
+        self.records = list(records)
+        self.rows = None
+        self._index = None
+        self.endResetModel()
+
+    def append_records(self, records):
+        """기록을 표 끝에 추가합니다. (필터를 적용한 동안에는 필터를 다시 적용해야 표시됨)"""
+        if not records:
+            return
+        self._index = None
+        if self.rows is not None:
+            self.records.extend(records)
+            return
+        first = len(self.records)
+        self.beginInsertRows(QModelIndex(), first, first + len(records) - 1)
+        self.records.extend(records)
+        self.endInsertRows()
+
+    def clear(self):
+        self.set_records([])
+
+    def search_index(self):
+        """필터용 색인 (기록이 바뀐 뒤 처음 필요할 때 만듦)"""
+        if self._index is None:
+            self._index = ResultIndex(self.records)
+        return self._index
+
+    def set_filter(self, **criteria):
+        """ResultIndex.filter 조건에 맞는 기록만 표시합니다. 조건이 없으면 전체를 표시합니다."""
+        rows = self.search_index().filter(**criteria) if criteria else None
+        self.beginResetModel()
+        self.rows = rows
+        self.endResetModel()
+
+    def to_frame_rows(self):
+        """화면에 표시된 그대로의 값으로 {헤더: 값} 행 목록을 반환합니다. (엑셀 내보내기용)"""
+        return [
+            {header: display_value(record, key) for key, header in zip(self.keys, self.headers)}
+            for record in self.records
+        ]
+
+
+class FrameTableModel(QAbstractTableModel):
+    """데이터프레임(요약 표)을 그대로 표시하는 읽기 전용 테이블 모델"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.columns = []
+        self.values = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.values)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.columns)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        value = self.values[index.row()][index.column()]
+        if role == Qt.DisplayRole:
+            return str(value)
+        if role == Qt.TextAlignmentRole and isinstance(value, (int, float)):
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.columns[section]
+        return section + 1
+
+    def set_frame(self, df):
+        """표시할 데이터프레임을 바꿉니다. None 이면 비웁니다."""
+        self.beginResetModel()
+        self.columns = [] if df is None else [str(col) for col in df.columns]
+        # 셀마다 numpy 값을 변환하지 않도록 파이썬 값 목록으로 한 번에 변환
+        self.values = [] if df is None else df.astype(object).values.tolist()
+        self.endResetModel()
@@ -0,0 +1,61 @@
+# 부서별/직원별 월간 의심 기록 요약 (감사 보고서용 집계)
+#
+# 의심 기록 목록을 한 번 데이터프레임으로 바꾼 뒤 groupby 로 부서 × 월, 직원 × 월 합계를 구합니다.
+import pandas as pd
+
+from result_filter import suspicious_hours
+
+# 요약 종류 -> (표시 이름, 묶는 컬럼)
+SUMMARY_GROUPS = {
+    "department": ("부서별 요약", ["부서명"]),
+    "employee": ("직원별 요약", ["부서명", "직원명"]),
+}
+
+SUMMARY_VALUE_COLUMNS = [
+    "의심 기록",
+    "경비 기록 없음",
+    "총 의심시간",
+    "휴일 의심 기록",
+    "휴일 비율(%)",
+]
+
+
+def suspicious_frame(records):
+    """의심 기록 목록을 요약에 필요한 컬럼만 있는 데이터프레임으로 변환합니다."""
+    dates = pd.to_datetime(
+        pd.Series([record.get("날짜") for record in records], dtype=object), errors="coerce"
+    )
+    return pd.DataFrame(
+        {
+            "월": dates.dt.strftime("%Y-%m").fillna(""),
+            "부서명": [record.get("부서명") or "" for record in records],
+            "직원명": [record.get("직원명") or "" for record in records],
+            "의심시간": [suspicious_hours(record) for record in records],
+            "휴일": [record.get("휴일여부") == "휴일" for record in records],
+            "기록없음": [record.get("경비상태") == "기록 없음" for record in records],
+        }
+    )
+
+
+def summary_table(frame, group_columns):
+    """group_columns × 월 별 의심 기록 수, 경비 기록 없음 수, 총 의심시간, 휴일 비율 표"""
+    columns = group_columns + ["월"]
+    if frame.empty:
+        return pd.DataFrame(columns=columns + SUMMARY_VALUE_COLUMNS)
+    table = frame.groupby(columns, sort=True).agg(
+        **{
+            "의심 기록": ("의심시간", "size"),
+            "경비 기록 없음": ("기록없음", "sum"),
+            "총 의심시간": ("의심시간", "sum"),
+            "휴일 의심 기록": ("휴일", "sum"),
+        }
+    )
+    table["총 의심시간"] = table["총 의심시간"].round(2)
+    table["휴일 비율(%)"] = (table["휴일 의심 기록"] / table["의심 기록"] * 100).round(1)
+    return table.reset_index()
+
+
+def summary_tables(records):
+    """{요약 종류: 요약 표} 를 반환합니다. (SUMMARY_GROUPS 순서)"""
+    frame = suspicious_frame(records)
+    return {kind: summary_table(frame, columns) for kind, (_, columns) in SUMMARY_GROUPS.items()}
@@ -0,0 +1,456 @@
+# 경비 기록 처리 공용 로직 및 대용량 파일용 스트리밍 처리
+import math
+import os
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+
+import pandas as pd
+
+from classification_rules import get_rule_tables
+from datetime_formats import (
+    DATE_FORMATS,
+    KIND_TEXT,
+    TIME_FORMATS,
+    parse_dates,
+    parse_times,
+    sniff_format,
+    value_kind,
+)
+from input_readers import HAS_PYARROW, PARQUET_EXTENSIONS, detect_csv_encoding
+
+# 스트리밍 모드 전환 기준 크기 (MB)
+# 파일 전체를 올렸을 때 예상 크기가 이 값을 넘으면 나누어 읽고, 청크 크기도 이 값으로 정합니다.
+# 업무일별 경비 상태는 청크와 상관없이 계속 메모리에 남으므로 전체 메모리 사용량의 한도는 아닙니다.
+DEFAULT_MEMORY_BUDGET_MB = 256
+
+# 데이터프레임으로 올렸을 때 한 행이 차지하는 대략적인 메모리 (object 컬럼 기준 추정치)
+ESTIMATED_ROW_BYTES = 1024
+
+# 엑셀/CSV 파일 크기 대비 메모리 상의 데이터프레임 크기 배율 (xlsx 는 압축되어 있으므로 크게 잡음)
+FILE_EXPANSION_RATIO = {".xlsx": 10, ".xlsm": 10, ".csv": 3, ".parquet": 5, ".pq": 5}
+
+# 경비 구역(건물/구역) 컬럼을 찾을 때 사용하는 키워드
+ZONE_COLUMN_KEYWORDS = ("구역", "건물", "zone", "site", "사이트")
+
+# 구역을 구분하지 않고 모든 경비 기록을 합쳐서 볼 때 사용하는 구역 키
+ALL_ZONES = "전체"
+
+# 같은 업무일에 바로 앞 기록과 같은 경비 상태로 다시 기록된 전환을 합칠 기본 간격(초)
+# (여러 패널/리더기가 한 번의 설정/해제를 몇 초 간격으로 중복 기록하는 경우)
+DEFAULT_DEDUPE_SECONDS = 60
+
+# 경비 상태 전환으로 기록하는 기록유형 -> 업무일별 경비 상태의 상태 값
+STATE_LABELS = {"경비해제": "해제", "경비시작": "시작"}
+
+# 스트리밍 모드를 지원하는 파일 확장자
+STREAMABLE_EXTENSIONS = (".xlsx", ".xlsm", ".csv") + PARQUET_EXTENSIONS
+
+
+# 경비 기록 컬럼 이름으로 찾을 때 사용하는 키워드 (앞의 항목부터 검사)
+SECURITY_COLUMN_KEYWORDS = {
+    "발생일자": ("발생일자", "날짜"),
+    "발생시각": ("발생시각", "시간"),
+    "모드": ("모드", "상태", "내용"),
+    "구역": ZONE_COLUMN_KEYWORDS,
+}
+
+
+def security_column_field(column):
+    """컬럼 이름에 키워드가 들어 있으면 해당 필드(발생일자/발생시각/모드/구역), 없으면 None"""
+    col_str = str(column).lower()  # 컬럼명을 소문자로 변환하여 비교
+    for field, keywords in SECURITY_COLUMN_KEYWORDS.items():
+        if any(keyword in col_str for keyword in keywords):
+            return field
+    return None
+
+
+def map_security_columns(columns):
+    """경비 기록 컬럼 목록에서 발생일자/발생시각/모드(/구역) 컬럼을 찾아 매핑합니다."""
+    columns = list(columns)
+    col_mapping = {}
+
+    # 컬럼 이름 매핑 (정확한 이름 또는 포함된 문자열로 찾기)
+    for col in columns:
+        field = security_column_field(col)
+        if field is not None:
+            col_mapping[field] = col
+
+    # 찾지 못한 컬럼은 기본 위치로 설정
+    if "발생일자" not in col_mapping:
+        col_mapping["발생일자"] = columns[0]  # A열
+    if "발생시각" not in col_mapping:
+        col_mapping["발생시각"] = columns[1]  # B열
+    if "모드" not in col_mapping:
+        if len(columns) > 8:
+            col_mapping["모드"] = columns[8]  # I열
+        else:
+            col_mapping["모드"] = None
+
+    # 구역 컬럼은 선택 사항 (없으면 모든 기록을 하나의 구역으로 처리)
+    col_mapping.setdefault("구역", None)
+
+    # 필요한 컬럼이 없으면 오류 반환
+    if col_mapping["모드"] is None:
+        raise ValueError("다음 컬럼을 찾을 수 없습니다: 모드")
+
+    return col_mapping
+
+
+def zone_labels(series):
+    """구역 컬럼 값을 앞뒤 공백을 제거한 문자열로 변환합니다. (범주형 컬럼 포함, 빈 값은 "")"""
+    return series.astype("string").fillna("").str.strip()
+
+
+def parse_time_parts(series, time_format=None):
+    """발생시각 열을 (시, 분, 초) 정수(Int64) 시리즈로 변환합니다. 변환할 수 없는 값은 <NA> 입니다."""
+    seconds = parse_times(series, time_format).dt.total_seconds().round().astype("Int64")
+    return seconds // 3600, seconds % 3600 // 60, seconds % 60
+
+
+def repeated_state_mask(business_days, states, occurred_at, window_seconds=DEFAULT_DEDUPE_SECONDS):
+    """시간순 경비 상태 전환 기록 중 합칠(뺄) 행을 True 로 표시한 배열을 반환합니다.
+
+    같은 업무일의 바로 앞 전환과 상태가 같고 window_seconds 초 안에 기록된 전환이 대상입니다.
+    (math.inf 이면 간격과 관계없이 연속된 같은 상태를 모두 합침) 같은 상태로 다시 전환해도 경비 설정
+    구간은 바뀌지 않으므로 합친 뒤에도 의심 구간은 같고, 경비설정시각 목록의 중복만 사라집니다.
+    """
+    mask = (business_days == business_days.shift()) & (states == states.shift())
+    if not math.isinf(window_seconds):
+        mask &= occurred_at - occurred_at.shift() <= pd.Timedelta(seconds=window_seconds)
+    return mask.to_numpy(dtype=bool)
+
+
+def chunk_rows_for_budget(memory_budget_mb):
+    """스트리밍 전환 기준 크기에서 한 번에 읽을 청크 행 수를 계산합니다. (기준의 1/4 을 청크에 사용)"""
+    budget_bytes = max(1, int(memory_budget_mb)) * 1024 * 1024
+    return max(1000, budget_bytes // 4 // ESTIMATED_ROW_BYTES)
+
+
+def should_stream(file_path, memory_budget_mb=DEFAULT_MEMORY_BUDGET_MB):
+    """파일을 통째로 로드했을 때 예상 크기가 스트리밍 전환 기준을 넘으면 True 를 반환합니다."""
+    file_ext = os.path.splitext(file_path)[1].lower()
+    if file_ext not in STREAMABLE_EXTENSIONS:
+        return False
+    estimated_bytes = os.path.getsize(file_path) * FILE_EXPANSION_RATIO.get(file_ext, 1)
+    return estimated_bytes > memory_budget_mb * 1024 * 1024
+
+
+def iter_security_chunks(file_path, chunk_rows):
+    """경비 기록 파일을 chunk_rows 행씩 데이터프레임으로 읽어 반환합니다."""
+    file_ext = os.path.splitext(file_path)[1].lower()
+
+    if file_ext == ".csv":
+        encoding = detect_csv_encoding(file_path)
+        for chunk in pd.read_csv(
+            file_path, chunksize=chunk_rows, encoding=encoding, encoding_errors="replace"
+        ):
+            yield chunk
+        return
+
+    if file_ext in PARQUET_EXTENSIONS:
+        if not HAS_PYARROW:
+            raise ValueError("Parquet 파일을 읽으려면 pyarrow 패키지가 필요합니다.")
+        import pyarrow.parquet as pq
+
+        # Parquet 는 행 그룹 단위로 나누어 읽음
+        parquet_file = pq.ParquetFile(file_path)
+        for batch in parquet_file.iter_batches(batch_size=chunk_rows):
+            yield batch.to_pandas()
+        return
+
+    if file_ext not in (".xlsx", ".xlsm"):
+        raise ValueError(f"스트리밍 모드는 {', '.join(STREAMABLE_EXTENSIONS)} 파일만 지원합니다.")
+
+    from openpyxl import load_workbook
+
+    # read_only 모드는 시트 전체를 메모리에 올리지 않고 행 단위로 읽음
+    workbook = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        # pd.read_excel 과 동일하게 빈 헤더는 "Unnamed: n" 으로 표시
+        header = [f"Unnamed: {i}" if value is None else value for i, value in enumerate(header)]
+
+        buffer = []
+        for row in rows:
+            buffer.append(row[: len(header)])
+            if len(buffer) >= chunk_rows:
+                yield pd.DataFrame(buffer, columns=header)
+                buffer = []
+        if buffer:
+            yield pd.DataFrame(buffer, columns=header)
+    finally:
+        workbook.close()
+
+
+def _event_seconds(sort_key):
+    date_value, hour, minute, second, _ = sort_key
+    return date_value // 10**9 + hour * 3600 + minute * 60 + second
+
+
+def _collapse_repeated_states(events, window_seconds):
+    """시간순 (정렬키, 시간 문자열, 상태) 목록에서 repeated_state_mask 와 같은 규칙으로 반복된 전환을 뺍니다."""
+    kept = events[:1]
+    for previous, event in zip(events, events[1:]):
+        gap = _event_seconds(event[0]) - _event_seconds(previous[0])
+        if event[2] == previous[2] and gap <= window_seconds:
+            continue
+        kept.append(event)
+    return kept
+
+
+class _BusinessDayState:
+    """업무일 하나의 경비 상태를 요약해서 보관하는 구조체"""
+
+    __slots__ = ("events", "first", "last", "count", "has_release", "has_start", "has_unclear")
+
+    def __init__(self):
+        self.events = []  # (정렬키, 시간 문자열, 상태) - 경비해제/경비시작 기록만 보관
+        self.first = None  # (정렬키, 기록유형, 시간 문자열)
+        self.last = None  # (정렬키, 기록유형, 시:분)
+        self.count = 0
+        self.has_release = False
+        self.has_start = False
+        self.has_unclear = False
+
+
+class SecurityStateBuilder:
+    """경비 기록을 청크 단위로 받아 업무일별 경비 상태만 누적하는 클래스
+
+    process_security_log 와 같은 규칙(새벽 4시 업무일 기준, 첫 '출입' 기록은 경비해제)으로
+    분류하되, 원본 행은 보관하지 않고 업무일별 경비해제/경비시작 시각만 남깁니다.
+    구역 컬럼이 있으면 구역별 상태와 전체(ALL_ZONES) 상태를 함께 누적합니다.
+    """
+
+    def __init__(
+        self,
+        start_date=None,
+        end_date=None,
+        rule_tables=None,
+        dedupe_seconds=DEFAULT_DEDUPE_SECONDS,
+    ):
+        self.start_date = start_date
+        self.end_date = end_date
+        self.rule_tables = rule_tables or get_rule_tables()
+        # 반복된 경비 상태 전환을 합칠 간격(초), None 이면 합치지 않음
+        self.dedupe_seconds = dedupe_seconds
+        self.col_mapping = None
+        self.row_count = 0
+        self._zones = {ALL_ZONES: {}}  # 구역 -> 업무일 -> _BusinessDayState
+        self._sequence = 0  # 같은 시각 기록의 원본 순서 유지용
+        # 첫 청크에서 판별한 발생일자/발생시각 문자열 형식 (이후 청크는 판별 없이 재사용)
+        self.date_format = None
+        self.time_format = None
+
+    # 청크 하나를 분류하여 업무일별 상태에 반영
+    def add_chunk(self, df):
+        if df.empty:
+            return
+        if self.col_mapping is None:
+            self.col_mapping = map_security_columns(df.columns)
+
+        self.row_count += len(df)
+        date_values = df[self.col_mapping["발생일자"]]
+        time_values = df[self.col_mapping["발생시각"]]
+        if self.date_format is None and value_kind(date_values) == KIND_TEXT:
+            self.date_format = sniff_format(date_values, DATE_FORMATS)
+        if self.time_format is None and value_kind(time_values) == KIND_TEXT:
+            self.time_format = sniff_format(time_values, TIME_FORMATS)
+        dates = parse_dates(date_values, self.date_format)
+        hours, minutes, seconds = parse_time_parts(time_values, self.time_format)
+
+        mask = dates.notna() & hours.notna()
+        if self.start_date and self.end_date:
+            mask &= (dates >= self.start_date) & (dates <= self.end_date)
+        if not mask.any():
+            return
+
+        dates = dates[mask]
+        hours = hours[mask].astype(int)
+        minutes = minutes[mask].astype(int)
+        seconds = seconds[mask].fillna(0).astype(int)
+        record_types = self.rule_tables.security_mode.classify_series(
+            df.loc[mask, self.col_mapping["모드"]]
+        )
+        zone_col = self.col_mapping["구역"]
+        if zone_col is not None:
+            zones = zone_labels(df.loc[mask, zone_col])
+        else:
+            zones = [None] * len(record_types)
+
+        # 새벽 시간대(0-4시)는 전날의 업무일로 계산
+        calendar_days = dates.dt.normalize()
+        business_days = calendar_days.where(hours >= 4, calendar_days - pd.Timedelta(days=1))
+
+        for date_value, business_day, hour, minute, second, record_type, zone in zip(
+            calendar_days, business_days, hours, minutes, seconds, record_types, zones
+        ):
+            self._sequence += 1
+            sort_key = (date_value.value, hour, minute, second, self._sequence)
+            time_str = f"{date_value.strftime('%Y-%m-%d')} {hour:02d}:{minute:02d}"
+            record = (sort_key, record_type, time_str, f"{hour:02d}:{minute:02d}")
+
+            self._add_record(self._zones[ALL_ZONES], business_day.date(), record)
+            if zone is not None:
+                self._add_record(self._zones.setdefault(zone, {}), business_day.date(), record)
+
+    @property
+    def has_zones(self):
+        """경비 기록에 구역 컬럼이 있는지 여부"""
+        return self.col_mapping is not None and self.col_mapping["구역"] is not None
+
+    @staticmethod
+    def _add_record(days, business_day, record):
+        sort_key, record_type, time_str, hour_minute = record
+        state = days.get(business_day)
+        if state is None:
+            state = days[business_day] = _BusinessDayState()
+
+        state.count += 1
+        if record_type == "경비해제":
+            state.has_release = True
+            state.events.append((sort_key, time_str, "해제"))
+        elif record_type == "경비시작":
+            state.has_start = True
+            state.events.append((sort_key, time_str, "시작"))
+        elif record_type == "출입(불명확)":
+            state.has_unclear = True
+
+        if state.first is None or sort_key < state.first[0]:
+            state.first = (sort_key, record_type, time_str)
+        if state.last is None or sort_key > state.last[0]:
+            state.last = (sort_key, record_type, hour_minute)
+
+    # 누적된 상태를 process_security_log 와 같은 형식으로 변환
+    def finalize(self, zone=ALL_ZONES):
+        """구역의 (업무일별 경비 상태, 경비 데이터가 불명확한 업무일 목록)을 반환합니다."""
+        security_status_by_day = {}
+        unclear_security_days = []
+        days = self._zones.get(zone, {})
+
+        for business_day in sorted(days):
+            state = days[business_day]
+            events = list(state.events)
+
+            if state.has_unclear:
+                # 첫 기록이 '출입(불명확)'이면 '경비해제'로 간주, 나머지 출입 기록은 무시
+                if state.first[1] == "출입(불명확)":
+                    events.append((state.first[0], state.first[2], "해제"))
+                    print(f"[경비판단] {business_day} - 첫 기록이 '출입'이므로 '경비해제'로 판단")
+
+                # 마지막 기록이 확실한 경비시작이 아니면 확인 필요
+                if state.last[1] not in ("경비시작", "기타"):
+                    unclear_security_days.append(
+                        {
+                            "업무일": business_day,
+                            "마지막기록시간": state.last[2],
+                            "기록유형": state.last[1],
+                            "문제": "마지막 기록이 '경비시작'이 아님",
+                        }
+                    )
+
+            # 명확한 경비 기록이 아예 없는 경우도 의심 데이터로 분류
+            if not state.has_release and not state.has_start and state.count > 0:
+                unclear_security_days.append(
+                    {
+                        "업무일": business_day,
+                        "기록수": state.count,
+                        "문제": "명확한 경비해제/시작 기록 없음",
+                    }
+                )
+
+            events.sort(key=lambda event: event[0])
+            if self.dedupe_seconds is not None:
+                events = _collapse_repeated_states(events, self.dedupe_seconds)
+            security_status_by_day[business_day] = [
+                {"시간": time_str, "상태": status} for _, time_str, status in events
+            ]
+
+        return security_status_by_day, unclear_security_days
+
+
+class ArmedTimeline:
+    """분석 기간 전체의 경비 설정(시작)/해제 전환을 시간순으로 담은 연속 타임라인
+
+    업무일별 경비 상태를 한 번만 합쳐 정렬해 두고, 초과근무 구간과 겹치는 경비 설정 구간은
+    이진 탐색으로 찾습니다. 전환 사이의 상태는 직전 전환의 상태가 그대로 유지되므로 자정이나
+    업무일 경계를 넘는 구간도 끊기지 않습니다. 첫 전환 이전은 첫 전환과 반대 상태로 간주합니다.
+    """
+
+    def __init__(self, transitions):
+        # transitions: 시간순으로 정렬된 (datetime, "시작"|"해제") 목록
+        self.times = [moment for moment, _ in transitions]
+        self.armed = [status == "시작" for _, status in transitions]
+
+    def __len__(self):
+        return len(self.times)
+
+    @classmethod
+    def from_status_by_day(cls, security_status_by_day):
+        """{업무일: [{"시간": "YYYY-mm-dd HH:MM", "상태": ...}]} 로 타임라인을 만듭니다."""
+        transitions = [
+            (datetime.strptime(change["시간"], "%Y-%m-%d %H:%M"), change["상태"])
+            for business_day in sorted(security_status_by_day)
+            for change in security_status_by_day[business_day]
+        ]
+        # 같은 시각의 기록은 업무일/기록 순서 유지 (안정 정렬)
+        transitions.sort(key=lambda transition: transition[0])
+        return cls(transitions)
+
+    def is_armed_at(self, moment):
+        """해당 시각의 경비 설정 여부 (전환 시각에는 전환 후 상태)"""
+        index = bisect_right(self.times, moment) - 1
+        if index < 0:
+            return bool(self.armed) and not self.armed[0]
+        return self.armed[index]
+
+    def armed_intervals(self, start, end):
+        """[start, end) 구간 중 경비가 설정되어 있던 구간 목록 [(시작, 종료)] 을 반환합니다."""
+        intervals = []
+        armed = self.is_armed_at(start)
+        segment_start = start
+        index = bisect_right(self.times, start)
+        while index < len(self.times) and self.times[index] < end:
+            if self.armed[index] != armed:
+                if armed:
+                    intervals.append((segment_start, self.times[index]))
+                armed = self.armed[index]
+                segment_start = self.times[index]
+            index += 1
+        if armed and segment_start < end:
+            intervals.append((segment_start, end))
+        return intervals
+
+    def set_times_between(self, start, end):
+        """start 이상 end 이하 구간의 경비 설정(시작) 시각 목록을 반환합니다."""
+        lo = bisect_left(self.times, start)
+        hi = bisect_right(self.times, end)
+        return [self.times[i] for i in range(lo, hi) if self.armed[i]]
+
+
+def stream_security_log(
+    file_path,
+    start_date=None,
+    end_date=None,
+    memory_budget_mb=DEFAULT_MEMORY_BUDGET_MB,
+    rule_tables=None,
+    dedupe_seconds=DEFAULT_DEDUPE_SECONDS,
+):
+    """경비 기록 파일을 청크 단위로 읽어 업무일별 경비 상태를 계산합니다.
+
+    반환값: (업무일별 경비 상태, 경비 데이터가 불명확한 업무일 목록, 읽은 행 수)
+    """
+    chunk_rows = chunk_rows_for_budget(memory_budget_mb)
+    print(f"[INFO] 경비 기록 스트리밍 처리 시작 (청크: {chunk_rows}행, 한도: {memory_budget_mb}MB)")
+
+    builder = SecurityStateBuilder(start_date, end_date, rule_tables, dedupe_seconds)
+    for chunk in iter_security_chunks(file_path, chunk_rows):
+        builder.add_chunk(chunk)
+
+    security_status_by_day, unclear_security_days = builder.finalize()
+    print(
+        f"[INFO] 경비 기록 스트리밍 처리 완료: {builder.row_count}행, {len(security_status_by_day)}개 업무일"
+    )
+    return security_status_by_day, unclear_security_days, builder.row_count
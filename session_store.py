@@ -0,0 +1,222 @@
+# 분석 세션 저장/열기
+#
+# 세션은 JSON 매니페스트 파일(*.ovsession)과 같은 이름의 데이터 폴더(<이름>_data)로 구성됩니다.
+# 데이터 폴더에는 불러온 경비/초과근무 기록, 구역별 업무일 경비 상태, 의심 기록을 압축하지 않은
+# Feather(Arrow IPC) 파일로 저장하므로, 다시 열 때 파일을 메모리 매핑으로 바로 읽을 수 있습니다.
+# 확인 필요 데이터는 한 줄에 기록 하나씩 JSON Lines 파일로 저장합니다. (날짜/시각 타입 유지)
+import json
+import os
+from datetime import datetime
+
+import pandas as pd
+
+from input_readers import HAS_PYARROW
+from security_log import DEFAULT_DEDUPE_SECONDS
+from zone_mapping import ZoneMapping
+
+if HAS_PYARROW:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+
+SESSION_EXTENSION = ".ovsession"
+SESSION_DIALOG_FILTER = "분석 세션 (*.ovsession)"
+
+# 세션 파일 형식 버전 (호환되지 않게 바뀌면 올림)
+SESSION_FORMAT_VERSION = 2
+
+# 데이터 폴더의 표 이름 -> 파일 이름
+SESSION_TABLES = {
+    "security": "security.feather",
+    "overtime": "overtime.feather",
+    "security_state": "security_state.feather",
+    "suspicious": "suspicious.feather",
+}
+
+# 확인 필요 데이터(AnalysisDiagnostics.dump) 파일 이름
+DIAGNOSTICS_FILE = "diagnostics.jsonl"
+
+SECURITY_STATE_COLUMNS = ["구역", "업무일", "시간", "상태"]
+
+
+class AnalysisSession:
+    """저장하거나 다시 열 수 있는 분석 세션 (입력 데이터, 분석 조건, 분석 결과)"""
+
+    def __init__(
+        self,
+        start_date,
+        end_date,
+        holiday_source="both",
+        dedupe_seconds=DEFAULT_DEDUPE_SECONDS,
+        security_df=None,
+        overtime_df=None,
+        security_stream_path=None,
+        zone_mapping=None,
+        suspicious_records=None,
+        security_by_zone=None,
+        diagnostics=None,
+        source_paths=None,
+    ):
+        self.start_date = start_date
+        self.end_date = end_date
+        self.holiday_source = holiday_source
+        # 중복 경비 기록 병합 간격(초), None 이면 병합하지 않음
+        self.dedupe_seconds = dedupe_seconds
+        self.security_df = security_df
+        self.overtime_df = overtime_df
+        # 스트리밍 모드로 분석한 경비 기록은 원본 파일 경로만 저장
+        self.security_stream_path = security_stream_path
+        self.zone_mapping = zone_mapping
+        self.suspicious_records = suspicious_records or []
+        self.security_by_zone = security_by_zone or {}
+        # 저장할 때는 AnalysisDiagnostics, 열 때는 load_session 에 넘긴 저장소
+        self.diagnostics = diagnostics
+        # 원본 입력 파일 경로 {"security": ..., "overtime": ..., "zone": ...}
+        self.source_paths = source_paths or {}
+
+
+def session_data_dir(file_path):
+    """세션 매니페스트 파일에 대응하는 데이터 폴더 경로를 반환합니다."""
+    return os.path.splitext(file_path)[0] + "_data"
+
+
+def _arrow_safe_frame(df):
+    """Arrow 로 저장할 수 없는 컬럼(여러 타입이 섞인 object 컬럼)은 문자열로 바꾼 복사본을 반환합니다."""
+    df = df.rename(columns=str)
+    converted = {}
+    for col in df.columns:
+        if df[col].dtype != object:
+            continue
+        try:
+            pa.array(df[col], from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            converted[col] = df[col].map(lambda value: value if pd.isna(value) else str(value))
+    return df.assign(**converted) if converted else df
+
+
+def _security_state_frame(security_by_zone):
+    rows = [
+        (zone, business_day, change["시간"], change["상태"])
+        for zone, status_by_day in security_by_zone.items()
+        for business_day, changes in status_by_day.items()
+        for change in changes
+    ]
+    return pd.DataFrame(rows, columns=SECURITY_STATE_COLUMNS)
+
+
+def _security_state_from_frame(df):
+    security_by_zone = {}
+    for zone, business_day, time_str, status in df.itertuples(index=False):
+        status_by_day = security_by_zone.setdefault(zone, {})
+        status_by_day.setdefault(business_day, []).append({"시간": time_str, "상태": status})
+    return security_by_zone
+
+
+def save_session(file_path, session):
+    """분석 세션을 매니페스트 파일과 데이터 폴더로 저장합니다."""
+    if not HAS_PYARROW:
+        raise ValueError("분석 세션을 저장하려면 pyarrow 패키지가 필요합니다.")
+
+    data_dir = session_data_dir(file_path)
+    os.makedirs(data_dir, exist_ok=True)
+
+    frames = {
+        "security": session.security_df,
+        "overtime": session.overtime_df,
+        "security_state": _security_state_frame(session.security_by_zone),
+        "suspicious": pd.DataFrame(session.suspicious_records),
+    }
+    tables = {}
+    for name, df in frames.items():
+        path = os.path.join(data_dir, SESSION_TABLES[name])
+        if df is None:
+            if os.path.exists(path):
+                os.remove(path)
+            continue
+        # 메모리 매핑으로 바로 읽을 수 있도록 압축하지 않고 저장
+        feather.write_feather(_arrow_safe_frame(df), path, compression="uncompressed")
+        tables[name] = SESSION_TABLES[name]
+
+    diagnostics_path = os.path.join(data_dir, DIAGNOSTICS_FILE)
+    if session.diagnostics is not None:
+        # 임시 파일에 있는 전체 기록을 한 줄씩 옮겨 씀
+        with open(diagnostics_path, "wb") as f:
+            session.diagnostics.dump(f)
+    elif os.path.exists(diagnostics_path):
+        os.remove(diagnostics_path)
+
+    zone_mapping = session.zone_mapping
+    manifest = {
+        "format": SESSION_FORMAT_VERSION,
+        "saved_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "start_date": session.start_date,
+        "end_date": session.end_date,
+        "holiday_source": session.holiday_source,
+        "dedupe_seconds": session.dedupe_seconds,
+        "security_stream_path": session.security_stream_path,
+        "source_paths": session.source_paths,
+        "zone_mapping": (
+            {
+                "employee_zones": zone_mapping.employee_zones,
+                "department_zones": zone_mapping.department_zones,
+            }
+            if zone_mapping is not None
+            else None
+        ),
+        "tables": tables,
+        "diagnostics": DIAGNOSTICS_FILE if session.diagnostics is not None else None,
+    }
+    # 매니페스트는 데이터 파일을 모두 쓴 뒤 마지막에 교체 (저장 도중 실패하면 이전 세션 유지)
+    tmp_path = file_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2, default=str)
+    os.replace(tmp_path, file_path)
+    print(f"[INFO] 분석 세션 저장: {file_path}")
+
+
+def load_session(file_path, diagnostics=None):
+    """저장된 분석 세션을 엽니다. 표 데이터는 메모리 매핑으로 읽습니다.
+
+    diagnostics(AnalysisDiagnostics)를 넘기면 저장된 확인 필요 데이터를 한 줄씩 읽어 채웁니다.
+    """
+    if not HAS_PYARROW:
+        raise ValueError("분석 세션을 열려면 pyarrow 패키지가 필요합니다.")
+
+    with open(file_path, encoding="utf-8") as f:
+        manifest = json.load(f)
+    if manifest.get("format") != SESSION_FORMAT_VERSION:
+        raise ValueError(f"지원하지 않는 분석 세션 형식입니다: {manifest.get('format')}")
+
+    data_dir = session_data_dir(file_path)
+    frames = {}
+    for name, file_name in manifest["tables"].items():
+        table = feather.read_table(os.path.join(data_dir, file_name), memory_map=True)
+        frames[name] = table.to_pandas()
+
+    if diagnostics is not None:
+        diagnostics.clear()
+        if manifest.get("diagnostics"):
+            with open(os.path.join(data_dir, manifest["diagnostics"]), "rb") as f:
+                diagnostics.load(f)
+
+    suspicious = frames.get("suspicious")
+    zone_mapping = manifest.get("zone_mapping")
+    session = AnalysisSession(
+        manifest["start_date"],
+        manifest["end_date"],
+        manifest.get("holiday_source", "both"),
+        manifest.get("dedupe_seconds", DEFAULT_DEDUPE_SECONDS),
+        security_df=frames.get("security"),
+        overtime_df=frames.get("overtime"),
+        security_stream_path=manifest.get("security_stream_path"),
+        zone_mapping=ZoneMapping(**zone_mapping) if zone_mapping is not None else None,
+        suspicious_records=(suspicious.to_dict("records") if suspicious is not None else []),
+        security_by_zone=(
+            _security_state_from_frame(frames["security_state"])
+            if "security_state" in frames
+            else {}
+        ),
+        diagnostics=diagnostics,
+        source_paths=manifest.get("source_paths"),
+    )
+    print(f"[INFO] 분석 세션 열기: {file_path} (저장 시각: {manifest.get('saved_at')})")
+    return session
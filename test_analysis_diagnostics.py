@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# 분석 진단 정보 저장소 테스트
+import io
+import os
+import pickle
+from datetime import date, datetime, time
+
+from analysis_diagnostics import AnalysisDiagnostics
+
+
+def test_samples_are_capped_but_counts_are_exact():
+    diagnostics = AnalysisDiagnostics(sample_limit=3)
+    diagnostics.extend("error_records", [{"번호": i} for i in range(10)])
+
+    assert diagnostics.count("error_records") == 10
+    assert len(diagnostics.samples("error_records")) == 3
+    assert diagnostics.is_truncated("error_records")
+
+
+def test_spill_keeps_full_detail_and_clear_resets():
+    """샘플 한도를 넘는 기록은 임시 파일에서 다시 읽고, clear() 후에는 모두 비워지는지 확인합니다"""
+    diagnostics = AnalysisDiagnostics(sample_limit=2, spill=True)
+    diagnostics.extend("no_security_records", [{"업무일": date(2025, 3, i)} for i in range(1, 6)])
+
+    records = list(diagnostics.iter_records("no_security_records"))
+    assert [r["업무일"] for r in records] == [date(2025, 3, i) for i in range(1, 6)]
+
+    spill_dir = diagnostics._spill_dir
+    diagnostics.clear()
+    assert not os.path.exists(spill_dir)
+    assert diagnostics.total_count() == 0
+    assert list(diagnostics.iter_records("no_security_records")) == []
+
+
+def test_repeated_runs_do_not_accumulate():
+    """분석을 반복해도 이전 실행의 기록이 남지 않는지 확인합니다"""
+    diagnostics = AnalysisDiagnostics(sample_limit=5)
+    for _ in range(3):
+        diagnostics.clear()
+        diagnostics.extend("missing_time_records", [{"직원명": "홍길동"}] * 4)
+    assert diagnostics.count("missing_time_records") == 4
+    assert len(diagnostics.samples("missing_time_records")) == 4
+
+
+def test_dump_and_load_keep_value_types():
+    """임시 파일에 있는 전체 기록이 날짜/시각 타입 그대로 저장되고 복원되는지 확인합니다"""
+    record = {"날짜": date(2025, 3, 4), "시각": time(21, 5), "기록": datetime(2025, 3, 5, 1, 30)}
+    diagnostics = AnalysisDiagnostics(sample_limit=1, spill=True)
+    diagnostics.extend("error_records", [dict(record, 번호=i) for i in range(3)])
+
+    f = io.BytesIO()
+    diagnostics.dump(f)
+    f.seek(0)
+    restored = AnalysisDiagnostics(sample_limit=1, spill=True)
+    restored.load(f)
+
+    assert restored.count("error_records") == 3
+    assert list(restored.iter_records("error_records")) == list(
+        diagnostics.iter_records("error_records")
+    )
+    assert restored.samples("error_records") == [dict(record, 번호=0)]
+    diagnostics.clear()
+    restored.clear()
+
+
+def test_merge_keeps_counts_of_capped_worker_results():
+    """프로세스 풀에서 돌아온 작업별 저장소의 기록과 전체 건수를 모두 가져오는지 확인합니다"""
+    parent = AnalysisDiagnostics(sample_limit=2, spill=True)
+    for spill in (True, False):
+        worker = parent.empty_copy()
+        worker.spill = spill
+        worker.extend("missing_time_records", [{"번호": i} for i in range(4)])
+        parent.merge(pickle.loads(pickle.dumps(worker)))
+        worker.clear()
+
+    assert parent.count("missing_time_records") == 8
+    # 임시 파일을 쓰지 않은 작업은 샘플 2건만 옮겨 옴
+    assert len(list(parent.iter_records("missing_time_records"))) == 6
+    parent.clear()
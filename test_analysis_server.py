@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# 로컬 HTTP 분석 서비스 테스트
+import json
+import os
+import threading
+import urllib.error
+import urllib.request
+
+import pandas as pd
+import pytest
+
+from analysis_server import AnalysisService, make_server
+
+OVERTIME_ROW = ["총무과", "주무관", 1001, "홍길동", "N", "N", "2025-03-27", "18:00", "22:00"]
+
+
+@pytest.fixture
+def server_url(tmp_path):
+    service = AnalysisService(max_workers=1, upload_dir=str(tmp_path / "uploads"))
+    server = make_server(service, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+    service.close()
+
+
+def _input_files(tmp_path):
+    security = tmp_path / "security.csv"
+    pd.DataFrame(
+        {
+            "발생일자": ["2025-03-27", "2025-03-27"],
+            "발생시각": ["08:00:00", "19:00:00"],
+            "모드": ["해제", "세트"],
+        }
+    ).to_csv(security, index=False)
+    overtime = tmp_path / "overtime.csv"
+    pd.DataFrame([OVERTIME_ROW + ["", "", 4, 4, "업무"]]).to_csv(overtime, index=False)
+    return str(security), str(overtime)
+
+
+def _post(url, body, content_type="application/json"):
+    if isinstance(body, dict):
+        body = json.dumps(body).encode("utf-8")
+    request = urllib.request.Request(url, data=body, headers={"Content-Type": content_type})
+    with urllib.request.urlopen(request) as response:
+        return response.headers, response.read()
+
+
+def _upload_inputs(server_url, tmp_path):
+    security, overtime = _input_files(tmp_path)
+    paths = {}
+    for name, path in (("security", security), ("overtime", overtime)):
+        with open(path, "rb") as f:
+            _, body = _post(f"{server_url}/upload?name={name}.csv", f.read(), "text/csv")
+        paths[name] = json.loads(body)["path"]
+    return paths
+
+
+def test_repeat_analysis_is_served_from_memory(server_url, tmp_path):
+    params = dict(_upload_inputs(server_url, tmp_path), start="2025-03-01", end="2025-03-31")
+
+    first = json.loads(_post(server_url + "/analyze", params)[1])
+    second = json.loads(_post(server_url + "/analyze", params)[1])
+    assert not first["cached"] and second["cached"]
+    assert first["records"] == second["records"]
+    assert [(r["날짜"], r["직원명"]) for r in first["records"]] == [("2025-03-27", "홍길동")]
+    assert first["summary"]["의심 기록"] == 1
+
+    headers, body = _post(server_url + "/analyze", dict(params, format="xlsx"))
+    assert headers["X-Cache"] == "hit" and body[:2] == b"PK"
+
+
+def test_uploads_can_be_referenced_by_file_name(server_url, tmp_path):
+    paths = _upload_inputs(server_url, tmp_path)
+    params = {name: os.path.basename(path) for name, path in paths.items()}
+    result = json.loads(
+        _post(server_url + "/analyze", dict(params, start="2025-03-01", end="2025-03-31"))[1]
+    )
+    assert len(result["records"]) == 1
+
+
+def test_only_uploaded_files_are_analyzed(server_url, tmp_path):
+    """업로드 폴더 밖의 서버 파일은 열지 않고, 분석 오류의 상세 내용은 돌려주지 않는지 확인합니다"""
+    security, overtime = _input_files(tmp_path)
+    uploaded = _upload_inputs(server_url, tmp_path)
+    for value in (security, "../security.csv", "/etc/passwd"):
+        params = dict(uploaded, security=value, start="2025-03-01", end="2025-03-31")
+        with pytest.raises(urllib.error.HTTPError) as error:
+            _post(server_url + "/analyze", params)
+        assert error.value.code == 400
+        assert "/upload" in json.loads(error.value.read())["error"]
+
+    _, body = _post(f"{server_url}/upload?name=broken.xlsx", b"not a workbook", "text/plain")
+    params = dict(uploaded, security=json.loads(body)["path"], start="2025-03-01", end="2025-03-31")
+    with pytest.raises(urllib.error.HTTPError) as error:
+        _post(server_url + "/analyze", params)
+    assert error.value.code == 400
+    assert json.loads(error.value.read())["error"].startswith("입력 파일을 분석할 수 없습니다")
+
+
+def test_invalid_requests_return_400(server_url, tmp_path):
+    with pytest.raises(urllib.error.HTTPError) as error:
+        _post(server_url + "/analyze", {"security": str(tmp_path / "없음.csv")})
+    assert error.value.code == 400
+    assert "overtime" in json.loads(error.value.read())["error"]
+
+    with pytest.raises(urllib.error.HTTPError) as error:
+        _post(server_url + "/upload?name=memo.txt", b"x", "text/plain")
+    assert error.value.code == 400
+
+
+def test_dedupe_seconds_defaults_to_server_setting(tmp_path):
+    service = AnalysisService(max_workers=1, upload_dir=str(tmp_path), dedupe_seconds=30)
+    try:
+        assert service.dedupe_seconds_for({}) == 30
+        assert service.dedupe_seconds_for({"dedupe_seconds": 120}) == 120
+        assert service.dedupe_seconds_for({"dedupe_seconds": -1}) is None
+        assert service.dedupe_seconds_for({"dedupe_seconds": None}) is None
+        with pytest.raises(ValueError):
+            service.dedupe_seconds_for({"dedupe_seconds": "60"})
+    finally:
+        service.close()
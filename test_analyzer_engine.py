@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+# 분석 엔진(구역별 경비 상태 비교) 테스트
+import functools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+import pandas as pd
+
+import analyzer_engine
+from analysis_diagnostics import AnalysisDiagnostics
+from analyzer_engine import OvertimeAnalysisEngine
+from frame_dtypes import normalize_overtime_frame, normalize_security_frame
+from zone_mapping import ZoneMapping
+
+OVERTIME_COLUMNS = [
+    "부서명",
+    "직급",
+    "개인식별번호",
+    "성명",
+    "현업여부",
+    "휴일여부",
+    "초과근무일자",
+    "출근시간",
+    "퇴근시간",
+    "출근IP",
+    "퇴근IP",
+    "초과근무시간",
+    "수당시간",
+    "근무내용",
+]
+
+
+def _overtime_frame(rows):
+    return pd.DataFrame(
+        [
+            [dept, "주무관", 1000 + i, name, "N", "N", day, start, end, "", "", 3, 3, "업무"]
+            for i, (dept, name, day, start, end) in enumerate(rows)
+        ],
+        columns=OVERTIME_COLUMNS,
+    )
+
+
+def _zone_security_frame():
+    # A동은 19:00 에 경비 설정, B동은 22:30 에 경비 설정
+    return pd.DataFrame(
+        {
+            "발생일자": ["2025-03-27"] * 4,
+            "발생시각": ["08:00:00", "19:00:00", "08:30:00", "22:30:00"],
+            "모드": ["해제", "세트", "해제", "세트"],
+            "구역": ["A동", "A동", "B동", "B동"],
+        }
+    )
+
+
+def _analyze(zone_mapping):
+    engine = OvertimeAnalysisEngine("2025-03-01", "2025-03-31")
+    overtime_df = _overtime_frame(
+        [
+            ("총무과", "홍길동", "2025-03-27", "18:00", "22:00"),
+            ("시설과", "김철수", "2025-03-27", "18:00", "22:00"),
+        ]
+    )
+    return engine.analyze(_zone_security_frame(), overtime_df, zone_mapping)
+
+
+def test_zone_armed_state_is_not_masked_by_other_zone():
+    """다른 구역의 경비 해제가 배정된 구역의 경비 설정을 가리지 않는지 확인합니다"""
+    mapping = ZoneMapping(employee_zones={"홍길동": "A동"}, department_zones={"시설과": "B동"})
+    suspicious = _analyze(mapping)
+
+    # A동 홍길동은 19:00 이후 초과근무가 의심, B동 김철수는 22:30 전에 퇴근했으므로 정상
+    assert [(r["직원명"], r["구역"]) for r in suspicious] == [("홍길동", "A동")]
+    assert "19:00-22:00" in suspicious[0]["의심사유"]
+
+
+def test_unmapped_employees_use_combined_timeline():
+    """구역이 배정되지 않은 직원은 모든 구역을 합친 경비 기록과 비교하는지 확인합니다"""
+    suspicious = _analyze(None)
+    assert {r["구역"] for r in suspicious} == {""}
+
+
+def test_holiday_calendar_without_column_f():
+    """F열이 비어 있어도 공휴일 달력으로 휴일을 판단하고, F열과 다르면 불일치로 기록하는지 확인합니다"""
+    overtime_df = _overtime_frame(
+        [
+            ("총무과", "홍길동", "2025-10-06", "10:00", "12:00"),  # 추석 (F열 비어 있음)
+            ("총무과", "김철수", "2025-10-10", "10:00", "12:00"),  # 평일인데 F열은 휴일
+        ]
+    )
+    overtime_df.loc[0, "휴일여부"] = None
+    overtime_df.loc[1, "휴일여부"] = "Y"
+
+    engine = OvertimeAnalysisEngine("2025-10-01", "2025-10-31")
+    records = engine.process_overtime_log(overtime_df)
+    assert [(r["직원명"], r["휴일여부"]) for r in records] == [("홍길동", True), ("김철수", True)]
+    mismatches = engine.diagnostics.samples("holiday_mismatch_records")
+    assert [r["직원명"] for r in mismatches] == ["김철수"]
+
+    # 달력만 사용하면 F열이 휴일이어도 평일로 보므로 정규 근무시간 근무는 초과근무가 아님
+    engine = OvertimeAnalysisEngine("2025-10-01", "2025-10-31", holiday_source="calendar")
+    records = engine.process_overtime_log(overtime_df)
+    assert [r["직원명"] for r in records] == ["홍길동"]
+
+
+def test_overtime_crossing_midnight_uses_continuous_armed_state():
+    """자정을 넘는 초과근무는 업무일 경계와 관계없이 연속된 경비 설정 구간과 비교하는지 확인합니다"""
+    security_df = pd.DataFrame(
+        {
+            "발생일자": ["2025-03-27", "2025-03-27", "2025-03-28"],
+            "발생시각": ["08:00:00", "23:00:00", "08:00:00"],
+            "모드": ["해제", "세트", "해제"],
+        }
+    )
+    overtime_df = _overtime_frame([("총무과", "홍길동", "2025-03-27", "18:00", "02:00")])
+    engine = OvertimeAnalysisEngine("2025-03-01", "2025-03-31")
+    suspicious = engine.analyze(security_df, overtime_df)
+
+    # 23:00 경비 설정 이후 다음날 02:00 퇴근까지 3시간 전체가 의심 구간
+    assert len(suspicious) == 1
+    assert "총 3.0시간" in suspicious[0]["의심사유"]
+    assert "23:00-02:00" in suspicious[0]["의심사유"]
+    assert suspicious[0]["의심시간"] == 3
+
+
+def test_repeated_runs_on_normalized_frames_are_identical():
+    """불러올 때 정규화한 데이터프레임으로 여러 번 분석해도 입력이 바뀌지 않고 결과가 같은지 확인합니다"""
+    security_df = normalize_security_frame(_zone_security_frame())
+    overtime_df = normalize_overtime_frame(
+        _overtime_frame([("총무과", "홍길동", "2025-03-27", "18:00", "22:00")])
+    )
+    security_before, overtime_before = security_df.copy(), overtime_df.copy()
+    mapping = ZoneMapping(employee_zones={"홍길동": "A동"})
+
+    results = [
+        OvertimeAnalysisEngine("2025-03-01", "2025-03-31").analyze(
+            security_df, overtime_df, mapping
+        )
+        for _ in range(2)
+    ]
+    assert results[0] == results[1] and len(results[0]) == 1
+    pd.testing.assert_frame_equal(security_df, security_before)
+    pd.testing.assert_frame_equal(overtime_df, overtime_before)
+
+
+def test_iter_analyze_yields_same_records_in_batches():
+    """의심 기록을 묶음으로 나누어 받아도 한 번에 분석한 결과와 순서/내용이 같은지 확인합니다"""
+    overtime_df = _overtime_frame(
+        [("총무과", f"직원{i}", "2025-03-27", "18:00", "22:00") for i in range(5)]
+    )
+    expected = OvertimeAnalysisEngine("2025-03-01", "2025-03-31").analyze(
+        _zone_security_frame(), overtime_df
+    )
+    batches = list(
+        OvertimeAnalysisEngine("2025-03-01", "2025-03-31").iter_analyze(
+            _zone_security_frame(), overtime_df, batch_size=2
+        )
+    )
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert [record for batch in batches for record in batch] == expected
+
+
+def test_spilled_zone_diagnostics_survive_spawn_workers(monkeypatch):
+    """spawn 방식 작업 프로세스가 끝나도 구역별 임시 파일을 부모가 합칠 수 있는지 확인합니다 (Windows 기본값)"""
+    monkeypatch.setattr(analyzer_engine, "PARALLEL_MIN_ROWS", 0)
+    monkeypatch.setattr(
+        analyzer_engine,
+        "ProcessPoolExecutor",
+        functools.partial(ProcessPoolExecutor, mp_context=get_context("spawn")),
+    )
+    days = [f"2025-03-{day:02d}" for day in range(1, 11)]
+    # 두 구역 모두 업무일마다 경비 데이터 불명확 기록이 생겨 샘플 한도(2건)를 넘음
+    df = pd.DataFrame(
+        {
+            "발생일자": days * 2,
+            "발생시각": ["09:00:00"] * 20,
+            "모드": ["점검"] * 20,
+            "구역": ["A동"] * 10 + ["B동"] * 10,
+        }
+    )
+    diagnostics = AnalysisDiagnostics(sample_limit=2, spill=True)
+    engine = OvertimeAnalysisEngine(
+        "2025-03-01", "2025-03-31", max_workers=2, diagnostics=diagnostics
+    )
+    try:
+        engine.process_security_log_by_zone(df, {"A동", "B동"})
+        records = list(diagnostics.iter_records("unclear_security_days"))
+        assert diagnostics.counts["unclear_security_days"] == len(records) == 20
+        assert {record["구역"] for record in records} == {"A동", "B동"}
+    finally:
+        spill_dir = diagnostics._spill_dir
+        diagnostics.clear()
+    assert spill_dir is not None and not os.path.exists(spill_dir)
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# 일괄 분석 파이프라인 테스트
+import pandas as pd
+
+from batch_analysis import analyze_in_worker
+from batch_pipeline import BatchPipeline
+from folder_watcher import find_pairs
+from frame_dtypes import normalize_overtime_frame, normalize_security_frame
+
+OVERTIME_ROW = ["총무과", "주무관", 1001, "홍길동", "N", "N", "2025-03-27", "18:00", "22:00"]
+
+
+def _write_pair(directory, name):
+    pd.DataFrame(
+        {
+            "발생일자": ["2025-03-27", "2025-03-27"],
+            "발생시각": ["08:00:00", "19:00:00"],
+            "모드": ["해제", "세트"],
+        }
+    ).to_csv(directory / f"경비기록_{name}.csv", index=False)
+    overtime = pd.DataFrame([OVERTIME_ROW + ["", "", 4, 4, "업무"]])
+    overtime.to_csv(directory / f"초과근무_{name}.csv", index=False)
+
+
+def test_pipeline_processes_all_pairs_with_small_queues(tmp_path):
+    input_dir = tmp_path / "in"
+    input_dir.mkdir()
+    for name in ("본관", "별관", "신관"):
+        _write_pair(input_dir, name)
+    # 읽을 수 없는 파일 쌍이 있어도 나머지 쌍은 계속 처리
+    (input_dir / "경비기록_오류.csv").write_text("잘못된 내용", encoding="utf-8")
+    (input_dir / "초과근무_오류.csv").write_text("x", encoding="utf-8")
+    output_dir = tmp_path / "out"
+    output_dir.mkdir()
+
+    jobs = find_pairs(str(input_dir), str(output_dir))
+    assert sorted(name for name, *_ in jobs) == ["별관", "본관", "신관", "오류"]
+
+    pipeline = BatchPipeline(
+        "2025-03-01", "2025-03-31", readers=2, compute_workers=1, writers=1, queue_size=1
+    )
+    results = pipeline.run(jobs)
+    outputs = {str(output_dir / f"{name}_분석결과.xlsx") for name in ("본관", "별관", "신관")}
+    assert {path: results[path] for path in outputs} == dict.fromkeys(outputs, 1)
+    assert isinstance(results[str(output_dir / "오류_분석결과.xlsx")], Exception)
+    assert sorted(p.name for p in output_dir.iterdir()) == sorted(
+        f"{name}_분석결과.xlsx" for name in ("본관", "별관", "신관")
+    )
+    # 결과가 입력보다 새로우면 다시 분석 대상에 넣지 않음
+    assert [name for name, *_ in find_pairs(str(input_dir), str(output_dir))] == ["오류"]
+
+
+def test_worker_uses_dedupe_setting():
+    """파이프라인/서버가 프로세스 풀에 넘긴 중복 경비 기록 병합 간격으로 분석하는지 확인합니다"""
+    security_df = normalize_security_frame(
+        pd.DataFrame(
+            {
+                "발생일자": ["2025-03-27"] * 3,
+                "발생시각": ["08:00:00", "19:00:00", "19:00:30"],
+                "모드": ["해제", "세트", "세트"],
+            }
+        )
+    )
+    overtime_df = normalize_overtime_frame(pd.DataFrame([OVERTIME_ROW + ["", "", 4, 4, "업무"]]))
+    pipeline = BatchPipeline("2025-03-01", "2025-03-31", dedupe_seconds=None)
+    engine = pipeline.engine
+    assert pipeline._job_engine().dedupe_seconds is None
+
+    set_times = {}
+    for dedupe_seconds in (60, None):
+        records, _ = analyze_in_worker(
+            engine.start_date,
+            engine.end_date,
+            engine.holiday_source,
+            dedupe_seconds,
+            engine.rule_tables,
+            security_df,
+            overtime_df,
+            None,
+            pipeline.memory_budget_mb,
+        )
+        set_times[dedupe_seconds] = records[0]["경비상태"]
+    assert set_times[60].endswith("(경비설정시각: 19:00:00)")
+    assert set_times[None].endswith("(경비설정시각: 19:00:00, 19:00:00)")
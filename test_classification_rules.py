@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# 키워드 분류 규칙 테이블 테스트
+import json
+
+import pandas as pd
+
+from classification_rules import KeywordClassifier, get_rule_tables, load_rule_tables
+
+
+def test_default_rules_match_existing_keywords():
+    """기본 규칙 파일이 기존 모드/휴일 키워드 판단과 같은 결과를 내는지 확인합니다"""
+    rules = get_rule_tables()
+    cases = {
+        "출근": "경비해제",
+        "경비 해제": "경비해제",
+        "퇴근 세팅": "경비시작",
+        "경비세트": "경비시작",
+        "출입문 통과": "출입(불명확)",
+        "퇴근 해제": "경비해제",  # 여러 규칙이 맞으면 먼저 정의된 규칙 우선
+        "알람": "기타",
+    }
+    for value, expected in cases.items():
+        assert rules.security_mode.classify(value) == expected, value
+
+    for value in ["Y", "y", "휴일", "공휴일", "토요일", "일요일"]:
+        assert rules.is_holiday_label(rules.holiday.classify(value)), value
+    for value in ["N", "평일", ""]:
+        assert not rules.is_holiday_label(rules.holiday.classify(value)), value
+
+
+def test_classify_series_broadcasts_unique_values():
+    classifier = KeywordClassifier([{"label": "설정", "keywords": ["ARM"]}], "기타")
+    series = pd.Series(["arm", None, "Disarm", "ARM"], index=[10, 11, 12, 13])
+    labels = classifier.classify_series(series)
+    assert labels.tolist() == ["설정", "기타", "설정", "설정"]
+    assert labels.index.tolist() == [10, 11, 12, 13]
+
+
+def test_vendor_rules_from_config_file(tmp_path):
+    """다른 업체의 모드 표현도 코드 수정 없이 설정 파일로 분류할 수 있는지 확인합니다"""
+    config = {
+        "version": 2,
+        "security_mode": {
+            "default": "기타",
+            "rules": [
+                {"label": "경비해제", "keywords": ["disarm"]},
+                {"label": "경비시작", "keywords": ["arm"]},
+            ],
+        },
+        "holiday": {"default": "평일", "rules": [{"label": "휴일", "keywords": ["holiday"]}]},
+    }
+    file_path = tmp_path / "rules.json"
+    file_path.write_text(json.dumps(config), encoding="utf-8")
+
+    rules = load_rule_tables(str(file_path))
+    assert rules.security_mode.classify("DISARM by card") == "경비해제"
+    assert rules.security_mode.classify("ARM") == "경비시작"
+    assert rules.version.startswith("2-")
+    assert rules.version != get_rule_tables().version
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# 날짜/시각 형식 판별 및 변환 테스트
+from datetime import datetime, time
+
+import pandas as pd
+
+from datetime_formats import (
+    DATE_FORMATS,
+    TIME_FORMATS,
+    combine_date_time,
+    parse_dates,
+    parse_times,
+    sniff_format,
+)
+
+
+def test_sniff_format_picks_fixed_format():
+    assert sniff_format(pd.Series(["2025.03.27", "2025.12.01"]), DATE_FORMATS) == "%Y.%m.%d"
+    assert sniff_format(pd.Series(["20250327", None]), DATE_FORMATS) == "%Y%m%d"
+    assert sniff_format(pd.Series(["08:30", "19:05"]), TIME_FORMATS) == "%H:%M"
+
+
+def test_parse_dates_handles_excel_serials_and_stray_values():
+    serials = parse_dates(pd.Series([45743, 45744.0]))
+    assert list(serials.dt.strftime("%Y-%m-%d")) == ["2025-03-27", "2025-03-28"]
+
+    # 판별된 형식과 다른 값은 값별로 다시 변환하고, 변환할 수 없는 값은 NaT
+    dates = parse_dates(pd.Series(["2025-03-27", "2025-03-28", "2025/03/29", "없음", None]))
+    assert list(dates[:3].dt.day) == [27, 28, 29]
+    assert dates[3:].isna().all()
+
+
+def test_parse_times_accepts_time_cells_datetimes_and_fractions():
+    expected = [pd.Timedelta(hours=8, minutes=30), pd.Timedelta(hours=19, minutes=5, seconds=9)]
+
+    assert list(parse_times(pd.Series([time(8, 30), time(19, 5, 9)]))) == expected
+    assert list(parse_times(pd.Series(["08:30:00", "19:05:09"]))) == expected
+    assert list(parse_times(pd.Series([datetime(2025, 3, 27, 8, 30), None]))) == [
+        expected[0],
+        pd.NaT,
+    ]
+    # 엑셀 시각 (하루에 대한 비율)
+    assert list(parse_times(pd.Series([8.5 / 24]))) == [expected[0]]
+
+
+def test_combine_date_time():
+    dates = parse_dates(pd.Series(["2025-03-27 00:00:00"]))
+    times = parse_times(pd.Series(["21:16:09"]))
+    assert combine_date_time(dates, times)[0] == pd.Timestamp("2025-03-27 21:16:09")
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# 직원별 타임라인 색인 테스트
+from datetime import date, datetime
+
+import pandas as pd
+
+from analyzer_engine import OvertimeAnalysisEngine
+from employee_index import overlap_intervals
+from test_analyzer_engine import _overtime_frame, _zone_security_frame
+from zone_mapping import ZoneMapping
+
+
+def _analyzed_engine():
+    engine = OvertimeAnalysisEngine("2025-03-01", "2025-03-31")
+    overtime_df = _overtime_frame(
+        [
+            ("총무과", "홍길동", "2025-03-27", "18:00", "22:00"),
+            ("시설과", "김철수", "2025-03-27", "18:00", "22:00"),
+            ("총무과", "홍길동", "2025-03-28", "18:00", "02:00"),
+        ]
+    )
+    overtime_df.loc[2, "개인식별번호"] = overtime_df.loc[0, "개인식별번호"]
+    mapping = ZoneMapping(employee_zones={"홍길동": "A동", "김철수": "B동"})
+    engine.analyze(_zone_security_frame(), overtime_df, mapping)
+    return engine, overtime_df, mapping
+
+
+def test_month_days_compare_overtime_with_zone_armed_intervals():
+    index = _analyzed_engine()[0].employee_index
+    hong = index.find_employee("홍길동", "총무과")
+    assert index.months(hong) == [(2025, 3)]
+
+    days = index.month_days(hong, 2025, 3)
+    assert [day["업무일"] for day in days] == [date(2025, 3, 27), date(2025, 3, 28)]
+    # A동은 19:00 에 경비 설정 (다음 해제 기록이 없으므로 이후 계속 설정 상태)
+    assert days[0]["겹침"] == [(datetime(2025, 3, 27, 19), datetime(2025, 3, 27, 22))]
+    assert days[0]["겹침시간"] == 3
+    # 경비 기록이 없는 업무일은 비교 결과와 같이 '경비 기록 없음'
+    assert days[1]["초과근무"][0][:2] == (datetime(2025, 3, 28, 18), datetime(2025, 3, 29, 2))
+    assert days[1]["경비설정"] is None and days[1]["겹침"] == []
+
+    kim = index.find_employee("김철수")
+    assert index.month_days(kim, 2025, 3)[0]["겹침"] == []  # B동은 22:30 에 경비 설정
+    assert index.month_days(kim, 2025, 4) == []
+
+
+def test_build_employee_index_without_comparing_matches_analysis():
+    engine, overtime_df, mapping = _analyzed_engine()
+    rebuilt = OvertimeAnalysisEngine("2025-03-01", "2025-03-31").build_employee_index(
+        overtime_df, zone_mapping=mapping, security_by_zone=engine.security_by_zone
+    )
+    assert rebuilt.segments == engine.employee_index.segments
+    assert rebuilt.armed_by_zone_day == engine.employee_index.armed_by_zone_day
+
+
+def test_build_employee_index_from_streamed_security_file(tmp_path):
+    """캐시된 결과를 스트리밍 모드로 열었을 때 경비 기록 파일을 다시 읽어 같은 색인을 만드는지 확인합니다"""
+    engine, overtime_df, mapping = _analyzed_engine()
+    security_path = tmp_path / "security.csv"
+    _zone_security_frame().to_csv(security_path, index=False)
+    rebuilt = OvertimeAnalysisEngine("2025-03-01", "2025-03-31").build_employee_index(
+        overtime_df, zone_mapping=mapping, security_stream_path=str(security_path)
+    )
+    assert rebuilt.segments == engine.employee_index.segments
+    assert rebuilt.armed_by_zone_day == engine.employee_index.armed_by_zone_day
+
+
+def test_overlap_intervals():
+    t = pd.Timestamp
+    segments = [(t("2025-03-27 18:00"), t("2025-03-27 20:00"))]
+    armed = [
+        (t("2025-03-27 17:00"), t("2025-03-27 18:30")),
+        (t("2025-03-27 19:00"), t("2025-03-27 21:00")),
+    ]
+    assert overlap_intervals(segments, armed) == [
+        (t("2025-03-27 18:00"), t("2025-03-27 18:30")),
+        (t("2025-03-27 19:00"), t("2025-03-27 20:00")),
+    ]
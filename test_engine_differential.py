@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+# 현재 분석 엔진과 기준 커밋의 분석 로직(reference_engine)의 결과가 같은지 확인하는 차이 테스트
+#
+# hypothesis 로 경비/초과근무 기록 표를 만들어 단계별 결과(업무일별 경비 상태, 초과근무 기록, 의심 기록,
+# 확인 필요 데이터)를 비교합니다. 새벽 4시 업무일 경계, '출입' 기록, 시간 누락이 자주 나오도록 값을
+# 고릅니다. 기준 커밋 이후 의도적으로 바뀐 동작은 아래처럼 비교에서 구분합니다.
+# - 구역(구역), 직원 키(직원키), 의심시간 필드가 추가됨 -> 기준 엔진에 있는 필드만 비교
+# - 공휴일 달력으로 휴일 판단 -> 기준과 같은 F열 판단(holiday_source="column")으로 비교
+# - 반복된 경비 상태 병합 -> 병합하지 않는 설정(dedupe_seconds=None)으로 비교
+# - 자정을 넘는 초과근무는 출근일 업무일로 계산하고, 경비 상태는 업무일/자정 경계 없이 하나의
+#   타임라인으로 판단하며 이어진 경비 설정 구간은 합쳐서 표시 -> 비교 단계는 업무일마다 해제로 시작해
+#   설정으로 끝나고 설정/해제가 번갈아 나오는 경비 기록과 자정을 넘지 않는 초과근무로만 비교
+import math
+from datetime import date, timedelta
+
+import pandas as pd
+import pytest
+from hypothesis import HealthCheck, example, given, settings
+from hypothesis import strategies as st
+
+from analysis_diagnostics import DIAGNOSTIC_CATEGORIES
+from analyzer_engine import OvertimeAnalysisEngine
+from reference_engine import ReferenceAnalysisEngine
+from security_log import SecurityStateBuilder
+from test_analyzer_engine import OVERTIME_COLUMNS
+
+# 기준 엔진은 시각 문자열을 형식 지정 없이 파싱하므로 pandas 경고가 남
+pytestmark = pytest.mark.filterwarnings("ignore:Could not infer format")
+
+START_DATE = "2025-03-01"
+END_DATE = "2025-03-06"
+FIRST_DAY = date(2025, 3, 1)
+
+# 업무일 경계(04시) 전후와 정규 근무시간 경계 시각을 자주 고름
+HOURS = st.one_of(st.sampled_from([0, 3, 4, 8, 9, 17, 18, 21, 23]), st.integers(0, 23))
+MINUTES = st.sampled_from([0, 1, 30, 59])
+SECURITY_MODES = st.sampled_from(["세트", "해제", "출입", "출근", "퇴근", "세팅", "점검"])
+RELEASE_MODES = st.sampled_from(["해제", "출근"])
+SET_MODES = st.sampled_from(["세트", "퇴근", "세팅"])
+EMPLOYEES = [("총무과", "홍길동", 1001), ("총무과", "김영희", 1002), ("시설과", "김철수", 1003)]
+
+# 기준 엔진이 만드는 초과근무 기록/의심 기록 필드
+OVERTIME_FIELDS = (
+    "업무일",
+    "날짜",
+    "시작시간",
+    "종료시간",
+    "초과근무유형",
+    "직원명",
+    "부서명",
+    "기록된_초과근무시간",
+    "근무내용",
+    "휴일여부",
+)
+SUSPICIOUS_FIELDS = (
+    "날짜",
+    "직원명",
+    "부서명",
+    "초과근무시간",
+    "경비상태",
+    "의심사유",
+    "근무내용",
+    "휴일여부",
+)
+
+# 기준 엔진에 있는 확인 필요 데이터 분류 (휴일 판단 불일치는 공휴일 달력과 함께 추가됨)
+REFERENCE_CATEGORIES = (
+    "unclear_security_days",
+    "missing_time_records",
+    "error_records",
+    "no_security_records",
+)
+
+SETTINGS = settings(
+    max_examples=40,
+    deadline=None,
+    suppress_health_check=[HealthCheck.too_slow, HealthCheck.data_too_large],
+)
+
+
+def _day(offset):
+    return (FIRST_DAY + timedelta(days=offset)).strftime("%Y-%m-%d")
+
+
+@st.composite
+def security_frames(draw, repeats=False):
+    events = draw(
+        st.lists(
+            st.tuples(st.integers(-1, 6), HOURS, MINUTES, st.integers(0, 59), SECURITY_MODES),
+            max_size=40,
+        )
+    )
+    if repeats and events:
+        # 여러 패널/리더기가 같은 기록을 몇 초~몇 분 뒤에 다시 남긴 경우
+        copies = draw(
+            st.lists(st.tuples(st.integers(0, len(events) - 1), st.integers(0, 150)), max_size=20)
+        )
+        for index, delay in copies:
+            offset, hour, minute, second, mode = events[index]
+            seconds = min(minute * 60 + second + delay, 3599)
+            events.append((offset, hour, seconds // 60, seconds % 60, mode))
+    return pd.DataFrame(
+        {
+            "발생일자": [_day(offset) for offset, *_ in events],
+            "발생시각": [
+                f"{hour:02d}:{minute:02d}:{second:02d}" for _, hour, minute, second, _ in events
+            ],
+            "모드": [mode for *_, mode in events],
+        },
+        columns=["발생일자", "발생시각", "모드"],
+    )
+
+
+@st.composite
+def armed_day_frames(draw):
+    """업무일마다 해제로 시작해 설정으로 끝나고 설정/해제가 번갈아 나오는 경비 기록 (04~24시)"""
+    events = []
+    for offset in draw(st.lists(st.integers(-1, 6), unique=True, max_size=6)):
+        modes = [draw(st.sampled_from(["해제", "출근", "출입"]))]
+        for i in range(2 * draw(st.integers(1, 3)) - 1):
+            if draw(st.booleans()):
+                # 첫 기록이 아닌 '출입'과 분류되지 않는 기록은 경비 상태에 영향 없음
+                modes.append(draw(st.sampled_from(["점검", "출입"])))
+            modes.append(draw(SET_MODES if i % 2 == 0 else RELEASE_MODES))
+        # 같은 분에 두 기록이 있으면 길이 0 인 구간이 생기므로 분 단위로 겹치지 않게 고름
+        times = sorted(
+            draw(
+                st.lists(
+                    st.tuples(st.integers(4, 23), MINUTES),
+                    min_size=len(modes),
+                    max_size=len(modes),
+                    unique=True,
+                )
+            )
+        )
+        for (hour, minute), mode in zip(times, modes):
+            second = draw(st.integers(0, 59))
+            events.append((_day(offset), f"{hour:02d}:{minute:02d}:{second:02d}", mode))
+    return pd.DataFrame(draw(st.permutations(events)), columns=["발생일자", "발생시각", "모드"])
+
+
+def _clock(hour, minute):
+    return f"{hour:02d}:{minute:02d}"
+
+
+@st.composite
+def overtime_frames(draw, crossing=True):
+    rows = draw(
+        st.lists(
+            st.tuples(
+                st.sampled_from(EMPLOYEES),
+                st.integers(-1, 6),
+                st.one_of(st.none(), st.tuples(HOURS, MINUTES)),
+                st.one_of(st.none(), st.tuples(HOURS, MINUTES)),
+                st.sampled_from(["N", "Y", "", "토요일"]),
+            ),
+            max_size=25,
+        )
+    )
+    if not crossing:
+        # 자정을 넘지 않도록 출근/퇴근 시각 순서를 맞춤
+        rows = [
+            (
+                (employee, offset, *sorted((start, end)), holiday)
+                if start is not None and end is not None
+                else (employee, offset, start, end, holiday)
+            )
+            for employee, offset, start, end, holiday in rows
+        ]
+    return pd.DataFrame(
+        [
+            [
+                dept,
+                "주무관",
+                employee_id,
+                name,
+                "N",
+                holiday,
+                _day(offset),
+                None if start is None else _clock(*start),
+                None if end is None else _clock(*end),
+                "",
+                "",
+                3,
+                3,
+                "업무",
+            ]
+            for (dept, name, employee_id), offset, start, end, holiday in rows
+        ],
+        columns=OVERTIME_COLUMNS,
+    )
+
+
+def _engines():
+    return (
+        OvertimeAnalysisEngine(
+            START_DATE, END_DATE, max_workers=1, holiday_source="column", dedupe_seconds=None
+        ),
+        ReferenceAnalysisEngine(START_DATE, END_DATE),
+    )
+
+
+def _fields(records, fields):
+    return [{field: record[field] for field in fields} for record in records]
+
+
+def _reference_diagnostics(reference):
+    return {category: getattr(reference, category) for category in REFERENCE_CATEGORIES}
+
+
+def _diagnostic_records(diagnostics, categories=REFERENCE_CATEGORIES):
+    return {category: list(diagnostics.iter_records(category)) for category in categories}
+
+
+@SETTINGS
+@given(security_frames())
+def test_security_state_matches_reference(security_df):
+    engine, reference = _engines()
+    assert engine.process_security_log(security_df) == reference.process_security_log(
+        security_df.copy()
+    )
+    assert _diagnostic_records(engine.diagnostics) == _reference_diagnostics(reference)
+
+
+@SETTINGS
+@given(security_frames())
+def test_streaming_security_state_matches_reference(security_df):
+    reference = ReferenceAnalysisEngine(START_DATE, END_DATE)
+    builder = SecurityStateBuilder(START_DATE, END_DATE, dedupe_seconds=None)
+    builder.add_chunk(security_df)
+    security_status_by_day, unclear_security_days = builder.finalize()
+    assert security_status_by_day == reference.process_security_log(security_df.copy())
+    assert unclear_security_days == reference.unclear_security_days
+
+
+@SETTINGS
+@given(overtime_frames(crossing=False))
+def test_overtime_records_match_reference(overtime_df):
+    engine, reference = _engines()
+    assert _fields(engine.process_overtime_log(overtime_df), OVERTIME_FIELDS) == (
+        reference.process_overtime_log(overtime_df.copy())
+    )
+    assert _diagnostic_records(engine.diagnostics) == _reference_diagnostics(reference)
+
+
+@SETTINGS
+@given(armed_day_frames(), overtime_frames(crossing=False))
+def test_suspicious_records_match_reference(security_df, overtime_df):
+    engine, reference = _engines()
+    security_status_by_day = reference.process_security_log(security_df.copy())
+    overtime_records = reference.process_overtime_log(overtime_df.copy())
+
+    suspicious_records = engine.compare_security_and_overtime(
+        security_status_by_day, overtime_records
+    )
+    assert _fields(suspicious_records, SUSPICIOUS_FIELDS) == (
+        reference.compare_security_and_overtime(security_status_by_day, overtime_records)
+    )
+    assert list(engine.diagnostics.iter_records("no_security_records")) == (
+        reference.no_security_records
+    )
+
+
+def _security_frame(events):
+    return pd.DataFrame(events, columns=["발생일자", "발생시각", "모드"])
+
+
+def _overtime_frame(rows):
+    dept, name, employee_id = EMPLOYEES[0]
+    return pd.DataFrame(
+        [
+            [dept, "주무관", employee_id, name, "N", holiday, day, start, end, "", "", 3, 3, "업무"]
+            for day, start, end, holiday in rows
+        ],
+        columns=OVERTIME_COLUMNS,
+    )
+
+
+@SETTINGS
+@given(armed_day_frames(), overtime_frames(crossing=False))
+# 경비 설정 1분 뒤 퇴근 (1분 겹침)
+@example(
+    _security_frame([("2025-03-03", "08:00:00", "해제"), ("2025-03-03", "18:59:00", "세트")]),
+    _overtime_frame([("2025-03-03", "18:00", "19:00", "N")]),
+)
+# 04시 정각의 첫 '출입' 기록과 새벽 초과근무(전날 업무일), 경비 기록이 없는 업무일
+@example(
+    _security_frame(
+        [
+            ("2025-03-03", "04:00:00", "출입"),
+            ("2025-03-03", "12:00:00", "출입"),
+            ("2025-03-03", "23:30:00", "퇴근"),
+        ]
+    ),
+    _overtime_frame([("2025-03-04", "00:30", "03:59", "Y"), ("2025-03-05", "19:00", "21:00", "N")]),
+)
+def test_full_analysis_matches_reference(security_df, overtime_df):
+    engine, reference = _engines()
+    suspicious_records = engine.analyze(security_df, overtime_df)
+    assert _fields(suspicious_records, SUSPICIOUS_FIELDS) == reference.analyze(
+        security_df, overtime_df
+    )
+    assert _diagnostic_records(engine.diagnostics) == _reference_diagnostics(reference)
+
+
+def _is_subsequence(items, sequence):
+    remaining = iter(sequence)
+    return all(item in remaining for item in items)
+
+
+@SETTINGS
+@given(
+    security_frames(repeats=True),
+    overtime_frames(),
+    st.sampled_from([0, 60, 600, math.inf]),
+)
+def test_dedupe_keeps_suspicious_intervals(security_df, overtime_df, dedupe_seconds):
+    """반복된 경비 상태를 합쳐도 의심 구간/시간과 확인 필요 데이터는 합치지 않을 때와 같은지 확인합니다"""
+
+    def engine(dedupe_seconds):
+        return OvertimeAnalysisEngine(
+            START_DATE, END_DATE, max_workers=1, dedupe_seconds=dedupe_seconds
+        )
+
+    # 합친 결과는 기준 엔진의 업무일별 경비 상태에서 일부 전환만 뺀 것
+    reference = ReferenceAnalysisEngine(START_DATE, END_DATE)
+    expected_states = reference.process_security_log(security_df.copy())
+    security_status_by_day = engine(dedupe_seconds).process_security_log(security_df)
+    assert security_status_by_day.keys() == expected_states.keys()
+    for business_day, changes in security_status_by_day.items():
+        assert _is_subsequence(changes, expected_states[business_day])
+
+    builder = SecurityStateBuilder(START_DATE, END_DATE, dedupe_seconds=dedupe_seconds)
+    builder.add_chunk(security_df)
+    assert builder.finalize()[0] == security_status_by_day
+
+    # 경비설정시각 목록(경비상태)의 중복만 사라지고 나머지 필드는 같음
+    def without_set_times(records):
+        return [dict(record, 경비상태=record["경비상태"].split(" (")[0]) for record in records]
+
+    deduped, undeduped = engine(dedupe_seconds), engine(None)
+    assert without_set_times(deduped.analyze(security_df, overtime_df)) == without_set_times(
+        undeduped.analyze(security_df, overtime_df)
+    )
+    assert _diagnostic_records(deduped.diagnostics, DIAGNOSTIC_CATEGORIES) == (
+        _diagnostic_records(undeduped.diagnostics, DIAGNOSTIC_CATEGORIES)
+    )
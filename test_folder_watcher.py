@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# 폴더 감시 모드 테스트
+import os
+
+import pandas as pd
+
+from folder_watcher import FolderWatcher, classify_file
+
+OVERTIME_ROW = ["총무과", "주무관", 1001, "홍길동", "N", "N", "2025-03-27", "18:00", "22:00"]
+
+
+def _write_pair(directory, suffix="2025-03"):
+    security = directory / f"경비기록_{suffix}.csv"
+    pd.DataFrame(
+        {
+            "발생일자": ["2025-03-27", "2025-03-27"],
+            "발생시각": ["08:00:00", "19:00:00"],
+            "모드": ["해제", "세트"],
+        }
+    ).to_csv(security, index=False)
+    overtime = directory / f"초과근무_{suffix}.csv"
+    pd.DataFrame([OVERTIME_ROW + ["", "", 4, 4, "업무"]]).to_csv(overtime, index=False)
+    return str(security), str(overtime)
+
+
+def test_classify_file_pairs_by_name_without_keyword():
+    assert classify_file("경비기록_2025-03.xlsx") == ("security", "2025-03")
+    assert classify_file("2025-03 초과근무.csv") == ("overtime", "2025-03")
+    assert classify_file("Security-본관.parquet") == ("security", "본관")
+    assert classify_file("~$경비기록_2025-03.xlsx") is None  # 엑셀 잠금 파일
+    assert classify_file("경비기록_2025-03.txt") is None
+    assert classify_file("경비_초과근무.xlsx") is None  # 종류를 알 수 없음
+
+
+def test_scan_waits_until_files_settle(tmp_path):
+    _write_pair(tmp_path)
+    watcher = FolderWatcher(str(tmp_path), str(tmp_path / "out"), settle_seconds=10)
+
+    assert watcher.scan(now=100) == ([], 2)
+    assert watcher.scan(now=105) == ([], 2)
+    pairs, unsettled = watcher.scan(now=110)
+    assert unsettled == 0 and [key for key, *_ in pairs] == ["2025-03"]
+    # 이미 분석을 시작한 쌍은 파일이 바뀌기 전까지 다시 반환하지 않음
+    assert watcher.scan(now=120) == ([], 0)
+
+
+def test_run_once_writes_result_and_skips_finished_pairs(tmp_path):
+    input_dir = tmp_path / "in"
+    input_dir.mkdir()
+    _write_pair(input_dir)
+    output_dir = tmp_path / "out"
+    options = dict(max_workers=1, use_cache=False, poll_seconds=0.05, settle_seconds=0)
+
+    results = FolderWatcher(str(input_dir), str(output_dir), **options).run(once=True)
+    output_path = str(output_dir / "2025-03_분석결과.xlsx")
+    assert results == {output_path: 1}
+    assert os.listdir(output_dir) == ["2025-03_분석결과.xlsx"]
+    records = pd.read_excel(output_path, sheet_name=None)
+    assert any("홍길동" in frame.to_string() for frame in records.values())
+
+    # 결과 파일이 입력보다 새로우면 다시 시작해도 분석하지 않음
+    assert FolderWatcher(str(input_dir), str(output_dir), **options).run(once=True) == {}
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# 범주형 컬럼 변환 및 정수 직원 키 테스트
+import pandas as pd
+
+from classification_rules import KeywordClassifier
+from frame_dtypes import (
+    OVERTIME_COLUMNS,
+    categorize_overtime_frame,
+    employee_keys,
+    normalize_overtime_frame,
+    normalize_security_frame,
+    to_category,
+)
+
+
+def test_employee_keys_share_key_for_same_id_and_fall_back_to_name():
+    ids = pd.Series([1001, "1001", None, None, "1002", None])
+    names = pd.Series(["홍길동", "홍길동", "김철수", "김철수", "홍길동", None])
+    # 엑셀에서 숫자로 읽힌 1001.0 도 같은 직원
+    ids[1] = 1001.0
+
+    keys, identities = employee_keys(ids, names)
+    assert keys.dtype == "int64"
+    assert keys[0] == keys[1]
+    assert keys[2] == keys[3] != keys[0]
+    # 같은 이름이라도 개인식별번호가 다르면 다른 직원
+    assert keys[4] not in (keys[0], keys[2])
+    assert keys[5] == -1
+    assert identities[keys[2]] == "이름:김철수"
+
+
+def test_to_category_skips_mostly_unique_columns():
+    assert to_category(pd.Series(["A동", "A동", "B동", "A동"])).dtype == "category"
+    assert to_category(pd.Series(["a", "b", "c", "d"])).dtype != "category"
+    assert to_category(pd.Series([1, 1, 1])).dtype == "int64"
+
+
+def test_normalize_security_frame_sorts_and_assigns_business_days():
+    security = pd.DataFrame(
+        {
+            "발생일자": ["2025-03-28", "2025-03-27", "2025-03-28", "없음"],
+            "발생시각": ["02:10", "19:00", "08:30", "08:00"],
+            "모드": ["세트", "세트", "해제", "해제"],
+            "구역": [" A동", "A동", "B동", "A동"],
+        }
+    )
+    original = security.copy()
+    normalized = normalize_security_frame(security)
+
+    # 날짜를 읽을 수 없는 행은 제외하고 발생일시 순으로 정렬
+    assert normalized["발생일시"].dt.strftime("%m-%d %H:%M").tolist() == [
+        "03-27 19:00",
+        "03-28 02:10",
+        "03-28 08:30",
+    ]
+    # 새벽 4시 이전 기록은 전날 업무일
+    assert normalized["업무일"].dt.day.tolist() == [27, 27, 28]
+    assert normalized["모드"].dtype == "category" and normalized["구역"].dtype == "category"
+    assert normalized["구역"].tolist() == ["A동", "A동", "B동"]
+    # 원본은 그대로이고, 정규화된 데이터프레임은 다시 정규화하지 않음
+    pd.testing.assert_frame_equal(security, original)
+    assert normalize_security_frame(normalized) is normalized
+
+
+def test_normalize_overtime_frame_renames_columns_by_position():
+    overtime = pd.DataFrame(
+        [["부서1", "주무관", 1, "홍길동", "N", "N", "2025-03-27"] + [""] * 8] * 3
+    )
+    overtime.columns = [f"열{i}" for i in range(15)]
+    normalized = normalize_overtime_frame(overtime)
+
+    assert tuple(normalized.columns[:14]) == OVERTIME_COLUMNS
+    assert normalized.columns[14] == "컬럼14"
+    assert normalized["날짜_datetime"].dt.day.tolist() == [27, 27, 27]
+    assert normalized["성명"].dtype == "category"
+    assert list(overtime.columns) == [f"열{i}" for i in range(15)]
+    assert normalize_overtime_frame(normalized) is normalized
+
+
+def test_categorize_overtime_frame_keeps_columns():
+    overtime = pd.DataFrame([["부서1", "주무관", 1, "홍길동", "N", "N", "x"]] * 3)
+    overtime.columns = ["부서", "직급", "번호", "성명", "현업", "휴일", "비고"]
+    converted = categorize_overtime_frame(overtime)
+    assert list(converted.columns) == list(overtime.columns)
+    assert [str(dtype) for dtype in converted.dtypes][:6] == [
+        "category",
+        "category",
+        "int64",
+        "category",
+        "category",
+        "category",
+    ]
+    assert overtime["부서"].dtype != "category"
+
+
+def test_classify_series_returns_categorical_labels():
+    classifier = KeywordClassifier([{"label": "설정", "keywords": ["ARM"]}], "기타")
+    labels = classifier.classify_series(pd.Series(["arm", None, "Disarm"] * 100))
+    # 데이터에 없는 라벨도 범주에 포함
+    assert list(classifier.classify_series(pd.Series([None])).cat.categories) == ["설정", "기타"]
+    assert labels.dtype == "category"
+    assert list(labels.cat.categories) == ["설정", "기타"]
+    assert (labels == "설정").sum() == 200
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# 입력 파일 미리 보기 테스트 (컬럼 매핑, 분류 결과, 확인 필요 안내)
+import pandas as pd
+import pytest
+
+from frame_dtypes import OVERTIME_COLUMNS
+from input_preview import column_letter, preview_overtime, preview_security
+
+
+def _write_csv(tmp_path, name, df):
+    file_path = tmp_path / name
+    df.to_csv(file_path, index=False, encoding="utf-8-sig")
+    return str(file_path)
+
+
+def test_column_letter():
+    assert [column_letter(i) for i in (0, 8, 25, 26, 27)] == ["A", "I", "Z", "AA", "AB"]
+
+
+def test_security_preview_reads_only_head(tmp_path):
+    df = pd.DataFrame(
+        {
+            "발생일자": ["2025-03-03"] * 3 + ["2025-03-04"] * 497,
+            "발생시각": ["08:00:00", "20:00:00", "02:30:00"] + ["09:00:00"] * 497,
+            "모드": ["출근 해제", "퇴근 세팅", "출입"] + ["해제"] * 497,
+            "건물": "본관",
+        }
+    )
+    preview = preview_security(_write_csv(tmp_path, "security.csv", df), nrows=3)
+
+    assert len(preview.sample) == 3
+    assert [method for _, _, method in preview.mapping] == ["이름으로 찾음"] * 4
+    assert ("구역", "D열 '건물'", "이름으로 찾음") in preview.mapping
+    assert list(preview.sample["기록유형"]) == ["경비해제", "경비시작", "출입(불명확)"]
+    # 새벽 2시 30분 기록은 전날 업무일
+    assert list(preview.sample["업무일"]) == ["2025-03-03", "2025-03-03", "2025-03-02"]
+    assert preview.counts == {"경비해제": 1, "경비시작": 1, "출입(불명확)": 1}
+    assert preview.warnings == []
+
+
+def test_security_preview_warns_on_positional_fallback(tmp_path):
+    # 모드 컬럼 이름이 키워드와 달라 I열(기본 위치)이 선택되는 경우
+    df = pd.DataFrame({f"c{i}": ["x"] for i in range(9)})
+    df["c0"], df["c1"] = "2025-03-03", "08:00"
+    preview = preview_security(_write_csv(tmp_path, "security.csv", df))
+
+    assert ("모드", "I열 'c8'", "기본 위치") in preview.mapping
+    assert any("'발생일자' 컬럼을 이름으로 찾지 못해" in w for w in preview.warnings)
+    assert any("경비해제/경비시작" in w for w in preview.warnings)
+
+
+def test_overtime_preview_maps_positions(tmp_path):
+    row = ["총무과", "주무관", 1001, "홍길동", "N", "Y", "2025-03-08", "09:00", "18시", "", ""]
+    row += [9, 4, "업무"]
+    df = pd.DataFrame([row, row], columns=list(OVERTIME_COLUMNS))
+    preview = preview_overtime(_write_csv(tmp_path, "overtime.csv", df))
+
+    assert preview.mapping[6] == ("초과근무일자", "G열 '초과근무일자'", "열 위치")
+    assert list(preview.sample["휴일분류"]) == ["휴일", "휴일"]
+    assert list(preview.sample["확인"]) == ["출퇴근시간 형식 오류"] * 2
+    assert preview.warnings == ["출근/퇴근시간이 HH:mm 형식이 아닌 행 2개"]
+
+
+def test_overtime_preview_warns_on_unexpected_headers(tmp_path):
+    columns = list(OVERTIME_COLUMNS)
+    columns[6], columns[7] = columns[7], columns[6]
+    df = pd.DataFrame([["값"] * len(columns)], columns=columns)
+    preview = preview_overtime(_write_csv(tmp_path, "overtime.csv", df))
+
+    assert any(w.startswith("G열 '출근시간'을 초과근무일자") for w in preview.warnings)
+    assert any(w.startswith("H열 '초과근무일자'을 출근시간") for w in preview.warnings)
+
+
+def test_overtime_preview_requires_columns(tmp_path):
+    df = pd.DataFrame({"성명": ["홍길동"], "일자": ["2025-03-03"]})
+    with pytest.raises(ValueError):
+        preview_overtime(_write_csv(tmp_path, "overtime.csv", df))
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+# 입력 파일(CSV/Parquet) 로드 로직 테스트
+import pandas as pd
+import pytest
+
+from input_readers import detect_csv_encoding, read_input_file, read_input_head
+
+
+@pytest.mark.parametrize("encoding", ["cp949", "utf-8-sig", "utf-8"])
+def test_csv_encoding_detection(tmp_path, encoding):
+    """한국어 CSV 내보내기에서 흔한 인코딩을 판별하고 같은 내용으로 읽는지 확인합니다"""
+    file_path = tmp_path / "overtime.csv"
+    file_path.write_text("부서명,성명\n총무과,홍길동\n", encoding=encoding)
+
+    detected = detect_csv_encoding(str(file_path))
+    assert detected == ("cp949" if encoding == "cp949" else "utf-8-sig")
+
+    df = read_input_file(str(file_path))
+    assert list(df.columns) == ["부서명", "성명"]
+    assert df.iloc[0]["성명"] == "홍길동"
+
+
+def test_parquet_keeps_column_positions(tmp_path):
+    """Parquet 입력도 열 순서가 유지되어 위치 기반 매핑을 그대로 쓸 수 있는지 확인합니다"""
+    pytest.importorskip("pyarrow")
+    df = pd.DataFrame({"A": ["총무과"], "B": ["주무관"], "C": [1001], "D": ["홍길동"]})
+    file_path = tmp_path / "overtime.parquet"
+    df.to_parquet(file_path)
+
+    loaded = read_input_file(str(file_path))
+    assert list(loaded.columns) == ["A", "B", "C", "D"]
+
+
+def test_unsupported_extension(tmp_path):
+    with pytest.raises(ValueError):
+        read_input_file(str(tmp_path / "overtime.txt"))
+
+
+def test_read_input_head(tmp_path):
+    file_path = tmp_path / "security.csv"
+    pd.DataFrame({"발생일자": range(100)}).to_csv(file_path, index=False)
+    head = read_input_head(str(file_path), 5)
+    assert list(head["발생일자"]) == [0, 1, 2, 3, 4]
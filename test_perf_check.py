@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# 성능 회귀 검사 비교 로직 테스트 (실제 측정은 python cli.py perf-check 로 실행)
+import pandas as pd
+
+import perf_check
+from perf_check import (
+    BASELINE_FORMAT_VERSION,
+    compare_to_baseline,
+    load_baseline,
+    synthetic_overtime_frame,
+    synthetic_security_frame,
+)
+
+
+def _result(overtime, security, compare, memory, suspicious=10):
+    return {
+        "stages": {"초과근무 기록": overtime, "경비 기록": security, "비교": compare},
+        "peak_memory_mb": memory,
+        "suspicious_records": suspicious,
+    }
+
+
+# 기준값과 같은 속도/메모리 특성의 컴퓨터
+SAME_MACHINE = (0.5, 50.0)
+
+BASELINE = {
+    "format": BASELINE_FORMAT_VERSION,
+    "machine": "test",
+    "calibration_seconds": 0.5,
+    "calibration_memory_mb": 50.0,
+    "tolerances": {"time": 0.3, "memory": 0.2},
+    "datasets": {"small": _result(1.0, 10.0, 2.0, 100.0)},
+}
+
+
+def test_synthetic_frames_are_deterministic():
+    first = synthetic_security_frame(500, zones=3)
+    pd.testing.assert_frame_equal(first, synthetic_security_frame(500, zones=3))
+    assert list(first.columns) == ["발생일자", "발생시각", "모드", "구역"]
+    assert first["발생시각"].str.match(r"^\d{2}:\d{2}:\d{2}$").all()
+    assert len(synthetic_overtime_frame(50).columns) == 14
+
+
+def test_within_tolerance_passes():
+    results = {"small": _result(1.2, 12.5, 2.4, 115.0)}
+    assert compare_to_baseline(results, BASELINE, calibration=SAME_MACHINE) == []
+
+
+def test_slower_stage_and_memory_fail():
+    results = {"small": _result(1.0, 14.0, 2.0, 130.0)}
+    regressions = compare_to_baseline(results, BASELINE, calibration=SAME_MACHINE)
+    assert len(regressions) == 2
+    assert regressions[0].startswith("small 경비 기록")
+    assert regressions[1].startswith("small 최대 메모리")
+
+
+def test_baseline_time_scales_with_calibration():
+    # 보정 작업이 두 배 느린 컴퓨터면 기준 시간도 두 배
+    results = {"small": _result(2.0, 20.0, 4.0, 100.0)}
+    assert compare_to_baseline(results, BASELINE, calibration=(1.0, 50.0)) == []
+    assert compare_to_baseline(results, BASELINE, calibration=SAME_MACHINE) != []
+
+
+def test_baseline_memory_scales_with_calibration():
+    # 운영체제마다 메모리 측정 기준이 달라 보정 작업도 1.5배로 측정되면 기준 메모리도 1.5배
+    results = {"small": _result(1.0, 10.0, 2.0, 150.0)}
+    assert compare_to_baseline(results, BASELINE, calibration=(0.5, 75.0)) == []
+    assert compare_to_baseline(results, BASELINE, calibration=SAME_MACHINE) != []
+
+
+def test_tolerance_override():
+    results = {"small": _result(1.0, 12.5, 2.0, 100.0)}
+    assert compare_to_baseline(results, BASELINE, SAME_MACHINE, time_tolerance=0.1) != []
+
+
+def test_update_baseline_then_check(tmp_path, monkeypatch):
+    path = str(tmp_path / "baseline.json")
+    measured = {"small": _result(1.0, 10.0, 2.0, 100.0)}
+    monkeypatch.setattr(perf_check, "calibration_seconds", lambda: 0.5)
+    monkeypatch.setattr(perf_check, "calibration_memory_mb", lambda: 50.0)
+    monkeypatch.setattr(perf_check, "run_measurements", lambda datasets: dict(measured))
+
+    assert perf_check.perf_check(["small"], path, update_baseline=True) == 0
+    assert load_baseline(path)["datasets"]["small"] == measured["small"]
+    assert perf_check.perf_check(["small"], path) == 0
+
+    measured["small"] = _result(3.0, 10.0, 2.0, 100.0)
+    assert perf_check.perf_check(["small"], path) == 1
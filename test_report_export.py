@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# 분석 자료 내보내기 테스트
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from analysis_diagnostics import DIAGNOSTIC_CATEGORIES, AnalysisDiagnostics
+from report_export import export_analysis_artifacts, export_analysis_workbook
+
+SUSPICIOUS = [
+    {
+        "날짜": date(2025, 3, 4),
+        "직원명": "홍길동",
+        "부서명": "총무과",
+        "초과근무시간": "18:00-21:00",
+        "경비상태": "경비 설정됨",
+        "의심사유": "경비 설정 후 초과근무",
+        "근무내용": "문서 정리",
+        "휴일여부": "평일",
+    }
+]
+
+
+def _diagnostics():
+    diagnostics = AnalysisDiagnostics(sample_limit=2, spill=True)
+    diagnostics.extend(
+        "no_security_records",
+        [{"직원명": f"직원{i}", "업무일": date(2025, 3, i + 1)} for i in range(5)],
+    )
+    diagnostics.add("error_records", {"행": 3, "오류": "시간 형식 오류"})
+    return diagnostics
+
+
+def test_workbook_has_summary_and_full_diagnostic_sheets(tmp_path):
+    """확인 필요 데이터는 샘플 한도와 관계없이 전체 기록이 시트로 저장되는지 확인합니다"""
+    diagnostics = _diagnostics()
+    path = tmp_path / "report.xlsx"
+    export_analysis_workbook(path, SUSPICIOUS, diagnostics, [("의심 기록", 1)])
+
+    sheets = pd.read_excel(path, sheet_name=None)
+    assert list(sheets)[:4] == ["요약", "의심 기록", "부서별 요약", "직원별 요약"]
+    assert len(sheets) == 4 + len(DIAGNOSTIC_CATEGORIES)
+    assert sheets["의심 기록"].loc[0, "날짜"] == "2025-03-04"
+    assert len(sheets["경비 기록 없는 초과근무"]) == 5
+    assert sheets["직원별 요약"].loc[0, ["직원명", "월", "의심 기록"]].tolist() == [
+        "홍길동",
+        "2025-03",
+        1,
+    ]
+    # 시트 이름에 쓸 수 없는 '/' 는 바꿔서 저장
+    assert "출·퇴근 시간 누락" in sheets
+    diagnostics.clear()
+
+
+@pytest.mark.parametrize("file_format", ["csv", "parquet"])
+def test_artifacts_are_written_per_category(tmp_path, file_format):
+    diagnostics = _diagnostics()
+    paths = export_analysis_artifacts(tmp_path, SUSPICIOUS, diagnostics, file_format)
+
+    assert len(paths) == 1 + len(DIAGNOSTIC_CATEGORIES)
+    no_security_path = tmp_path / f"no_security_records.{file_format}"
+    if file_format == "csv":
+        df = pd.read_csv(no_security_path, encoding="utf-8-sig")
+    else:
+        df = pd.read_parquet(no_security_path)
+    assert list(df["직원명"]) == [f"직원{i}" for i in range(5)]
+    diagnostics.clear()
+
+
+def test_unknown_artifact_format_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        export_analysis_artifacts(tmp_path, SUSPICIOUS, AnalysisDiagnostics(), "json")
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# 분석 결과 캐시 테스트
+import os
+from datetime import date
+
+import result_cache
+from analysis_diagnostics import AnalysisDiagnostics
+from analyzer_engine import OvertimeAnalysisEngine
+from result_cache import ResultCache, analysis_cache_key
+
+SUSPICIOUS = [{"날짜": date(2025, 3, 4), "직원명": "홍길동", "의심사유": "경비 설정 후 초과근무"}]
+
+
+def _write(path, content):
+    path.write_bytes(content)
+    return str(path)
+
+
+def test_cache_key_depends_on_content_and_dates(tmp_path):
+    security = _write(tmp_path / "security.csv", b"a,b\n1,2\n")
+    overtime = _write(tmp_path / "overtime.csv", b"c,d\n3,4\n")
+    march = OvertimeAnalysisEngine("2025-03-01", "2025-03-31")
+    april = OvertimeAnalysisEngine("2025-04-01", "2025-04-30")
+
+    key = analysis_cache_key(march, security, overtime)
+    assert key == analysis_cache_key(march, security, overtime)
+    assert key != analysis_cache_key(april, security, overtime)
+
+    _write(tmp_path / "overtime.csv", b"c,d\n3,5\n")
+    os.utime(overtime, ns=(0, 0))  # 크기와 수정 시각이 달라도 내용 해시로 판단
+    assert key != analysis_cache_key(march, security, overtime)
+
+
+def test_cache_key_depends_on_analysis_logic_version(tmp_path, monkeypatch):
+    """분석 로직 버전을 올리면 이전 로직으로 저장된 결과를 사용하지 않는지 확인합니다"""
+    security = _write(tmp_path / "security.csv", b"a,b\n1,2\n")
+    overtime = _write(tmp_path / "overtime.csv", b"c,d\n3,4\n")
+    engine = OvertimeAnalysisEngine("2025-03-01", "2025-03-31")
+
+    key = analysis_cache_key(engine, security, overtime)
+    monkeypatch.setattr(
+        result_cache, "ANALYSIS_LOGIC_VERSION", result_cache.ANALYSIS_LOGIC_VERSION + 1
+    )
+    assert key != analysis_cache_key(engine, security, overtime)
+
+
+def test_hit_restores_records_and_full_diagnostic_counts(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    diagnostics = AnalysisDiagnostics(sample_limit=2)
+    diagnostics.extend("no_security_records", [{"직원명": f"직원{i}"} for i in range(5)])
+    cache.put("key", SUSPICIOUS, diagnostics)
+
+    restored = AnalysisDiagnostics(sample_limit=2)
+    records = cache.get("key", restored)
+
+    assert records == SUSPICIOUS
+    assert restored.count("no_security_records") == 5
+    assert len(restored.samples("no_security_records")) == 2
+    assert cache.get("missing", AnalysisDiagnostics()) is None
+
+
+def test_hit_restores_spilled_diagnostics(tmp_path):
+    """임시 파일에 저장된 전체 확인 필요 데이터가 날짜 타입 그대로 복원되는지 확인합니다"""
+    cache = ResultCache(str(tmp_path))
+    diagnostics = AnalysisDiagnostics(sample_limit=1, spill=True)
+    records = [{"업무일": date(2025, 3, i)} for i in range(1, 4)]
+    diagnostics.extend("no_security_records", records)
+    cache.put("key", SUSPICIOUS, diagnostics)
+    diagnostics.clear()
+
+    restored = AnalysisDiagnostics(sample_limit=1, spill=True)
+    assert cache.get("key", restored) == SUSPICIOUS
+    assert list(restored.iter_records("no_security_records")) == records
+    restored.clear()
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    diagnostics = AnalysisDiagnostics()
+    for i, key in enumerate(["old", "used", "new"]):
+        cache.put(key, SUSPICIOUS * 200, diagnostics)
+        os.utime(cache._path(key), ns=(i * 10**9, i * 10**9))
+    cache.get("used", AnalysisDiagnostics())  # 사용하면 가장 최근 항목이 됨
+
+    entry_size = os.path.getsize(cache._path("new"))
+    cache.max_bytes = entry_size * 2
+    cache.evict()
+
+    assert cache.get("old", AnalysisDiagnostics()) is None
+    assert cache.get("used", AnalysisDiagnostics()) is not None
+    assert cache.get("new", AnalysisDiagnostics()) is not None
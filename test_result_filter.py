@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# 의심 기록 필터 색인 테스트
+from datetime import date
+
+from result_filter import ResultIndex, suspicious_hours
+
+RECORDS = [
+    {
+        "날짜": date(2025, 3, 3),
+        "직원명": "홍길동",
+        "부서명": "총무과",
+        "의심시간": 3.0,
+        "휴일여부": "평일",
+    },
+    {
+        "날짜": date(2025, 3, 8),
+        "직원명": "김철수",
+        "부서명": "시설과",
+        "의심시간": 0.5,
+        "휴일여부": "휴일",
+    },
+    {
+        "날짜": date(2025, 3, 1),
+        "직원명": "홍길순",
+        "부서명": "총무과",
+        "의심시간": 1.0,
+        "휴일여부": "휴일",
+    },
+    {"날짜": None, "직원명": "Lee", "부서명": "", "의심시간": 0.0, "휴일여부": "평일"},
+]
+
+
+def test_filters_combine_and_keep_original_order():
+    index = ResultIndex(RECORDS)
+    assert index.filter().tolist() == [0, 1, 2, 3]
+    assert index.filter(employee=" 홍길").tolist() == [0, 2]
+    assert index.filter(employee="lee").tolist() == [3]
+    assert index.filter(department="총무", holiday=True).tolist() == [2]
+    assert index.filter(holiday=False).tolist() == [0, 3]
+    assert index.filter(min_hours=1).tolist() == [0, 2]
+    # 날짜 범위는 양 끝 포함, 날짜가 없는 기록은 날짜 조건이 있으면 제외
+    assert index.filter(start=date(2025, 3, 1), end=date(2025, 3, 3)).tolist() == [0, 2]
+    assert index.filter(start=date(2025, 3, 2)).tolist() == [0, 1]
+    assert index.filter(employee="없는 직원").tolist() == []
+
+
+def test_index_helpers():
+    index = ResultIndex(RECORDS)
+    assert index.values("부서명") == ["시설과", "총무과"]
+    assert index.date_range() == (date(2025, 3, 1), date(2025, 3, 8))
+    assert ResultIndex([]).date_range() is None
+    assert ResultIndex([]).filter(employee="홍").tolist() == []
+
+
+def test_suspicious_hours_reads_older_records_from_reason():
+    assert suspicious_hours({"의심시간": 2.5}) == 2.5
+    assert (
+        suspicious_hours({"의심사유": "경비 작동 중 총 1.5시간 초과근무 기록 존재 (19:00-20:30)"})
+        == 1.5
+    )
+    assert suspicious_hours({"의심사유": "해당 업무일에 경비 기록 없음"}) == 0
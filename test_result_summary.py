@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# 부서별/직원별 월간 요약 테스트
+from datetime import date
+
+from result_summary import SUMMARY_VALUE_COLUMNS, summary_tables
+
+
+def _record(day, name, dept, hours, holiday=False, no_security=False):
+    return {
+        "날짜": day,
+        "직원명": name,
+        "부서명": dept,
+        "경비상태": "기록 없음" if no_security else "경비 작동 중",
+        "의심시간": 0.0 if no_security else hours,
+        "휴일여부": "휴일" if holiday else "평일",
+    }
+
+
+RECORDS = [
+    _record(date(2025, 3, 3), "홍길동", "총무과", 2.5),
+    _record(date(2025, 3, 8), "홍길동", "총무과", 1.0, holiday=True),
+    _record(date(2025, 3, 9), "김영희", "총무과", 0, holiday=True, no_security=True),
+    _record(date(2025, 4, 1), "홍길동", "총무과", 0.25),
+    _record(date(2025, 3, 4), "김철수", "시설과", 3.0),
+]
+
+
+def test_department_summary_by_month():
+    table = summary_tables(RECORDS)["department"]
+    assert list(table.columns) == ["부서명", "월"] + SUMMARY_VALUE_COLUMNS
+    rows = {(row["부서명"], row["월"]): row for row in table.to_dict("records")}
+    assert list(rows) == [("시설과", "2025-03"), ("총무과", "2025-03"), ("총무과", "2025-04")]
+    march = rows[("총무과", "2025-03")]
+    assert march["의심 기록"] == 3
+    assert march["경비 기록 없음"] == 1
+    assert march["총 의심시간"] == 3.5
+    assert march["휴일 의심 기록"] == 2
+    assert march["휴일 비율(%)"] == 66.7
+
+
+def test_employee_summary_by_month():
+    table = summary_tables(RECORDS)["employee"]
+    hong = table[table["직원명"] == "홍길동"]
+    assert hong["월"].tolist() == ["2025-03", "2025-04"]
+    assert hong["총 의심시간"].tolist() == [3.5, 0.25]
+    assert hong["휴일 비율(%)"].tolist() == [50.0, 0.0]
+
+
+def test_empty_results_give_empty_tables_with_columns():
+    tables = summary_tables([])
+    assert tables["employee"].empty
+    assert list(tables["employee"].columns) == ["부서명", "직원명", "월"] + SUMMARY_VALUE_COLUMNS
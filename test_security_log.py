@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# 경비 기록 스트리밍 처리 로직 테스트
+import math
+from datetime import date, datetime
+
+import pandas as pd
+
+from security_log import (
+    ArmedTimeline,
+    SecurityStateBuilder,
+    chunk_rows_for_budget,
+    stream_security_log,
+)
+
+
+def _security_frame():
+    return pd.DataFrame(
+        {
+            "발생일자": ["2025-03-27", "2025-03-27", "2025-03-27", "2025-03-28", "2025-03-28"],
+            "발생시각": ["08:01:00", "12:00:00", "21:16:09", "01:30:00", "09:00:00"],
+            "모드": ["출입", "출입", "경비 세트", "출입", "출입"],
+        }
+    )
+
+
+def test_stream_builder_matches_business_day_rules():
+    """청크로 나누어 넣어도 업무일/출입 판단 규칙이 그대로 적용되는지 확인합니다"""
+    df = _security_frame()
+    builder = SecurityStateBuilder("2025-03-01", "2025-03-31")
+    builder.add_chunk(df.iloc[:2])
+    builder.add_chunk(df.iloc[2:])
+    status_by_day, unclear_days = builder.finalize()
+
+    # 3/28 01:30 기록은 3/27 업무일로 계산되고, 첫 '출입' 기록만 경비해제로 간주
+    assert status_by_day[date(2025, 3, 27)] == [
+        {"시간": "2025-03-27 08:01", "상태": "해제"},
+        {"시간": "2025-03-27 21:16", "상태": "시작"},
+    ]
+    assert status_by_day[date(2025, 3, 28)] == [{"시간": "2025-03-28 09:00", "상태": "해제"}]
+
+    problems = {(d["업무일"], d["문제"]) for d in unclear_days}
+    assert (date(2025, 3, 27), "마지막 기록이 '경비시작'이 아님") in problems
+    assert (date(2025, 3, 28), "명확한 경비해제/시작 기록 없음") in problems
+
+
+def test_stream_security_log_reads_xlsx_in_chunks(tmp_path):
+    """xlsx 파일을 read_only 모드로 나누어 읽은 결과가 데이터프레임 처리와 같은지 확인합니다"""
+    df = _security_frame()
+    file_path = tmp_path / "security.xlsx"
+    df.to_excel(file_path, index=False)
+
+    builder = SecurityStateBuilder("2025-03-01", "2025-03-31")
+    builder.add_chunk(df)
+    expected = builder.finalize()
+
+    status_by_day, unclear_days, row_count = stream_security_log(
+        str(file_path), "2025-03-01", "2025-03-31"
+    )
+    assert row_count == len(df)
+    assert (status_by_day, unclear_days) == expected
+
+
+def test_stream_security_log_reads_first_sheet(tmp_path):
+    """활성 시트가 다른 시트여도 pd.read_excel 과 같이 첫 번째 시트를 읽는지 확인합니다"""
+    df = _security_frame()
+    file_path = tmp_path / "security.xlsx"
+    with pd.ExcelWriter(file_path) as writer:
+        df.to_excel(writer, sheet_name="경비기록", index=False)
+        df.iloc[:1].to_excel(writer, sheet_name="메모", index=False)
+        writer.book.active = 1
+
+    _, _, row_count = stream_security_log(str(file_path), "2025-03-01", "2025-03-31")
+    assert row_count == len(df)
+
+
+def test_chunk_rows_for_budget():
+    assert chunk_rows_for_budget(1) == 1000
+    assert chunk_rows_for_budget(256) == 256 * 1024 * 1024 // 4 // 1024
+
+
+def test_armed_timeline_spans_business_days():
+    """업무일이 달라도 경비 설정 상태가 다음 해제까지 이어지는지 확인합니다"""
+    timeline = ArmedTimeline.from_status_by_day(
+        {
+            date(2025, 3, 28): [{"시간": "2025-03-28 08:00", "상태": "해제"}],
+            date(2025, 3, 27): [
+                {"시간": "2025-03-27 08:00", "상태": "해제"},
+                {"시간": "2025-03-27 21:00", "상태": "시작"},
+                {"시간": "2025-03-27 23:00", "상태": "시작"},
+            ],
+        }
+    )
+
+    intervals = timeline.armed_intervals(datetime(2025, 3, 27, 18), datetime(2025, 3, 28, 9))
+    assert intervals == [(datetime(2025, 3, 27, 21), datetime(2025, 3, 28, 8))]
+    assert timeline.is_armed_at(datetime(2025, 3, 27, 7))  # 첫 해제 이전은 경비 설정 상태
+    assert not timeline.is_armed_at(datetime(2025, 3, 28, 8))
+    assert timeline.set_times_between(datetime(2025, 3, 27, 22), datetime(2025, 3, 28)) == [
+        datetime(2025, 3, 27, 23)
+    ]
+
+
+def test_repeated_states_are_collapsed():
+    """같은 업무일에 간격 안에서 연속으로 반복된 같은 상태만 첫 기록 하나로 합치는지 확인합니다"""
+    df = pd.DataFrame(
+        {
+            "발생일자": ["2025-03-27"] * 6,
+            "발생시각": ["08:00:00", "08:00:40", "08:01:30", "20:00:00", "20:30:00", "20:30:10"],
+            "모드": ["해제", "해제", "해제", "경비 세트", "경비 세트", "해제"],
+        }
+    )
+    expected = {
+        # 40초/50초 간격으로 이어진 해제는 하나로, 30분 뒤의 세트는 간격을 넘으므로 유지
+        60: ["08:00 해제", "20:00 시작", "20:30 시작", "20:30 해제"],
+        math.inf: ["08:00 해제", "20:00 시작", "20:30 해제"],
+        None: ["08:00 해제", "08:00 해제", "08:01 해제", "20:00 시작", "20:30 시작", "20:30 해제"],
+    }
+    for dedupe_seconds, changes in expected.items():
+        builder = SecurityStateBuilder(dedupe_seconds=dedupe_seconds)
+        builder.add_chunk(df)
+        status_by_day, _ = builder.finalize()
+        assert [
+            f"{change['시간'][-5:]} {change['상태']}" for change in status_by_day[date(2025, 3, 27)]
+        ] == changes
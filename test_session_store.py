@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# 분석 세션 저장/열기 테스트
+from datetime import date, time
+
+import pandas as pd
+
+from analysis_diagnostics import AnalysisDiagnostics
+from session_store import AnalysisSession, load_session, save_session
+from zone_mapping import ZoneMapping
+
+
+def test_session_round_trip(tmp_path):
+    """입력 데이터, 업무일별 경비 상태, 의심 기록이 그대로 복원되는지 확인합니다"""
+    security_df = pd.DataFrame(
+        {
+            "발생일자": pd.to_datetime(["2025-03-04", "2025-03-04"]),
+            # 엑셀에서 읽은 시각(datetime.time)과 문자열이 섞인 컬럼
+            "발생시각": [time(8, 30), "19:05:00"],
+            "모드": ["해제", "세트"],
+        }
+    )
+    overtime_df = pd.DataFrame({"A": [1], "B": ["홍길동"]})
+    security_by_zone = {
+        "전체": {
+            date(2025, 3, 4): [
+                {"시간": "2025-03-04 08:30", "상태": "해제"},
+                {"시간": "2025-03-04 19:05", "상태": "시작"},
+            ]
+        }
+    }
+    suspicious = [{"날짜": date(2025, 3, 4), "직원명": "홍길동", "구역": ""}]
+    diagnostics = AnalysisDiagnostics(sample_limit=1, spill=True)
+    missing = [{"날짜": date(2025, 3, day), "직원명": "홍길동"} for day in (5, 6)]
+    diagnostics.extend("missing_time_records", missing)
+    session = AnalysisSession(
+        "2025-03-01",
+        "2025-03-31",
+        "calendar",
+        None,
+        security_df=security_df,
+        overtime_df=overtime_df,
+        zone_mapping=ZoneMapping({"홍길동": "A동"}),
+        suspicious_records=suspicious,
+        security_by_zone=security_by_zone,
+        diagnostics=diagnostics,
+    )
+
+    path = str(tmp_path / "3월.ovsession")
+    save_session(path, session)
+    restored_diagnostics = AnalysisDiagnostics(sample_limit=1, spill=True)
+    restored = load_session(path, restored_diagnostics)
+
+    assert (restored.start_date, restored.end_date) == ("2025-03-01", "2025-03-31")
+    assert restored.holiday_source == "calendar"
+    assert restored.dedupe_seconds is None
+    assert list(restored.security_df["발생시각"]) == ["08:30:00", "19:05:00"]
+    assert restored.overtime_df.equals(overtime_df)
+    assert restored.security_by_zone == security_by_zone
+    assert restored.suspicious_records == suspicious
+    assert restored.zone_mapping.zone_for("홍길동") == "A동"
+    assert restored.security_stream_path is None
+    assert list(restored_diagnostics.iter_records("missing_time_records")) == missing
+    diagnostics.clear()
+    restored_diagnostics.clear()
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# 타임라인 보기용 데이터 테스트
+from datetime import datetime
+
+import numpy as np
+
+from test_employee_index import _analyzed_engine
+from timeline_data import IntervalSeries, TimelineData
+
+
+def test_merged_joins_overlapping_and_touching_intervals():
+    series = IntervalSeries.merged([50, 0, 10, 30, 40], [60, 10, 20, 45, 42])
+    assert series.starts.tolist() == [0, 30, 50]
+    assert series.ends.tolist() == [20, 45, 60]
+    assert series.total_seconds() == 45
+    assert len(IntervalSeries.merged([], [])) == 0
+
+
+def test_coverage_is_fraction_of_each_bucket():
+    series = IntervalSeries([10, 30], [20, 35])
+    coverage = series.coverage([0, 10, 15, 25, 40])
+    assert np.allclose(coverage, [0, 1, 0.5, 5 / 15])
+    assert np.allclose(IntervalSeries([], []).coverage([0, 10, 20]), [0, 0])
+
+
+def test_intersect():
+    overtime = IntervalSeries([0, 20, 50], [10, 40, 60])
+    armed = IntervalSeries([5, 30], [25, 55])
+    overlap = overtime.intersect(armed)
+    assert overlap.starts.tolist() == [5, 20, 30, 50]
+    assert overlap.ends.tolist() == [10, 25, 40, 55]
+
+
+def test_from_index_overlap_matches_employee_view():
+    data = TimelineData.from_index(_analyzed_engine()[0].employee_index)
+    assert data.origin == datetime(2025, 3, 27)
+    assert [row.zone for row in data.rows] == ["A동", "B동"]
+
+    hong = data.rows[0]
+    assert hong.label == "홍길동 (총무과)"
+    assert hong.overtime.total_seconds() == 12 * 3600
+    # 27일 19:00~22:00 만 겹침 (28일은 경비 기록 없음)
+    assert data.to_datetime(hong.overlap.starts[0]) == datetime(2025, 3, 27, 19)
+    assert hong.overlap.total_seconds() == 3 * 3600
+    assert data.rows[1].overlap.total_seconds() == 0
+    assert data.span_seconds >= data.to_seconds(datetime(2025, 3, 29, 4))
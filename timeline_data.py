@@ -0,0 +1,147 @@
+# 타임라인 보기용 데이터 (구역별 경비 설정 구간, 직원별 초과근무/겹친 구간)
+#
+# 구간은 기준 시각으로부터의 초(float)로 바꾸어 겹치지 않게 합친 뒤 누적 길이와 함께 보관합니다.
+# 화면의 픽셀 열마다 구간이 덮는 비율을 누적 길이의 차로 계산하므로, 한 행을 그리는 비용은 구간 수가
+# 아니라 화면 너비에 비례합니다. 축소하면 한 픽셀에 여러 구간이 합쳐져 덮는 비율(농도)로 표시됩니다.
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from employee_index import business_day_window
+
+
+class IntervalSeries:
+    """겹치지 않게 합친 [시작, 종료) 구간 목록 (초 단위, 시작 순)"""
+
+    def __init__(self, starts, ends):
+        self.starts = np.asarray(starts, dtype=np.float64)
+        self.ends = np.asarray(ends, dtype=np.float64)
+        lengths = self.ends - self.starts
+        # cumulative[i]: i번째 구간 이전까지 덮은 길이
+        self.cumulative = np.concatenate(([0.0], np.cumsum(lengths)))
+        # 누적 길이는 구간 안에서 기울기 1, 구간 사이에서 0 인 꺾은선 (시작/종료 시각이 꺾이는 점)
+        self._knot_times = np.column_stack((self.starts, self.ends)).ravel()
+        self._knot_values = np.column_stack((self.cumulative[:-1], self.cumulative[1:])).ravel()
+
+    def __len__(self):
+        return len(self.starts)
+
+    @classmethod
+    def merged(cls, starts, ends):
+        """겹치거나 맞닿은 구간을 합쳐 만듭니다."""
+        starts = np.asarray(starts, dtype=np.float64)
+        ends = np.asarray(ends, dtype=np.float64)
+        if len(starts) == 0:
+            return cls([], [])
+        order = np.argsort(starts, kind="stable")
+        starts, ends = starts[order], np.maximum.accumulate(ends[order])
+        # 앞 구간들이 끝나기 전에 시작하는 구간은 같은 묶음
+        new_group = np.concatenate(([True], starts[1:] > ends[:-1]))
+        group_last = np.concatenate((np.flatnonzero(new_group)[1:] - 1, [len(starts) - 1]))
+        return cls(starts[new_group], ends[group_last])
+
+    def total_seconds(self):
+        return float(self.cumulative[-1])
+
+    def covered_until(self, times):
+        """각 시각까지 구간이 덮은 누적 길이"""
+        times = np.asarray(times, dtype=np.float64)
+        if len(self.starts) == 0:
+            return np.zeros_like(times)
+        return np.interp(times, self._knot_times, self._knot_values)
+
+    def coverage(self, edges):
+        """edges 로 나눈 칸마다 구간이 덮는 비율 (0~1)"""
+        edges = np.asarray(edges, dtype=np.float64)
+        return np.diff(self.covered_until(edges)) / np.diff(edges)
+
+    def intersect(self, other):
+        """두 구간 목록이 겹치는 구간"""
+        starts, ends = [], []
+        i = j = 0
+        while i < len(self.starts) and j < len(other.starts):
+            start = max(self.starts[i], other.starts[j])
+            end = min(self.ends[i], other.ends[j])
+            if start < end:
+                starts.append(start)
+                ends.append(end)
+            if self.ends[i] < other.ends[j]:
+                i += 1
+            else:
+                j += 1
+        return IntervalSeries(starts, ends)
+
+
+class TimelineRow:
+    """타임라인 한 행 (직원 한 명)"""
+
+    __slots__ = ("key", "label", "zone", "overtime", "overlap")
+
+    def __init__(self, key, label, zone, overtime, overlap):
+        self.key = key
+        self.label = label
+        self.zone = zone
+        self.overtime = overtime
+        self.overlap = overlap
+
+
+class TimelineData:
+    """EmployeeTimelineIndex 로 만든 타임라인 전체 데이터
+
+    origin 은 첫 업무일 0시이며, 모든 구간은 origin 으로부터의 초로 저장합니다.
+    """
+
+    def __init__(self, origin, span_seconds, rows, armed_by_zone):
+        self.origin = origin
+        self.span_seconds = span_seconds
+        self.rows = rows
+        self.armed_by_zone = armed_by_zone  # 구역 -> IntervalSeries
+
+    def __len__(self):
+        return len(self.rows)
+
+    def to_seconds(self, moment):
+        return (moment - self.origin).total_seconds()
+
+    def to_datetime(self, seconds):
+        return self.origin + timedelta(seconds=float(seconds))
+
+    @classmethod
+    def from_index(cls, index):
+        segments = [segment for segments in index.segments.values() for segment in segments]
+        if not segments:
+            return cls(datetime(2000, 1, 1), 0.0, [], {})
+        first_day = min(segment[0] for segment in segments)
+        last_day = max(segment[0] for segment in segments)
+        origin = datetime.combine(first_day, datetime.min.time())
+        span_end = max(business_day_window(last_day)[1], max(segment[2] for segment in segments))
+
+        def seconds(moments):
+            return [(moment - origin).total_seconds() for moment in moments]
+
+        armed_by_zone = {}
+        for zone, armed_by_day in index.armed_by_zone_day.items():
+            intervals = [
+                interval
+                for intervals in armed_by_day.values()
+                if intervals
+                for interval in intervals
+            ]
+            armed_by_zone[zone] = IntervalSeries.merged(
+                seconds(start for start, _ in intervals), seconds(end for _, end in intervals)
+            )
+
+        rows = []
+        for key, info in sorted(
+            index.employees.items(),
+            key=lambda item: (item[1]["구역"], item[1]["직원명"], item[1]["부서명"]),
+        ):
+            employee_segments = index.segments[key]
+            overtime = IntervalSeries.merged(
+                seconds(segment[1] for segment in employee_segments),
+                seconds(segment[2] for segment in employee_segments),
+            )
+            armed = armed_by_zone.get(info["구역"], IntervalSeries([], []))
+            label = f"{info['직원명']} ({info['부서명']})" if info["부서명"] else info["직원명"]
+            rows.append(TimelineRow(key, label, info["구역"], overtime, overtime.intersect(armed)))
+        return cls(origin, (span_end - origin).total_seconds(), rows, armed_by_zone)
@@ -0,0 +1,279 @@
+# 경비 설정 구간과 직원별 초과근무를 시간축에 함께 그리는 타임라인(간트 차트) 보기
+#
+# 화면에 보이는 행만 그리며(가로/세로 범위 밖 데이터는 계산하지 않음), 각 행은 TimelineData 의 픽셀
+# 열별 덮는 비율로 색을 정해 한 장의 이미지로 그립니다. 확대하면 구간 경계가 그대로 보이고, 축소하면
+# 여러 구간이 한 픽셀로 합쳐진 농도로 보이므로 1년치 수백 명 데이터도 같은 비용으로 그립니다.
+#
+# 조작: 휠 - 위아래 이동, Ctrl+휠 - 마우스 위치 기준 확대/축소, 끌기 - 이동, 더블클릭 - 직원별 보기
+from datetime import timedelta
+
+import numpy as np
+from PyQt5.QtCore import QPoint, QRect, Qt, pyqtSignal
+from PyQt5.QtGui import QColor, QImage, QPainter, QPen
+from PyQt5.QtWidgets import QAbstractScrollArea
+
+from timeline_data import IntervalSeries
+
+LABEL_WIDTH = 160
+AXIS_HEIGHT = 26
+ROW_HEIGHT = 18
+BAR_MARGIN = 3  # 행 위아래 여백 (경비 설정 배경은 행 전체, 초과근무 막대는 여백 안쪽)
+
+# 확대/축소 한계 (픽셀당 초)
+MIN_SECONDS_PER_PIXEL = 15
+ZOOM_STEP = 1.25
+
+BACKGROUND_COLOR = np.array([255, 255, 255], dtype=np.float32)
+ARMED_COLOR = np.array([205, 210, 225], dtype=np.float32)  # 경비 설정
+OVERTIME_COLOR = np.array([70, 130, 200], dtype=np.float32)  # 초과근무
+OVERLAP_COLOR = np.array([215, 45, 45], dtype=np.float32)  # 경비 설정 중 초과근무
+
+EMPTY_SERIES = IntervalSeries([], [])
+
+# 덮는 비율을 나누는 색 단계 수
+COLOR_LEVELS = 16
+
+HOUR = 3600
+DAY = 24 * HOUR
+# 눈금 간격 후보 (초). 한 달 이상은 달의 첫날마다 눈금
+TICK_STEPS = (HOUR, 3 * HOUR, 6 * HOUR, 12 * HOUR, DAY, 7 * DAY)
+MONTH_TICK_STEPS = (1, 2, 3, 6, 12)
+MIN_TICK_PIXELS = 90
+
+
+def _color_tables():
+    """덮는 비율 단계별 (배경 색, 막대 색) 표. 막대 색은 (경비, 초과근무, 겹침) 단계 순으로 펼친 표"""
+    levels = np.linspace(0.0, 1.0, COLOR_LEVELS + 1, dtype=np.float32)
+    armed, overtime, overlap = np.meshgrid(levels, levels, levels, indexing="ij")
+    background = BACKGROUND_COLOR + (ARMED_COLOR - BACKGROUND_COLOR) * armed[..., None]
+    bar = background + (OVERTIME_COLOR - background) * overtime[..., None]
+    bar = bar + (OVERLAP_COLOR - bar) * overlap[..., None]
+    return background[:, 0, 0].round().astype(np.uint8), bar.reshape(-1, 3).round().astype(np.uint8)
+
+
+BACKGROUND_TABLE, BAR_TABLE = _color_tables()
+
+
+def _levels(ratio):
+    return np.rint(ratio * COLOR_LEVELS).astype(np.intp)
+
+
+def row_colors(rows, armed_by_zone, edges):
+    """보이는 행들의 (배경 색, 막대 색) 배열을 반환합니다. 각각 (행 수, 너비, 3) uint8
+
+    경비 설정 비율은 구역마다 한 번만 계산하고, 색은 비율 단계별 색 표에서 한 번에 찾습니다.
+    """
+    widths = np.diff(edges)
+    zone_coverage = {}
+    for row in rows:
+        if row.zone not in zone_coverage:
+            armed = armed_by_zone.get(row.zone, EMPTY_SERIES)
+            zone_coverage[row.zone] = armed.coverage(edges)
+    armed = np.stack([zone_coverage[row.zone] for row in rows])
+    overtime = np.stack([np.diff(row.overtime.covered_until(edges)) for row in rows])
+    overlap = np.stack([np.diff(row.overlap.covered_until(edges)) for row in rows])
+    # 막대 안에서 겹친 구간이 차지하는 비율만큼 빨간색 (축소해도 의심 구간이 흐려지지 않도록)
+    overlap_ratio = np.divide(overlap, overtime, out=np.zeros_like(overtime), where=overtime > 0)
+
+    armed_level = _levels(armed)
+    steps = COLOR_LEVELS + 1
+    bar_index = (armed_level * steps + _levels(overtime / widths)) * steps + _levels(overlap_ratio)
+    return BACKGROUND_TABLE[armed_level], BAR_TABLE[bar_index]
+
+
+class TimelineView(QAbstractScrollArea):
+    """TimelineData 를 그리는 위젯. 행을 더블클릭하면 employee_activated(직원키, datetime) 를 보냅니다."""
+
+    employee_activated = pyqtSignal(object, object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.data = None
+        self.seconds_per_pixel = float(DAY) / 24
+        self._drag_origin = None
+        self.horizontalScrollBar().valueChanged.connect(self.viewport().update)
+        self.verticalScrollBar().valueChanged.connect(self.viewport().update)
+
+    def set_data(self, data):
+        """새 데이터로 바꾸고 전체 기간이 한 화면에 보이도록 맞춥니다."""
+        self.data = data
+        self.fit_all()
+
+    def chart_width(self):
+        return max(self.viewport().width() - LABEL_WIDTH, 1)
+
+    def fit_all(self):
+        if self.data is not None and self.data.span_seconds > 0:
+            self.seconds_per_pixel = max(
+                self.data.span_seconds / self.chart_width(), MIN_SECONDS_PER_PIXEL
+            )
+        self.update_scrollbars()
+        self.horizontalScrollBar().setValue(0)
+
+    def max_seconds_per_pixel(self):
+        if self.data is None or self.data.span_seconds <= 0:
+            return float(DAY)
+        return max(self.data.span_seconds / self.chart_width(), MIN_SECONDS_PER_PIXEL)
+
+    def update_scrollbars(self):
+        rows = len(self.data) if self.data is not None else 0
+        visible_rows = max((self.viewport().height() - AXIS_HEIGHT) // ROW_HEIGHT, 1)
+        self.verticalScrollBar().setRange(0, max(rows - visible_rows, 0))
+        self.verticalScrollBar().setPageStep(visible_rows)
+        span = self.data.span_seconds if self.data is not None else 0
+        total_pixels = int(np.ceil(span / self.seconds_per_pixel))
+        self.horizontalScrollBar().setRange(0, max(total_pixels - self.chart_width(), 0))
+        self.horizontalScrollBar().setPageStep(self.chart_width())
+        self.viewport().update()
+
+    def left_seconds(self):
+        return self.horizontalScrollBar().value() * self.seconds_per_pixel
+
+    def zoom(self, factor, anchor_x):
+        """anchor_x(차트 영역 픽셀) 위치의 시각을 고정한 채 확대/축소합니다."""
+        anchor_seconds = self.left_seconds() + anchor_x * self.seconds_per_pixel
+        self.seconds_per_pixel = min(
+            max(self.seconds_per_pixel * factor, MIN_SECONDS_PER_PIXEL),
+            self.max_seconds_per_pixel(),
+        )
+        self.update_scrollbars()
+        self.horizontalScrollBar().setValue(
+            int(round(anchor_seconds / self.seconds_per_pixel - anchor_x))
+        )
+
+    def row_at(self, y):
+        if self.data is None or y < AXIS_HEIGHT:
+            return None
+        row = self.verticalScrollBar().value() + (y - AXIS_HEIGHT) // ROW_HEIGHT
+        return row if row < len(self.data) else None
+
+    # 이벤트 처리
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.seconds_per_pixel = min(self.seconds_per_pixel, self.max_seconds_per_pixel())
+        self.update_scrollbars()
+
+    def wheelEvent(self, event):
+        if event.modifiers() & Qt.ControlModifier:
+            steps = event.angleDelta().y() / 120
+            self.zoom(ZOOM_STEP ** (-steps), max(event.pos().x() - LABEL_WIDTH, 0))
+            event.accept()
+            return
+        super().wheelEvent(event)
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            self._drag_origin = (
+                event.pos(),
+                self.horizontalScrollBar().value(),
+                self.verticalScrollBar().value(),
+            )
+            self.viewport().setCursor(Qt.ClosedHandCursor)
+
+    def mouseMoveEvent(self, event):
+        if self._drag_origin is None:
+            return
+        origin, h_value, v_value = self._drag_origin
+        delta = event.pos() - origin
+        self.horizontalScrollBar().setValue(h_value - delta.x())
+        self.verticalScrollBar().setValue(v_value - delta.y() // ROW_HEIGHT)
+
+    def mouseReleaseEvent(self, event):
+        self._drag_origin = None
+        self.viewport().unsetCursor()
+
+    def mouseDoubleClickEvent(self, event):
+        row = self.row_at(event.pos().y())
+        if row is None:
+            return
+        x = max(event.pos().x() - LABEL_WIDTH, 0)
+        moment = self.data.to_datetime(self.left_seconds() + x * self.seconds_per_pixel)
+        self.employee_activated.emit(self.data.rows[row].key, moment)
+
+    # 그리기
+    def paintEvent(self, event):
+        painter = QPainter(self.viewport())
+        painter.fillRect(self.viewport().rect(), Qt.white)
+        if self.data is None or not len(self.data):
+            painter.drawText(
+                self.viewport().rect(), Qt.AlignCenter, "분석 결과가 있으면 타임라인이 표시됩니다."
+            )
+            return
+
+        width = self.chart_width()
+        first_row = self.verticalScrollBar().value()
+        visible_rows = (self.viewport().height() - AXIS_HEIGHT) // ROW_HEIGHT + 1
+        rows = self.data.rows[first_row : first_row + visible_rows]
+        left = self.left_seconds()
+        edges = left + np.arange(width + 1, dtype=np.float64) * self.seconds_per_pixel
+
+        # 보이는 행만 픽셀 열별 색을 계산하여 한 장의 이미지로 그림
+        background, bar = row_colors(rows, self.data.armed_by_zone, edges)
+        image = np.empty((len(rows), ROW_HEIGHT, width, 3), dtype=np.uint8)
+        image[:] = background[:, None]
+        image[:, BAR_MARGIN : ROW_HEIGHT - BAR_MARGIN] = bar[:, None]
+        image[:, ROW_HEIGHT - 1] = 235  # 행 구분선
+        image = image.reshape(len(rows) * ROW_HEIGHT, width, 3)
+        qimage = QImage(image.data, width, image.shape[0], width * 3, QImage.Format_RGB888)
+        painter.drawImage(LABEL_WIDTH, AXIS_HEIGHT, qimage)
+
+        self._paint_axis(painter, left, width)
+        painter.setPen(Qt.black)
+        for i, row in enumerate(rows):
+            rect = QRect(4, AXIS_HEIGHT + i * ROW_HEIGHT, LABEL_WIDTH - 8, ROW_HEIGHT)
+            painter.drawText(rect, Qt.AlignVCenter | Qt.AlignLeft, row.label)
+        painter.setPen(QColor(160, 160, 160))
+        painter.drawLine(LABEL_WIDTH - 1, 0, LABEL_WIDTH - 1, self.viewport().height())
+
+    def _tick_seconds(self, left, width):
+        """보이는 범위의 눈금 위치(초)와 라벨 형식"""
+        right = left + width * self.seconds_per_pixel
+        for step in TICK_STEPS:
+            if step / self.seconds_per_pixel >= MIN_TICK_PIXELS:
+                first = np.ceil(left / step) * step
+                label = "%m-%d %H:%M" if step < DAY else "%m-%d"
+                return np.arange(first, right, step), label
+        # 한 달 이상 간격: month_step 달마다 달의 첫날
+        month_step = next(
+            (
+                step
+                for step in MONTH_TICK_STEPS
+                if 30 * DAY * step / self.seconds_per_pixel >= MIN_TICK_PIXELS
+            ),
+            MONTH_TICK_STEPS[-1],
+        )
+        month = self.data.to_datetime(left).replace(
+            day=1, hour=0, minute=0, second=0, microsecond=0
+        )
+        month = month.replace(month=month.month - (month.month - 1) % month_step)
+        ticks = []
+        while True:
+            seconds = self.data.to_seconds(month)
+            if seconds > right:
+                return ticks, "%Y-%m"
+            if seconds >= left:
+                ticks.append(seconds)
+            index = month.month - 1 + month_step
+            month = month.replace(year=month.year + index // 12, month=index % 12 + 1)
+
+    def _paint_axis(self, painter, left, width):
+        painter.fillRect(QRect(0, 0, self.viewport().width(), AXIS_HEIGHT), QColor(245, 245, 245))
+        ticks, label_format = self._tick_seconds(left, width)
+        grid_pen = QPen(QColor(0, 0, 0, 40))
+        height = self.viewport().height()
+        for seconds in ticks:
+            x = LABEL_WIDTH + int(round((seconds - left) / self.seconds_per_pixel))
+            painter.setPen(grid_pen)
+            painter.drawLine(x, AXIS_HEIGHT - 6, x, height)
+            painter.setPen(Qt.black)
+            moment = self.data.to_datetime(seconds)
+            painter.drawText(QPoint(x + 3, AXIS_HEIGHT - 9), moment.strftime(label_format))
+        painter.setPen(QColor(160, 160, 160))
+        painter.drawLine(0, AXIS_HEIGHT - 1, self.viewport().width(), AXIS_HEIGHT - 1)
+        visible = timedelta(seconds=width * self.seconds_per_pixel)
+        painter.setPen(Qt.darkGray)
+        painter.drawText(
+            QRect(4, 0, LABEL_WIDTH - 8, AXIS_HEIGHT),
+            Qt.AlignVCenter | Qt.AlignLeft,
+            f"표시 범위 {visible.days}일" if visible.days else f"표시 범위 {visible}",
+        )
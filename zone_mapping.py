@@ -0,0 +1,69 @@
+# 직원/부서별 경비 구역 매핑
+import pandas as pd
+
+from input_readers import read_input_file
+from security_log import ALL_ZONES, ZONE_COLUMN_KEYWORDS
+
+# 매핑 파일에서 직원/부서 컬럼을 찾을 때 사용하는 키워드
+EMPLOYEE_COLUMN_KEYWORDS = ("성명", "직원", "이름")
+DEPARTMENT_COLUMN_KEYWORDS = ("부서",)
+
+
+class ZoneMapping:
+    """직원명 또는 부서명으로 경비 구역을 찾습니다. (직원명 매핑이 부서명 매핑보다 우선)"""
+
+    def __init__(self, employee_zones=None, department_zones=None):
+        self.employee_zones = dict(employee_zones or {})
+        self.department_zones = dict(department_zones or {})
+
+    def __len__(self):
+        return len(self.employee_zones) + len(self.department_zones)
+
+    def zone_for(self, employee_name, department=""):
+        """직원에게 배정된 구역을 반환합니다. 배정된 구역이 없으면 ALL_ZONES 를 반환합니다."""
+        zone = self.employee_zones.get(str(employee_name).strip())
+        if zone is None and department:
+            zone = self.department_zones.get(str(department).strip())
+        return zone if zone else ALL_ZONES
+
+    @classmethod
+    def from_dataframe(cls, df):
+        """구역 컬럼과 직원명/부서명 컬럼이 있는 표에서 매핑을 만듭니다."""
+
+        def find_column(keywords):
+            for col in df.columns:
+                if any(keyword in str(col).lower() for keyword in keywords):
+                    return col
+            return None
+
+        zone_col = find_column(ZONE_COLUMN_KEYWORDS)
+        employee_col = find_column(EMPLOYEE_COLUMN_KEYWORDS)
+        department_col = find_column(DEPARTMENT_COLUMN_KEYWORDS)
+
+        if zone_col is None:
+            raise ValueError("구역 매핑 파일에서 구역 컬럼을 찾을 수 없습니다.")
+        if employee_col is None and department_col is None:
+            raise ValueError("구역 매핑 파일에서 직원명 또는 부서명 컬럼을 찾을 수 없습니다.")
+
+        employee_zones = {}
+        department_zones = {}
+        for _, row in df.iterrows():
+            if pd.isna(row[zone_col]):
+                continue
+            zone = str(row[zone_col]).strip()
+            if employee_col is not None and pd.notna(row[employee_col]):
+                employee_zones[str(row[employee_col]).strip()] = zone
+            elif department_col is not None and pd.notna(row[department_col]):
+                department_zones[str(row[department_col]).strip()] = zone
+
+        return cls(employee_zones, department_zones)
+
+
+def load_zone_mapping(file_path):
+    """구역 매핑 파일(엑셀/CSV/Parquet)을 읽어 ZoneMapping 을 반환합니다."""
+    mapping = ZoneMapping.from_dataframe(read_input_file(file_path))
+    print(
+        f"[INFO] 구역 매핑 로드: 직원 {len(mapping.employee_zones)}명, "
+        f"부서 {len(mapping.department_zones)}개"
+    )
+    return mapping